@@ -0,0 +1,63 @@
+"""
+Benchmark of process graph traversals (flattening, unflattening, walking, ...)
+on very deep process graphs (long chains of processes, e.g. generated in a loop).
+
+Traversal time should scale linearly with graph depth.
+
+Usage:
+
+    python benchmarks/graph_traversal.py --depths 1000 10000 100000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.process_graph_visitor import (
+    ProcessGraphUnflattener,
+    ProcessGraphVisitor,
+)
+
+
+def build_chain(depth: int) -> PGNode:
+    """Build a chain of `depth` process nodes."""
+    node = PGNode("load_collection", id="S2")
+    for i in range(1, depth):
+        node = PGNode("apply", data={"from_node": node}, process={"process_graph": PGNode("absolute", x=i)})
+    return node
+
+
+def timed(f: Callable) -> float:
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def run(depths: List[int]):
+    print(f"{'depth':>8} {'traversal':<22} {'time (s)':>10} {'per node (µs)':>14}")
+    for depth in depths:
+        node = build_chain(depth)
+        flat_graph = node.flat_graph()
+        benchmarks = {
+            "PGNode.flat_graph": node.flat_graph,
+            "PGNode.to_dict": node.to_dict,
+            "PGNode.walk_nodes": lambda: sum(1 for _ in node.walk_nodes()),
+            "PGNode.from_flat_graph": lambda: PGNode.from_flat_graph(flat_graph),
+            "Unflattener.unflatten": lambda: ProcessGraphUnflattener.unflatten(flat_graph),
+            "flat_graph + visit": lambda: ProcessGraphVisitor().accept_process_graph(node.flat_graph()),
+        }
+        for name, f in benchmarks.items():
+            elapsed = timed(f)
+            print(f"{depth:>8} {name:<22} {elapsed:>10.3f} {elapsed / depth * 1e6:>14.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1000, 10000, 100000], help="Graph depths")
+    arguments = parser.parse_args()
+    run(depths=arguments.depths)
+
+
+if __name__ == "__main__":
+    main()
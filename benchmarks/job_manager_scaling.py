@@ -0,0 +1,78 @@
+"""
+Benchmark of the throughput and API call counts of the MultiBackendJobManager
+with increasing numbers of jobs, against a simulated back-end served over real HTTP
+(see ``openeo.testing.simulation.BackendSimulation``).
+
+Usage:
+
+    python benchmarks/job_manager_scaling.py --jobs 100 1000 --parallel-jobs 50 --run-time 0.5 2
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import pandas as pd
+
+import openeo
+from openeo.extra.job_management import CsvJobDatabase, MultiBackendJobManager
+from openeo.testing.simulation import BackendSimulation
+
+
+def start_job(row, connection, **kwargs):
+    pg = {"add": {"process_id": "add", "arguments": {"x": int(row["x"]), "y": 1}, "result": True}}
+    return connection.create_job(pg)
+
+
+def run_jobs(job_count: int, *, parallel_jobs: int, run_time: Tuple[float, float], poll_sleep: float, **kwargs):
+    simulation = BackendSimulation(queue_time=(0, run_time[0]), run_time=run_time, seed=42, **kwargs)
+    with simulation.serve() as url, tempfile.TemporaryDirectory() as tmp:
+        manager = MultiBackendJobManager(poll_sleep=poll_sleep, root_dir=tmp, download_results=False)
+        manager.add_backend("sim", connection=openeo.connect(url), parallel_jobs=parallel_jobs)
+        job_db = CsvJobDatabase(Path(tmp) / "jobs.csv").initialize_from_df(pd.DataFrame({"x": range(job_count)}))
+        start = time.perf_counter()
+        manager.run_jobs(job_db=job_db, start_job=start_job)
+        elapsed = time.perf_counter() - start
+    return elapsed, simulation.stats()
+
+
+def run(job_counts: List[int], **kwargs):
+    print(f"{'jobs':>8} {'time (s)':>10} {'jobs/s':>8} {'requests':>9} {'req/job':>8} {'status polls/job':>17}")
+    for job_count in job_counts:
+        elapsed, stats = run_jobs(job_count, **kwargs)
+        polls = stats["endpoints"].get("GET /jobs/{job_id}", 0)
+        print(
+            f"{job_count:>8} {elapsed:>10.2f} {job_count / elapsed:>8.1f} {stats['requests']:>9}"
+            f" {stats['requests'] / job_count:>8.2f} {polls / job_count:>17.2f}",
+            flush=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[100, 1000], help="Number of jobs")
+    parser.add_argument("--parallel-jobs", type=int, default=50, help="Maximum number of parallel jobs")
+    parser.add_argument(
+        "--run-time", type=float, nargs=2, default=[0.5, 2], help="Range of simulated job run time (seconds)"
+    )
+    parser.add_argument("--poll-sleep", type=float, default=0.1, help="Job manager poll sleep (seconds)")
+    parser.add_argument("--latency", type=float, default=0, help="Simulated request latency (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests to fail with 5xx")
+    arguments = parser.parse_args()
+    # Don't let warnings (e.g. about missing authentication or injected errors) clutter the output
+    logging.basicConfig(level=logging.ERROR)
+    run(
+        job_counts=arguments.jobs,
+        parallel_jobs=arguments.parallel_jobs,
+        run_time=tuple(arguments.run_time),
+        poll_sleep=arguments.poll_sleep,
+        latency=arguments.latency,
+        error_rate=arguments.error_rate,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark of long chains of metadata operations (band lookups, filter_bands, rename_labels, ...)
+on cube metadata with a lot of bands (e.g. hyperspectral data).
+
+Time per operation should be (roughly) independent of the number of bands for band lookups,
+and scale with the number of affected bands (not all bands) for band dimension updates.
+
+Usage:
+
+    python benchmarks/metadata_chain.py --bands 10 300 1000 --length 1000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from openeo.metadata import (
+    Band,
+    BandDimension,
+    CubeMetadata,
+    SpatialDimension,
+    TemporalDimension,
+)
+
+
+def build_metadata(band_count: int) -> CubeMetadata:
+    bands = [Band(name=f"B{i:04d}", common_name=f"c{i}", aliases=[f"alias{i}"]) for i in range(band_count)]
+    return CubeMetadata(
+        dimensions=[
+            TemporalDimension(name="t", extent=["2024-01-01", "2025-01-01"]),
+            BandDimension(name="bands", bands=bands),
+            SpatialDimension(name="y", extent=[0, 10]),
+            SpatialDimension(name="x", extent=[0, 10]),
+        ]
+    )
+
+
+def band_lookups(metadata: CubeMetadata, length: int):
+    band_count = len(metadata.band_names)
+    for i in range(length):
+        j = (i * 7) % band_count
+        metadata.get_band_index(f"B{j:04d}")
+        metadata.band_dimension.band_name(f"alias{j}")
+
+
+def chain(metadata: CubeMetadata, length: int):
+    band_count = len(metadata.band_names)
+    for i in range(length):
+        j = (i * 7) % band_count
+        metadata = metadata.rename_labels("bands", target=[f"B{j:04d}"], source=[f"B{j:04d}"])
+        metadata = metadata.append_band(f"extra{i}").filter_bands(metadata.band_names)
+        metadata = metadata.add_dimension(name="tmp", label="x").drop_dimension("tmp")
+
+
+def timed(f: Callable) -> float:
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+def run(band_counts: List[int], length: int):
+    print(f"{'bands':>8} {'benchmark':<14} {'time (s)':>10} {'per op (µs)':>12}")
+    for band_count in band_counts:
+        metadata = build_metadata(band_count)
+        for name, f in {
+            "band lookups": lambda: band_lookups(metadata, length),
+            "chain": lambda: chain(metadata, length),
+        }.items():
+            elapsed = timed(f)
+            print(f"{band_count:>8} {name:<14} {elapsed:>10.3f} {elapsed / length * 1e6:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bands", type=int, nargs="+", default=[10, 300, 1000], help="Number of bands")
+    parser.add_argument("--length", type=int, default=1000, help="Number of operations in chain")
+    arguments = parser.parse_args()
+    run(band_counts=arguments.bands, length=arguments.length)
+
+
+if __name__ == "__main__":
+    main()
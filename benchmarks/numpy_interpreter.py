@@ -0,0 +1,90 @@
+"""
+Benchmark of the lightweight NumPy process graph interpreter
+(:py:mod:`openeo.internal.numpy_interpreter`) on band math callbacks,
+evaluated repeatedly on (small) local arrays.
+
+Compilation happens once, so evaluation time should be dominated by the NumPy operations themselves.
+If ``openeo_pg_parser_networkx`` and ``openeo_processes_dask`` are installed,
+the same callbacks are also evaluated through the ``openeo.local`` process registry for comparison.
+
+Usage:
+
+    python benchmarks/numpy_interpreter.py --sizes 10 1000 100000 --repeat 100
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.numpy_interpreter import compile_process_graph
+from openeo.internal.processes.builder import convert_callable_to_pgnode
+from openeo.processes import array_element, mean
+
+CALLBACKS: Dict[str, Callable] = {
+    "scale + log10": lambda x: (x * 0.0001 + 1).log(base=10),
+    "ndvi": lambda data: (array_element(data, 1) - array_element(data, 0))
+    / (array_element(data, 1) + array_element(data, 0)),
+    "mean > threshold": lambda data: mean(data) > 0.5,
+}
+
+
+def timed(f: Callable, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        f()
+    return (time.perf_counter() - start) / repeat
+
+
+def dask_registry_evaluator(node: PGNode) -> Optional[Callable]:
+    """Build evaluator through the `openeo.local` process registry (if available)."""
+    try:
+        from openeo_pg_parser_networkx import OpenEOProcessGraph
+
+        from openeo.local.processing import PROCESS_REGISTRY
+    except ImportError:
+        return None
+
+    flat_graph = node.flat_graph()
+
+    def evaluate(**parameters):
+        pg = OpenEOProcessGraph(pg_data={"process_graph": flat_graph})
+        return pg.to_callable(process_registry=PROCESS_REGISTRY)(named_parameters=parameters)
+
+    return evaluate
+
+
+def run(sizes: List[int], repeat: int):
+    print(f"{'size':>8} {'callback':<18} {'evaluator':<16} {'time (ms)':>10}")
+    for size in sizes:
+        data = np.random.default_rng(42).uniform(0, 10000, size=(2, size))
+        for name, callback in CALLBACKS.items():
+            parameter = "x" if "log" in name else "data"
+            arguments = {parameter: data[0] if parameter == "x" else data / 10000}
+            node = convert_callable_to_pgnode(callback)
+            evaluators = {"numpy (compile)": lambda: compile_process_graph(node)(**arguments)}
+            compiled = compile_process_graph(node)
+            evaluators["numpy (reuse)"] = lambda: compiled(**arguments)
+            dask_evaluate = dask_registry_evaluator(node)
+            if dask_evaluate:
+                evaluators["dask registry"] = lambda: dask_evaluate(**arguments)
+            for evaluator, f in evaluators.items():
+                print(f"{size:>8} {name:<18} {evaluator:<16} {timed(f, repeat=repeat) * 1e3:>10.3f}")
+    try:
+        import openeo_processes_dask  # noqa: F401
+    except ImportError:
+        print("Note: openeo_processes_dask not installed: skipped dask registry comparison.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000], help="Array sizes")
+    parser.add_argument("--repeat", type=int, default=100, help="Number of evaluations per measurement")
+    arguments = parser.parse_args()
+    run(sizes=arguments.sizes, repeat=arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+Benchmark suite of client-side hot paths (graph building, serialization, metadata handling,
+result conversion, job management, job database persistence, UDF execution, downloads, ...).
+
+Runs offline: back-end interaction is handled by a mocked back-end (``DummyBackend``)
+or a simulated back-end served locally (``BackendSimulation``).
+
+Usage:
+
+    # List available benchmarks
+    python benchmarks/suite.py --list
+
+    # Run all benchmarks (or a selection with --filter) and save the results as baseline
+    python benchmarks/suite.py --save baseline.json
+
+    # Run again (e.g. after some changes or on a next commit) and compare with the baseline
+    python benchmarks/suite.py --compare baseline.json
+
+In comparison mode, benchmarks that are slower than the baseline
+by more than a threshold (``--threshold``, default 20%) are reported as regressions,
+and the process exits with a non-zero exit code (e.g. to flag regressions per commit in CI).
+Comparison is based on the best (minimum) time of the repeated runs, which is least sensitive to noise.
+
+Use ``--quick`` for a fast smoke run at reduced scale
+(only compare results of runs at the same scale).
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import logging
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterator, List, NamedTuple, Optional
+
+import pandas as pd
+import requests_mock
+
+import openeo
+from openeo.extra.job_management import (
+    CsvJobDatabase,
+    MultiBackendJobManager,
+    ParquetJobDatabase,
+)
+from openeo.rest._testing import DummyBackend
+from openeo.rest.conversions import timeseries_json_to_pandas
+from openeo.testing.simulation import BackendSimulation
+from openeo.udf import UdfData, XarrayDataCube
+from openeo.udf.run_code import run_udf_code
+
+# Benchmark scripts in this folder (importable when running this script directly)
+import graph_traversal  # isort: skip
+import metadata_chain  # isort: skip
+
+
+class Benchmark(NamedTuple):
+    name: str
+    #: context manager factory, taking the "quick" flag and providing the function to time
+    setup: Callable[[bool], ContextManager[Callable[[], None]]]
+    #: default number of repeats (overriding the global default, e.g. for slow benchmarks)
+    repeat: Optional[int] = None
+
+
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, repeat: Optional[int] = None):
+    """
+    Decorator to register a benchmark: a generator function (taking the "quick" flag)
+    that does the setup, yields the function to time and cleans up afterwards.
+    """
+
+    def decorator(f):
+        _BENCHMARKS[name] = Benchmark(name=name, setup=contextlib.contextmanager(f), repeat=repeat)
+        return f
+
+    return decorator
+
+
+@contextlib.contextmanager
+def dummy_backend(url: str = "https://oeo.test") -> Iterator[DummyBackend]:
+    """Mocked back-end (without actual HTTP traffic)."""
+    with requests_mock.Mocker() as mocker:
+        backend = DummyBackend.at_url(url, requests_mock=mocker)
+        backend.setup_collection("S2", bands=[f"B{i:02d}" for i in range(1, 13)])
+        yield backend
+
+
+def _build_cube(connection: openeo.Connection, length: int) -> openeo.DataCube:
+    cube = connection.load_collection("S2", spatial_extent={"west": 3, "south": 51, "east": 4, "north": 52})
+    for i in range(length):
+        if i % 4 == 0:
+            cube = cube.filter_temporal("2024-01-01", f"2024-{i % 12 + 1:02d}-28")
+        elif i % 4 == 1:
+            cube = cube.apply(lambda x: x.absolute() * 2 + 1)
+        elif i % 4 == 2:
+            b4, b8 = cube.band("B04"), cube.band("B08")
+            cube = cube.merge_cubes(((b8 - b4) / (b8 + b4)).add_dimension("bands", "ndvi", type="bands"))
+        else:
+            cube = cube.filter_bands(["B04", "B08"] + (["ndvi"] if "ndvi" in cube.metadata.band_names else []))
+    return cube
+
+
+@benchmark("graph building")
+def bench_graph_building(quick: bool):
+    with dummy_backend() as backend:
+        length = 100 if quick else 1000
+        yield lambda: _build_cube(backend.connection, length=length)
+
+
+@benchmark("graph flattening")
+def bench_graph_flattening(quick: bool):
+    with dummy_backend() as backend:
+        cube = _build_cube(backend.connection, length=100 if quick else 1000)
+        yield cube.flat_graph
+
+
+@benchmark("to_json")
+def bench_to_json(quick: bool):
+    with dummy_backend() as backend:
+        cube = _build_cube(backend.connection, length=100 if quick else 1000)
+        yield cube.to_json
+
+
+@benchmark("deep graph traversal")
+def bench_deep_graph_traversal(quick: bool):
+    node = graph_traversal.build_chain(1000 if quick else 20000)
+    yield lambda: graph_traversal.ProcessGraphUnflattener.unflatten(node.flat_graph())
+
+
+@benchmark("metadata chain")
+def bench_metadata_chain(quick: bool):
+    metadata = metadata_chain.build_metadata(300)
+    length = 100 if quick else 1000
+    yield lambda: metadata_chain.chain(metadata, length=length)
+
+
+@benchmark("timeseries_json_to_pandas")
+def bench_timeseries_json_to_pandas(quick: bool):
+    dates = pd.date_range("2020-01-01", periods=100 if quick else 730, freq="D")
+    polygons = 20 if quick else 100
+    timeseries = {
+        d.strftime("%Y-%m-%dT%H:%M:%SZ"): [[p + i, p * 2.0, None, p / 3] for p in range(polygons)]
+        for i, d in enumerate(dates)
+    }
+    yield lambda: timeseries_json_to_pandas(timeseries)
+
+
+@benchmark("job manager loop", repeat=1)
+def bench_job_manager(quick: bool):
+    job_count = 200 if quick else 10_000
+    with dummy_backend() as backend, tempfile.TemporaryDirectory() as tmp:
+        backend.setup_simple_job_status_flow(queued=1, running=2)
+
+        def start_job(row, connection, **kwargs):
+            pg = {"add": {"process_id": "add", "arguments": {"x": int(row["i"]), "y": 1}, "result": True}}
+            return connection.create_job(pg)
+
+        def run():
+            manager = MultiBackendJobManager(poll_sleep=0, root_dir=tmp, download_results=False)
+            manager.add_backend("dummy", connection=backend.connection, parallel_jobs=20)
+            job_db = CsvJobDatabase(Path(tmp) / f"jobs-{time.time_ns()}.csv")
+            job_db.initialize_from_df(pd.DataFrame({"i": range(job_count)}))
+            manager.run_jobs(job_db=job_db, start_job=start_job)
+
+        yield run
+
+
+def _job_db_benchmark(db_class, suffix: str, quick: bool):
+    rows = 1000 if quick else 10_000
+    df = pd.DataFrame(
+        {
+            "id": [f"job-{i}" for i in range(rows)],
+            "status": "not_started",
+            "year": [2000 + i % 25 for i in range(rows)],
+            "geometry": ["POINT (1 2)"] * rows,
+        }
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def run():
+            job_db = db_class(Path(tmp) / f"jobs-{time.time_ns()}.{suffix}")
+            job_db.initialize_from_df(df)
+            for i in range(0, rows, rows // 20):
+                update = job_db.read().iloc[i : i + 10].copy()
+                update["status"] = "running"
+                job_db.persist(update)
+
+        yield run
+
+
+@benchmark("job db persist (CSV)")
+def bench_job_db_csv(quick: bool):
+    yield from _job_db_benchmark(CsvJobDatabase, "csv", quick=quick)
+
+
+@benchmark("job db persist (Parquet)")
+def bench_job_db_parquet(quick: bool):
+    yield from _job_db_benchmark(ParquetJobDatabase, "parquet", quick=quick)
+
+
+@benchmark("run_udf_code dispatch")
+def bench_run_udf_code(quick: bool):
+    import numpy
+    import xarray
+
+    code = "\n".join(
+        [
+            "import xarray",
+            "def apply_datacube(cube: xarray.DataArray, context: dict) -> xarray.DataArray:",
+            "    return cube * 2",
+        ]
+    )
+    array = xarray.DataArray(numpy.ones((2, 3, 16, 16)), dims=["t", "bands", "y", "x"])
+    calls = 20 if quick else 200
+
+    def run():
+        for _ in range(calls):
+            run_udf_code(code=code, data=UdfData(datacube_list=[XarrayDataCube(array)]))
+
+    yield run
+
+
+@benchmark("ranged download")
+def bench_ranged_download(quick: bool):
+    simulation = BackendSimulation(asset_size=(8 if quick else 128) * 1024 * 1024)
+    with simulation.serve() as url, tempfile.TemporaryDirectory() as tmp:
+        connection = openeo.connect(url)
+        job = connection.create_job({"add": {"process_id": "add", "arguments": {"x": 3, "y": 5}, "result": True}})
+        job.start()
+        asset = job.get_results().get_assets()[0]
+        yield lambda: asset.download(Path(tmp) / "result.data", range_size=8 * 1024 * 1024)
+
+
+@benchmark("import openeo", repeat=3)
+def bench_import(quick: bool):
+    yield lambda: subprocess.run([sys.executable, "-c", "import openeo"], check=True)
+
+
+class Result(NamedTuple):
+    times: List[float]
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+
+def run_benchmark(bench: Benchmark, *, quick: bool, repeat: int) -> Result:
+    times = []
+    with bench.setup(quick) as f:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            f()
+            times.append(time.perf_counter() - start)
+    return Result(times=times)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return (
+            subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=Path(__file__).parent
+            ).stdout.strip()
+            or None
+        )
+    except OSError:
+        return None
+
+
+def run(
+    names: List[str],
+    *,
+    quick: bool = False,
+    repeat: Optional[int] = None,
+    save: Optional[Path] = None,
+    compare: Optional[Path] = None,
+    threshold: float = 0.2,
+) -> bool:
+    """Run given benchmarks, optionally save and compare results. Returns true if no regressions were found."""
+    baseline = json.loads(compare.read_text(encoding="utf8")) if compare else None
+    if baseline and baseline["metadata"].get("quick") != quick:
+        print(f"WARNING: comparing with baseline of different scale (quick={baseline['metadata'].get('quick')})")
+    baseline_results = baseline["results"] if baseline else {}
+
+    header = f"{'benchmark':<28} {'best (s)':>10} {'median (s)':>11}"
+    if baseline:
+        header += f" {'baseline (s)':>13} {'change':>8}"
+    print(header)
+    results = {}
+    regressions = []
+    for name in names:
+        bench = _BENCHMARKS[name]
+        result = run_benchmark(bench, quick=quick, repeat=repeat or bench.repeat or (2 if quick else 5))
+        results[name] = {"best": result.best, "median": result.median, "times": result.times}
+        line = f"{name:<28} {result.best:>10.4f} {result.median:>11.4f}"
+        if name in baseline_results:
+            reference = baseline_results[name]["best"]
+            change = result.best / reference - 1
+            line += f" {reference:>13.4f} {change:>+8.1%}"
+            if change > threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line, flush=True)
+
+    if save:
+        metadata = {
+            "timestamp": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "openeo": openeo.client_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+        }
+        save.write_text(json.dumps({"metadata": metadata, "results": results}, indent=2), encoding="utf8")
+        print(f"Saved results to {save}")
+    if regressions:
+        print(f"Regressions (>{threshold:.0%} slower than baseline): {regressions}")
+    return not regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--list", action="store_true", help="List available benchmarks")
+    parser.add_argument("--filter", "-k", help="Only run benchmarks with name matching this regex")
+    parser.add_argument("--quick", action="store_true", help="Run at reduced scale (smoke test)")
+    parser.add_argument("--repeat", type=int, help="Number of repeats per benchmark")
+    parser.add_argument("--save", type=Path, help="Save results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Compare with baseline results from this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown to flag as regression")
+    arguments = parser.parse_args()
+    # Don't let warnings of the benchmark scenarios (e.g. about missing authentication) clutter the output
+    logging.basicConfig(level=logging.ERROR)
+
+    names = [n for n in _BENCHMARKS if not arguments.filter or re.search(arguments.filter, n)]
+    if arguments.list:
+        print("\n".join(names))
+        return
+    ok = run(
+        names,
+        quick=arguments.quick,
+        repeat=arguments.repeat,
+        save=arguments.save,
+        compare=arguments.compare,
+        threshold=arguments.threshold,
+    )
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
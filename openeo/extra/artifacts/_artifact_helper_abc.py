@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Mapping, Optional, Union
 
 from openeo.extra.artifacts._backend import ProviderConfig
 from openeo.extra.artifacts._config import ArtifactsStorageConfigABC
@@ -63,6 +63,32 @@ class ArtifactHelperABC(ABC):
 
         """
 
+    def upload_files(self, files: Union[Iterable[str | Path], Mapping[str | Path, str]]) -> List[StorageURI]:
+        """
+        Store multiple artifacts remotely.
+        Implementations can override this to transfer the files concurrently.
+
+        :param files: file paths to upload, or a mapping of file paths to the desired object names.
+
+        :return: list of StorageURIs, in the same order as the given files.
+
+        .. versionadded:: 0.52.0
+        """
+        items = files.items() if isinstance(files, Mapping) else ((path, "") for path in files)
+        return [self.upload_file(path, object_name) for path, object_name in items]
+
+    def get_presigned_urls(
+        self, storage_uris: Iterable[StorageURI], expires_in_seconds: int = 7 * 3600 * 24
+    ) -> List[str]:
+        """
+        Get signed https URLs for multiple StorageURIs (see :py:meth:`get_presigned_url`).
+
+        :return: list of signed URLs, in the same order as the given StorageURIs.
+
+        .. versionadded:: 0.52.0
+        """
+        return [self.get_presigned_url(uri, expires_in_seconds=expires_in_seconds) for uri in storage_uris]
+
     def __init__(self, config: ArtifactsStorageConfigABC):
         if not config.is_openeo_connection_metadata_loaded():
             raise RuntimeError("config should have openeo connection metadata loaded prior to initialization.")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import collections
 import datetime
-from typing import TYPE_CHECKING, Optional
+import logging
+import threading
+from typing import TYPE_CHECKING, Iterable, List, Mapping, Optional, Union
 
 if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
     from types_boto3_s3.client import S3Client
 
 from pathlib import Path
@@ -14,15 +18,20 @@ from openeo.extra.artifacts._s3sts.model import S3URI, AWSSTSCredentials
 from openeo.extra.artifacts._s3sts.sts import OpenEOSTSClient
 from openeo.rest.connection import Connection
 
+_log = logging.getLogger(__name__)
+
 
 class S3STSArtifactHelper(ArtifactHelperABC):
     # From what size will we switch to multi-part-upload
     MULTIPART_THRESHOLD_IN_MB = 50
+    # Refresh the STS credentials when they expire within this margin
+    CREDENTIALS_REFRESH_MARGIN = datetime.timedelta(minutes=15)
 
     def __init__(self, connection: Connection, config: S3STSConfig):
         super().__init__(config)
         self._connection = connection
         self.config = config
+        self._creds_lock = threading.Lock()
         self._creds = self.get_new_creds()
         self._s3: Optional[S3Client] = None
 
@@ -50,12 +59,40 @@ class S3STSArtifactHelper(ArtifactHelperABC):
             path = Path(path)
         return path.name
 
+    def _credentials_expire_soon(self) -> bool:
+        expiration = self._creds.expiration
+        if expiration.tzinfo is None:
+            expiration = expiration.replace(tzinfo=datetime.timezone.utc)
+        return expiration - datetime.datetime.now(tz=datetime.timezone.utc) < self.CREDENTIALS_REFRESH_MARGIN
+
     def _get_s3_client(self):
-        # TODO: validate whether credentials are still reasonably long valid
-        # and if not refresh credentials and rebuild client
-        if self._s3 is None:
-            self._s3 = self.config.build_client("s3", session_kwargs=self._creds.as_kwargs())
-        return self._s3
+        with self._creds_lock:
+            if self._credentials_expire_soon():
+                _log.info(f"Refreshing STS credentials (expiring at {self._creds.expiration})")
+                self._creds = self.get_new_creds()
+                # Rebuild client with the new credentials
+                self._s3 = None
+            if self._s3 is None:
+                self._s3 = self.config.build_client("s3", session_kwargs=self._creds.as_kwargs())
+            return self._s3
+
+    def _build_transfer_config(
+        self,
+        *,
+        multipart_threshold_mb: Optional[float] = None,
+        multipart_chunksize_mb: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> TransferConfig:
+        # Local import to avoid dependency
+        from boto3.s3.transfer import TransferConfig
+
+        mb = 1024**2
+        kwargs = {"multipart_threshold": int((multipart_threshold_mb or self.MULTIPART_THRESHOLD_IN_MB) * mb)}
+        if multipart_chunksize_mb:
+            kwargs["multipart_chunksize"] = int(multipart_chunksize_mb * mb)
+        if max_concurrency:
+            kwargs["max_concurrency"] = max_concurrency
+        return TransferConfig(**kwargs)
 
     def upload_file(self, path: str | Path, object_name: str = "") -> S3URI:
         """
@@ -66,16 +103,56 @@ class S3STSArtifactHelper(ArtifactHelperABC):
 
         :return: `S3URI` A S3URI that points to the uploaded file in the S3 compatible backend
         """
-        # Local import to avoid dependency
-        from boto3.s3.transfer import TransferConfig
-
-        mb = 1024**2
-        config = TransferConfig(multipart_threshold=self.MULTIPART_THRESHOLD_IN_MB * mb)
+        config = self._build_transfer_config()
         bucket = self.config.bucket
         key = self._get_upload_key(object_name or self.get_object_name_from_path(path))
         self._get_s3_client().upload_file(str(path), bucket, key, Config=config)
         return S3URI(bucket, key)
 
+    def upload_files(
+        self,
+        files: Union[Iterable[str | Path], Mapping[str | Path, str]],
+        *,
+        max_concurrency: int = 10,
+        multipart_threshold_mb: Optional[float] = None,
+        multipart_chunksize_mb: Optional[float] = None,
+    ) -> List[S3URI]:
+        """
+        Upload multiple files concurrently to a backend understanding the S3 API.
+        Large files are uploaded in parallel parts (multipart upload).
+
+        :param files: file paths to upload, or a mapping of file paths to the desired object names
+            (if omitted the filename is used).
+        :param max_concurrency: maximum number of concurrent transfers (files and parts of files).
+        :param multipart_threshold_mb: Optional size (in MB) from which files are uploaded with multipart upload.
+            Defaults to ``MULTIPART_THRESHOLD_IN_MB``.
+        :param multipart_chunksize_mb: Optional size (in MB) of the parts of a multipart upload.
+
+        :return: list of `S3URI`, in the same order as the given files.
+
+        .. versionadded:: 0.52.0
+        """
+        # Local import to avoid dependency
+        from boto3.s3.transfer import create_transfer_manager
+
+        items = list(files.items() if isinstance(files, Mapping) else ((path, "") for path in files))
+        bucket = self.config.bucket
+        uris = [S3URI(bucket, self._get_upload_key(name or self.get_object_name_from_path(p))) for p, name in items]
+        duplicates = [key for key, count in collections.Counter(u.key for u in uris).items() if count > 1]
+        if duplicates:
+            raise ValueError(f"Multiple files would be uploaded to the same key: {sorted(duplicates)}")
+
+        config = self._build_transfer_config(
+            multipart_threshold_mb=multipart_threshold_mb,
+            multipart_chunksize_mb=multipart_chunksize_mb,
+            max_concurrency=max_concurrency,
+        )
+        with create_transfer_manager(self._get_s3_client(), config) as manager:
+            futures = [manager.upload(str(path), uri.bucket, uri.key) for (path, _), uri in zip(items, uris)]
+            for future in futures:
+                future.result()
+        return uris
+
     def get_presigned_url(self, storage_uri: S3URI, expires_in_seconds: int = 7 * 3600 * 24) -> str:
         """
         Get a presigned URL to allow retrieval of an object.
@@ -85,13 +162,35 @@ class S3STSArtifactHelper(ArtifactHelperABC):
 
         :return: `str` A HTTP url that can be used to download a file. It also supports Range header in its requests.
         """
-        url = self._get_s3_client().generate_presigned_url(
-            "get_object",
-            Params={"Bucket": storage_uri.bucket, "Key": storage_uri.key, **self.get_extra_sign_arguments()},
-            ExpiresIn=expires_in_seconds,
-        )
+        return self.get_presigned_urls([storage_uri], expires_in_seconds=expires_in_seconds)[0]
+
+    def get_presigned_urls(
+        self, storage_uris: Iterable[S3URI], expires_in_seconds: int = 7 * 3600 * 24
+    ) -> List[str]:
+        """
+        Get presigned URLs for multiple objects (signed with the same credentials and client).
+
+        .. note::
+            Presigned URLs are signed with (temporary) STS credentials
+            and will stop working when these credentials expire, even if ``expires_in_seconds`` is longer.
+
+        :return: list of HTTP URLs, in the same order as the given storage URIs.
+
+        .. versionadded:: 0.52.0
+        """
+        s3 = self._get_s3_client()
+        extra = self.get_extra_sign_arguments()
         assert isinstance(self._config, S3STSConfig)
-        return self._config.add_trace_id_qp_if_needed(url)
+        return [
+            self._config.add_trace_id_qp_if_needed(
+                s3.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": uri.bucket, "Key": uri.key, **extra},
+                    ExpiresIn=expires_in_seconds,
+                )
+            )
+            for uri in storage_uris
+        ]
 
     def get_extra_sign_arguments(self) -> dict:
         extra_sign_args = {}
@@ -8,6 +8,7 @@ from openeo.extra.job_management._job_db import (
 )
 from openeo.extra.job_management._job_splitting import split_area
 from openeo.extra.job_management._manager import MultiBackendJobManager
+from openeo.extra.job_management._metrics import JobManagerMetrics
 from openeo.extra.job_management.process_based import ProcessBasedJobCreator
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "get_job_db",
     "split_area",
     "MultiBackendJobManager",
+    "JobManagerMetrics",
 ]
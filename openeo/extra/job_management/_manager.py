@@ -22,20 +22,26 @@ from typing import (
 
 import pandas as pd
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util import Retry
 
 # TODO avoid this (circular) dependency on _job_db?
 import openeo.extra.job_management._job_db
 from openeo import BatchJob, Connection
 from openeo.extra.job_management._interface import JobDatabaseInterface
+from openeo.extra.job_management._metrics import JobManagerMetrics
 from openeo.extra.job_management._thread_worker import (
+    _api_totals,
+    _ConnectionPool,
+    _JobDownloadTask,
     _JobManagerWorkerThreadPool,
     _JobStartTask,
-    _JobDownloadTask
+    _TaskResult,
 )
-from openeo.rest import OpenEoApiError
+from openeo.rest import OpenEoApiError, OpenEoApiPlainError
 from openeo.rest.auth.auth import BearerAuth
+from openeo.rest.job import _LogCursor
+from openeo.rest.models.logs import normalize_log_level
 from openeo.util import deep_get, rfc3339
 
 _log = logging.getLogger(__name__)
@@ -168,6 +174,23 @@ class MultiBackendJobManager:
         Optional temporal limit (in seconds) after which running jobs should be canceled
         by the job manager.
 
+    :param connection_pool_maxsize:
+        Maximum number of keep-alive HTTP connections to keep per backend
+        in the connections that are shared between the job manager's worker threads.
+
+    :param tail_logs:
+        Optional minimum log level (e.g. ``"warning"``) of job log entries to follow
+        while tracking the status of running jobs.
+        New log entries are fetched incrementally at each status poll
+        and emitted through the job manager's logger (at their own log level).
+
+    :param metrics_path:
+        Optional path of a file to dump the job manager metrics to in Prometheus text format
+        (e.g. to be picked up by the textfile collector of the Prometheus node exporter),
+        rewritten at each poll of :py:meth:`run_jobs`.
+        At the end of :py:meth:`run_jobs`, a final report (in JSON format) is written next to it
+        (same path, with ``.json`` suffix).
+        Also see :py:attr:`metrics` for other ways to inspect or export the metrics.
 
     .. versionadded:: 0.14.0
 
@@ -177,6 +200,9 @@ class MultiBackendJobManager:
     .. versionchanged:: 0.47.0
         Added ``download_results`` parameter.
 
+    .. versionchanged:: 0.52.0
+        Added ``connection_pool_maxsize``, ``tail_logs`` and ``metrics_path`` parameters.
+
     """
 
     # Expected columns in the job DB dataframes.
@@ -207,6 +233,9 @@ class MultiBackendJobManager:
         *,
         download_results: bool = True,
         cancel_running_job_after: Optional[int] = None,
+        connection_pool_maxsize: int = DEFAULT_POOLSIZE,
+        tail_logs: Union[str, int, None] = None,
+        metrics_path: Union[str, Path, None] = None,
     ):
         """Create a MultiBackendJobManager."""
         self._stop_thread = None
@@ -224,14 +253,23 @@ class MultiBackendJobManager:
         )
         self._thread = None
         self._worker_pool = None
+        # Connections (and their HTTP sessions) shared by the worker thread tasks
+        self._connection_pool = _ConnectionPool(pool_maxsize=connection_pool_maxsize)
         # Generic cache
         self._cache = {}
+        self._tail_logs = tail_logs
+        # Incremental log cursors per job (when tailing logs)
+        self._log_cursors: Dict[str, _LogCursor] = {}
+        #: Job lifecycle timings and per-backend throughput/latency metrics (:py:class:`JobManagerMetrics`).
+        self.metrics = JobManagerMetrics()
+        self._metrics_path = Path(metrics_path) if metrics_path else None
 
     def add_backend(
         self,
         name: str,
         connection: Union[Connection, Callable[[], Connection]],
         parallel_jobs: int = 2,
+        queueing_limit: int = 10,
     ):
         """
         Register a backend with a name and a :py:class:`Connection` getter.
@@ -248,6 +286,11 @@ class MultiBackendJobManager:
             Either a Connection to the backend, or a callable to create a backend connection.
         :param parallel_jobs:
             Maximum number of jobs to allow in parallel on a backend.
+        :param queueing_limit:
+            Maximum number of jobs to allow in queue on a backend.
+
+        .. versionchanged:: 0.52.0
+            Added ``queueing_limit`` parameter.
         """
 
         # TODO: Code might become simpler if we turn _Backend into class move this logic there.
@@ -257,8 +300,9 @@ class MultiBackendJobManager:
             c = connection
             connection = lambda: c
         assert callable(connection)
-        # TODO: expose queueing_limit?
-        self.backends[name] = _Backend(get_connection=connection, parallel_jobs=parallel_jobs, queueing_limit=10)
+        self.backends[name] = _Backend(
+            get_connection=connection, parallel_jobs=parallel_jobs, queueing_limit=queueing_limit
+        )
 
     def _get_connection(self, backend_name: str, resilient: bool = True) -> Connection:
         """Get a connection for the backend and optionally make it resilient (adds retry behavior)
@@ -281,19 +325,22 @@ class MultiBackendJobManager:
         connection = self.backends[backend_name].get_connection()
         # If we really need it we can skip making it resilient, but by default it should be resilient.
         if resilient:
-            self._make_resilient(connection)
+            self._make_resilient(connection, connection_pool=self._connection_pool)
 
         self._connections[backend_name] = connection
         return connection
 
     @staticmethod
-    def _make_resilient(connection):
+    def _make_resilient(connection, connection_pool: Optional[_ConnectionPool] = None):
         """Add an HTTPAdapter that retries the request if it fails.
 
         Retry for the following HTTP 50x statuses:
         502 Bad Gateway
         503 Service Unavailable
         504 Gateway Timeout
+
+        When a connection pool is given, its pool size settings are used for the adapter
+        and its usage is included in the connection pool stats.
         """
         # TODO: migrate this to now built-in retry configuration of `Connection` or `openeo.util.http.retry_adapter`?
         status_forcelist = [500, 502, 503, 504]
@@ -306,8 +353,11 @@ class MultiBackendJobManager:
             status_forcelist=status_forcelist,
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
         )
-        connection.session.mount("https://", HTTPAdapter(max_retries=retries))
-        connection.session.mount("http://", HTTPAdapter(max_retries=retries))
+        if connection_pool:
+            connection_pool.mount_adapter(session=connection.session, retry=retries)
+        else:
+            connection.session.mount("https://", HTTPAdapter(max_retries=retries))
+            connection.session.mount("http://", HTTPAdapter(max_retries=retries))
 
     @classmethod
     def _normalize_df(cls, df: pd.DataFrame) -> pd.DataFrame:
@@ -385,11 +435,14 @@ class MultiBackendJobManager:
 
                 # Show current stats and sleep
                 _log.info(f"Job status histogram: {job_db.count_by_status()}. Run stats: {dict(stats)}")
+                self._update_metrics(stats)
                 for _ in range(int(max(1, self.poll_sleep))):
                     time.sleep(1)
                     if self._stop_thread:
                         break
 
+            self._update_metrics(stats, final=True)
+
         self._thread = Thread(target=run_loop)
         self._thread.start()
 
@@ -527,6 +580,7 @@ class MultiBackendJobManager:
 
             # Show current stats and sleep
             _log.info(f"Job status histogram: {job_db.count_by_status()}. Run stats: {dict(stats)}")
+            self._update_metrics(stats)
             time.sleep(self.poll_sleep)
             stats["sleep"] += 1
 
@@ -535,6 +589,8 @@ class MultiBackendJobManager:
         self._worker_pool.shutdown()
         self._worker_pool = None
 
+        self._update_metrics(stats, final=True)
+
         return stats
 
     def _job_update_loop(
@@ -586,6 +642,8 @@ class MultiBackendJobManager:
         # TODO: move this back closer to the `_track_statuses` call above, once job done/error handling is also handled in threads?
         for job, row in jobs_done:
             self.on_job_done(job, row)
+            if not self._download_results:
+                self.metrics.job_download_skipped(job.job_id)
 
         for job, row in jobs_error:
             self.on_job_error(job, row)
@@ -593,6 +651,29 @@ class MultiBackendJobManager:
         for job, row in jobs_cancel:
             self.on_job_cancel(job, row)
 
+        stats.update(self._connection_stats())
+
+    def _update_metrics(self, stats: dict, *, final: bool = False):
+        """Update the metrics with the run stats, log a summary and dump them to file (if configured)."""
+        self.metrics.update_run_stats(stats)
+        _log.info(f"Job manager {'final ' if final else ''}metrics: {self.metrics}")
+        if self._metrics_path:
+            try:
+                self.metrics.write_prometheus(self._metrics_path)
+                if final:
+                    self.metrics.write_report(self._metrics_path.with_suffix(".json"))
+            except OSError as e:
+                _log.warning(f"Failed to write job manager metrics to {self._metrics_path}: {e!r}")
+
+    def _connection_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Connection related stats (connection reuse, request metrics, ...)
+        of the connections used by the job manager, both in main loop and worker threads.
+        """
+        stats = collections.Counter(self._connection_pool.stats())
+        for connection in self._connections.values():
+            stats.update(_api_totals(connection))
+        return dict(stats)
 
     def _launch_job(self, start_job, df, i, backend_name, stats: Optional[dict] = None):
         """Helper method for launching jobs
@@ -626,6 +707,7 @@ class MultiBackendJobManager:
             connection = self._get_connection(backend_name, resilient=True)
 
             stats["start_job call"] += 1
+            start = time.perf_counter()
             job = start_job(
                 row=row,
                 connection_provider=self._get_connection,
@@ -636,15 +718,18 @@ class MultiBackendJobManager:
             _log.warning(f"Failed to start job for {row.to_dict()}", exc_info=True)
             df.loc[i, "status"] = "start_failed"
             stats["start_job error"] += 1
+            self.metrics.job_launch_failed(backend=backend_name)
         else:
             df.loc[i, "start_time"] = rfc3339.now_utc()
             if job:
                 df.loc[i, "id"] = job.job_id
                 _log.info(f"Job created: {job.job_id}")
+                self.metrics.job_created(job.job_id, backend=backend_name, seconds=time.perf_counter() - start)
                 with ignore_connection_errors(context="get status"):
                     status = job.status()
                     stats["job get status"] += 1
                     df.loc[i, "status"] = status
+                    self.metrics.job_status(job.job_id, status)
                     if status == "created":
                         # start job if not yet done by callback
                         try:
@@ -656,16 +741,19 @@ class MultiBackendJobManager:
                                 bearer_token=job_con.auth.bearer if isinstance(job_con.auth, BearerAuth) else None,
                                 job_id=job.job_id,
                                 df_idx=i,
+                                connection_pool=self._connection_pool,
                             )
                             _log.info(f"Submitting task {task} to thread pool")
                             self._worker_pool.submit_task(task=task, pool_name="job_start")
 
                             stats["job_queued_for_start"] += 1
                             df.loc[i, "status"] = "queued_for_start"
+                            self.metrics.job_status(job.job_id, "queued_for_start")
                         except OpenEoApiError as e:
                             _log.info(f"Failed submitting task {task} to thread pool with error: {e}")
                             df.loc[i, "status"] = "queued_for_start_failed"
                             stats["job queued for start failed"] += 1
+                            self.metrics.job_status(job.job_id, "queued_for_start_failed")
             else:
                 # TODO: what is this "skipping" about actually?
                 df.loc[i, "status"] = "skipped"
@@ -709,6 +797,8 @@ class MultiBackendJobManager:
         # Collect update dicts
         updates: List[Dict[str, Any]] = []
         for res in results:
+            self._record_task_metrics(res)
+
             # Process database updates
             if res.db_update:
                 try:
@@ -741,6 +831,23 @@ class MultiBackendJobManager:
         job_db.persist(df_updates)
         stats["job_db persist"] = stats.get("job_db persist", 0) + 1
 
+    def _record_task_metrics(self, result: _TaskResult):
+        """Record the outcome of a worker thread task in the job manager metrics."""
+        # Invalid updates are handled (and logged) in `_process_threadworker_updates`
+        if isinstance(result.db_update, dict) and result.db_update.get("status"):
+            self.metrics.job_status(result.job_id, result.db_update["status"])
+        metrics = getattr(result, "metrics", None)
+        if not isinstance(metrics, dict):
+            return
+        if "start seconds" in metrics:
+            self.metrics.job_started(result.job_id, seconds=metrics["start seconds"])
+        if "download seconds" in metrics:
+            self.metrics.job_downloaded(
+                result.job_id, seconds=metrics["download seconds"], size=int(metrics.get("download bytes", 0))
+            )
+        if metrics.get("download errors"):
+            self.metrics.job_download_failed(result.job_id)
+
     def on_job_done(self, job: BatchJob, row):
         """
         Handles jobs that have finished. Can be overridden to provide custom behaviour.
@@ -765,6 +872,7 @@ class MultiBackendJobManager:
                 root_url=job_con.root_url,
                 bearer_token=job_con.auth.bearer if isinstance(job_con.auth, BearerAuth) else None,
                 download_dir=job_dir,
+                connection_pool=self._connection_pool,
             )
             _log.info(f"Submitting download task {task} to download thread pool")
             
@@ -902,6 +1010,10 @@ class MultiBackendJobManager:
                     self._cancel_prolonged_job(the_job, active.loc[i])
 
                 active.loc[i, "status"] = new_status
+                self.metrics.job_status(job_id, new_status, backend=backend_name)
+
+                if self._tail_logs is not None and new_status not in {"created", "queued", "queued_for_start"}:
+                    self._tail_job_logs(the_job, final=new_status not in {"running"}, stats=stats)
 
                 # TODO: there is well hidden coupling here with "cpu", "memory" and "duration" from `_normalize_df`
                 for key in job_metadata.get("usage", {}).keys():
@@ -920,6 +1032,23 @@ class MultiBackendJobManager:
 
         return jobs_done, jobs_error, jobs_cancel
 
+    def _tail_job_logs(self, job: BatchJob, *, final: bool, stats: dict):
+        """Emit the new log entries of a job (since the previous call) through the job manager's logger."""
+        if job.job_id not in self._log_cursors:
+            self._log_cursors[job.job_id] = _LogCursor(
+                connection=job.connection, path=f"/jobs/{job.job_id}/logs", level=self._tail_logs
+            )
+        cursor = self._log_cursors[job.job_id]
+        try:
+            for entry in cursor.fetch():
+                stats["job log entries"] += 1
+                _log.log(normalize_log_level(entry.level), f"Job {job.job_id!r} log: {entry.message}")
+        except (OpenEoApiError, OpenEoApiPlainError, requests.exceptions.ConnectionError) as e:
+            stats["job logs error"] += 1
+            _log.warning(f"Failed to fetch logs of job {job.job_id!r}: {e!r}")
+        if final:
+            del self._log_cursors[job.job_id]
+
 
 def _format_usage_stat(job_metadata: dict, field: str) -> str:
     value = deep_get(job_metadata, "usage", field, "value", default=0)
@@ -0,0 +1,437 @@
+"""
+Metrics of the job manager: job lifecycle timings, per-backend throughput and latency aggregates,
+with export in Prometheus text format and a final (JSON) report.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import datetime
+import http.server
+import json
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from openeo.util import rfc3339
+
+_log = logging.getLogger(__name__)
+
+# Final job statuses
+_DONE_STATUSES = {"finished", "error", "canceled", "start_failed", "queued_for_start_failed", "skipped"}
+
+# Descriptions of the durations (in seconds) that are measured, per backend.
+_DURATIONS = {
+    "create": "Duration of the `start_job` callback (job creation).",
+    "start_request": "Duration of the request to start a job.",
+    "queue_wait": "Time from job start request to running.",
+    "created_to_running": "Time from job creation to running.",
+    "run": "Time from running to finished, error or canceled.",
+    "turnaround": "Time from job creation to finished, error or canceled.",
+    "download": "Duration of the download of the job results.",
+}
+
+#: quantiles to report of the rolling duration windows
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _quantile(values: List[float], q: float) -> float:
+    """Quantile (with linear interpolation) of sorted values."""
+    if not values:
+        return math.nan
+    position = q * (len(values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class _Summary:
+    """Running count/sum/min/max of a measurement, with quantiles over a rolling window of recent samples."""
+
+    __slots__ = ("count", "sum", "min", "max", "window")
+
+    def __init__(self, window_size: int):
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.window: Deque[float] = collections.deque(maxlen=window_size)
+
+    def add(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.window.append(value)
+
+    def quantiles(self) -> Dict[float, float]:
+        values = sorted(self.window)
+        return {q: _quantile(values, q) for q in QUANTILES}
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            **{f"p{round(q * 100)}": v for q, v in self.quantiles().items() if self.count},
+        }
+
+
+class _Job:
+    """Lifecycle of a job as observed by the job manager."""
+
+    __slots__ = ("backend", "status", "timestamps")
+
+    def __init__(self, backend: str, status: Optional[str] = None):
+        self.backend = backend
+        self.status = status
+        # Time of (observed) transition to each status
+        self.timestamps: Dict[str, float] = {}
+
+
+class JobManagerMetrics:
+    """
+    Thread-safe collection of job manager metrics, to tune e.g. the ``parallel_jobs``
+    and ``queueing_limit`` settings of the backends based on actual data:
+
+    - per job: timestamps of the (observed) lifecycle transitions
+      (e.g. created, queued, running, finished), from which durations
+      like queue wait time and run duration are derived,
+    - per backend: event counters, duration summaries (count, mean, min, max and
+      quantiles over a rolling window of the most recent samples),
+      rolling throughput (jobs done per minute) and download throughput,
+    - the run stats of the job manager loop.
+
+    Note that status transitions are only observed when polling the job status,
+    so derived durations have the precision of the poll interval.
+
+    Metrics can be exported in Prometheus text format
+    (:py:meth:`to_prometheus`, :py:meth:`write_prometheus` or served over HTTP with :py:meth:`serve`)
+    and as a (JSON) report (:py:meth:`report`, :py:meth:`write_report`).
+
+    :param window_size: number of most recent samples per duration to compute quantiles from.
+    :param rate_window: time window (in seconds) to compute the rolling throughput over.
+
+    .. versionadded:: 0.52.0
+    """
+
+    def __init__(
+        self,
+        *,
+        window_size: int = 1000,
+        rate_window: float = 600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.window_size = window_size
+        self.rate_window = rate_window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._start = clock()
+        # Active jobs
+        self._jobs: Dict[str, _Job] = {}
+        # Backend of finished jobs (awaiting download of the results)
+        self._finished: Dict[str, str] = {}
+        self._counters: Dict[Tuple[str, str], int] = collections.Counter()
+        self._durations: Dict[Tuple[str, str], _Summary] = {}
+        self._done_times: Dict[str, Deque[float]] = collections.defaultdict(collections.deque)
+        self._download_bytes: Dict[str, int] = collections.Counter()
+        self._run_stats: Dict[str, Union[int, float]] = {}
+
+    def _observe(self, name: str, backend: str, value: float):
+        key = (name, backend)
+        if key not in self._durations:
+            self._durations[key] = _Summary(window_size=self.window_size)
+        self._durations[key].add(value)
+
+    def job_created(self, job_id: str, *, backend: str, seconds: float):
+        """Record the creation of a job (with the duration of the ``start_job`` callback)."""
+        with self._lock:
+            self._jobs[job_id] = _Job(backend=backend)
+            self._observe("create", backend, seconds)
+            self._transition(job_id, "created")
+
+    def job_launch_failed(self, *, backend: str):
+        """Record a failure to create a job."""
+        with self._lock:
+            self._counters["start_failed", backend] += 1
+
+    def job_status(self, job_id: str, status: str, *, backend: Optional[str] = None):
+        """
+        Record the (observed) status of a job.
+        Jobs that were not created in this session (e.g. when resuming from an existing job database)
+        are tracked from their first observation onwards.
+        """
+        with self._lock:
+            if job_id in self._jobs:
+                self._transition(job_id, status)
+            elif backend is not None:
+                # First observation: no transition time to derive durations from.
+                if status == "finished":
+                    self._finished[job_id] = backend
+                elif status not in _DONE_STATUSES:
+                    self._jobs[job_id] = _Job(backend=backend, status=status)
+
+    def job_started(self, job_id: str, *, seconds: float):
+        """Record the duration of the request to start a job."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                self._observe("start_request", job.backend, seconds)
+
+    def job_downloaded(self, job_id: str, *, seconds: float, size: int):
+        """Record the download of job results (duration and total size in bytes)."""
+        with self._lock:
+            backend = self._finished.pop(job_id, None)
+            if backend is not None:
+                self._observe("download", backend, seconds)
+                self._download_bytes[backend] += size
+                self._counters["downloaded", backend] += 1
+
+    def job_download_failed(self, job_id: str):
+        """Record a failure to download the results of a finished job."""
+        with self._lock:
+            backend = self._finished.pop(job_id, None)
+            if backend is not None:
+                self._counters["download_failed", backend] += 1
+
+    def job_download_skipped(self, job_id: str):
+        """Record that the results of a finished job will not be downloaded."""
+        with self._lock:
+            self._finished.pop(job_id, None)
+
+    def _transition(self, job_id: str, status: str):
+        job = self._jobs[job_id]
+        if status == job.status:
+            return
+        if status in {"created", "queued", "queued_for_start"} and "running" in job.timestamps:
+            # Outdated status (e.g. from a worker thread result that was processed late)
+            return
+        now = self._clock()
+        job.status = status
+        job.timestamps.setdefault(status, now)
+        self._counters[status, job.backend] += 1
+        timestamps = job.timestamps
+
+        if status == "running":
+            requested = timestamps.get("queued_for_start", timestamps.get("queued"))
+            if requested is not None:
+                self._observe("queue_wait", job.backend, now - requested)
+            if "created" in timestamps:
+                self._observe("created_to_running", job.backend, now - timestamps["created"])
+        elif status in _DONE_STATUSES:
+            if "running" in timestamps:
+                self._observe("run", job.backend, now - timestamps["running"])
+            if "created" in timestamps:
+                self._observe("turnaround", job.backend, now - timestamps["created"])
+            if status in {"finished", "error", "canceled"}:
+                self._done_times[job.backend].append(now)
+            del self._jobs[job_id]
+            if status == "finished":
+                # Keep track of the backend for the download of the results
+                self._finished[job_id] = job.backend
+
+    def update_run_stats(self, stats: Mapping[str, Union[int, float]]):
+        """Update the (snapshot of the) run stats of the job manager loop."""
+        with self._lock:
+            self._run_stats = dict(stats)
+
+    def _throughput(self, backend: str, now: float) -> float:
+        """Number of jobs done per minute over the rolling rate window."""
+        done = self._done_times[backend]
+        while done and done[0] < now - self.rate_window:
+            done.popleft()
+        window = min(self.rate_window, now - self._start)
+        return 60 * len(done) / window if window > 0 else 0.0
+
+    def _backends(self) -> List[str]:
+        backends = {b for (_, b) in self._counters} | {b for (_, b) in self._durations}
+        return sorted(backends | {j.backend for j in self._jobs.values()})
+
+    def report(self) -> dict:
+        """Report (as JSON-serializable dictionary) of the metrics, per backend."""
+        with self._lock:
+            now = self._clock()
+            backends = {}
+            for backend in self._backends():
+                download = self._durations.get(("download", backend))
+                download_bytes = self._download_bytes[backend]
+                backends[backend] = {
+                    "events": {e: n for (e, b), n in sorted(self._counters.items()) if b == backend},
+                    "active": dict(collections.Counter(j.status for j in self._jobs.values() if j.backend == backend)),
+                    "throughput_per_minute": self._throughput(backend, now),
+                    "durations": {
+                        name: self._durations[name, backend].to_dict()
+                        for name in _DURATIONS
+                        if (name, backend) in self._durations
+                    },
+                    "download_bytes": download_bytes,
+                    "download_bytes_per_second": (
+                        download_bytes / download.sum if download is not None and download.sum > 0 else None
+                    ),
+                }
+            return {
+                "start_time": rfc3339.datetime(datetime.datetime.fromtimestamp(self._start, tz=datetime.timezone.utc)),
+                "elapsed": now - self._start,
+                "backends": backends,
+                "run_stats": dict(self._run_stats),
+            }
+
+    def write_report(self, path: Union[str, Path]):
+        """Write the report (:py:meth:`report`) to a JSON file."""
+        _atomic_write(Path(path), json.dumps(self.report(), indent=2))
+
+    def to_prometheus(self, prefix: str = "openeo_job_manager") -> str:
+        """Metrics in Prometheus text exposition format."""
+        report = self.report()
+        lines = []
+
+        def metric(name: str, kind: str, help: str, samples: List[Tuple[str, Dict[str, str], float]]):
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{prefix}_{name}{suffix}{_labels(labels)} {_value(value)}")
+
+        backends = report["backends"]
+        metric(
+            "job_events_total",
+            "counter",
+            "Number of (observed) job status transitions and other job events.",
+            [("", {"backend": b, "event": e}, n) for b, r in backends.items() for e, n in r["events"].items()],
+        )
+        metric(
+            "jobs_active",
+            "gauge",
+            "Number of active jobs per status.",
+            [("", {"backend": b, "status": s}, n) for b, r in backends.items() for s, n in r["active"].items()],
+        )
+        metric(
+            "throughput_jobs_per_minute",
+            "gauge",
+            f"Number of jobs done per minute, over the last {self.rate_window:g} seconds.",
+            [("", {"backend": b}, r["throughput_per_minute"]) for b, r in backends.items()],
+        )
+        metric(
+            "download_bytes_total",
+            "counter",
+            "Total size of downloaded job results.",
+            [("", {"backend": b}, r["download_bytes"]) for b, r in backends.items()],
+        )
+        with self._lock:
+            durations = {k: (s.count, s.sum, s.quantiles()) for k, s in self._durations.items()}
+        for name, help in _DURATIONS.items():
+            samples = []
+            for backend in backends:
+                if (name, backend) not in durations:
+                    continue
+                count, total, quantiles = durations[name, backend]
+                samples.extend(("", {"backend": backend, "quantile": f"{q:g}"}, v) for q, v in quantiles.items())
+                samples.append(("_sum", {"backend": backend}, total))
+                samples.append(("_count", {"backend": backend}, count))
+            if samples:
+                metric(f"job_{name}_seconds", "summary", help, samples)
+        metric(
+            "run_stats",
+            "gauge",
+            "Run stats of the job manager loop.",
+            [("", {"stat": k}, v) for k, v in sorted(report["run_stats"].items())],
+        )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Union[str, Path]):
+        """
+        Write the metrics in Prometheus text format to a file
+        (e.g. to be picked up by the textfile collector of the Prometheus node exporter).
+        """
+        _atomic_write(Path(path), self.to_prometheus())
+
+    @contextlib.contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """
+        Context manager to serve the metrics in Prometheus text format
+        over HTTP (in a background thread), e.g. while running the job manager:
+
+        .. code-block:: python
+
+            with manager.metrics.serve(port=9100) as url:
+                manager.run_jobs(...)
+
+        :param host: host to bind to.
+        :param port: port to bind to (0 to pick a free one).
+        :return: URL of the metrics endpoint.
+        """
+        metrics = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                _log.debug(f"Metrics endpoint: {format % args}")
+
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://{server.server_address[0]}:{server.server_address[1]}/metrics"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def __str__(self) -> str:
+        report = self.report()
+        parts = []
+        for backend, r in report["backends"].items():
+            run = r["durations"].get("run", {})
+            queue_wait = r["durations"].get("queue_wait", {})
+            parts.append(
+                f"{backend}: {r['events'].get('finished', 0)} finished, {r['events'].get('error', 0)} failed,"
+                f" {r['throughput_per_minute']:.2f} jobs/min, queue wait p50 {_fmt(queue_wait.get('p50'))},"
+                f" run p50 {_fmt(run.get('p50'))}"
+            )
+        return "; ".join(parts) or "no jobs"
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = ((k, str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')) for k, v in labels.items())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _value(value: Optional[float]) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NaN"
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def _fmt(seconds: Optional[float]) -> str:
+    return "n/a" if seconds is None else f"{seconds:.1f}s"
+
+
+def _atomic_write(path: Path, content: str):
+    """Write to a temporary file and rename, so readers never see a partially written file."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
@@ -2,18 +2,28 @@
 Internal utilities to handle job management tasks through threads.
 """
 
+import collections
 import concurrent.futures
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 from pathlib import Path
 
 import json
+import requests
+import requests.adapters
 import urllib3.util
 
 import openeo
-from openeo.utils.http import HTTP_429_TOO_MANY_REQUESTS, retry_configuration
+from openeo.utils.http import (
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTPAdapterWithStats,
+    _to_retry,
+    retry_configuration,
+)
 
 _log = logging.getLogger(__name__)
 
@@ -37,12 +47,17 @@ class _TaskResult:
     :param stats_update:
         Optional dictionary capturing statistical counters or metrics,
         e.g., number of successful starts or errors. Defaults to an empty dict.
+
+    :param metrics:
+        Optional dictionary with measurements (e.g. durations in seconds, sizes in bytes)
+        to record in the job manager metrics. Defaults to an empty dict.
     """
 
     job_id: str  # Mandatory
     df_idx: int  # Mandatory
     db_update: Dict[str, Any] = field(default_factory=dict)  # Optional
     stats_update: Dict[str, int] = field(default_factory=dict)  # Optional
+    metrics: Dict[str, float] = field(default_factory=dict)  # Optional
 
 
 @dataclass(frozen=True)
@@ -76,6 +91,133 @@ class Task(ABC):
         pass
 
 
+def _retry_key(retry: Union[urllib3.util.Retry, dict, bool, None]) -> Hashable:
+    """Build hashable key from a retry specification, to be used as cache key."""
+    if isinstance(retry, urllib3.util.Retry):
+        return (
+            "Retry",
+            retry.total,
+            retry.backoff_factor,
+            frozenset(retry.status_forcelist or []),
+            frozenset(retry.allowed_methods) if retry.allowed_methods else None,
+        )
+    elif isinstance(retry, dict):
+        return ("dict", json.dumps(retry, sort_keys=True, default=repr))
+    return retry
+
+
+def _api_totals(connection: openeo.Connection) -> Dict[str, Union[int, float]]:
+    """Request metrics totals of a connection, with "api" prefix to use in job manager stats."""
+    return {f"api {k}": v for k, v in connection.stats().items() if k != "endpoints"}
+
+
+class _ConnectionPool:
+    """
+    Thread-safe cache of (authenticated) connections, keyed on root URL, bearer token and retry settings,
+    to share HTTP sessions between tasks:
+    keep-alive connections (avoiding repeated TCP/TLS handshakes),
+    version discovery and the capabilities cache are reused instead of being redone for each task.
+
+    Least recently used connections are evicted (and their session closed)
+    when the number of cached connections exceeds ``max_connections``,
+    e.g. because of bearer token refreshes.
+
+    :param pool_connections: number of urllib3 connection pools (one per host) per session.
+    :param pool_maxsize: maximum number of keep-alive connections per host per session.
+        Should be at least the number of worker threads using the same connection.
+    :param max_connections: maximum number of connections to keep.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = requests.adapters.DEFAULT_POOLSIZE,
+        pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+        max_connections: int = 16,
+    ):
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+        self._connections: "collections.OrderedDict[Hashable, openeo.Connection]" = collections.OrderedDict()
+        self._adapters: List[HTTPAdapterWithStats] = []
+        self._stats = collections.Counter()
+
+    def mount_adapter(
+        self, session: requests.Session, retry: Union[urllib3.util.Retry, dict, bool, None] = None
+    ) -> HTTPAdapterWithStats:
+        """
+        Mount an HTTP adapter (with the pool size settings of this connection pool) on given session,
+        and include it in the pool saturation stats.
+        """
+        adapter = HTTPAdapterWithStats(
+            max_retries=_to_retry(retry) if retry is not False else 0,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        with self._lock:
+            self._adapters.append(adapter)
+        return adapter
+
+    def get_connection(
+        self,
+        root_url: str,
+        *,
+        bearer_token: Optional[str] = None,
+        retry: Union[urllib3.util.Retry, dict, bool, None] = None,
+    ) -> openeo.Connection:
+        """Get a cached connection, or create (and cache) a new one."""
+        key = (root_url, bearer_token, _retry_key(retry))
+        with self._lock:
+            if key in self._connections:
+                self._connections.move_to_end(key)
+                self._stats["connection pool reuse"] += 1
+                return self._connections[key]
+
+        # Build new connection outside the lock, to avoid blocking other threads during version discovery.
+        session = requests.Session()
+        adapter = self.mount_adapter(session=session, retry=retry)
+        connection = openeo.connect(root_url, session=session)
+        if bearer_token:
+            connection.authenticate_bearer_token(bearer_token)
+
+        evicted = []
+        with self._lock:
+            if key in self._connections:
+                # Another thread was faster: discard ours.
+                evicted.append(connection)
+                self._adapters.remove(adapter)
+                connection = self._connections[key]
+                self._stats["connection pool reuse"] += 1
+            else:
+                self._connections[key] = connection
+                self._stats["connection pool create"] += 1
+                while len(self._connections) > self._max_connections:
+                    _, old = self._connections.popitem(last=False)
+                    evicted.append(old)
+                    self._stats["connection pool evict"] += 1
+                    # Preserve request metrics of evicted connections
+                    self._stats.update(_api_totals(old))
+        for old in evicted:
+            old.session.close()
+        return connection
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of connection reuse, HTTP pool saturation and request metrics counters."""
+        with self._lock:
+            stats = collections.Counter(self._stats)
+            for connection in self._connections.values():
+                stats.update(_api_totals(connection))
+            for adapter in self._adapters:
+                adapter_stats = adapter.stats()
+                stats["http requests"] += adapter_stats.get("requests", 0)
+                stats["http pool saturated"] += adapter_stats.get("pool saturated", 0)
+                stats["http max in flight"] = max(stats["http max in flight"], adapter_stats.get("max in flight", 0))
+        return dict(stats)
+
+
 @dataclass(frozen=True)
 class ConnectedTask(Task):
     """
@@ -90,12 +232,19 @@ class ConnectedTask(Task):
     :param bearer_token:
         Optional Bearer token used for authentication.
 
+    :param connection_pool:
+        Optional (shared) connection pool to get the connection from,
+        instead of setting up a new connection for each task.
+
     """
 
     root_url: str
     bearer_token: Optional[str] = field(default=None, repr=False)
+    connection_pool: Optional[_ConnectionPool] = field(default=None, repr=False, compare=False)
 
     def get_connection(self, retry: Union[urllib3.util.Retry, dict, bool, None] = None) -> openeo.Connection:
+        if self.connection_pool is not None:
+            return self.connection_pool.get_connection(self.root_url, bearer_token=self.bearer_token, retry=retry)
         connection = openeo.connect(self.root_url, retry=retry)
         if self.bearer_token:
             connection.authenticate_bearer_token(self.bearer_token)
@@ -124,13 +273,16 @@ class _JobStartTask(ConnectedTask):
             )
             job = self.get_connection(retry=retry).job(self.job_id)
             # TODO: only start when status is "queued"?
+            start = time.perf_counter()
             job.start()
+            seconds = time.perf_counter() - start
             _log.info(f"Job {self.job_id!r} started successfully")
             return _TaskResult(
                 job_id=self.job_id,
                 df_idx=self.df_idx,
                 db_update={"status": "queued"},
                 stats_update={"job start": 1},
+                metrics={"start seconds": seconds},
             )
         except Exception as e:
             _log.error(f"Failed to start job {self.job_id!r}: {e!r}")
@@ -161,7 +313,10 @@ class _JobDownloadTask(ConnectedTask):
             file_count = len(job.get_results().get_assets())
             
             # Download results
-            job.get_results().download_files(target=self.download_dir)
+            start = time.perf_counter()
+            downloaded = job.get_results().download_files(target=self.download_dir)
+            seconds = time.perf_counter() - start
+            size = sum(Path(p).stat().st_size for p in downloaded)
 
             # Download metadata
             job_metadata = job.describe()
@@ -175,6 +330,7 @@ class _JobDownloadTask(ConnectedTask):
                 df_idx=self.df_idx,
                 db_update={}, #TODO consider db updates?
                 stats_update={"job download": 1, "files downloaded": file_count},
+                metrics={"download seconds": seconds, "download bytes": size},
             )
         except Exception as e:
             _log.error(f"Failed to download results for job {self.job_id!r}: {e!r}")
@@ -183,6 +339,7 @@ class _JobDownloadTask(ConnectedTask):
                 df_idx=self.df_idx,
                 db_update={},
                 stats_update={"job download error": 1, "files downloaded": 0},
+                metrics={"download errors": 1},
             )
         
 class _TaskThreadPool:
@@ -1,6 +1,7 @@
+import json
 import logging
 import re
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy
 import pandas as pd
@@ -9,6 +10,9 @@ import shapely.geometry.base
 import shapely.wkt
 
 from openeo import BatchJob, Connection
+from openeo.internal.graph_building import PGNode
+from openeo.internal.graph_template import JsonTemplate
+from openeo.internal.json_encoding import prepare_request_body
 from openeo.internal.processes.parse import (
     Parameter,
     Process,
@@ -57,6 +61,13 @@ class ProcessBasedJobCreator:
     -   Finally if no (default) value can be determined and the parameter
         is not flagged as optional, an error will be raised.
 
+    To keep mass job creation cheap, process definitions (remote ones as well as user-defined processes)
+    are only fetched once,
+    and the job creation request is built and JSON-encoded once (per backend and set of arguments)
+    as a template, in which the argument values of each row are filled in.
+    Preflight validation (if enabled) is done for each job,
+    relying on the connection's validation cache to skip identical process graphs.
+
 
     :param process_id: (optional) openEO process identifier.
         Can be omitted when working with a remote process definition
@@ -73,6 +84,9 @@ class ProcessBasedJobCreator:
 
     .. versionadded:: 0.33.0
 
+    .. versionchanged:: 0.52.0
+        Cache user-defined process definitions and job creation request templates.
+
     .. warning::
         This is an experimental API subject to change,
         and we greatly welcome
@@ -95,6 +109,8 @@ class ProcessBasedJobCreator:
         self._parameter_defaults = parameter_defaults or {}
         self._parameter_column_map = parameter_column_map
         self._cache = LazyLoadCache()
+        # Job creation request templates, per backend and argument names.
+        self._templates: Dict[Tuple[str, Tuple[str, ...]], _JobCreationTemplate] = {}
 
     def _get_process_definition(self, connection: Connection) -> Process:
         if isinstance(self._namespace, str) and re.match("https?://", self._namespace):
@@ -105,8 +121,10 @@ class ProcessBasedJobCreator:
             )
         elif self._namespace is None:
             # Handling of a user-specific UDP
-            udp_raw = connection.user_defined_process(self._process_id).describe()
-            return Process.from_dict(udp_raw)
+            return self._cache.get(
+                key=("user_defined_process", connection.root_url, self._process_id),
+                load=lambda: Process.from_dict(connection.user_defined_process(self._process_id).describe()),
+            )
         else:
             raise NotImplementedError(
                 f"Unsupported process definition source udp_id={self._process_id!r} namespace={self._namespace!r}"
@@ -160,13 +178,24 @@ class ProcessBasedJobCreator:
 
             arguments[param_name] = value
 
-        cube = connection.datacube_from_process(process_id=process_id, namespace=self._namespace, **arguments)
-
         title = row.get("title", f"Process {process_id!r} with {repr_truncate(arguments)}")
         description = row.get("description", f"Process {process_id!r} (namespace {self._namespace}) with {arguments}")
-        job = connection.create_job(cube, title=title, description=description)
 
-        return job
+        template_key = (connection.root_url, tuple(arguments.keys()))
+        if template_key not in self._templates:
+            self._templates[template_key] = _JobCreationTemplate(
+                connection=connection, process_id=process_id, namespace=self._namespace, argument_names=arguments.keys()
+            )
+        template = self._templates[template_key]
+        try:
+            body = template.render(arguments=arguments, title=title, description=description)
+        except (TypeError, ValueError) as e:
+            # Values that can not be handled as plain JSON (e.g. graph building objects): take the full route.
+            _log.debug(f"Falling back on building full process graph for job creation: {e!r}")
+            cube = connection.datacube_from_process(process_id=process_id, namespace=self._namespace, **arguments)
+            return connection.create_job(cube, title=title, description=description)
+
+        return template.create_job(connection=connection, body=body)
 
     def __call__(self, *arg, **kwargs) -> BatchJob:
         """Syntactic sugar for calling :py:meth:`start_job`."""
@@ -194,3 +223,36 @@ class ProcessBasedJobCreator:
                 )
         _log.debug(f"Guessed parameter-column map: {parameter_column_map}")
         return parameter_column_map
+
+
+class _JobCreationTemplate:
+    """
+    Template of the job creation request (process graph with metadata)
+    for a single (parameterized) process call, with slots for the argument values, title and description.
+    """
+
+    def __init__(self, connection: Connection, process_id: str, namespace: Optional[str], argument_names):
+        argument_names = list(argument_names)
+        self._template = JsonTemplate(
+            lambda slot: connection._build_request_with_process_graph(
+                process_graph=PGNode(
+                    process_id=process_id,
+                    namespace=namespace,
+                    arguments={name: slot(f"argument:{name}") for name in argument_names},
+                ),
+                title=slot("title"),
+                description=slot("description"),
+            )
+        )
+
+    def render(self, arguments: dict, title: str, description: str) -> str:
+        values = {f"argument:{k}": v for k, v in arguments.items()}
+        values.update(title=title, description=description)
+        return self._template.render(values)
+
+    def create_job(self, connection: Connection, body: str) -> BatchJob:
+        if connection._preflight_validation_enabled():
+            # Only decode the (potentially large) body when it is actually validated
+            connection._preflight_validation(pg_with_metadata=json.loads(body), validate=True)
+        data, headers = prepare_request_body(body.encode("utf8"), compress_threshold=connection._compress_threshold)
+        return connection._post_job(data=data, headers=headers)
@@ -1,7 +1,10 @@
+import collections
 import concurrent.futures
 import datetime
 import logging
-from typing import Iterable, List, Optional, Union
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Union
 
 import geopandas as gpd
 import numpy as np
@@ -10,8 +13,10 @@ import pystac
 import pystac_client
 import requests
 from shapely.geometry import mapping, shape
+from urllib3.util import Retry
 
 from openeo.extra.job_management import JobDatabaseInterface, MultiBackendJobManager
+from openeo.utils.http import session_with_retries
 
 _log = logging.getLogger(__name__)
 
@@ -32,6 +37,9 @@ class STACAPIJobDatabase(JobDatabaseInterface):
         auth: Optional[requests.auth.AuthBase] = None,
         has_geometry: bool = False,
         geometry_column: str = "geometry",
+        *,
+        max_workers: int = 4,
+        status_sync_interval: Optional[float] = 15 * 60,
     ):
         """
         Initialize the STACAPIJobDatabase.
@@ -41,6 +49,16 @@ class STACAPIJobDatabase(JobDatabaseInterface):
         :param auth: requests AuthBase that will be used to authenticate, e.g. OAuth2ResourceOwnerPasswordCredentials
         :param has_geometry: Whether the job metadata supports any geometry that implements __geo_interface__.
         :param geometry_column: The name of the geometry column in the job metadata that implements __geo_interface__.
+        :param max_workers: maximum number of concurrent bulk ingest requests
+            (which share a pooled HTTP session).
+        :param status_sync_interval: maximum age (in seconds) of the local mirror of item statuses
+            (used by :py:meth:`count_by_status`) before it is fully resynced from the STAC API,
+            to pick up changes from other writers.
+            The mirror is always updated directly on :py:meth:`persist`.
+            Use ``None`` to never resync and ``0`` to disable the mirror (query the STAC API on each call).
+
+        .. versionchanged:: 0.52.0
+            Added ``max_workers`` and ``status_sync_interval`` arguments.
         """
         self.collection_id = collection_id
         self.client = pystac_client.Client.open(stac_root_url)
@@ -50,6 +68,20 @@ class STACAPIJobDatabase(JobDatabaseInterface):
         self.geometry_column = geometry_column
         self.base_url = stac_root_url
         self.bulk_size = 500
+        self.max_workers = max_workers
+
+        # Bulk upserts are idempotent, so it's safe to also retry POST requests.
+        self._session = session_with_retries(
+            retry={"allowed_methods": Retry.DEFAULT_ALLOWED_METHODS | {"POST"}},
+            pool_maxsize=max(max_workers, requests.adapters.DEFAULT_POOLSIZE),
+        )
+        self._session.auth = auth
+
+        # Local mirror of item statuses (item id -> status).
+        self._status_sync_interval = status_sync_interval
+        self._status_lock = threading.Lock()
+        self._statuses: Optional[Dict[str, str]] = None
+        self._statuses_synced: float = 0
 
     def exists(self) -> bool:
         return any(c.id == self.collection_id for c in self.client.get_collections())
@@ -155,15 +187,86 @@ class STACAPIJobDatabase(JobDatabaseInterface):
             item.bbox = None
         return item
 
+    def _item_dicts_from_df(self, df: pd.DataFrame) -> List[dict]:
+        """
+        Convert a dataframe to STAC Item dictionaries (to be ingested in the job database collection).
+        Equivalent to :py:meth:`item_from` on each row (with collection link added),
+        but without the (costly) round trip through :py:class:`pystac.Item` objects.
+        """
+        if df.empty:
+            return []
+        properties = df.drop(columns=["item_id"]).to_dict(orient="records")
+
+        now = pystac.utils.datetime_to_str(datetime.datetime.now(tz=datetime.timezone.utc))
+        if "datetime" in df.columns:
+            # Normalize each distinct value only once (jobs typically share a limited set of dates).
+            normalized = {}
+            datetimes = []
+            for value in df["datetime"]:
+                if value is None or pd.isna(value):
+                    datetimes.append(now)
+                else:
+                    if value not in normalized:
+                        normalized[value] = _normalize_datetime(value)
+                    datetimes.append(normalized[value])
+        else:
+            datetimes = [now] * len(df)
+
+        if self.has_geometry:
+            geometries = df[self.geometry_column].to_list()
+        else:
+            geometries = [None] * len(df)
+
+        stac_version = pystac.get_stac_version()
+        items = []
+        for item_id, props, dt, geometry in zip(df["item_id"], properties, datetimes, geometries):
+            props["datetime"] = dt
+            item = {
+                "type": "Feature",
+                "stac_version": stac_version,
+                "stac_extensions": [],
+                "id": item_id,
+                "geometry": geometry,
+                "properties": props,
+                "links": [{"rel": pystac.RelType.COLLECTION.value, "href": self.collection_id}],
+                "assets": {},
+                "collection": self.collection_id,
+            }
+            if geometry:
+                item["bbox"] = list(shape(geometry).bounds)
+            items.append(item)
+        return items
+
+    def _sync_statuses(self) -> Dict[str, str]:
+        """Get local mirror of item statuses, (re)syncing it from the STAC API when necessary."""
+        with self._status_lock:
+            if (
+                self._statuses is None
+                or self._status_sync_interval == 0
+                or (
+                    self._status_sync_interval is not None
+                    and time.time() - self._statuses_synced > self._status_sync_interval
+                )
+            ):
+                df = self.get_by_status(statuses=[])
+                self._statuses = dict(zip(df["item_id"], df["status"]))
+                self._statuses_synced = time.time()
+            return self._statuses
+
+    def _update_statuses(self, df: pd.DataFrame):
+        """Update local mirror of item statuses with given (persisted) dataframe."""
+        with self._status_lock:
+            if self._statuses is not None and "status" in df.columns:
+                self._statuses.update(zip(df["item_id"], df["status"]))
+
     def count_by_status(self, statuses: Iterable[str] = ()) -> dict:
         if isinstance(statuses, str):
             statuses = {statuses}
         statuses = set(statuses)
-        items = self.get_by_status(statuses)
-        if items is None:
-            return {k: 0 for k in statuses}
-        else:
-            return items["status"].value_counts().to_dict()
+        counts = collections.Counter(self._sync_statuses().values())
+        if statuses:
+            return {k: v for k, v in counts.items() if k in statuses}
+        return dict(counts)
 
     def _search_result_to_df(self, search_result: pystac_client.ItemSearch) -> pd.DataFrame:
         """Build a DataFrame from a STAC ItemSearch result."""
@@ -208,56 +311,32 @@ class STACAPIJobDatabase(JobDatabaseInterface):
             c = pystac.Collection(id=self.collection_id, description="STAC API job database collection.", extent=extent)
             self._create_collection(c)
 
-        all_items = []
-        if not df.empty:
-
-            def handle_row(series):
-                item = self.item_from(series)
-                all_items.append(item)
-
-            df.apply(handle_row, axis=1)
-
-        self._upload_items_bulk(self.collection_id, all_items)
-
-    def _prepare_item(self, item: pystac.Item, collection_id: str):
-        item.collection_id = collection_id
-
-        if not item.get_links(pystac.RelType.COLLECTION):
-            item.add_link(pystac.Link(rel=pystac.RelType.COLLECTION, target=item.collection_id))
-
-    def _ingest_bulk(self, items: List[pystac.Item]) -> dict:
-        collection_id = items[0].collection_id
-        if not all(i.collection_id == collection_id for i in items):
-            raise Exception("All collection IDs should be identical for bulk ingests")
+        self._upload_items_bulk(self.collection_id, self._item_dicts_from_df(df))
+        self._update_statuses(df)
 
+    def _ingest_bulk(self, collection_id: str, items: List[dict]) -> dict:
         # TODO: this "bulk_items" endpoint is from obscure "bulk transactions" extension?
         url_path = f"collections/{collection_id}/bulk_items"
-        data = {"method": "upsert", "items": {item.id: item.to_dict() for item in items}}
-        response = requests.post(url=self.join_url(url_path), auth=self._auth, json=data)
+        data = {"method": "upsert", "items": {item["id"]: item for item in items}}
+        response = self._session.post(url=self.join_url(url_path), json=data)
 
-        _log.info(f"HTTP response: {response.status_code} - {response.reason}: body: {response.json()}")
+        _log.info(f"HTTP response: {response.status_code} - {response.reason}: body: {response.text}")
 
         _check_response_status(response, _EXPECTED_STATUS_POST)
         return response.json()
 
-    def _upload_items_bulk(self, collection_id: str, items: List[pystac.Item]) -> None:
-        chunk = []
-        futures = []
+    def _upload_items_bulk(self, collection_id: str, items: List[dict]) -> None:
+        chunks = [items[i : i + self.bulk_size] for i in range(0, len(items), self.bulk_size)]
+        if len(chunks) <= 1 or self.max_workers <= 1:
+            for chunk in chunks:
+                self._ingest_bulk(collection_id, chunk)
+            return
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            for item in items:
-                self._prepare_item(item, collection_id)
-                chunk.append(item)
-
-                if len(chunk) == self.bulk_size:
-                    futures.append(executor.submit(self._ingest_bulk, chunk.copy()))
-                    chunk = []
-
-            if chunk:
-                self._ingest_bulk(chunk)
-
-            for _ in concurrent.futures.as_completed(futures):
-                continue
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._ingest_bulk, collection_id, chunk) for chunk in chunks]
+            for future in concurrent.futures.as_completed(futures):
+                # Propagate ingest failures.
+                future.result()
 
     def join_url(self, url_path: str) -> str:
         """Create a URL from the base_url and the url_path.
@@ -292,12 +371,19 @@ class STACAPIJobDatabase(JobDatabaseInterface):
 
         coll_dict.update(default_auth)
 
-        response = requests.post(self.join_url("collections"), auth=self._auth, json=coll_dict)
+        response = self._session.post(self.join_url("collections"), json=coll_dict)
         _check_response_status(response, _EXPECTED_STATUS_POST)
 
         return response.json()
 
 
+def _normalize_datetime(value: Union[str, datetime.datetime]) -> str:
+    """Normalize a datetime (or datetime string) to a STAC datetime string."""
+    if isinstance(value, str):
+        value = pystac.utils.str_to_datetime(value)
+    return pystac.utils.datetime_to_str(value)
+
+
 _EXPECTED_STATUS_POST = [
     requests.status_codes.codes.ok,
     requests.status_codes.codes.created,
@@ -11,13 +11,13 @@ from __future__ import annotations
 import abc
 import collections
 import copy
-import json
 import sys
 from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from openeo.api.process import Parameter
+from openeo.internal import json_encoding
 from openeo.internal.process_graph_visitor import (
     ProcessGraphUnflattener,
     ProcessGraphVisitException,
@@ -50,7 +50,7 @@ class FlatGraphableMixin(metaclass=abc.ABCMeta):
         :return: JSON string
         """
         pg = {"process_graph": self.flat_graph()}
-        return json.dumps(pg, indent=indent, separators=separators)
+        return json_encoding.dumps(pg, indent=indent, separators=separators)
 
     def print_json(
         self,
@@ -87,7 +87,7 @@ class FlatGraphableMixin(metaclass=abc.ABCMeta):
             # Just use file as-is, but don't close it automatically.
             file_ctx = nullcontext(enter_result=file or sys.stdout)
         with file_ctx as f:
-            json.dump(pg, f, indent=indent, separators=separators)
+            f.write(json_encoding.dumps(pg, indent=indent, separators=separators))
             if end:
                 f.write(end)
 
@@ -189,23 +189,38 @@ class PGNode(_FromNodeMixin, FlatGraphableMixin):
         Convert process graph to a nested dictionary structure.
         Uses deep copy style: nodes that are reused in graph will be deduplicated
         """
-
-        def _deep_copy(x):
-            """PGNode aware deep copy helper"""
+        # Iterative (explicit stack) deep copy, to support very deep graphs.
+        root = [None]
+        # Stack of (value to copy, target container, key/index in target container)
+        stack = [(self, root, 0)]
+        # Containers to convert to their final type (e.g. tuple) after their items are copied.
+        finalize = []
+        while stack:
+            x, target, key = stack.pop()
             if isinstance(x, PGNode):
-                return dict_no_none(process_id=x.process_id, arguments=_deep_copy(x.arguments), namespace=x.namespace)
-            if isinstance(x, Parameter):
-                return {"from_parameter": x.name}
+                copied = {"process_id": x.process_id, "arguments": None}
+                if x.namespace is not None:
+                    copied["namespace"] = x.namespace
+                stack.append((x.arguments, copied, "arguments"))
+            elif isinstance(x, Parameter):
+                copied = {"from_parameter": x.name}
             elif isinstance(x, dict):
-                return {str(k): _deep_copy(v) for k, v in x.items()}
+                copied = {str(k): None for k in x}
+                stack.extend((v, copied, str(k)) for k, v in x.items())
             elif isinstance(x, (list, tuple)):
-                return type(x)(_deep_copy(v) for v in x)
+                copied = [None] * len(x)
+                stack.extend((v, copied, i) for i, v in enumerate(x))
+                if type(x) is not list:
+                    finalize.append((type(x), copied, target, key))
             elif isinstance(x, (str, int, float)) or x is None:
-                return x
+                copied = x
             else:
                 raise ValueError(repr(x))
-
-        return _deep_copy(self)
+            target[key] = copied
+        # Finalize inner containers first.
+        for cls, items, target, key in reversed(finalize):
+            target[key] = cls(items)
+        return root[0]
 
     def flat_graph(self) -> Dict[str, dict]:
         """Get the process graph in internal flat dict representation."""
@@ -238,19 +253,17 @@ class PGNode(_FromNodeMixin, FlatGraphableMixin):
     def walk_nodes(self) -> Iterator[PGNode]:
         """Walk this node and all it's parents"""
         # TODO: option to do deep walk (walk through child graphs too)?
-        yield self
-
-        def walk(x) -> Iterator[PGNode]:
+        # Depth-first (pre-order) walk with explicit stack (instead of recursion) to support very deep graphs.
+        stack = [self]
+        while stack:
+            x = stack.pop()
             if isinstance(x, PGNode):
-                yield from x.walk_nodes()
+                yield x
+                stack.append(x.arguments)
             elif isinstance(x, dict):
-                for v in x.values():
-                    yield from walk(v)
+                stack.extend(reversed(list(x.values())))
             elif isinstance(x, (list, tuple)):
-                for v in x:
-                    yield from walk(v)
-
-        yield from walk(self.arguments)
+                stack.extend(reversed(x))
 
 
 def as_flat_graph(x: Union[dict, FlatGraphableMixin, Path, List[FlatGraphableMixin], Any]) -> Dict[str, dict]:
@@ -359,11 +372,13 @@ class GraphFlattener(ProcessGraphVisitor):
             flat_graph[self._last_node_id]["result"] = True
         return flat_graph
 
-    def accept_node(self, node: PGNode):
+    def _accept_node_steps(self, node: PGNode) -> Iterator:
         # Process reused nodes only first time and remember node id.
         node_id = id(node)
         if node_id not in self._node_cache:
-            super()._accept_process(process_id=node.process_id, arguments=node.arguments, namespace=node.namespace)
+            yield from self._accept_process_steps(
+                process_id=node.process_id, arguments=node.arguments, namespace=node.namespace
+            )
             self._node_cache[node_id] = self._last_node_id
         else:
             self._last_node_id = self._node_cache[node_id]
@@ -429,10 +444,10 @@ class GraphFlattener(ProcessGraphVisitor):
     def constantArgument(self, argument_id: str, value):
         self._store_argument(argument_id, value)
 
-    def _accept_dict(self, value: dict):
+    def _accept_dict_steps(self, value: dict) -> Iterator:
         for k, v in value.items():
             if isinstance(v, dict) and "from_node" in v:
-                self.accept_node(v["from_node"])
+                yield v["from_node"]
 
 
 class PGNodeGraphUnflattener(ProcessGraphUnflattener):
@@ -0,0 +1,473 @@
+"""
+Client-side process graph optimizer: semantics-preserving rewrites of a :py:class:`PGNode` graph,
+e.g. to push filters (``filter_bbox``, ``filter_temporal``, ``filter_bands``)
+into the arguments of the load process (``load_collection``, ``load_stac``),
+or to fuse chains of element-wise ``apply`` nodes into a single ``apply`` node.
+
+Optimization passes are local rewrite rules that are applied bottom-up (dependencies first),
+so that chains of rewrites (e.g. multiple filters after a load process) are handled in a single traversal.
+The original graph is never modified: rewritten nodes are (shallow) copies.
+"""
+
+from __future__ import annotations
+
+import collections
+import copy
+import datetime as dt
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from openeo.api.process import Parameter
+from openeo.internal.graph_building import (
+    MultiLeafGraph,
+    PGNode,
+    PGNodeGraphUnflattener,
+)
+from openeo.internal.process_graph_visitor import (
+    ProcessGraphUnflattener,
+    ProcessGraphVisitException,
+    find_result_node,
+)
+from openeo.util import normalize_crs, rfc3339
+
+_log = logging.getLogger(__name__)
+
+# A rewrite rule takes a node (of which the dependencies are already optimized)
+# and the consumer counts of the graph, and returns a replacement node (or None if not applicable).
+RewriteRule = Callable[[PGNode, "ConsumerCounts"], Optional[PGNode]]
+
+LOAD_PROCESSES = {"load_collection", "load_stac"}
+
+
+class ConsumerCounts:
+    """Number of consumers (nodes referring to it, or being a result node) of each node in a graph."""
+
+    def __init__(self):
+        self._counts: Dict[int, int] = collections.Counter()
+        # Keep references to counted nodes, to avoid `id` reuse.
+        self._nodes: Dict[int, PGNode] = {}
+
+    def add(self, node: PGNode, count: int = 1):
+        self._counts[id(node)] += count
+        self._nodes[id(node)] = node
+
+    def __getitem__(self, node: PGNode) -> int:
+        return self._counts.get(id(node), 0)
+
+    def is_exclusive(self, node: PGNode) -> bool:
+        """Node is only used by a single consumer (so it can be safely merged into that consumer)."""
+        return self[node] == 1
+
+
+def _dependencies(value) -> Iterable[PGNode]:
+    """Direct node dependencies in given argument value (not descending into child process graphs)."""
+    stack = [value]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, PGNode):
+            yield x
+        elif isinstance(x, dict):
+            if "process_graph" not in x:
+                stack.extend(x.values())
+        elif isinstance(x, (list, tuple)):
+            stack.extend(x)
+
+
+def _post_order(roots: List[PGNode]) -> List[PGNode]:
+    """
+    List all nodes of the graph with given result nodes in post-order (dependencies first),
+    using an explicit stack (instead of recursion) to support very deep graphs.
+    """
+    order: List[PGNode] = []
+    visited = set()
+    stack = [(root, False) for root in reversed(roots)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+        elif id(node) not in visited:
+            visited.add(id(node))
+            stack.append((node, True))
+            stack.extend((d, False) for d in reversed(list(_dependencies(node.arguments))) if id(d) not in visited)
+    return order
+
+
+def _replace_dependencies(value, replacements: Dict[int, PGNode]):
+    """Replace node dependencies in given argument value (not descending into child process graphs)."""
+    if isinstance(value, PGNode):
+        return replacements.get(id(value), value)
+    elif isinstance(value, dict) and "process_graph" not in value:
+        return {k: _replace_dependencies(v, replacements) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_replace_dependencies(v, replacements) for v in value]
+    elif isinstance(value, tuple):
+        return tuple(_replace_dependencies(v, replacements) for v in value)
+    return value
+
+
+def with_arguments(node: PGNode, arguments: dict) -> PGNode:
+    """Shallow copy of given node (preserving its class) with new arguments."""
+    new = copy.copy(node)
+    new._arguments = arguments
+    return new
+
+
+def dependency(node: PGNode, argument: str = "data") -> Union[PGNode, None]:
+    """Get the node referenced by given argument of given node (if any)."""
+    value = node.arguments.get(argument)
+    if isinstance(value, dict) and isinstance(value.get("from_node"), PGNode):
+        return value["from_node"]
+    elif isinstance(value, PGNode):
+        return value
+    return None
+
+
+def _is_exclusive_load_node(node: Union[PGNode, None], consumers: ConsumerCounts) -> bool:
+    return (
+        node is not None
+        and node.process_id in LOAD_PROCESSES
+        and node.namespace is None
+        and consumers.is_exclusive(node)
+    )
+
+
+def _has_only_arguments(node: PGNode, *names: str) -> bool:
+    return node.namespace is None and set(node.arguments).issubset(names)
+
+
+def _bbox_crs(bbox: dict):
+    return normalize_crs(bbox.get("crs") or 4326)
+
+
+def _intersect_bbox(current: Union[dict, None], extent: dict) -> Union[dict, None]:
+    """Intersection of two bounding box dicts (or None if not possible or empty)."""
+    keys = {"west", "south", "east", "north"}
+    if not (isinstance(extent, dict) and keys.issubset(extent) and set(extent).issubset(keys | {"crs"})):
+        return None
+    if not all(isinstance(extent[k], (int, float)) for k in keys):
+        return None
+    if current is None:
+        return dict(extent)
+    if not (isinstance(current, dict) and keys.issubset(current) and set(current).issubset(keys | {"crs"})):
+        # E.g. GeoJSON geometry, parameterized or 3D extent.
+        return None
+    if not all(isinstance(current[k], (int, float)) for k in keys):
+        return None
+    try:
+        if _bbox_crs(current) != _bbox_crs(extent):
+            return None
+    except ValueError:
+        return None
+    intersection = dict(
+        west=max(current["west"], extent["west"]),
+        south=max(current["south"], extent["south"]),
+        east=min(current["east"], extent["east"]),
+        north=min(current["north"], extent["north"]),
+    )
+    if intersection["west"] > intersection["east"] or intersection["south"] > intersection["north"]:
+        return None
+    if "crs" in current:
+        intersection["crs"] = current["crs"]
+    return intersection
+
+
+def _parse_temporal_bound(x: str) -> dt.datetime:
+    d = rfc3339.parse_date_or_datetime(x)
+    return d if isinstance(d, dt.datetime) else dt.datetime.combine(d, dt.time())
+
+
+def _intersect_temporal(current: Union[list, None], extent: list) -> Union[list, None]:
+    """Intersection of two (half-open) temporal intervals (or None if not possible or empty)."""
+
+    def valid(interval) -> bool:
+        return (
+            isinstance(interval, (list, tuple))
+            and len(interval) == 2
+            and all(x is None or isinstance(x, str) for x in interval)
+            and interval != [None, None]
+        )
+
+    if not valid(extent):
+        return None
+    if current is None:
+        return list(extent)
+    if not valid(current):
+        return None
+    try:
+        starts = [x for x in (current[0], extent[0]) if x is not None]
+        ends = [x for x in (current[1], extent[1]) if x is not None]
+        start = max(starts, key=_parse_temporal_bound, default=None)
+        end = min(ends, key=_parse_temporal_bound, default=None)
+        if start is not None and end is not None and _parse_temporal_bound(start) >= _parse_temporal_bound(end):
+            return None
+    except ValueError:
+        return None
+    return [start, end]
+
+
+def push_filter_bbox(node: PGNode, consumers: ConsumerCounts) -> Optional[PGNode]:
+    """Merge ``filter_bbox`` into the ``spatial_extent`` of the load process."""
+    if node.process_id != "filter_bbox" or not _has_only_arguments(node, "data", "extent"):
+        return None
+    load = dependency(node)
+    if not _is_exclusive_load_node(load, consumers):
+        return None
+    spatial_extent = _intersect_bbox(load.arguments.get("spatial_extent"), node.arguments.get("extent"))
+    if spatial_extent is None:
+        return None
+    return with_arguments(load, {**load.arguments, "spatial_extent": spatial_extent})
+
+
+def push_filter_temporal(node: PGNode, consumers: ConsumerCounts) -> Optional[PGNode]:
+    """Merge ``filter_temporal`` into the ``temporal_extent`` of the load process."""
+    if node.process_id != "filter_temporal" or not _has_only_arguments(node, "data", "extent"):
+        # Note: a filter on a particular (temporal) dimension is not handled.
+        return None
+    load = dependency(node)
+    if not _is_exclusive_load_node(load, consumers):
+        return None
+    temporal_extent = _intersect_temporal(load.arguments.get("temporal_extent"), node.arguments.get("extent"))
+    if temporal_extent is None:
+        return None
+    return with_arguments(load, {**load.arguments, "temporal_extent": temporal_extent})
+
+
+def push_filter_bands(node: PGNode, consumers: ConsumerCounts) -> Optional[PGNode]:
+    """Merge ``filter_bands`` into the ``bands`` of the load process."""
+    if node.process_id != "filter_bands" or not _has_only_arguments(node, "data", "bands"):
+        # Note: filtering on wavelengths is not handled.
+        return None
+    load = dependency(node)
+    if not _is_exclusive_load_node(load, consumers):
+        return None
+    bands = node.arguments.get("bands")
+    if not (isinstance(bands, (list, tuple)) and bands and all(isinstance(b, str) for b in bands)):
+        return None
+    current = load.arguments.get("bands")
+    if current is not None and not (isinstance(current, (list, tuple)) and set(bands).issubset(current)):
+        # Filtered bands must be a subset of the loaded bands (without name resolution).
+        return None
+    return with_arguments(load, {**load.arguments, "bands": list(bands)})
+
+
+def _callback(node: PGNode, argument: str) -> Union[PGNode, None]:
+    """Get result node of the child process graph in given argument of given node (if any)."""
+    value = node.arguments.get(argument)
+    if not (isinstance(value, dict) and set(value.keys()) == {"process_graph"}):
+        return None
+    process_graph = value["process_graph"]
+    if isinstance(process_graph, PGNode):
+        return process_graph
+    elif isinstance(process_graph, dict):
+        # Flat graph representation (e.g. from an unflattened flat graph)
+        try:
+            return PGNode.from_flat_graph(process_graph)
+        except (ProcessGraphVisitException, KeyError, TypeError, AttributeError):
+            return None
+    return None
+
+
+def _is_parameter_reference(value, name: str) -> bool:
+    return (isinstance(value, dict) and value == {"from_parameter": name}) or (
+        isinstance(value, Parameter) and value.name == name
+    )
+
+
+def _substitute_parameter(value, name: str, replacement):
+    """Replace parameter references in given argument value (not descending into child process graphs)."""
+    if _is_parameter_reference(value, name):
+        return replacement
+    elif isinstance(value, dict) and "process_graph" not in value and "from_node" not in value:
+        return {k: _substitute_parameter(v, name, replacement) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_substitute_parameter(v, name, replacement) for v in value]
+    return value
+
+
+def _compose_callbacks(outer: PGNode, parameter: str, inner: PGNode) -> Union[PGNode, None]:
+    """
+    Compose two child process graphs: replace references to given parameter in the outer graph
+    with the result of the inner graph.
+    Returns None if that is not possible (safely): when the outer graph has child process graphs itself,
+    where parameter scoping would get ambiguous, or when a UDF is involved
+    (which back-ends might only handle directly on the callback parameter).
+    """
+    nodes = _post_order([outer])
+    if any(isinstance(v, dict) and "process_graph" in v for n in nodes for v in _nested_values(n.arguments)):
+        return None
+    if any(n.process_id == "run_udf" for n in nodes + _post_order([inner])):
+        return None
+    replacements: Dict[int, PGNode] = {}
+    reference = {"from_node": inner}
+    for node in nodes:
+        arguments = _replace_dependencies(node.arguments, replacements)
+        arguments = _substitute_parameter(arguments, parameter, reference)
+        replacements[id(node)] = with_arguments(node, arguments)
+    return replacements[id(outer)]
+
+
+def _nested_values(value) -> Iterable:
+    """All (nested) values in given argument value (not descending into node references)."""
+    stack = [value]
+    while stack:
+        x = stack.pop()
+        yield x
+        if isinstance(x, dict) and "process_graph" not in x and "from_node" not in x:
+            stack.extend(x.values())
+        elif isinstance(x, (list, tuple)):
+            stack.extend(x)
+
+
+def _references_parameter(root: PGNode, name: str) -> bool:
+    return any(_is_parameter_reference(v, name) for n in _post_order([root]) for v in _nested_values(n.arguments))
+
+
+def _is_exclusive_node(node: Union[PGNode, None], process_id: str, consumers: ConsumerCounts) -> bool:
+    return (
+        node is not None and node.process_id == process_id and node.namespace is None and consumers.is_exclusive(node)
+    )
+
+
+def fuse_apply_apply(node: PGNode, consumers: ConsumerCounts) -> Optional[PGNode]:
+    """Fuse ``apply`` on top of ``apply`` into a single ``apply`` with the composed child process graph."""
+    if node.process_id != "apply" or not _has_only_arguments(node, "data", "process", "context"):
+        return None
+    inner = dependency(node)
+    if not _is_exclusive_node(inner, "apply", consumers) or not _has_only_arguments(
+        inner, "data", "process", "context"
+    ):
+        return None
+    if inner.arguments.get("context") != node.arguments.get("context"):
+        return None
+    outer_callback = _callback(node, "process")
+    inner_callback = _callback(inner, "process")
+    if outer_callback is None or inner_callback is None:
+        return None
+    composed = _compose_callbacks(outer=outer_callback, parameter="x", inner=inner_callback)
+    if composed is None:
+        return None
+    return with_arguments(inner, {**inner.arguments, "process": {"process_graph": composed}})
+
+
+def fuse_reduce_apply(node: PGNode, consumers: ConsumerCounts) -> Optional[PGNode]:
+    """
+    Fuse ``apply`` on top of ``reduce_dimension`` (e.g. band math) into the reducer of the ``reduce_dimension``:
+    applying a unary operation after the reduction is the same as doing it in the reducer.
+    """
+    if node.process_id != "apply" or not _has_only_arguments(node, "data", "process", "context"):
+        return None
+    reduce = dependency(node)
+    if not _is_exclusive_node(reduce, "reduce_dimension", consumers) or not _has_only_arguments(
+        reduce, "data", "reducer", "dimension", "context"
+    ):
+        return None
+    callback = _callback(node, "process")
+    reducer = _callback(reduce, "reducer")
+    if callback is None or reducer is None:
+        return None
+    context = node.arguments.get("context")
+    reduce_context = reduce.arguments.get("context")
+    if context is not None and context != reduce_context:
+        return None
+    if context is None and reduce_context is not None and _references_parameter(callback, "context"):
+        # After fusion, the callback would get access to the context of the reducer.
+        return None
+    composed = _compose_callbacks(outer=callback, parameter="x", inner=reducer)
+    if composed is None:
+        return None
+    return with_arguments(reduce, {**reduce.arguments, "reducer": {"process_graph": composed}})
+
+
+# Available optimization passes (by name), each consisting of one or more rewrite rules.
+OPTIMIZATION_PASSES: Dict[str, List[RewriteRule]] = {
+    "filter_pushdown": [push_filter_bbox, push_filter_temporal, push_filter_bands],
+    "apply_fusion": [fuse_apply_apply, fuse_reduce_apply],
+}
+
+
+class GraphOptimizer:
+    """
+    Optimizer of a process graph (given as one or more result nodes),
+    applying the rewrite rules of given optimization passes.
+
+    :param passes: names of the optimization passes to apply (all available passes by default).
+    """
+
+    def __init__(self, passes: Optional[Iterable[str]] = None):
+        passes = list(OPTIMIZATION_PASSES.keys() if passes is None else passes)
+        unknown = [p for p in passes if p not in OPTIMIZATION_PASSES]
+        if unknown:
+            raise ValueError(f"Unknown optimization passes: {unknown}. Available: {list(OPTIMIZATION_PASSES)}")
+        self._rules: List[RewriteRule] = [r for p in passes for r in OPTIMIZATION_PASSES[p]]
+
+    def optimize(self, roots: List[PGNode]) -> List[PGNode]:
+        """Optimize graph with given result nodes and return the (possibly new) result nodes."""
+        consumers = ConsumerCounts()
+        for root in roots:
+            consumers.add(root)
+        order = _post_order(roots)
+        for node in order:
+            for dep in _dependencies(node.arguments):
+                consumers.add(dep)
+
+        replacements: Dict[int, PGNode] = {}
+        for node in order:
+            new = node
+            if any(id(d) in replacements for d in _dependencies(node.arguments)):
+                new = with_arguments(node, _replace_dependencies(node.arguments, replacements))
+            # Apply rules until fixed point.
+            changed = True
+            while changed:
+                changed = False
+                for rule in self._rules:
+                    rewritten = rule(new, consumers)
+                    if rewritten is not None:
+                        _log.debug(f"GraphOptimizer: {rule.__name__} rewrote {new.process_id!r} node")
+                        # The rewritten node takes over the consumers of the original node.
+                        consumers.add(rewritten, consumers[node])
+                        new = rewritten
+                        changed = True
+                        break
+            if new is not node:
+                consumers.add(new, consumers[node] - consumers[new])
+                replacements[id(node)] = new
+        return [replacements.get(id(root), root) for root in roots]
+
+    def optimize_flat_graph(self, flat_graph: Dict[str, dict]) -> Dict[str, dict]:
+        """
+        Optimize a process graph in flat dict representation.
+        Returns the original flat graph as-is if there is nothing to optimize (or it can not be handled).
+        """
+        try:
+            result_key, _ = find_result_node(flat_graph=flat_graph)
+            # Leaf nodes: nodes that are not referenced by other nodes (with the result node last).
+            referenced = set(
+                k
+                for node in flat_graph.values()
+                for k in ProcessGraphUnflattener._from_node_keys(node.get("arguments"))
+            )
+            leaf_keys = [k for k in flat_graph if k not in referenced and k != result_key] + [result_key]
+            unflattener = PGNodeGraphUnflattener(flat_graph=flat_graph)
+            leaves = [unflattener.get_node(k) for k in leaf_keys]
+        except (ProcessGraphVisitException, KeyError, TypeError, AttributeError) as e:
+            _log.warning(f"GraphOptimizer: skipping optimization of unsupported flat graph: {e!r}")
+            return flat_graph
+        optimized = self.optimize(leaves)
+        if all(o is leaf for o, leaf in zip(optimized, leaves)):
+            return flat_graph
+        return optimized[0].flat_graph() if len(optimized) == 1 else MultiLeafGraph(optimized).flat_graph()
+
+
+def optimize_process_graph(
+    node: Union[PGNode, List[PGNode]], passes: Optional[Iterable[str]] = None
+) -> Union[PGNode, List[PGNode]]:
+    """
+    Apply client-side optimizations to given process graph (result node or list of result nodes).
+
+    :param node: result node (or list of result nodes) of the process graph to optimize.
+    :param passes: names of the optimization passes to apply (all available passes by default).
+    :return: optimized result node (or list of result nodes).
+    """
+    if isinstance(node, PGNode):
+        return GraphOptimizer(passes=passes).optimize([node])[0]
+    return GraphOptimizer(passes=passes).optimize(list(node))
@@ -0,0 +1,71 @@
+"""
+Templates of JSON documents (e.g. process graphs with metadata) with value "slots":
+JSON-encode a document once and render it for different slot values
+with cheap string concatenation, instead of building and encoding the full document each time.
+"""
+
+import re
+import uuid
+from typing import Any, Callable, List, Mapping
+
+from openeo.internal import json_encoding
+
+
+class JsonTemplate:
+    """
+    JSON document template with slots to fill in at render time.
+
+    The document is built once (with a builder function that gets a ``slot`` function
+    to create placeholder values), JSON-encoded and split into constant JSON fragments
+    around the slot placeholders.
+    Rendering just JSON-encodes the slot values and joins them with these fragments.
+
+    Usage example:
+
+    .. code-block:: pycon
+
+        >>> template = JsonTemplate(lambda slot: {"add": {"x": slot("x"), "y": 3}})
+        >>> template.render({"x": [1, 2]})
+        '{"add": {"x": [1, 2], "y": 3}}'
+
+    :param build: function that takes a ``slot`` function (slot name to placeholder value)
+        and returns the document, using these placeholder values where appropriate.
+        Placeholders must be used as-is (as complete JSON values), not as part of a larger string.
+    """
+
+    def __init__(self, build: Callable[[Callable[[str], str]], Any]):
+        marker = f"__openeo_slot_{uuid.uuid4().hex}_"
+        names: List[str] = []
+
+        def slot(name: str) -> str:
+            names.append(name)
+            return f"{marker}{len(names) - 1}"
+
+        encoded = self.dumps(build(slot))
+        parts = re.split('"' + re.escape(marker) + r'(\d+)"', encoded)
+        if any(marker in fragment for fragment in parts[0::2]):
+            raise ValueError("Slot placeholder not used as complete JSON value.")
+        self._fragments: List[str] = parts[0::2]
+        self._slots: List[str] = [names[int(i)] for i in parts[1::2]]
+
+    @staticmethod
+    def dumps(value: Any) -> str:
+        return json_encoding.dumps(value, allow_nan=False)
+
+    @property
+    def slot_names(self) -> List[str]:
+        """Names of the slots, in order of appearance in the document."""
+        return list(self._slots)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """
+        Render the template with given slot values to a JSON string.
+
+        :param values: mapping of slot name to (JSON-encodable) value.
+        """
+        fragments = self._fragments
+        parts = [fragments[0]]
+        for name, fragment in zip(self._slots, fragments[1:]):
+            parts.append(self.dumps(values[name]))
+            parts.append(fragment)
+        return "".join(parts)
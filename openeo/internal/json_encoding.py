@@ -0,0 +1,231 @@
+"""
+JSON serialization of process graphs and request bodies.
+
+Uses the standard library ``json`` module, except for canonical encoding (e.g. for hashing process graphs),
+which uses `orjson <https://github.com/ijl/orjson>`_ when it is available (significantly faster
+for large process graphs, e.g. with embedded geometries).
+orjson is not used for user-facing or request body serialization:
+it silently encodes non-finite floats (NaN, infinity) as ``null``
+and differs from the standard library in escaping of non-ASCII characters and float formatting.
+
+Also provides:
+
+- a canonical (sorted keys, compact) encoding, e.g. for hashing process graphs,
+- :py:class:`PreEncodedJson` to JSON-encode large values (e.g. GeoJSON geometries) just once
+  and embed them as-is in each serialization of the containing document,
+- gzip compression of request bodies.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import re
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Native support for embedding pre-encoded JSON (orjson>=3.9)
+_orjson_fragment = getattr(orjson, "Fragment", None)
+
+COMPACT_SEPARATORS = (",", ":")
+
+# Marker to embed pre-encoded JSON fragments in the output of encoders without native support for that.
+_RAW_MARKER = f"__openeo_raw_{uuid.uuid4().hex}_"
+_RAW_MARKER_REGEX = re.compile('"' + re.escape(_RAW_MARKER) + r'(\d+)"')
+
+
+class PreEncodedJson:
+    """
+    Wrapper for a JSON value (e.g. a large GeoJSON geometry) that is JSON-encoded just once
+    (in canonical compact form, strictly JSON compliant) and embedded as-is each time the containing document is serialized
+    (e.g. for the request body of each batch job created with it).
+
+    Usage example:
+
+    .. code-block:: python
+
+        from openeo.util import PreEncodedJson
+
+        geometry = PreEncodedJson(large_feature_collection)
+        for year in range(2015, 2025):
+            cube.aggregate_spatial(geometries=geometry, reducer="mean").create_job(title=f"{year}")
+
+    Compares equal to its (decoded) value.
+
+    .. note::
+        The wrapper is kept as-is in the internal flat graph representation
+        (e.g. :py:meth:`DataCube.flat_graph() <openeo.rest.datacube.DataCube.flat_graph>`),
+        which can therefore not be encoded directly with the standard library ``json`` module.
+        Use :py:meth:`~openeo.rest.datacube.DataCube.to_json()` instead,
+        or pass ``default=lambda x: x.value`` to ``json.dumps``.
+
+    .. versionadded:: 0.52.0
+    """
+
+    __slots__ = ("value", "encoded")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.encoded: str = dumps(value, canonical=True, allow_nan=False)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PreEncodedJson):
+            return self.encoded == other.encoded
+        return self.value == other
+
+    def __hash__(self):
+        return hash(self.encoded)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} ({len(self.encoded)} chars)>"
+
+
+def resolve_pre_encoded(value: Any) -> Any:
+    """
+    Get a version of given (nested) value with :py:class:`PreEncodedJson` values replaced by their original value,
+    e.g. to pass it on to code that expects plain JSON-style data structures.
+    Containers without such values are returned as-is.
+    """
+    if isinstance(value, PreEncodedJson):
+        return value.value
+    elif isinstance(value, dict):
+        resolved = {k: resolve_pre_encoded(v) for k, v in value.items()}
+        return value if all(resolved[k] is v for k, v in value.items()) else resolved
+    elif isinstance(value, (list, tuple)):
+        resolved = [resolve_pre_encoded(v) for v in value]
+        return value if all(r is v for r, v in zip(resolved, value)) else resolved
+    return value
+
+
+class _RawCollector:
+    """Encoder ``default`` hook that replaces :py:class:`PreEncodedJson` values with string markers."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self):
+        self.raw: List[str] = []
+
+    def __call__(self, value: Any) -> Any:
+        if isinstance(value, PreEncodedJson):
+            if _orjson_fragment is not None:
+                return _orjson_fragment(value.encoded)
+            self.raw.append(value.encoded)
+            return f"{_RAW_MARKER}{len(self.raw) - 1}"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def substitute(self, encoded: str) -> str:
+        if not self.raw:
+            return encoded
+        return _RAW_MARKER_REGEX.sub(lambda m: self.raw[int(m.group(1))], encoded)
+
+
+def dumps(
+    value: Any,
+    *,
+    canonical: bool = False,
+    indent: Union[int, None] = None,
+    separators: Optional[Tuple[str, str]] = None,
+    allow_nan: bool = True,
+) -> str:
+    """
+    JSON-encode given value (with support for embedded :py:class:`PreEncodedJson` values).
+
+    Formatting options ``indent`` and ``separators`` follow the standard library ``json.dumps``.
+
+    :param canonical: produce canonical JSON (sorted keys, compact, non-ASCII characters as-is),
+        e.g. for hashing. Formatting options are ignored in this mode.
+        Uses orjson when available, so the exact output (e.g. float formatting) depends on that.
+    :param allow_nan: allow non-finite floats (encoded as ``NaN``/``Infinity``,
+        or as ``null`` in canonical mode with orjson).
+        If false, a ``ValueError`` is raised for non-finite floats.
+    """
+    return _encode(
+        value, canonical=canonical, indent=indent, separators=separators, allow_nan=allow_nan, as_bytes=False
+    )
+
+
+def dumps_bytes(value: Any, *, canonical: bool = False, allow_nan: bool = True) -> bytes:
+    """JSON-encode given value in compact form to UTF-8 bytes."""
+    return _encode(
+        value, canonical=canonical, indent=None, separators=COMPACT_SEPARATORS, allow_nan=allow_nan, as_bytes=True
+    )
+
+
+def _encode(
+    value: Any,
+    *,
+    canonical: bool,
+    indent: Union[int, None],
+    separators: Optional[Tuple[str, str]],
+    allow_nan: bool,
+    as_bytes: bool,
+) -> Union[str, bytes]:
+    collector = _RawCollector()
+    # orjson can not reject non-finite floats (it encodes them as null),
+    # which is acceptable for hashing, but not when strict compliance is required.
+    if orjson is not None and canonical and allow_nan:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+        try:
+            encoded = orjson.dumps(value, default=collector, option=options)
+        except TypeError:
+            # E.g. integers beyond 64 bit: leave it to the standard library
+            collector = _RawCollector()
+        else:
+            if collector.raw:
+                return _to(collector.substitute(encoded.decode("utf8")), as_bytes=as_bytes)
+            return encoded if as_bytes else encoded.decode("utf8")
+
+    if canonical:
+        encoded = json.dumps(
+            value,
+            sort_keys=True,
+            separators=COMPACT_SEPARATORS,
+            ensure_ascii=False,
+            allow_nan=allow_nan,
+            default=collector,
+        )
+    else:
+        encoded = json.dumps(
+            value,
+            indent=indent,
+            separators=separators,
+            ensure_ascii=not as_bytes,
+            allow_nan=allow_nan,
+            default=collector,
+        )
+    return _to(collector.substitute(encoded), as_bytes=as_bytes)
+
+
+def _to(encoded: str, *, as_bytes: bool) -> Union[str, bytes]:
+    return encoded.encode("utf8") if as_bytes else encoded
+
+
+def encode_request_body(value: Any, *, compress_threshold: Optional[int] = None) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Encode a value as (strictly compliant) JSON request body.
+
+    :param value: JSON-encodable value
+    :param compress_threshold: (optional) minimum body size (in bytes) to apply gzip compression.
+    :return: tuple of body bytes and corresponding request headers to set.
+    """
+    return prepare_request_body(dumps_bytes(value, allow_nan=False), compress_threshold=compress_threshold)
+
+
+def prepare_request_body(body: bytes, *, compress_threshold: Optional[int] = None) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Prepare an already JSON-encoded request body: apply gzip compression if it is large enough.
+
+    :param body: JSON-encoded request body
+    :param compress_threshold: (optional) minimum body size (in bytes) to apply gzip compression.
+    :return: tuple of body bytes and corresponding request headers to set.
+    """
+    headers = {"Content-Type": "application/json"}
+    if compress_threshold is not None and len(body) >= compress_threshold:
+        body = gzip.compress(body, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
@@ -1,6 +1,6 @@
-import json
 import os
 
+from openeo.internal import json_encoding
 from openeo.rest import OpenEoApiError
 
 SCRIPT_URL = "https://cdn.jsdelivr.net/npm/@openeo/vue-components@2/assets/openeo.min.js"
@@ -136,9 +136,7 @@ def render_component(component: str, data=None, parameters: dict = None):
     <openeo-{component}>
         <script type="application/json">{props}</script>
     </openeo-{component}>
-    """.format(
-        script=SCRIPT_URL, component=component, props=json.dumps(parameters)
-    )
+    """.format(script=SCRIPT_URL, component=component, props=json_encoding.dumps(parameters))
 
 
 def render_error(error: OpenEoApiError):
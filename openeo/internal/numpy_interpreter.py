@@ -0,0 +1,765 @@
+"""
+Lightweight interpreter to evaluate (small) openEO process graphs and child callbacks
+on local NumPy arrays (or xarray DataArrays) with vectorized operations,
+e.g. for unit tests or to evaluate band math callbacks on local data.
+
+A process graph is compiled once to a sequence of node evaluation steps
+(closures over the process implementations and argument evaluators),
+so that it can be evaluated efficiently for many inputs:
+
+    >>> compiled = compile_process_graph(lambda x: (x * 0.0001 + 1).log(base=10))
+    >>> compiled(x=numpy.array([1000, 2000]))
+
+Conventions:
+
+-   "null" (no-data) values are represented as NaN,
+-   processes that operate on arrays (e.g. ``mean``, ``array_element``, ``count``)
+    work along the first axis of the given (multidimensional) array,
+    so that e.g. a band math reducer can be evaluated on a ``(bands, y, x)`` array at once.
+
+Only the math, comparison, logic and (basic) array processes are supported,
+other processes must be provided explicitly.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import xarray
+
+from openeo.internal.graph_building import (
+    FlatGraphableMixin,
+    _FromNodeMixin,
+    as_flat_graph,
+)
+from openeo.internal.process_graph_visitor import (
+    ProcessGraphUnflattener,
+    ProcessGraphVisitException,
+)
+
+__all__ = ["compile_process_graph", "CompiledProcessGraph", "PROCESSES"]
+
+
+# Registry of process implementations (process id -> function with openEO parameter names as keyword arguments)
+PROCESSES: Dict[str, Callable] = {}
+
+
+def _process(*process_ids: str):
+    def decorate(f: Callable) -> Callable:
+        for process_id in process_ids or [f.__name__.rstrip("_")]:
+            PROCESSES[process_id] = f
+        return f
+
+    return decorate
+
+
+def _value(x):
+    """Normalize a (scalar or array) value: null to NaN, lists to arrays."""
+    if x is None:
+        return np.nan
+    elif isinstance(x, (list, tuple)):
+        return _array(x)
+    return x
+
+
+def _array(data) -> Union[np.ndarray, xarray.DataArray]:
+    """Normalize given "array" argument: lists (e.g. of per-band arrays) are stacked along a new first axis."""
+    if isinstance(data, (np.ndarray, xarray.DataArray)):
+        return data
+    elif isinstance(data, (list, tuple)):
+        items = [_value(x) for x in data]
+        if any(isinstance(x, xarray.DataArray) for x in items):
+            return xarray.concat(xarray.broadcast(*items), dim="array")
+        return np.stack(np.broadcast_arrays(*items)) if items else np.array([], dtype=float)
+    return np.asarray(_value(data))
+
+
+def _where(condition, x, y):
+    if any(isinstance(v, xarray.DataArray) for v in (condition, x, y)):
+        return xarray.where(condition, x, y)
+    result = np.where(condition, x, y)
+    return result[()] if result.ndim == 0 else result
+
+
+def _isnan(x):
+    x = _value(x)
+    if isinstance(x, str):
+        return False
+    try:
+        return np.isnan(x)
+    except TypeError:
+        # Non-numeric (e.g. object) arrays
+        return np.vectorize(lambda v: v is None or (isinstance(v, float) and math.isnan(v)), otypes=[bool])(x)
+
+
+def _with_nulls(result, *args):
+    """Set result to null (NaN) where any of the given arguments is null."""
+    null = functools.reduce(np.logical_or, (_isnan(a) for a in args))
+    if np.any(null):
+        return _where(null, np.nan, result)
+    return result
+
+
+def _bool_or_null(x):
+    """Convert a boolean-like result (with NaN as null) to boolean if there are no nulls."""
+    if isinstance(x, xarray.DataArray):
+        return x if x.isnull().any() else x.astype(bool)
+    x = np.asarray(x)
+    result = x if np.isnan(x).any() else x.astype(bool)
+    return result[()] if result.ndim == 0 else result
+
+
+def _truthy(x):
+    """Boolean mask of true values (null is not true)."""
+    x = _value(x)
+    with np.errstate(invalid="ignore"):
+        return np.asarray(x == 1) if not isinstance(x, xarray.DataArray) else (x == 1)
+
+
+def _falsy(x):
+    """Boolean mask of false values (null is not false)."""
+    x = _value(x)
+    with np.errstate(invalid="ignore"):
+        return np.asarray(x == 0) if not isinstance(x, xarray.DataArray) else (x == 0)
+
+
+# Math processes
+
+
+def _unary(process_id: str, f: Callable):
+    PROCESSES[process_id] = lambda x: f(_value(x))
+
+
+for _id, _f in {
+    "absolute": np.abs,
+    "sgn": np.sign,
+    "sqrt": np.sqrt,
+    "ln": np.log,
+    "ceil": np.ceil,
+    "floor": np.floor,
+    "int": np.trunc,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "arcsin": np.arcsin,
+    "arccos": np.arccos,
+    "arctan": np.arctan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "arsinh": np.arcsinh,
+    "arcosh": np.arccosh,
+    "artanh": np.arctanh,
+}.items():
+    _unary(_id, _f)
+
+
+@_process()
+def exp(p):
+    return np.exp(_value(p))
+
+
+@_process()
+def add(x, y):
+    return _value(x) + _value(y)
+
+
+@_process()
+def subtract(x, y):
+    return _value(x) - _value(y)
+
+
+@_process()
+def multiply(x, y):
+    return _value(x) * _value(y)
+
+
+@_process()
+def divide(x, y):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.divide(_value(x), _value(y))
+
+
+@_process()
+def mod(x, y):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.mod(_value(x), _value(y))
+
+
+@_process()
+def power(base, p):
+    with np.errstate(invalid="ignore"):
+        return np.power(_value(base), _value(p))
+
+
+@_process()
+def log(x, base):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log(_value(x)) / np.log(_value(base))
+
+
+@_process("round")
+def round_(x, p=0):
+    return np.round(_value(x), p)
+
+
+@_process()
+def clip(x, min, max):
+    return np.clip(_value(x), min, max)
+
+
+@_process()
+def linear_scale_range(x, inputMin, inputMax, outputMin=0, outputMax=1):
+    x = np.clip(_value(x), inputMin, inputMax)
+    return (x - inputMin) / (inputMax - inputMin) * (outputMax - outputMin) + outputMin
+
+
+@_process()
+def normalized_difference(x, y):
+    x, y = _value(x), _value(y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (x - y) / (x + y)
+
+
+@_process()
+def constant(x):
+    return x
+
+
+@_process()
+def e():
+    return math.e
+
+
+@_process()
+def pi():
+    return math.pi
+
+
+@_process()
+def nan():
+    return np.nan
+
+
+# Comparison processes
+
+
+def _compare(op: Callable, x, y):
+    if isinstance(x, str) or isinstance(y, str):
+        return op(x, y) if isinstance(x, str) and isinstance(y, str) else False
+    x, y = _value(x), _value(y)
+    with np.errstate(invalid="ignore"):
+        return _bool_or_null(_with_nulls(op(x, y), x, y))
+
+
+@_process()
+def eq(x, y, delta=None, case_sensitive=True):
+    if isinstance(x, str) and isinstance(y, str) and not case_sensitive:
+        return x.lower() == y.lower()
+    if delta is not None:
+        return _compare(lambda a, b: np.abs(a - b) <= delta, x, y)
+    return _compare(lambda a, b: a == b, x, y)
+
+
+@_process()
+def neq(x, y, delta=None, case_sensitive=True):
+    result = eq(x=x, y=y, delta=delta, case_sensitive=case_sensitive)
+    result = result.astype(float) if isinstance(result, xarray.DataArray) else np.asarray(result, dtype=float)
+    return _bool_or_null(_where(np.isnan(result), np.nan, 1.0 - result))
+
+
+@_process()
+def gt(x, y):
+    return _compare(lambda a, b: a > b, x, y)
+
+
+@_process()
+def gte(x, y):
+    return _compare(lambda a, b: a >= b, x, y)
+
+
+@_process()
+def lt(x, y):
+    return _compare(lambda a, b: a < b, x, y)
+
+
+@_process()
+def lte(x, y):
+    return _compare(lambda a, b: a <= b, x, y)
+
+
+@_process()
+def between(x, min, max, exclude_max=False):
+    x = _value(x)
+    with np.errstate(invalid="ignore"):
+        result = (x >= min) & ((x < max) if exclude_max else (x <= max))
+    return _bool_or_null(_with_nulls(result, x))
+
+
+@_process()
+def is_nan(x):
+    return _isnan(x)
+
+
+@_process()
+def is_nodata(x):
+    return _isnan(x)
+
+
+@_process()
+def is_valid(x):
+    x = _value(x)
+    return np.isfinite(x) if not isinstance(x, str) else True
+
+
+@_process()
+def is_infinite(x):
+    x = _value(x)
+    return np.isinf(x) if not isinstance(x, str) else False
+
+
+# Logic processes
+
+
+@_process("and")
+def and_(x, y):
+    false = _falsy(x) | _falsy(y)
+    null = _isnan(x) | _isnan(y)
+    return _bool_or_null(_where(false, 0.0, _where(null, np.nan, 1.0)))
+
+
+@_process("or")
+def or_(x, y):
+    true = _truthy(x) | _truthy(y)
+    null = _isnan(x) | _isnan(y)
+    return _bool_or_null(_where(true, 1.0, _where(null, np.nan, 0.0)))
+
+
+@_process()
+def xor(x, y):
+    return _bool_or_null(_with_nulls(_truthy(x) != _truthy(y), x, y))
+
+
+@_process("not")
+def not_(x):
+    return _bool_or_null(_with_nulls(_falsy(x), x))
+
+
+@_process("if")
+def if_(value, accept, reject=None):
+    return _where(_truthy(value), _value(accept), _value(reject))
+
+
+# Array processes (along the first axis)
+
+
+def _reduce(data, f: Callable, nan_f: Optional[Callable] = None, ignore_nodata: bool = True, **kwargs):
+    data = _array(data)
+    if ignore_nodata and nan_f:
+        f = nan_f
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        # E.g. "Mean of empty slice" or "All-NaN slice encountered"
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        if isinstance(data, xarray.DataArray):
+            return data.reduce(f, axis=0, **kwargs)
+        return f(data, axis=0, **kwargs)
+
+
+@_process("sum")
+def sum_(data, ignore_nodata=True):
+    data = _array(data)
+    if data.shape[0] == 0:
+        return np.nan
+    result = _reduce(data, np.sum, np.nansum, ignore_nodata=ignore_nodata)
+    # All-null slices give null (not 0)
+    return _where(np.all(_isnan(data), axis=0), np.nan, result) if ignore_nodata else result
+
+
+@_process()
+def product(data, ignore_nodata=True):
+    data = _array(data)
+    if data.shape[0] == 0:
+        return np.nan
+    result = _reduce(data, np.prod, np.nanprod, ignore_nodata=ignore_nodata)
+    return _where(np.all(_isnan(data), axis=0), np.nan, result) if ignore_nodata else result
+
+
+@_process()
+def mean(data, ignore_nodata=True):
+    return _reduce(data, np.mean, np.nanmean, ignore_nodata=ignore_nodata)
+
+
+@_process()
+def median(data, ignore_nodata=True):
+    return _reduce(data, np.median, np.nanmedian, ignore_nodata=ignore_nodata)
+
+
+@_process("min")
+def min_(data, ignore_nodata=True):
+    return _reduce(data, np.min, np.nanmin, ignore_nodata=ignore_nodata)
+
+
+@_process("max")
+def max_(data, ignore_nodata=True):
+    return _reduce(data, np.max, np.nanmax, ignore_nodata=ignore_nodata)
+
+
+@_process()
+def sd(data, ignore_nodata=True):
+    return _reduce(data, np.std, np.nanstd, ignore_nodata=ignore_nodata, ddof=1)
+
+
+@_process()
+def variance(data, ignore_nodata=True):
+    return _reduce(data, np.var, np.nanvar, ignore_nodata=ignore_nodata, ddof=1)
+
+
+@_process()
+def extrema(data, ignore_nodata=True):
+    return _array([min_(data, ignore_nodata=ignore_nodata), max_(data, ignore_nodata=ignore_nodata)])
+
+
+@_process()
+def quantiles(data, probabilities=None, q=None, ignore_nodata=True):
+    if probabilities is None:
+        if q is None:
+            raise ValueError("quantiles: either `probabilities` or `q` must be specified")
+        probabilities = [i / q for i in range(1, q)]
+    data = _array(data)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        if ignore_nodata:
+            return np.nanquantile(data, probabilities, axis=0)
+        return np.quantile(data, probabilities, axis=0)
+
+
+def _first_valid(data: np.ndarray, axis: int = 0, reverse: bool = False) -> np.ndarray:
+    valid = ~np.isnan(data)
+    if reverse:
+        data, valid = np.flip(data, axis=axis), np.flip(valid, axis=axis)
+    index = np.expand_dims(np.argmax(valid, axis=axis), axis=axis)
+    return np.where(np.any(valid, axis=axis), np.take_along_axis(data, index, axis=axis).squeeze(axis=axis), np.nan)
+
+
+@_process()
+def first(data, ignore_nodata=True):
+    if ignore_nodata:
+        return _reduce(data, _first_valid)
+    return _array(data)[0]
+
+
+@_process()
+def last(data, ignore_nodata=True):
+    if ignore_nodata:
+        return _reduce(data, lambda d, axis: _first_valid(d, axis=axis, reverse=True))
+    return _array(data)[-1]
+
+
+def _null_reduced(data: Union[np.ndarray, xarray.DataArray]):
+    """Null result of reducing given data along its (empty) first axis."""
+    if isinstance(data, xarray.DataArray):
+        dim = data.dims[0]
+        coords = {k: c for k, c in data.coords.items() if dim not in c.dims}
+        return xarray.DataArray(np.full(data.shape[1:], np.nan), dims=data.dims[1:], coords=coords)
+    result = np.full(data.shape[1:], np.nan)
+    return result[()] if result.ndim == 0 else result
+
+
+@_process("all")
+def all_(data, ignore_nodata=True):
+    data = _array(data)
+    if data.shape[0] == 0:
+        return _null_reduced(data)
+    false = np.any(_falsy(data), axis=0)
+    null = np.any(_isnan(data), axis=0) if not ignore_nodata else False
+    return _bool_or_null(_where(false, 0.0, _where(null, np.nan, 1.0)))
+
+
+@_process("any")
+def any_(data, ignore_nodata=True):
+    data = _array(data)
+    if data.shape[0] == 0:
+        return _null_reduced(data)
+    true = np.any(_truthy(data), axis=0)
+    null = np.any(_isnan(data), axis=0) if not ignore_nodata else False
+    return _bool_or_null(_where(true, 1.0, _where(null, np.nan, 0.0)))
+
+
+def _cumulative(data, ignore_nodata: bool, f: Callable, fill: float):
+    data = _array(data)
+    if not ignore_nodata:
+        return f(data, axis=0)
+    null = _isnan(data)
+    return _where(null, np.nan, f(_where(null, fill, data), axis=0))
+
+
+@_process()
+def cumsum(data, ignore_nodata=True):
+    return _cumulative(data, ignore_nodata, np.cumsum, 0)
+
+
+@_process()
+def cumproduct(data, ignore_nodata=True):
+    return _cumulative(data, ignore_nodata, np.cumprod, 1)
+
+
+@_process()
+def cummin(data, ignore_nodata=True):
+    return _cumulative(data, ignore_nodata, np.minimum.accumulate, np.inf)
+
+
+@_process()
+def cummax(data, ignore_nodata=True):
+    return _cumulative(data, ignore_nodata, np.maximum.accumulate, -np.inf)
+
+
+class ArrayElementNotAvailable(ProcessGraphVisitException):
+    pass
+
+
+@_process()
+def array_element(data, index=None, label=None, return_nodata=False):
+    data = _array(data)
+    if label is not None:
+        if not isinstance(data, xarray.DataArray):
+            raise ProcessGraphVisitException("array_element: label lookup requires a labeled array (xarray)")
+        labels = list(data[data.dims[0]].values)
+        if label not in labels:
+            if return_nodata:
+                return _where(True, np.nan, data[0])
+            raise ArrayElementNotAvailable(f"array_element: label {label!r} not available")
+        index = labels.index(label)
+    if index is None:
+        raise ProcessGraphVisitException("array_element: either `index` or `label` must be specified")
+    if not (0 <= index < data.shape[0]):
+        if return_nodata:
+            return np.full(data.shape[1:], np.nan)[()] if data.ndim > 1 else np.nan
+        raise ArrayElementNotAvailable(f"array_element: index {index} not available")
+    return data[index]
+
+
+@_process()
+def array_create(data=None, repeat=1):
+    return _array(list(data or []) * repeat)
+
+
+@_process()
+def array_concat(array1, array2):
+    array1, array2 = _array(array1), _array(array2)
+    if isinstance(array1, xarray.DataArray) or isinstance(array2, xarray.DataArray):
+        return xarray.concat([array1, array2], dim=array1.dims[0])
+    return np.concatenate([array1, array2], axis=0)
+
+
+@_process()
+def array_contains(data, value):
+    if value is None:
+        return False
+    data = _array(data)
+    with np.errstate(invalid="ignore"):
+        return np.any(data == value, axis=0)
+
+
+@_process()
+def array_find(data, value, reverse=False):
+    data = _array(data)
+    with np.errstate(invalid="ignore"):
+        found = np.asarray(data == value)
+    if reverse:
+        index = data.shape[0] - 1 - np.argmax(np.flip(found, axis=0), axis=0)
+    else:
+        index = np.argmax(found, axis=0)
+    return _where(np.any(found, axis=0), index, np.nan)
+
+
+@_process()
+def array_labels(data):
+    data = _array(data)
+    if isinstance(data, xarray.DataArray):
+        return data[data.dims[0]].values
+    return np.arange(data.shape[0])
+
+
+@_process()
+def array_apply(data, process: Callable, context=None):
+    data = _array(data)
+    index = np.arange(data.shape[0]).reshape((-1,) + (1,) * (data.ndim - 1))
+    return process(x=data, index=index, label=array_labels(data).reshape(index.shape), context=context)
+
+
+@_process()
+def array_filter(data, condition: Callable, context=None):
+    data = _array(data)
+    if data.ndim != 1:
+        raise ProcessGraphVisitException("array_filter: only one-dimensional arrays are supported")
+    index = np.arange(data.shape[0])
+    mask = _truthy(condition(x=data, index=index, label=array_labels(data), context=context))
+    return data[np.asarray(mask, dtype=bool)]
+
+
+@_process()
+def count(data, condition=None, context=None):
+    data = _array(data)
+    if condition is None:
+        return np.sum(~_isnan(data), axis=0)
+    elif condition is True:
+        return np.sum(np.ones_like(data, dtype=int), axis=0)
+    return np.sum(_truthy(condition(x=data, context=context)), axis=0)
+
+
+# Compilation
+
+# An evaluation step: node key, process implementation and evaluator of the arguments
+_Step = Tuple[str, Callable, Callable[["_Scope"], dict]]
+
+
+class _Scope:
+    """Evaluation scope: parameter values (with lookup in the parent scope) and node results."""
+
+    __slots__ = ("parameters", "parent", "results")
+
+    def __init__(self, parameters: Mapping[str, Any], parent: Optional[_Scope] = None):
+        self.parameters = parameters
+        self.parent = parent
+        self.results: Dict[str, Any] = {}
+
+    def get_parameter(self, name: str):
+        scope = self
+        while scope is not None:
+            if name in scope.parameters:
+                return scope.parameters[name]
+            scope = scope.parent
+        raise ProcessGraphVisitException(f"No value for parameter {name!r}")
+
+
+class _Reference:
+    """Unflattened reference to a node result or parameter (to compile into an evaluator)."""
+
+    __slots__ = ("node", "parameter")
+
+    def __init__(self, node: Optional[str] = None, parameter: Optional[str] = None):
+        self.node = node
+        self.parameter = parameter
+
+
+class _Compiler(ProcessGraphUnflattener):
+    """Compile a flat graph to a sequence of evaluation steps (in dependency order)."""
+
+    def __init__(self, flat_graph: dict, processes: Mapping[str, Callable]):
+        super().__init__(flat_graph=flat_graph)
+        self._processes = processes
+        self.steps: List[_Step] = []
+        self._current_key = None
+
+    def get_node(self, key: str) -> Any:
+        if key not in self._nodes:
+            # Dependencies first, so that the evaluation steps are collected in dependency order.
+            self._process_dependencies(key)
+            self._current_key = key
+        return super().get_node(key)
+
+    def _process_node(self, node: dict) -> _Reference:
+        process_id = node["process_id"]
+        if node.get("namespace") is not None or process_id not in self._processes:
+            raise ProcessGraphVisitException(
+                f"Unsupported process {process_id!r} (namespace {node.get('namespace')!r})"
+            )
+        key = self._current_key
+        arguments = self._compile_value(self._process_value(value=node.get("arguments", {})))
+        self.steps.append((key, self._processes[process_id], arguments))
+        return _Reference(node=key)
+
+    def _process_from_node(self, key: str, node: dict) -> _Reference:
+        return self.get_node(key=key)
+
+    def _process_from_parameter(self, name: str) -> _Reference:
+        return _Reference(parameter=name)
+
+    def _compile_value(self, value) -> Callable[[_Scope], Any]:
+        """Compile an (unflattened) argument value to an evaluator function."""
+        if isinstance(value, _Reference):
+            if value.node is not None:
+                key = value.node
+                return lambda scope: scope.results[key]
+            name = value.parameter
+            return lambda scope: scope.get_parameter(name)
+        elif isinstance(value, dict) and "process_graph" in value:
+            compiled = CompiledProcessGraph(value["process_graph"], processes=self._processes)
+            return lambda scope: compiled.bind(parent=scope)
+        elif isinstance(value, dict):
+            items = [(k, self._compile_value(v)) for k, v in value.items()]
+            return lambda scope: {k: f(scope) for k, f in items}
+        elif isinstance(value, list):
+            items = [self._compile_value(v) for v in value]
+            return lambda scope: [f(scope) for f in items]
+        return lambda scope: value
+
+
+class CompiledProcessGraph:
+    """
+    Process graph, compiled for (repeated) evaluation on local (NumPy/xarray) data.
+    Call it with the process graph parameters as keyword arguments to evaluate it.
+
+    :param process_graph: flat graph representation (optionally wrapped in a ``{"process_graph": ...}`` dict)
+        or process graph building object (e.g. :py:class:`~openeo.internal.graph_building.PGNode`).
+    :param processes: process implementations to use (instead of the default :py:data:`PROCESSES`).
+    """
+
+    def __init__(
+        self,
+        process_graph: Union[dict, FlatGraphableMixin, _FromNodeMixin],
+        *,
+        processes: Optional[Mapping[str, Callable]] = None,
+    ):
+        if isinstance(process_graph, dict) and "process_graph" in process_graph:
+            # Child process graph argument (e.g. ``reducer`` of ``reduce_dimension``)
+            process_graph = process_graph["process_graph"]
+        if isinstance(process_graph, _FromNodeMixin) and not isinstance(process_graph, FlatGraphableMixin):
+            process_graph = process_graph.from_node()
+        flat_graph = as_flat_graph(process_graph)
+        if isinstance(flat_graph.get("process_graph"), dict):
+            flat_graph = flat_graph["process_graph"]
+        compiler = _Compiler(flat_graph=flat_graph, processes=PROCESSES if processes is None else processes)
+        result = compiler.process()
+        self._steps: List[_Step] = compiler.steps
+        self._result_key = result.node
+
+    def evaluate(self, parameters: Mapping[str, Any], parent: Optional[_Scope] = None) -> Any:
+        scope = _Scope(parameters=parameters, parent=parent)
+        results = scope.results
+        for key, process, arguments in self._steps:
+            results[key] = process(**arguments(scope))
+        return results[self._result_key]
+
+    def bind(self, parent: _Scope) -> Callable[..., Any]:
+        """Get a callable to evaluate this process graph as child process graph in given parent scope."""
+        return lambda **parameters: self.evaluate(parameters=parameters, parent=parent)
+
+    def __call__(self, **parameters) -> Any:
+        return self.evaluate(parameters=parameters)
+
+
+def compile_process_graph(
+    process_graph: Union[dict, FlatGraphableMixin, _FromNodeMixin, Callable, str, Path],
+    *,
+    processes: Optional[Mapping[str, Callable]] = None,
+) -> CompiledProcessGraph:
+    """
+    Compile a process graph (or child callback) for efficient evaluation on local NumPy arrays/xarray DataArrays.
+
+    :param process_graph: flat graph representation (dict, JSON string or path),
+        process graph building object (e.g. :py:class:`~openeo.internal.graph_building.PGNode`)
+        or a Python callable as used for child callbacks (e.g. ``lambda x: x * 2 + 1``).
+    :param processes: process implementations to use (instead of the default :py:data:`PROCESSES`).
+    :return: compiled process graph, to call with the process graph parameters as keyword arguments.
+    """
+    if callable(process_graph) and not isinstance(process_graph, (FlatGraphableMixin, _FromNodeMixin)):
+        from openeo.internal.processes.builder import convert_callable_to_pgnode
+
+        process_graph = convert_callable_to_pgnode(process_graph)
+    return CompiledProcessGraph(process_graph, processes=processes)
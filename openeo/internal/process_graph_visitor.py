@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from abc import ABC
-from typing import Any, Tuple, Union
+from typing import Any, Iterator, Tuple, Union
 
 from openeo.internal.warnings import deprecated
 from openeo.rest import OpenEoClientException
@@ -97,48 +97,89 @@ class ProcessGraphVisitor(ABC):
         self.accept_node(node)
 
     def accept_node(self, node: dict):
+        self._run_steps(self._accept_node_steps(node))
+
+    def _run_steps(self, steps: Iterator):
+        """
+        Drive a traversal with an explicit stack (instead of recursion),
+        so that very deep graphs don't hit the recursion limit.
+
+        Traversal steps are generators that yield the nodes to visit (depth-first):
+        the generator is resumed when the yielded node has been fully visited.
+        """
+        legacy_accept_node = self._has_legacy_accept_node()
+        stack = [steps]
+        while stack:
+            try:
+                node = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+            if legacy_accept_node:
+                # Subclass only overrides `accept_node`: call it directly (recursively).
+                self.accept_node(node)
+            else:
+                stack.append(self._accept_node_steps(node))
+
+    def _has_legacy_accept_node(self) -> bool:
+        cls = type(self)
+        return (
+            cls.accept_node is not ProcessGraphVisitor.accept_node
+            and cls._accept_node_steps is ProcessGraphVisitor._accept_node_steps
+        )
+
+    def _accept_node_steps(self, node: dict) -> Iterator:
+        """Traversal steps to visit given node (overridable counterpart of `accept_node`)."""
         pid = node["process_id"]
         arguments = node.get("arguments", {})
         namespace = node.get("namespace", None)
-        self._accept_process(process_id=pid, arguments=arguments, namespace=namespace)
+        yield from self._accept_process_steps(process_id=pid, arguments=arguments, namespace=namespace)
 
     def _accept_process(self, process_id: str, arguments: dict, namespace: Union[str, None]):
+        self._run_steps(self._accept_process_steps(process_id=process_id, arguments=arguments, namespace=namespace))
+
+    def _accept_process_steps(self, process_id: str, arguments: dict, namespace: Union[str, None]) -> Iterator:
         self.process_stack.append(process_id)
         self.enterProcess(process_id=process_id, arguments=arguments, namespace=namespace)
         for arg_id, value in sorted(arguments.items()):
             if isinstance(value, list):
                 self.enterArray(argument_id=arg_id)
-                self._accept_argument_list(value)
+                yield from self._accept_argument_list_steps(value)
                 self.leaveArray(argument_id=arg_id)
             elif isinstance(value, dict):
                 self.enterArgument(argument_id=arg_id, value=value)
-                self._accept_argument_dict(value)
+                yield from self._accept_argument_dict_steps(value)
                 self.leaveArgument(argument_id=arg_id, value=value)
             else:
                 self.constantArgument(argument_id=arg_id, value=value)
         self.leaveProcess(process_id=process_id, arguments=arguments, namespace=namespace)
         assert self.process_stack.pop() == process_id
 
-    def _accept_argument_list(self, elements: list):
+    def _accept_argument_list_steps(self, elements: list) -> Iterator:
         for element in elements:
             if isinstance(element, dict):
-                self._accept_argument_dict(element)
+                yield from self._accept_argument_dict_steps(element)
                 self.arrayElementDone(element)
             else:
                 self.constantArrayElement(element)
 
-    def _accept_argument_dict(self, value: dict):
+    def _accept_argument_dict_steps(self, value: dict) -> Iterator:
         if DEREFERENCED_NODE_KEY in value and "from_node" in value:
             # TODO: this looks bit weird (or at least very specific).
-            self.accept_node(value[DEREFERENCED_NODE_KEY])
+            yield value[DEREFERENCED_NODE_KEY]
         elif value.get("from_node"):
-            self.accept_node(value["from_node"])
+            yield value["from_node"]
         elif "process_id" in value:
-            self.accept_node(value)
+            yield value
         elif "from_parameter" in value:
             self.from_parameter(value["from_parameter"])
         else:
-            self._accept_dict(value)
+            yield from self._accept_dict_steps(value)
+
+    def _accept_dict_steps(self, value: dict) -> Iterator:
+        """Traversal steps for a generic dict argument (overridable counterpart of `_accept_dict`)."""
+        self._accept_dict(value)
+        yield from ()
 
     def _accept_dict(self, value: dict):
         pass
@@ -220,6 +261,7 @@ class ProcessGraphUnflattener:
     def get_node(self, key: str) -> Any:
         """Get processed node by node key."""
         if key not in self._nodes:
+            self._process_dependencies(key)
             self._nodes[key] = self._UNDER_CONSTRUCTION
             node = self._process_node(self._flat_graph[key])
             self._nodes[key] = node
@@ -227,6 +269,44 @@ class ProcessGraphUnflattener:
             raise ProcessGraphVisitException("Cycle in process graph")
         return self._nodes[key]
 
+    def _process_dependencies(self, key: str):
+        """
+        Process the (transitive) "from_node" dependencies of given node first (depth-first, in post-order),
+        with an explicit stack instead of recursion, so that very deep graphs don't hit the recursion limit:
+        when processing a node, its dependencies are already available.
+        """
+        stack = [(key, iter(self._from_node_keys(self._flat_graph.get(key, {}).get("arguments"))))]
+        visiting = {key}
+        while stack:
+            current, dependencies = stack[-1]
+            dependency = next(dependencies, None)
+            if dependency is None:
+                stack.pop()
+                visiting.discard(current)
+                if current != key and current not in self._nodes:
+                    self.get_node(current)
+            elif dependency in visiting:
+                raise ProcessGraphVisitException("Cycle in process graph")
+            elif dependency not in self._nodes and dependency in self._flat_graph:
+                visiting.add(dependency)
+                stack.append((dependency, iter(self._from_node_keys(self._flat_graph[dependency].get("arguments")))))
+
+    @staticmethod
+    def _from_node_keys(value) -> Iterator[str]:
+        """Find "from_node" references (in traversal order of `_process_value`)."""
+        stack = [value]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, dict):
+                if "from_node" in value:
+                    yield value["from_node"]
+                elif "from_parameter" in value or "process_graph" in value:
+                    continue
+                else:
+                    stack.extend(reversed(list(value.values())))
+            elif isinstance(value, (list, tuple)):
+                stack.extend(reversed(value))
+
     def _process_node(self, node: dict) -> Any:
         """
         Overridable: generate process graph node from flat_graph data.
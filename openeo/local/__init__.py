@@ -1,3 +1,11 @@
-from openeo.local.connection import LocalConnection
-
 __all__ = ["LocalConnection"]
+
+
+def __getattr__(name):
+    # Lazy import: `LocalConnection` requires optional dependencies (e.g. `openeo_processes_dask`),
+    # which should not be required for lightweight submodules like `openeo.local.execution`.
+    if name == "LocalConnection":
+        from openeo.local.connection import LocalConnection
+
+        return LocalConnection
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
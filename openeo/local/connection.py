@@ -1,7 +1,8 @@
+import contextlib
 import datetime
 import logging
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 import xarray as xr
@@ -16,6 +17,16 @@ from openeo.local.collections import (
     _get_local_collections,
     _get_netcdf_zarr_metadata,
 )
+from openeo.local.execution import (
+    ChunkingPolicy,
+    ExecutionOptions,
+    ExecutionProfile,
+    guess_format,
+    profile_tasks,
+    profiling,
+    to_dataset,
+    use_chunking_policy,
+)
 from openeo.local.processing import PROCESS_REGISTRY
 from openeo.metadata import (
     Band,
@@ -34,14 +45,44 @@ class LocalConnection():
     Connection to no backend, for local processing.
     """
 
-    def __init__(self,local_collections_path: Union[str,List]):
+    def __init__(
+        self,
+        local_collections_path: Union[str, List],
+        *,
+        scheduler: Optional[str] = None,
+        num_workers: Optional[int] = None,
+        memory_limit: Union[int, str, None] = None,
+        chunking: Union[ChunkingPolicy, bool, None] = True,
+    ):
         """
         Constructor of LocalConnection.
 
         :param local_collections_path: String or list of strings, path to the folder(s) with
-        the local collections in netCDF, geoTIFF or ZARR.
+            the local collections in netCDF, geoTIFF or ZARR.
+        :param scheduler: dask scheduler to compute results with:
+            "threads", "processes", "synchronous"
+            or "distributed" (a ``distributed.LocalCluster``, started on first use).
+            If not set: dask's default (or currently configured) scheduler.
+        :param num_workers: number of worker threads/processes.
+        :param memory_limit: memory limit (bytes or string like ``"4GB"``):
+            per worker for the "distributed" scheduler, otherwise only used to cap the chunk size.
+        :param chunking: :py:class:`~openeo.local.execution.ChunkingPolicy` to chunk collections
+            loaded with ``load_collection``, ``True`` for the default policy,
+            or ``False`` to load each variable as a single chunk.
+
+        .. versionchanged:: 0.52.0
+            Added execution options ``scheduler``, ``num_workers``, ``memory_limit`` and ``chunking``.
         """
         self.local_collections_path = local_collections_path
+        if chunking is True:
+            chunking = ChunkingPolicy()
+        self.execution_options = ExecutionOptions(
+            scheduler=scheduler,
+            num_workers=num_workers,
+            memory_limit=memory_limit,
+            chunking=chunking or None,
+        )
+        self._dask_client = None
 
     def list_collections(self) -> List[dict]:
         """
@@ -274,6 +315,9 @@ class LocalConnection():
         """
         Execute locally the process graph and return the result as an xarray.DataArray.
 
+        The result is lazy (dask backed, chunked according to the connection's chunking policy):
+        use :py:meth:`compute` or :py:meth:`save_result` to compute it with the configured scheduler.
+
         :param process_graph: (flat) dict representing a process graph, or process graph as raw JSON string,
         :return: a datacube containing the requested data
         """
@@ -282,4 +326,89 @@ class LocalConnection():
         if auto_decode is not True:
             raise ValueError("LocalConnection requires auto_decode=True")
         process_graph = as_flat_graph(process_graph)
-        return OpenEOProcessGraph(process_graph).to_callable(PROCESS_REGISTRY)()
+        with use_chunking_policy(self.execution_options.effective_chunking()):
+            return OpenEOProcessGraph(process_graph).to_callable(PROCESS_REGISTRY)()
+
+    @contextlib.contextmanager
+    def _scheduler(self) -> Iterator[None]:
+        """Context to run dask computations with the configured scheduler."""
+        import dask
+
+        if self.execution_options.scheduler == "distributed":
+            if self._dask_client is None:
+                self._dask_client = self.execution_options.create_client()
+            with dask.config.set(scheduler=self._dask_client), profile_tasks(client=self._dask_client):
+                yield
+        else:
+            with dask.config.set(self.execution_options.dask_config()), profile_tasks():
+                yield
+
+    def compute(self, data: Union[xr.DataArray, xr.Dataset]) -> Union[xr.DataArray, xr.Dataset]:
+        """
+        Compute a (lazy) result, as returned by :py:meth:`execute`, with the configured dask scheduler.
+
+        :param data: lazy result
+        :return: computed result (loaded in memory)
+
+        .. versionadded:: 0.52.0
+        """
+        with self._scheduler():
+            return data.compute()
+
+    def save_result(
+        self,
+        data: Union[xr.DataArray, xr.Dataset],
+        path: Union[str, Path],
+        *,
+        format: Optional[str] = None,
+    ) -> Path:
+        """
+        Compute a (lazy) result, as returned by :py:meth:`execute`, and write it chunk by chunk
+        to a NetCDF or Zarr file, without loading the full result in memory.
+
+        :param data: lazy result
+        :param path: output path
+        :param format: "netcdf" or "zarr" (guessed from the file extension if not specified)
+        :return: output path
+
+        .. versionadded:: 0.52.0
+        """
+        path = Path(path)
+        format = (format or guess_format(path)).lower()
+        dataset = to_dataset(data)
+        if format == "netcdf":
+            delayed = dataset.to_netcdf(path, compute=False)
+        elif format == "zarr":
+            delayed = dataset.to_zarr(path, mode="w", compute=False)
+        else:
+            raise ValueError(f"Unsupported format {format!r}, expected 'netcdf' or 'zarr'")
+        with self._scheduler():
+            delayed.compute()
+        return path
+
+    @contextlib.contextmanager
+    def profile(self) -> Iterator[ExecutionProfile]:
+        """
+        Context manager to collect a per-process profiling report
+        of the :py:meth:`execute`, :py:meth:`compute` and :py:meth:`save_result` calls in its body, e.g.:
+
+        .. code-block:: python
+
+            with connection.profile() as profile:
+                result = connection.execute(process_graph)
+                connection.save_result(result, "result.nc")
+            print(profile)
+
+        .. versionadded:: 0.52.0
+        """
+        with profiling() as profile:
+            yield profile
+
+    def close(self):
+        """Shut down the dask ``LocalCluster`` of the "distributed" scheduler (if started)."""
+        if self._dask_client is not None:
+            cluster = self._dask_client.cluster
+            self._dask_client.close()
+            if cluster is not None:
+                cluster.close()
+            self._dask_client = None
@@ -0,0 +1,317 @@
+"""
+Execution controls for local processing (:py:class:`~openeo.local.LocalConnection`):
+dask scheduler selection, chunking of loaded collections, memory limits and per-process profiling.
+"""
+
+import collections
+import contextlib
+import contextvars
+import functools
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Union
+
+import xarray as xr
+
+_log = logging.getLogger(__name__)
+
+SCHEDULERS = ("threads", "processes", "synchronous", "distributed")
+
+_SPATIAL_DIMENSIONS = {"x", "y", "lon", "lat", "longitude", "latitude"}
+_TEMPORAL_DIMENSIONS = {"t", "time", "date"}
+
+
+@dataclass(frozen=True)
+class ChunkingPolicy:
+    """
+    Chunking policy for collections loaded with ``load_collection`` in local processing.
+
+    By default, all bands (and other non-spatiotemporal dimensions) and time steps are kept in a single chunk
+    and the spatial dimensions are tiled in square tiles to approach ``target_chunk_bytes``.
+    If a single spatial tile of ``min_spatial_tile`` pixels would exceed that target,
+    the temporal dimension is split too.
+
+    :param target_chunk_bytes: target size (in bytes) of a single chunk.
+    :param spatial_tile: fixed chunk size (in pixels) along each spatial dimension,
+        instead of deriving it from ``target_chunk_bytes``.
+    :param temporal_tile: fixed number of time steps per chunk,
+        instead of deriving it from ``target_chunk_bytes``.
+    :param min_spatial_tile: lower bound for derived spatial chunk sizes.
+
+    .. versionadded:: 0.52.0
+    """
+
+    target_chunk_bytes: int = 128 * 1024 * 1024
+    spatial_tile: Optional[int] = None
+    temporal_tile: Optional[int] = None
+    min_spatial_tile: int = 256
+
+    def chunks(self, sizes: Mapping[str, int], itemsize: int = 8) -> Dict[str, int]:
+        """
+        Determine chunk sizes for an array with given dimension sizes.
+
+        :param sizes: mapping of dimension name to dimension size.
+        :param itemsize: size (in bytes) of a single array element.
+        :return: mapping of dimension name to chunk size.
+        """
+        chunks = dict(sizes)
+        if any(s == 0 for s in sizes.values()):
+            # Empty array (e.g. empty temporal extent): nothing to split
+            return chunks
+        spatial = [d for d in sizes if str(d).lower() in _SPATIAL_DIMENSIONS]
+        temporal = [d for d in sizes if str(d).lower() in _TEMPORAL_DIMENSIONS]
+        base_bytes = itemsize * math.prod(s for d, s in sizes.items() if d not in spatial and d not in temporal)
+
+        if self.spatial_tile:
+            chunks.update({d: min(self.spatial_tile, sizes[d]) for d in spatial})
+        if self.temporal_tile:
+            chunks.update({d: min(self.temporal_tile, sizes[d]) for d in temporal})
+
+        if spatial and not self.spatial_tile:
+            pixels = self.target_chunk_bytes / (base_bytes * math.prod(chunks[d] for d in temporal))
+            tile = max(int(pixels ** (1 / len(spatial))), 1)
+            if not self.temporal_tile:
+                # Prefer splitting the temporal dimension over very small spatial tiles
+                tile = max(tile, self.min_spatial_tile)
+            chunks.update({d: min(tile, sizes[d]) for d in spatial})
+        if temporal and not self.temporal_tile:
+            steps = self.target_chunk_bytes // (base_bytes * math.prod(chunks[d] for d in spatial))
+            chunks.update({d: min(max(steps, 1), sizes[d]) for d in temporal})
+        return chunks
+
+    def with_memory_limit(self, memory_limit: int, workers: int) -> "ChunkingPolicy":
+        """
+        Cap the target chunk size, so that a couple of chunks per worker fit in the given memory limit.
+        """
+        target = min(self.target_chunk_bytes, max(memory_limit // (4 * max(workers, 1)), 1))
+        return ChunkingPolicy(
+            target_chunk_bytes=target,
+            spatial_tile=self.spatial_tile,
+            temporal_tile=self.temporal_tile,
+            min_spatial_tile=self.min_spatial_tile,
+        )
+
+    def apply(self, data: Union[xr.DataArray, xr.Dataset]) -> Union[xr.DataArray, xr.Dataset]:
+        """Rechunk given (lazy) data according to this policy."""
+        if isinstance(data, xr.Dataset):
+            itemsize = max((v.dtype.itemsize for v in data.data_vars.values()), default=8)
+        else:
+            itemsize = data.dtype.itemsize
+        return data.chunk(self.chunks(dict(data.sizes), itemsize=itemsize))
+
+
+def parse_memory_limit(memory_limit: Union[int, str, None]) -> Optional[int]:
+    """Parse memory limit (bytes as int, or human-readable string like ``"4GB"``) to bytes."""
+    if memory_limit is None or isinstance(memory_limit, int):
+        return memory_limit
+    import dask.utils
+
+    return dask.utils.parse_bytes(memory_limit)
+
+
+_chunking_policy = contextvars.ContextVar("openeo_local_chunking_policy", default=None)
+
+
+@contextlib.contextmanager
+def use_chunking_policy(policy: Optional[ChunkingPolicy]) -> Iterator[None]:
+    """Context manager to set the chunking policy for collections loaded with ``load_collection``."""
+    token = _chunking_policy.set(policy)
+    try:
+        yield
+    finally:
+        _chunking_policy.reset(token)
+
+
+def current_chunking_policy() -> Optional[ChunkingPolicy]:
+    return _chunking_policy.get()
+
+
+@dataclass
+class _Stats:
+    count: int = 0
+    seconds: float = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+
+
+class ExecutionProfile:
+    """
+    Per-process profiling report of local processing, as collected by :py:meth:`LocalConnection.profile`.
+
+    - "processes": openEO process implementation calls (number of calls and inclusive wall time,
+      which mostly covers building the lazy dask graph, plus eager operations)
+    - "tasks": dask tasks executed while computing or saving results, grouped by task name prefix
+      (number of tasks and total task time, summed over workers).
+
+    .. versionadded:: 0.52.0
+    """
+
+    def __init__(self):
+        self.processes: Dict[str, _Stats] = collections.defaultdict(_Stats)
+        self.tasks: Dict[str, _Stats] = collections.defaultdict(_Stats)
+
+    def to_dict(self) -> dict:
+        return {
+            section: {name: {"count": s.count, "seconds": s.seconds} for name, s in stats.items()}
+            for section, stats in [("processes", self.processes), ("tasks", self.tasks)]
+        }
+
+    def __str__(self) -> str:
+        lines = [f"{'':<2}{'name':<32} {'count':>8} {'seconds':>10}"]
+        for section, stats in [("processes", self.processes), ("tasks", self.tasks)]:
+            lines.append(f"{section}:")
+            for name, s in sorted(stats.items(), key=lambda kv: -kv[1].seconds):
+                lines.append(f"{'':<2}{name:<32} {s.count:>8} {s.seconds:>10.3f}")
+        return "\n".join(lines)
+
+
+_profile = contextvars.ContextVar("openeo_local_profile", default=None)
+
+
+@contextlib.contextmanager
+def profiling() -> Iterator[ExecutionProfile]:
+    """Context manager to collect an :py:class:`ExecutionProfile`."""
+    profile = ExecutionProfile()
+    token = _profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
+
+
+def current_profile() -> Optional[ExecutionProfile]:
+    return _profile.get()
+
+
+# Implementation function names that differ from their openEO process id
+_PROCESS_IDS = {"load_local_collection": "load_collection"}
+
+
+def profiled(f: Callable) -> Callable:
+    """Process implementation wrapper to record calls in the active :py:class:`ExecutionProfile` (if any)."""
+    name = getattr(f, "__name__", repr(f))
+    process_id = _PROCESS_IDS.get(name, name)
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        profile = _profile.get()
+        if profile is None:
+            return f(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            profile.processes[process_id].add(time.perf_counter() - start)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def profile_tasks(client=None) -> Iterator[None]:
+    """Context manager to record executed dask tasks in the active :py:class:`ExecutionProfile` (if any)."""
+    profile = _profile.get()
+    if profile is None:
+        yield
+        return
+
+    from dask.utils import key_split
+
+    if client is not None:
+        from distributed import get_task_stream
+
+        with get_task_stream(client=client) as task_stream:
+            yield
+        for task in task_stream.data:
+            seconds = sum(s["stop"] - s["start"] for s in task.get("startstops", []) if s.get("action") == "compute")
+            profile.tasks[key_split(task["key"])].add(seconds)
+    else:
+        from dask.diagnostics import Profiler
+
+        with Profiler() as profiler:
+            yield
+        for task in profiler.results:
+            profile.tasks[key_split(task.key)].add(task.end_time - task.start_time)
+
+
+@dataclass(frozen=True)
+class ExecutionOptions:
+    """
+    Dask execution options of a :py:class:`~openeo.local.LocalConnection`.
+
+    :param scheduler: dask scheduler: "threads", "processes", "synchronous"
+        or "distributed" (a ``distributed.LocalCluster``, requires the ``distributed`` package).
+        If not set: dask's default (or currently configured) scheduler.
+    :param num_workers: number of worker threads/processes.
+    :param memory_limit: memory limit (bytes or string like ``"4GB"``):
+        per worker for the "distributed" scheduler,
+        and used to cap the chunk size of loaded collections for the other schedulers.
+    :param chunking: chunking policy for ``load_collection``.
+        If not set: a single chunk per variable (as stored).
+
+    .. versionadded:: 0.52.0
+    """
+
+    scheduler: Optional[str] = None
+    num_workers: Optional[int] = None
+    memory_limit: Union[int, str, None] = None
+    chunking: Optional[ChunkingPolicy] = None
+
+    def __post_init__(self):
+        if self.scheduler is not None and self.scheduler not in SCHEDULERS:
+            raise ValueError(f"Invalid scheduler {self.scheduler!r}, expected one of {SCHEDULERS}")
+
+    def effective_chunking(self) -> Optional[ChunkingPolicy]:
+        memory_limit = parse_memory_limit(self.memory_limit)
+        if self.chunking is None or memory_limit is None:
+            return self.chunking
+        return self.chunking.with_memory_limit(memory_limit, workers=self.num_workers or os.cpu_count() or 1)
+
+    def dask_config(self) -> dict:
+        """dask config settings for the local (non-distributed) schedulers."""
+        config = {}
+        if self.scheduler and self.scheduler != "distributed":
+            config["scheduler"] = self.scheduler
+        if self.num_workers:
+            config["num_workers"] = self.num_workers
+        return config
+
+    def create_client(self):
+        """Create a ``distributed.Client`` on a new ``LocalCluster`` according to these options."""
+        from distributed import Client, LocalCluster
+
+        kwargs = {}
+        if self.num_workers:
+            kwargs["n_workers"] = self.num_workers
+        if self.memory_limit is not None:
+            kwargs["memory_limit"] = self.memory_limit
+        _log.info(f"Starting dask LocalCluster with {kwargs}")
+        return Client(LocalCluster(**kwargs))
+
+
+def to_dataset(data: Union[xr.DataArray, xr.Dataset]) -> xr.Dataset:
+    """Convert a result data cube to a dataset (bands as variables) for writing to NetCDF/Zarr."""
+    if isinstance(data, xr.Dataset):
+        return data
+    if "bands" in data.dims:
+        dataset = data.to_dataset(dim="bands")
+    else:
+        dataset = data.to_dataset(name=data.name or "data")
+    # Only keep attributes that can be serialized
+    dataset.attrs = {k: v for k, v in data.attrs.items() if isinstance(v, (str, int, float, list, tuple))}
+    for variable in dataset.data_vars.values():
+        variable.attrs = {k: v for k, v in variable.attrs.items() if isinstance(v, (str, int, float, list, tuple))}
+    return dataset
+
+
+def guess_format(path: Union[str, os.PathLike]) -> str:
+    suffixes: List[str] = [s.lower() for s in os.fspath(path).rsplit("/", 1)[-1].split(".")[1:]]
+    if "zarr" in suffixes:
+        return "zarr"
+    elif "nc" in suffixes or "netcdf" in suffixes:
+        return "netcdf"
+    raise ValueError(f"Can not guess format (NetCDF or Zarr) from {path!r}")
@@ -10,11 +10,13 @@ from openeo_pg_parser_networkx import ProcessRegistry
 from openeo_pg_parser_networkx.process_registry import Process
 from openeo_processes_dask.process_implementations.core import process
 
+from openeo.local.execution import current_chunking_policy, profiled
+
 _log = logging.getLogger(__name__)
 
 
 def init_process_registry():
-    process_registry = ProcessRegistry(wrap_funcs=[process])
+    process_registry = ProcessRegistry(wrap_funcs=[process, profiled])
 
     # Import these pre-defined processes from openeo_processes_dask and register them into registry
     processes_from_module = [
@@ -72,6 +74,9 @@ def load_local_collection(*args, **kwargs):
             if descriptions:
                 data = data.rename({d: descriptions[0]})
         data = data.to_array(dim='bands')
+    chunking_policy = current_chunking_policy()
+    if chunking_policy is not None:
+        data = chunking_policy.apply(data)
     return data
 
 PROCESS_REGISTRY["load_collection"] = Process(
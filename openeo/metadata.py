@@ -23,6 +23,7 @@ from openeo.api.process import Parameter
 from openeo.internal.jupyter import render_component
 from openeo.util import Rfc3339, deep_get
 from openeo.utils.normalize import normalize_resample_resolution, unique
+from openeo.utils.stac import DEFAULT_MAX_WORKERS, get_default_stac_io, iter_stac_items
 
 _log = logging.getLogger(__name__)
 
@@ -39,20 +40,30 @@ class DimensionAlreadyExistsException(MetadataException):
 # TODO: align better with STAC datacube extension
 # TODO: align/adapt/integrate with pystac's datacube extension implementation?
 class Dimension:
-    """Base class for dimensions."""
+    """
+    Base class for dimensions.
+
+    Dimension objects are treated as immutable: operations return new objects
+    (sharing unchanged parts, like :py:class:`Band` tuples, with the original).
+    Derived lookup structures (prefixed with underscore) are cached on first use.
+    """
 
     def __init__(self, type: str, name: str):
         self.type = type
         self.name = name
 
+    def _fields(self) -> dict:
+        """Public (non-cached) fields."""
+        return {k: v for (k, v) in self.__dict__.items() if not k.startswith("_")}
+
     def __repr__(self):
         return "{c}({f})".format(
             c=self.__class__.__name__,
-            f=", ".join("{k!s}={v!r}".format(k=k, v=v) for (k, v) in self.__dict__.items())
+            f=", ".join("{k!s}={v!r}".format(k=k, v=v) for (k, v) in self._fields().items())
         )
 
     def __eq__(self, other):
-        return self.__class__ == other.__class__ and self.__dict__ == other.__dict__
+        return self.__class__ == other.__class__ and self._fields() == other._fields()
 
     def rename(self, name) -> Dimension:
         """Create new dimension with new name."""
@@ -131,12 +142,36 @@ class Band(NamedTuple):
     gsd: Optional[dict] = None
 
 
+class _BandIndex(NamedTuple):
+    """Lookup tables from band name/common name/alias to (first) band index."""
+
+    names: Dict[str, int]
+    common_names: Dict[str, int]
+    aliases: Dict[str, List[int]]
+
+    @classmethod
+    def build(cls, bands: List[Band]) -> _BandIndex:
+        names = {}
+        common_names = {}
+        aliases = {}
+        for i, band in enumerate(bands):
+            names.setdefault(band.name, i)
+            common_names.setdefault(band.common_name, i)
+            for alias in band.aliases or []:
+                aliases.setdefault(alias, []).append(i)
+        return cls(names=names, common_names=common_names, aliases=aliases)
+
+
 class BandDimension(Dimension):
     # TODO #575 support unordered bands and avoid assumption that band order is known.
     def __init__(self, name: str, bands: List[Band]):
         super().__init__(type="bands", name=name)
         self.bands = bands
 
+    @functools.cached_property
+    def _index(self) -> _BandIndex:
+        return _BandIndex.build(self.bands)
+
     @property
     def band_names(self) -> List[str]:
         return [b.name for b in self.bands]
@@ -151,13 +186,13 @@ class BandDimension(Dimension):
 
     def _alias_match(self, name: str) -> Union[Tuple[int, Band], None]:
         """Look up band by alias, return (index, Band) or None if not found."""
-        matches = [(i, b) for (i, b) in enumerate(self.bands) if b.aliases and name in b.aliases]
+        matches = self._index.aliases.get(name, [])
         if len(matches) == 0:
             return None
         elif len(matches) == 1:
-            return matches[0]
+            return matches[0], self.bands[matches[0]]
         else:
-            raise ValueError(f"Multiple alias matches for band {name!r}: {[b.name for _, b in matches]}")
+            raise ValueError(f"Multiple alias matches for band {name!r}: {[self.bands[i].name for i in matches]}")
 
     def band_index(self, band: Union[int, str]) -> int:
         """
@@ -166,35 +201,33 @@ class BandDimension(Dimension):
         :param band: band name, common name or index
         :return int: band index
         """
-        band_names = self.band_names
-        if isinstance(band, int) and 0 <= band < len(band_names):
+        if isinstance(band, int) and 0 <= band < len(self.bands):
             return band
         elif isinstance(band, str):
-            common_names = self.common_names
             # First try common names if possible
-            if band in common_names:
-                return common_names.index(band)
-            if band in band_names:
-                return band_names.index(band)
+            if band in self._index.common_names:
+                return self._index.common_names[band]
+            if band in self._index.names:
+                return self._index.names[band]
             # Check band aliases to still support old band names
             if alias_match := self._alias_match(name=band):
                 return alias_match[0]
-        raise ValueError("Invalid band name/index {b!r}. Valid names: {n!r}".format(b=band, n=band_names))
+        raise ValueError("Invalid band name/index {b!r}. Valid names: {n!r}".format(b=band, n=self.band_names))
 
     def band_name(self, band: Union[str, int], allow_common=True) -> str:
         """Resolve (common) name or index to a valid (common) name"""
         if isinstance(band, str):
-            if band in self.band_names:
+            if band in self._index.names:
                 return band
-            elif band in self.common_names:
+            elif band in self._index.common_names:
                 if allow_common:
                     return band
                 else:
-                    return self.band_names[self.common_names.index(band)]
+                    return self.bands[self._index.common_names[band]].name
             elif alias_match := self._alias_match(name=band):
                 return alias_match[1].name
         elif isinstance(band, int) and 0 <= band < len(self.bands):
-            return self.band_names[band]
+            return self.bands[band].name
         raise ValueError("Invalid band name/index {b!r}. Valid names: {n!r}".format(b=band, n=self.band_names))
 
     def filter_bands(self, bands: List[Union[int, str]]) -> BandDimension:
@@ -211,7 +244,7 @@ class BandDimension(Dimension):
         """Create new BandDimension with appended band."""
         if isinstance(band, str):
             band = Band(name=band)
-        if band.name in self.band_names:
+        if band.name in self._index.names:
             raise ValueError("Duplicate band {b!r}".format(b=band))
 
         return BandDimension(
@@ -282,9 +315,12 @@ class CubeMetadata:
         self._dimensions: Union[List[Dimension], None] = dimensions
         self._band_dimension = None
         self._temporal_dimension = None
+        # Dimension name to (position) index lookup
+        self._dimension_index: Dict[str, int] = {}
 
         if dimensions is not None:
-            for dim in self._dimensions:
+            for i, dim in enumerate(self._dimensions):
+                self._dimension_index.setdefault(dim.name, i)
                 # TODO: here we blindly pick last bands or temporal dimension if multiple. Let user choose?
                 # TODO: add spatial dimension handling?
                 if dim.type == "bands":
@@ -328,9 +364,8 @@ class CubeMetadata:
 
     def assert_valid_dimension(self, dimension: str) -> str:
         """Make sure given dimension name is valid."""
-        names = self.dimension_names()
-        if dimension not in names:
-            raise ValueError(f"Invalid dimension {dimension!r}. Should be one of {names}")
+        if dimension not in self._dimension_index:
+            raise ValueError(f"Invalid dimension {dimension!r}. Should be one of {self.dimension_names()}")
         return dimension
 
     def has_band_dimension(self) -> bool:
@@ -436,7 +471,7 @@ class CubeMetadata:
         # TODO: rename argument to `name` for more internal consistency
         # TODO: merge with drop_dimension (which does the same).
         self.assert_valid_dimension(dimension_name)
-        loc = self.dimension_names().index(dimension_name)
+        loc = self._dimension_index[dimension_name]
         dimensions = self._dimensions[:loc] + self._dimensions[loc + 1 :]
         return self._clone_and_update(dimensions=dimensions)
 
@@ -447,7 +482,7 @@ class CubeMetadata:
 
     def add_dimension(self, name: str, label: Union[str, float], type: Optional[str] = None) -> CubeMetadata:
         """Create new CubeMetadata object with added dimension"""
-        if any(d.name == name for d in self._dimensions):
+        if name in self._dimension_index:
             raise DimensionAlreadyExistsException(f"Dimension with name {name!r} already exists")
         if type == "bands":
             dim = BandDimension(name=name, bands=[Band(name=label)])
@@ -488,9 +523,10 @@ class CubeMetadata:
 
     def drop_dimension(self, name: str = None) -> CubeMetadata:
         """Create new CubeMetadata object without dropped dimension with given name"""
-        dimension_names = self.dimension_names()
-        if name not in dimension_names:
-            raise ValueError("No dimension named {n!r} (valid names: {ns!r})".format(n=name, ns=dimension_names))
+        if name not in self._dimension_index:
+            raise ValueError(
+                "No dimension named {n!r} (valid names: {ns!r})".format(n=name, ns=self.dimension_names())
+            )
         return self._clone_and_update(dimensions=[d for d in self._dimensions if not d.name == name])
 
     def resample_spatial(
@@ -681,15 +717,32 @@ class CollectionMetadata(CubeMetadata):
         return f"CollectionMetadata({self.extent} - {bands} - {self.dimension_names()})"
 
 
-def metadata_from_stac(url: str) -> CubeMetadata:
+def metadata_from_stac(
+    url: str,
+    *,
+    stac_io: Optional[pystac.StacIO] = None,
+    item_budget: Optional[int] = None,
+) -> CubeMetadata:
     """
     Reads the band metadata a static STAC catalog or a STAC API Collection and returns it as a :py:class:`CubeMetadata`
 
+    STAC documents are read with a shared :py:class:`~openeo.utils.stac.CachingStacIO` by default,
+    with opt-in caching (client config options ``stac.cache_dir`` and ``stac.memory_cache_size``),
+    so that repeated calls for the same catalog can be fast.
+
     :param url: The URL to a static STAC catalog (STAC Item, STAC Collection, or STAC Catalog) or a specific STAC API Collection
+    :param stac_io: (optional) :py:class:`pystac.StacIO` to read STAC documents with.
+    :param item_budget: (optional) maximum number of items to sample
+        when band metadata has to be derived from the items of a collection.
     :return: A :py:class:`CubeMetadata` containing the DataCube band metadata from the url.
+
+    .. versionchanged:: 0.52.0
+        Added ``stac_io`` and ``item_budget`` arguments.
     """
-    stac_object = pystac.read_file(href=url)
-    bands = _StacMetadataParser().bands_from_stac_object(stac_object)
+    stac_io = stac_io or get_default_stac_io()
+    stac_object = pystac.read_file(href=url, stac_io=stac_io)
+    parser_kwargs = {"item_budget": item_budget} if item_budget is not None else {}
+    bands = _StacMetadataParser(stac_io=stac_io, **parser_kwargs).bands_from_stac_object(stac_object)
 
     # At least assume there are spatial dimensions
     # TODO #743: are there conditions in which we even should not assume the presence of spatial dimensions?
@@ -756,7 +809,25 @@ class _StacMetadataParser:
 
     # TODO: better, more compact name: StacMetadata is a bit redundant, technically we're also not "parsing" here either
 
-    def __init__(self, *, logger=_log, log_level=logging.DEBUG, supress_duplicate_warnings: bool = True):
+    def __init__(
+        self,
+        *,
+        logger=_log,
+        log_level=logging.DEBUG,
+        supress_duplicate_warnings: bool = True,
+        stac_io: Optional[pystac.StacIO] = None,
+        item_budget: Optional[int] = 100,
+        item_convergence: Optional[int] = 10,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        :param stac_io: :py:class:`pystac.StacIO` to fetch (linked) STAC documents with
+        :param item_budget: maximum number of items to consult when band metadata
+            has to be derived from the items of a collection (``None``: no limit).
+        :param item_convergence: stop consulting items when this number of consecutive items
+            did not contribute any new bands (``None``: consult all items within budget).
+        :param max_workers: maximum number of STAC documents to fetch concurrently.
+        """
         # TODO: argument to set some kind of reference to a root document to improve logging messages?
         self._logger = logger
         self._log_level = log_level
@@ -765,6 +836,10 @@ class _StacMetadataParser:
         if supress_duplicate_warnings:
             # Use caching trick to avoid duplicate warnings
             self._warn = functools.lru_cache(maxsize=1000)(self._warn)
+        self._stac_io = stac_io
+        self._item_budget = item_budget
+        self._item_convergence = item_convergence
+        self._max_workers = max_workers
 
     def get_temporal_dimension(self, stac_obj: pystac.STACObject) -> Union[TemporalDimension, None]:
         """
@@ -905,12 +980,7 @@ class _StacMetadataParser:
         # If no band metadata so far: traverse items in collection
         elif consult_items:
             self._warn("bands_from_stac_collection: consulting items for band metadata")
-            bands = _BandList.merge(
-                self.bands_from_stac_item(
-                    item=i, consult_collection=False, consult_assets=consult_assets, on_empty=_ON_EMPTY_IGNORE
-                )
-                for i in collection.get_items()
-            )
+            bands = self._bands_from_stac_items(collection=collection, consult_assets=consult_assets)
             if bands:
                 return bands
 
@@ -918,6 +988,40 @@ class _StacMetadataParser:
             self._warn("bands_from_stac_collection: no band name source found")
         return _BandList([])
 
+    def _bands_from_stac_items(self, collection: pystac.Collection, *, consult_assets: bool = True) -> _BandList:
+        """
+        Extract band listing from (a sample of) the items of a collection:
+        items are fetched concurrently and consulted in link order,
+        until the budget is exhausted or the band listing has converged.
+        """
+        band_lists = []
+        band_names = set()
+        stale = 0
+        items = iter_stac_items(
+            collection,
+            stac_io=self._stac_io or get_default_stac_io(),
+            max_items=self._item_budget,
+            max_workers=self._max_workers,
+            recursive=False,
+        )
+        try:
+            for count, item in enumerate(items, start=1):
+                bands = self.bands_from_stac_item(
+                    item=item, consult_collection=False, consult_assets=consult_assets, on_empty=_ON_EMPTY_IGNORE
+                )
+                if set(bands.band_names()).issubset(band_names):
+                    stale += 1
+                else:
+                    band_lists.append(bands)
+                    band_names.update(bands.band_names())
+                    stale = 0
+                if band_names and self._item_convergence is not None and stale >= self._item_convergence:
+                    self._log(f"_bands_from_stac_items: band listing converged after {count} items")
+                    break
+        finally:
+            items.close()
+        return _BandList.merge(band_lists)
+
     def bands_from_stac_item(
         self,
         item: pystac.Item,
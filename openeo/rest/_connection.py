@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
 import sys
-from typing import Iterable, Optional, Union
+from typing import Any, Iterable, Mapping, Optional, Union
 
 import requests
 import urllib3.util
@@ -10,9 +12,13 @@ from requests import Response
 from requests.auth import AuthBase
 
 import openeo
+from openeo.internal.json_encoding import encode_request_body
 from openeo.rest import OpenEoApiError, OpenEoApiPlainError, OpenEoRestError
+from openeo.rest._metrics import RequestMetrics, endpoint_template
+from openeo.rest._singleflight import SingleFlight
 from openeo.rest.auth.auth import NullAuth
 from openeo.util import ContextTimer, ensure_list, str_truncate, url_join
+from openeo.utils.events import EVENTS, EventBus
 from openeo.utils.http import HTTP_502_BAD_GATEWAY, session_with_retries
 
 _log = logging.getLogger(__name__)
@@ -21,9 +27,54 @@ _log = logging.getLogger(__name__)
 # TODO: get default_timeout from config?
 DEFAULT_TIMEOUT = 20 * 60
 
+# Default minimum size (in bytes) of JSON request bodies to compress (if compression is enabled)
+DEFAULT_COMPRESS_THRESHOLD = 16 * 1024
+
+
+def _content_length(headers: Mapping) -> Optional[int]:
+    content_length = headers.get("Content-Length")
+    return int(content_length) if isinstance(content_length, str) and content_length.isdigit() else None
+
+
+def _request_size(request: requests.PreparedRequest) -> int:
+    """Size (in bytes) of the request body (if known)."""
+    content_length = _content_length(request.headers)
+    if content_length is not None:
+        return content_length
+    elif isinstance(request.body, (bytes, str)):
+        return len(request.body)
+    return 0
+
+
+def _response_size(response: Response, stream: bool) -> int:
+    """Size (in bytes) of the response body, without consuming streaming responses."""
+    if not stream and isinstance(response.content, bytes):
+        return len(response.content)
+    return _content_length(response.headers) or 0
+
+
+def _retry_count(response: Response) -> int:
+    """Number of retries (from urllib3 retry history) it took to get this response."""
+    history = getattr(getattr(response.raw, "retries", None), "history", None)
+    return len(history) if isinstance(history, tuple) else 0
+
 
 class RestApiConnection:
-    """Base connection class implementing generic REST API request functionality"""
+    """
+    Base connection class implementing generic REST API request functionality
+
+    :param tracer: (optional) OpenTelemetry-compatible tracer,
+        to wrap each request in a span.
+        Only a ``start_as_current_span(name, attributes=...)`` method is required,
+        returning a context manager that provides a span object with a ``set_attribute(key, value)`` method.
+    :param compress_requests: gzip-compress JSON request bodies (``Content-Encoding: gzip``):
+        ``True`` to compress bodies larger than a default threshold,
+        or an integer to specify the minimum body size (in bytes) to compress.
+        Requires support for compressed request bodies on the back-end side.
+    :param coalesce_requests: deduplicate concurrent identical GET requests (e.g. from different threads):
+        ``True`` to let them share a single HTTP request and response,
+        or a number to additionally reuse successful responses for that many seconds.
+    """
 
     def __init__(
         self,
@@ -34,8 +85,17 @@ class RestApiConnection:
         default_timeout: Optional[int] = None,
         slow_response_threshold: Optional[float] = None,
         retry: Union[urllib3.util.Retry, dict, bool, None] = None,
+        tracer: Optional[Any] = None,
+        compress_requests: Union[bool, int] = False,
+        coalesce_requests: Union[bool, float] = False,
     ):
         self._root_url = root_url
+        self.events = EventBus()
+        self._metrics = RequestMetrics()
+        self.tracer = tracer
+        self._single_flight: Optional[SingleFlight] = None
+        if coalesce_requests:
+            self._single_flight = SingleFlight(ttl=0 if coalesce_requests is True else float(coalesce_requests))
         self._auth = None
         self.auth = auth or NullAuth()
         if session:
@@ -54,6 +114,9 @@ class RestApiConnection:
             )
         }
         self.slow_response_threshold = slow_response_threshold
+        if compress_requests is True:
+            compress_requests = DEFAULT_COMPRESS_THRESHOLD
+        self._compress_threshold: Optional[int] = compress_requests or None
 
     @property
     def root_url(self):
@@ -69,7 +132,32 @@ class RestApiConnection:
         self._on_auth_update()
 
     def _on_auth_update(self):
-        pass
+        if self._single_flight:
+            self._single_flight.clear()
+
+    def stats(self) -> dict:
+        """
+        Get a snapshot of the request metrics collected by this connection.
+        Totals (e.g. "requests", "errors", "retries", "request bytes", "response bytes",
+        "auth refresh", "auth refresh time", ...) are provided as top-level items.
+        Per endpoint metrics (keyed on method and endpoint template, e.g. ``"GET /jobs/{job_id}"``),
+        with status code counts and latency statistics/histogram, are provided under key ``"endpoints"``.
+
+        .. note::
+            The exact structure of this snapshot is experimental and subject to change.
+
+        .. versionadded:: 0.52.0
+        """
+        return self._metrics.snapshot()
+
+    def _trace_span(self, method: str, url: str, template: str):
+        """Start a tracing span for a request (if a tracer is set)."""
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return self.tracer.start_as_current_span(
+            f"{method.upper()} {template}",
+            attributes={"http.request.method": method.upper(), "url.full": url, "http.route": template},
+        )
 
     def build_url(self, path: str):
         return url_join(self._root_url, path)
@@ -103,6 +191,17 @@ class RestApiConnection:
         # Don't send default auth headers to external domains.
         auth = auth or (self.auth if not self._is_external(url) else None)
         slow_response_threshold = kwargs.pop("slow_response_threshold", self.slow_response_threshold)
+        if kwargs.get("json") is not None:
+            # Do JSON encoding ourselves (instead of leaving it to `requests`)
+            # for support of pre-encoded values and compression.
+            try:
+                kwargs["data"], body_headers = encode_request_body(
+                    kwargs.pop("json"), compress_threshold=self._compress_threshold
+                )
+            except ValueError as e:
+                # Same error as `requests` would raise for non-compliant JSON (e.g. NaN values)
+                raise requests.exceptions.InvalidJSONError(e) from e
+            headers = {**body_headers, **(headers or {})}
         if _log.isEnabledFor(logging.DEBUG):
             _log.debug(
                 "Request `{m} {u}` with params {p}, headers {h}, auth {a}, kwargs {k}".format(
@@ -114,26 +213,30 @@ class RestApiConnection:
                     k=list(kwargs.keys()),
                 )
             )
-        with ContextTimer() as timer:
-            resp = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                headers=self._merged_headers(headers),
-                auth=auth,
-                timeout=kwargs.pop("timeout", self.default_timeout),
-                **kwargs,
-            )
-        if slow_response_threshold and timer.elapsed() > slow_response_threshold:
-            _log.warning(
-                "Slow response: `{m} {u}` took {e:.2f}s (>{t:.2f}s)".format(
-                    m=method.upper(), u=str_truncate(url, width=64), e=timer.elapsed(), t=slow_response_threshold
-                )
-            )
-        if _log.isEnabledFor(logging.DEBUG):
-            _log.debug(
-                f"openEO request `{resp.request.method} {resp.request.path_url}` -> response {resp.status_code} headers {resp.headers!r}"
-            )
+        send = functools.partial(
+            self._send,
+            method=method,
+            path=path,
+            url=url,
+            params=params,
+            headers=headers,
+            auth=auth,
+            slow_response_threshold=slow_response_threshold,
+            **kwargs,
+        )
+        if self._single_flight is None:
+            resp = send()
+        elif method.lower() == "get" and not kwargs.get("stream") and set(kwargs).issubset({"stream", "timeout"}):
+            # Concurrent identical GET requests share a single HTTP request (and memoized response, if enabled).
+            key = (url, repr(sorted((params or {}).items())), repr(sorted((headers or {}).items())), id(auth))
+            resp, coalesced = self._single_flight.do(key, send, memoize=lambda r: 200 <= r.status_code < 300)
+            if coalesced:
+                self._metrics.record_coalesced(memo=coalesced == "memo")
+        else:
+            if method.lower() not in {"get", "head", "options"}:
+                # Potentially state changing request: don't reuse memoized responses anymore.
+                self._single_flight.clear()
+            resp = send()
         # Check for API errors and unexpected HTTP status codes as desired.
         status = resp.status_code
         expected_status = ensure_list(expected_status) if expected_status else []
@@ -147,6 +250,65 @@ class RestApiConnection:
             )
         return resp
 
+    def _send(
+        self,
+        *,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[dict],
+        headers: Optional[dict],
+        auth: Optional[AuthBase],
+        slow_response_threshold: Optional[float],
+        **kwargs,
+    ) -> Response:
+        """Send request and collect metrics (without response checks)."""
+        template = endpoint_template(path)
+        with ContextTimer() as timer, self._trace_span(method=method, url=url, template=template) as span:
+            try:
+                resp = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=self._merged_headers(headers),
+                    auth=auth,
+                    timeout=kwargs.pop("timeout", self.default_timeout),
+                    **kwargs,
+                )
+            except Exception:
+                self._metrics.record_request(method=method, path=path, status_code=None, elapsed=timer.elapsed())
+                raise
+            if span is not None:
+                span.set_attribute("http.response.status_code", resp.status_code)
+        self._record_response(
+            method=method, path=path, response=resp, elapsed=timer.elapsed(), stream=kwargs.get("stream", False)
+        )
+        if slow_response_threshold and timer.elapsed() > slow_response_threshold:
+            _log.warning(
+                "Slow response: `{m} {u}` took {e:.2f}s (>{t:.2f}s)".format(
+                    m=method.upper(), u=str_truncate(url, width=64), e=timer.elapsed(), t=slow_response_threshold
+                )
+            )
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                f"openEO request `{resp.request.method} {resp.request.path_url}` -> response {resp.status_code} headers {resp.headers!r}"
+            )
+        return resp
+
+    def _record_response(self, method: str, path: str, response: Response, elapsed: float, stream: bool):
+        """Collect metrics of given response and emit them as event."""
+        metrics = dict(
+            status_code=response.status_code,
+            elapsed=elapsed,
+            request_bytes=_request_size(response.request) if response.request is not None else 0,
+            response_bytes=_response_size(response, stream=stream),
+            retries=_retry_count(response),
+        )
+        self._metrics.record_request(method=method, path=path, **metrics)
+        self.events.emit(
+            EVENTS.HTTP_REQUEST, method=method.upper(), url=response.url, endpoint=endpoint_template(path), **metrics
+        )
+
     def _raise_api_error(self, response: requests.Response):
         """Convert API error response to Python exception"""
         status_code = response.status_code
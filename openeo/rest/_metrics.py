@@ -0,0 +1,140 @@
+"""
+Internal utilities to collect request metrics (timing, sizes, status codes, ...) of a REST API connection.
+"""
+
+from __future__ import annotations
+
+import collections
+import re
+import threading
+import urllib.parse
+from typing import Dict, Optional, Union
+
+# Upper bounds (in seconds) of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float("inf"))
+
+# Patterns to map concrete request paths to an endpoint template (e.g. "/jobs/j-123/results" -> "/jobs/{job_id}/results")
+_ENDPOINT_TEMPLATES = [
+    (re.compile(r"^/jobs/[^/]+"), "/jobs/{job_id}"),
+    (re.compile(r"^/collections/[^/]+"), "/collections/{collection_id}"),
+    (re.compile(r"^/process_graphs/[^/]+"), "/process_graphs/{process_graph_id}"),
+    (re.compile(r"^/processes/[^/]+/[^/]+"), "/processes/{namespace}/{process_id}"),
+    (re.compile(r"^/processes/[^/]+"), "/processes/{namespace}"),
+    (re.compile(r"^/services/[^/]+"), "/services/{service_id}"),
+    (re.compile(r"^/files/.+"), "/files/{path}"),
+]
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Normalize a request path to an endpoint template,
+    to aggregate metrics of requests that only differ in resource identifiers.
+
+    :param path: request path (relative to the API root URL), or a full URL for external requests.
+    """
+    if "://" in path:
+        return "{external}"
+    path = "/" + urllib.parse.urlsplit(path).path.lstrip("/")
+    for regex, template in _ENDPOINT_TEMPLATES:
+        if regex.match(path):
+            return regex.sub(template, path, count=1)
+    return path
+
+
+class RequestMetrics:
+    """
+    Thread-safe collector of request metrics of a connection:
+    request counts, latency histograms, status code counts, request/response sizes and retry counts
+    per endpoint template, time spent in (access token) auth refresh
+    and the number of requests avoided by request coalescing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = collections.Counter()
+        self._endpoints: Dict[str, dict] = {}
+
+    def record_request(
+        self,
+        *,
+        method: str,
+        path: str,
+        status_code: Optional[int],
+        elapsed: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        retries: int = 0,
+    ):
+        """
+        Record a (finished) request.
+
+        :param status_code: HTTP status code of the response, or ``None`` if no response was received.
+        """
+        key = f"{method.upper()} {endpoint_template(path)}"
+        error = status_code is None or status_code >= 400
+        with self._lock:
+            self._totals["requests"] += 1
+            self._totals["errors"] += error
+            self._totals["retries"] += retries
+            self._totals["request bytes"] += request_bytes
+            self._totals["response bytes"] += response_bytes
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = {
+                    "requests": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "request bytes": 0,
+                    "response bytes": 0,
+                    "status": collections.Counter(),
+                    "latency": {"total": 0.0, "min": elapsed, "max": elapsed, "histogram": collections.Counter()},
+                }
+            endpoint["requests"] += 1
+            endpoint["errors"] += error
+            endpoint["retries"] += retries
+            endpoint["request bytes"] += request_bytes
+            endpoint["response bytes"] += response_bytes
+            endpoint["status"][status_code if status_code is not None else "exception"] += 1
+            latency = endpoint["latency"]
+            latency["total"] += elapsed
+            latency["min"] = min(latency["min"], elapsed)
+            latency["max"] = max(latency["max"], elapsed)
+            latency["histogram"][next(b for b in LATENCY_BUCKETS if elapsed <= b)] += 1
+
+    def record_auth_refresh(self, *, elapsed: float, success: bool):
+        """Record an (access token) auth refresh attempt."""
+        with self._lock:
+            self._totals["auth refresh"] += 1
+            self._totals["auth refresh failed"] += not success
+            self._totals["auth refresh time"] += elapsed
+
+    def record_coalesced(self, *, memo: bool):
+        """Record a request that was served by an identical request in flight or a memoized response."""
+        with self._lock:
+            self._totals["coalesced"] += 1
+            self._totals["memo hits"] += memo
+
+    def totals(self) -> Dict[str, Union[int, float]]:
+        """Snapshot of the totals (summed over all endpoints)."""
+        with self._lock:
+            return dict(self._totals)
+
+    def snapshot(self) -> dict:
+        """
+        Snapshot of all metrics: totals as top-level items
+        and per endpoint metrics under key "endpoints".
+        """
+        with self._lock:
+            endpoints = {
+                key: {
+                    **endpoint,
+                    "status": dict(endpoint["status"]),
+                    "latency": {
+                        **endpoint["latency"],
+                        "mean": endpoint["latency"]["total"] / endpoint["requests"],
+                        "histogram": {b: endpoint["latency"]["histogram"][b] for b in LATENCY_BUCKETS},
+                    },
+                }
+                for key, endpoint in self._endpoints.items()
+            }
+            return {**self._totals, "endpoints": endpoints}
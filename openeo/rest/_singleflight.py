@@ -0,0 +1,99 @@
+"""
+Internal utilities to deduplicate concurrent identical requests ("single-flight")
+and to memoize their responses for a short time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """Call in flight, to be waited on by callers with the same key."""
+
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe deduplication of concurrent calls with the same key:
+    while a call is in flight, other callers with the same key wait for it and share its result (or exception),
+    instead of doing the same call again.
+    Optionally, results are memoized for a short time (``ttl`` in seconds).
+
+    :param ttl: time (in seconds) to memoize results (0 to disable memoization).
+    :param max_size: maximum number of memoized results.
+    """
+
+    def __init__(self, *, ttl: float = 0, max_size: int = 256, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._memo: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def do(
+        self, key: Hashable, func: Callable[[], Any], *, memoize: Callable[[Any], bool] = lambda result: True
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Do the call (or wait for an identical one in flight, or get a memoized result).
+
+        :param key: key to identify identical calls.
+        :param func: function to do the actual call.
+        :param memoize: predicate to decide if a result can be memoized.
+        :return: tuple of the result and how it was obtained:
+            ``None`` (actual call), ``"shared"`` (shared with a call in flight) or ``"memo"`` (memoized)
+        """
+        with self._lock:
+            if self.ttl > 0:
+                memoized = self._memo.get(key)
+                if memoized is not None:
+                    expiry, result = memoized
+                    if expiry > self._clock():
+                        return result, "memo"
+                    del self._memo[key]
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result, "shared"
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if call.exception is None and self.ttl > 0 and memoize(call.result):
+                    self._store(key, call.result)
+            call.done.set()
+        return call.result, None
+
+    def _store(self, key: Hashable, result: Any):
+        now = self._clock()
+        if len(self._memo) >= self.max_size:
+            self._memo = {k: v for k, v in self._memo.items() if v[0] > now}
+            while len(self._memo) >= self.max_size:
+                # Evict oldest entry
+                del self._memo[next(iter(self._memo))]
+        self._memo[key] = (now + self.ttl, result)
+
+    def clear(self):
+        """Drop all memoized results."""
+        with self._lock:
+            self._memo.clear()
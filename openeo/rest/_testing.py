@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import gzip
 import json
 import re
 from typing import (
@@ -25,6 +26,13 @@ class OpeneoTestingException(Exception):
     pass
 
 
+def _json_body(request) -> dict:
+    """Get JSON decoded body of given request (with support for gzip compressed bodies)."""
+    if request.headers.get("Content-Encoding") == "gzip":
+        return json.loads(gzip.decompress(request.body))
+    return request.json()
+
+
 class DummyBackend:
     """
     Dummy backend that handles sync/batch execution requests
@@ -192,7 +200,7 @@ class DummyBackend:
 
     def _handle_post_result(self, request, context):
         """handler of `POST /result` (synchronous execute)"""
-        post_data = request.json()
+        post_data = _json_body(request)
         pg = post_data["process"]["process_graph"]
         self.sync_requests_full.append(post_data)
         self.sync_requests.append(pg)
@@ -208,7 +216,7 @@ class DummyBackend:
 
     def _handle_post_jobs(self, request, context):
         """handler of `POST /jobs` (create batch job)"""
-        post_data = request.json()
+        post_data = _json_body(request)
         pg = post_data["process"]["process_graph"]
 
         # Generate (new) job id
@@ -326,7 +334,7 @@ class DummyBackend:
 
     def _handle_post_validation(self, request, context):
         """Handler of `POST /validation` (validate process graph)."""
-        pg = request.json()["process_graph"]
+        pg = _json_body(request)["process_graph"]
         self.validation_requests.append(pg)
         if isinstance(self.next_validation_errors, list):
             return {"errors": self.next_validation_errors}
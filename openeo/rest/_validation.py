@@ -0,0 +1,122 @@
+"""
+Preflight validation of process graphs before execution:
+caching of validation results and (optional) validation in background.
+"""
+
+import collections
+import concurrent.futures
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+from openeo.internal.json_encoding import dumps_bytes
+
+_log = logging.getLogger(__name__)
+
+
+def process_hash(process: dict) -> str:
+    """Hash of the canonical JSON representation of a process (graph with metadata)."""
+    canonical = dumps_bytes(process, canonical=True)
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class PreflightValidator:
+    """
+    Run preflight validation of process graphs, with LRU cache of validation results
+    (keyed on canonical process graph hash), so that repeated submissions of the same process graph
+    (e.g. from a job manager) only trigger a single validation request.
+
+    In background mode, validation requests run in a thread pool (not blocking the actual job creation
+    or execution request) and validation warnings are reported when the validation finishes.
+
+    A failed validation is only reported as warning, it does not block the job from running.
+    Therefore, something *else* going wrong during the validation is only logged too.
+
+    :param validate: function to get the validation errors of a process (with metadata)
+    :param cache_size: maximum number of cached validation results (0 to disable caching)
+    :param background: run validation requests in background
+    :param max_workers: number of worker threads for background validation
+    """
+
+    def __init__(
+        self,
+        validate: Callable[[dict], List[dict]],
+        *,
+        cache_size: int = 1000,
+        background: bool = False,
+        max_workers: int = 2,
+    ):
+        self._validate = validate
+        self._cache_size = cache_size
+        self._cache: Dict[str, List[dict]] = collections.OrderedDict()
+        self._pending: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._background = background
+        self._max_workers = max_workers
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def __call__(self, process: dict):
+        """Validate given process (with metadata) and report validation errors as warning."""
+        key = process_hash(process)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                errors = self._cache[key]
+            elif key in self._pending:
+                # Same process graph is already being validated: its outcome will be reported.
+                return
+            else:
+                errors = None
+                if self._background:
+                    if self._executor is None:
+                        self._executor = concurrent.futures.ThreadPoolExecutor(
+                            max_workers=self._max_workers, thread_name_prefix="openeo-validation"
+                        )
+                    self._pending[key] = self._executor.submit(self._run, key, process)
+                    return
+        if errors is not None:
+            _log.debug(f"Using cached preflight validation result {key[:12]}")
+            self._report(errors)
+        else:
+            self._run(key, process)
+
+    def _run(self, key: str, process: dict):
+        try:
+            errors = self._validate(process)
+        except Exception as e:
+            _log.error(f"Preflight process graph validation failed: {e}")
+            with self._lock:
+                self._pending.pop(key, None)
+            return
+        with self._lock:
+            if self._cache_size > 0:
+                self._cache[key] = errors
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            self._pending.pop(key, None)
+        self._report(errors)
+
+    @staticmethod
+    def _report(errors: List[dict]):
+        if errors:
+            _log.warning(
+                "Preflight process graph validation raised: "
+                + (" ".join(f"[{e.get('code')}] {e.get('message')}" for e in errors))
+            )
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for pending background validations to finish (and report their warnings).
+
+        :return: whether all pending validations finished (within the timeout).
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+        _, not_done = concurrent.futures.wait(pending, timeout=timeout)
+        return not not_done
+
+    def clear(self):
+        """Clear the validation result cache."""
+        with self._lock:
+            self._cache.clear()
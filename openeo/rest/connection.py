@@ -3,8 +3,8 @@ This module provides a Connection object to manage and persist settings when int
 """
 from __future__ import annotations
 
+import concurrent.futures
 import datetime
-import json
 import logging
 import os
 import shlex
@@ -34,6 +34,7 @@ from requests.auth import AuthBase, HTTPBasicAuth
 
 import openeo
 from openeo.config import config_log, get_config_option
+from openeo.internal import json_encoding
 from openeo.internal.documentation import openeo_process
 from openeo.internal.graph_building import (
     FlatGraphableMixin,
@@ -41,6 +42,7 @@ from openeo.internal.graph_building import (
     _FromNodeMixin,
     as_flat_graph,
 )
+from openeo.internal.graph_optimizer import GraphOptimizer
 from openeo.internal.jupyter import VisualDict, VisualList
 from openeo.internal.processes.builder import ProcessBuilderBase
 from openeo.internal.warnings import deprecated, legacy_alias
@@ -53,6 +55,7 @@ from openeo.rest import (
 )
 from openeo.rest._connection import DEFAULT_TIMEOUT, RestApiConnection
 from openeo.rest._datacube import _ProcessGraphAbstraction
+from openeo.rest._validation import PreflightValidator
 from openeo.rest.auth.auth import BasicBearerAuth, BearerAuth, OidcBearerAuth
 from openeo.rest.auth.config import AuthConfig, RefreshTokenStore
 from openeo.rest.auth.oidc import (
@@ -70,6 +73,7 @@ from openeo.rest.auth.oidc import (
 )
 from openeo.rest.capabilities import OpenEoCapabilities
 from openeo.rest.datacube import DataCube, InputDate
+from openeo.rest.geometry import GeometryPipeline
 from openeo.rest.graph_building import CollectionProperty
 from openeo.rest.job import BatchJob
 from openeo.rest.mlmodel import MlModel
@@ -82,17 +86,23 @@ from openeo.rest.models.general import (
 )
 from openeo.rest.result import SaveResult
 from openeo.rest.service import Service
+from openeo.rest.streaming import ResultStream
 from openeo.rest.udp import Parameter, RESTUserDefinedProcess
-from openeo.rest.userfile import UserFile
+from openeo.rest.userfile import (
+    FileTransferSummary,
+    UserFile,
+    download_directory,
+    upload_directory,
+)
 from openeo.rest.vectorcube import VectorCube
 from openeo.util import (
+    ContextTimer,
     LazyLoadCache,
     dict_no_none,
-    ensure_dir,
     load_json_resource,
     rfc3339,
 )
-from openeo.utils.events import EVENTS, EventBus
+from openeo.utils.events import EVENTS
 from openeo.utils.http import (
     HTTP_201_CREATED,
     HTTP_401_UNAUTHORIZED,
@@ -118,7 +128,9 @@ class Connection(RestApiConnection):
     :param url: Backend root url
     :param session: Optional ``requests.Session`` object to use for requests.
     :param default_timeout: Default timeout for requests in seconds.
-    :param auto_validate: toggle to automatically validate process graphs before execution
+    :param auto_validate: toggle to automatically validate process graphs before execution.
+        Use ``"async"`` to run the validation in background (concurrently with the actual request),
+        with validation warnings being reported when the validation finishes.
     :param slow_response_threshold: Optional threshold in seconds
         to consider a response as slow and log a warning.
     :param auth_config: Optional :class:`AuthConfig` object
@@ -140,6 +152,31 @@ class Connection(RestApiConnection):
 
     :param on_response_headers_sync: (optional) callback to handle (e.g. :py:func:`print`)
         the response headers of synchronous processing requests.
+    :param tracer: (optional) OpenTelemetry-compatible tracer (e.g. from ``opentelemetry.trace.get_tracer()``)
+        to wrap each request in a span.
+    :param optimize_process_graphs: opt-in toggle for client-side optimization of process graphs
+        before they are submitted for processing (synchronous execution and batch job creation),
+        e.g. pushing ``filter_bbox``, ``filter_temporal`` and ``filter_bands`` into ``load_collection``
+        or fusing chains of ``apply`` nodes.
+        Can be ``True`` (all available optimization passes)
+        or a list of optimization pass names (``"filter_pushdown"``, ``"apply_fusion"``).
+    :param validation_cache_size: maximum number of cached preflight validation results
+        (keyed on the canonical process graph), to avoid validating the same process graph
+        over and over again (e.g. when creating a lot of jobs). Set to 0 to disable caching.
+    :param compress_requests: gzip-compress JSON request bodies (e.g. process graphs with large geometries):
+        ``True`` to compress bodies larger than a default threshold,
+        or an integer to specify the minimum body size (in bytes) to compress.
+        Requires support for compressed request bodies (``Content-Encoding: gzip``) on the back-end side.
+    :param geometry_pipeline: (optional) :py:class:`~openeo.rest.geometry.GeometryPipeline`
+        to prepare geometry arguments (e.g. of ``aggregate_spatial``, ``filter_spatial``, ``mask_polygon``)
+        before embedding them in process graphs: simplification, quantization, de-duplication
+        and automatic upload of large geometries.
+        Can also be set later through the ``geometry_pipeline`` attribute.
+    :param coalesce_requests: deduplicate concurrent identical GET requests
+        (e.g. from multiple threads describing the same collection or batch job):
+        ``True`` to let them share a single HTTP request and response,
+        or a number to additionally reuse successful responses for that many seconds
+        (until the next non-GET request).
 
     .. versionchanged:: 0.41.0
         Added ``retry`` argument.
@@ -150,6 +187,13 @@ class Connection(RestApiConnection):
     .. versionchanged:: 0.51.0
         Added ``events`` attribute as entrypoint for generic event handling
 
+    .. versionchanged:: 0.52.0
+        Added ``tracer`` argument and :py:meth:`stats` method for request metrics.
+        Added ``optimize_process_graphs`` argument.
+        ``auto_validate`` also supports ``"async"``, added ``validation_cache_size`` argument.
+        Added ``compress_requests`` and ``geometry_pipeline`` arguments.
+        Added ``coalesce_requests`` argument.
+
     """
 
     _MINIMUM_API_VERSION = ComparableVersion("1.0.0")
@@ -160,7 +204,7 @@ class Connection(RestApiConnection):
         *,
         session: Optional[requests.Session] = None,
         default_timeout: Optional[int] = None,
-        auto_validate: bool = True,
+        auto_validate: Union[bool, str] = True,
         slow_response_threshold: Optional[float] = None,
         auth_config: Optional[AuthConfig] = None,
         refresh_token_store: Optional[RefreshTokenStore] = None,
@@ -168,7 +212,15 @@ class Connection(RestApiConnection):
         auth: Optional[AuthBase] = None,
         retry: Union[urllib3.util.Retry, dict, bool, None] = None,
         on_response_headers_sync: Optional[ResponseHeadersHandler] = None,
+        tracer: Optional[Any] = None,
+        optimize_process_graphs: Union[bool, Iterable[str]] = False,
+        validation_cache_size: int = 1000,
+        compress_requests: Union[bool, int] = False,
+        geometry_pipeline: Optional[GeometryPipeline] = None,
+        coalesce_requests: Union[bool, float] = False,
     ):
+        if auto_validate and isinstance(auto_validate, str) and auto_validate != "async":
+            raise ValueError(f"Invalid auto_validate value: {auto_validate!r}")
         if "://" not in url:
             url = "https://" + url
         self._orig_url = url
@@ -178,6 +230,9 @@ class Connection(RestApiConnection):
             auth=auth, session=session, default_timeout=default_timeout,
             slow_response_threshold=slow_response_threshold,
             retry=retry,
+            tracer=tracer,
+            compress_requests=compress_requests,
+            coalesce_requests=coalesce_requests,
         )
 
         # Initial API version check.
@@ -186,9 +241,18 @@ class Connection(RestApiConnection):
         self._auth_config = auth_config
         self._refresh_token_store = refresh_token_store
         self._oidc_auth_renewer = oidc_auth_renewer
-        self._auto_validate = auto_validate
+        self._auto_validate = bool(auto_validate)
+        self._preflight_validator = PreflightValidator(
+            validate=self._get_validation_errors,
+            cache_size=validation_cache_size,
+            background=auto_validate == "async",
+        )
+        self.geometry_pipeline = geometry_pipeline
+        self._graph_optimizer = None
+        if optimize_process_graphs:
+            passes = None if optimize_process_graphs is True else optimize_process_graphs
+            self._graph_optimizer = GraphOptimizer(passes=passes)
 
-        self.events = EventBus()
         # TODO: migrate `on_response_headers_sync` to more generic events system
         if on_response_headers_sync:
             self._on_response_headers_sync = on_response_headers_sync
@@ -750,19 +814,24 @@ class Connection(RestApiConnection):
         """
         reason = f" Reason: {reason}" if reason else ""
         if isinstance(self.auth, OidcBearerAuth) and self._oidc_auth_renewer:
-            try:
-                self._authenticate_oidc(
-                    authenticator=self._oidc_auth_renewer,
-                    provider_id=self._oidc_auth_renewer.provider_info.id,
-                    store_refresh_token=False,
-                    oidc_auth_renewer=self._oidc_auth_renewer,
-                )
-                _log.info(f"Obtained new access token (grant {self._oidc_auth_renewer.grant_type!r}).{reason}")
-                return True
-            except OpenEoClientException as auth_exc:
-                _log.error(
-                    f"Failed to obtain new access token (grant {self._oidc_auth_renewer.grant_type!r}): {auth_exc!r}.{reason}"
-                )
+            success = False
+            with ContextTimer() as timer:
+                try:
+                    self._authenticate_oidc(
+                        authenticator=self._oidc_auth_renewer,
+                        provider_id=self._oidc_auth_renewer.provider_info.id,
+                        store_refresh_token=False,
+                        oidc_auth_renewer=self._oidc_auth_renewer,
+                    )
+                    _log.info(f"Obtained new access token (grant {self._oidc_auth_renewer.grant_type!r}).{reason}")
+                    success = True
+                except OpenEoClientException as auth_exc:
+                    _log.error(
+                        f"Failed to obtain new access token (grant {self._oidc_auth_renewer.grant_type!r}): {auth_exc!r}.{reason}"
+                    )
+            self._metrics.record_auth_refresh(elapsed=timer.elapsed(), success=success)
+            self.events.emit(EVENTS.AUTH_REFRESH, success=success, elapsed=timer.elapsed())
+            return success
         return False
 
     def request(
@@ -828,6 +897,28 @@ class Connection(RestApiConnection):
         data = self.get("/collections", expected_status=200).json()
         return CollectionListingResponse(response_data=data, connection=self)
 
+    def iter_collections(self, *, page_size: Optional[int] = None, prefetch: bool = False) -> Iterator[dict]:
+        """
+        Lazily iterate over the basic metadata of all collections provided by the back-end,
+        page by page (following pagination links),
+        as a memory friendly alternative to :py:meth:`list_collections`.
+
+        :param page_size: (optional) number of collections to request per page.
+            If not set, the back-end decides.
+        :param prefetch: fetch the next page in a background thread while the current page is consumed.
+
+        .. versionadded:: 0.52.0
+        """
+        return self._iter_listing("/collections", key="collections", page_size=page_size, prefetch=prefetch)
+
+    def _iter_listing(
+        self, path: str, *, key: str, page_size: Optional[int] = None, prefetch: bool = False
+    ) -> Iterator[dict]:
+        """Iterate over the items (under given key) of a paginated listing endpoint."""
+        params = {"limit": page_size} if page_size else {}
+        for page in paginate(self, path, params=params, prefetch=prefetch):
+            yield from page.get(key, [])
+
     def list_collection_ids(self) -> List[str]:
         """
         List all collection ids provided by the back-end.
@@ -1010,6 +1101,24 @@ class Connection(RestApiConnection):
             response = self.get("/processes/" + namespace, expected_status=200).json()
         return ProcessListingResponse(response_data=response, connection=self)
 
+    def iter_processes(
+        self, namespace: Optional[str] = None, *, page_size: Optional[int] = None, prefetch: bool = False
+    ) -> Iterator[dict]:
+        """
+        Lazily iterate over the available processes of the back-end (or a given namespace),
+        page by page (following pagination links),
+        as a memory friendly alternative to :py:meth:`list_processes`.
+
+        :param namespace: The namespace for which to list processes.
+        :param page_size: (optional) number of processes to request per page.
+            If not set, the back-end decides.
+        :param prefetch: fetch the next page in a background thread while the current page is consumed.
+
+        .. versionadded:: 0.52.0
+        """
+        path = "/processes" if namespace is None else "/processes/" + namespace
+        return self._iter_listing(path, key="processes", page_size=page_size, prefetch=prefetch)
+
     def describe_process(self, id: str, namespace: Optional[str] = None) -> dict:
         """
         Returns a single process from the back end.
@@ -1051,12 +1160,40 @@ class Connection(RestApiConnection):
 
         .. versionchanged:: 0.41.0
             Change default value of ``limit`` to 100 (instead of unlimited).
+
+        .. seealso::
+
+            :py:meth:`~openeo.rest.connection.Connection.iter_jobs`
+            to lazily iterate over all jobs (following pagination).
         """
         # TODO: Parse the result so that Job classes returned?
-        # TODO: when pagination is enabled: how to expose link to next page?
         resp = self.get("/jobs", params={"limit": limit}, expected_status=200).json()
         return JobListingResponse(response_data=resp, connection=self)
 
+    def iter_jobs(self, *, page_size: Optional[int] = 100, prefetch: bool = False) -> Iterator[dict]:
+        """
+        Lazily iterate over the (batch) jobs metadata of the authenticated user,
+        page by page (following pagination links).
+        Unlike :py:meth:`list_jobs`, which only returns the first page,
+        this allows to go through all jobs with constant memory usage
+        and to stop early (e.g. after finding a job of interest).
+
+        Usage example:
+
+        .. code-block:: python
+
+            for job in connection.iter_jobs(prefetch=True):
+                if job["status"] == "error":
+                    print(job["id"], job.get("title"))
+
+        :param page_size: number of jobs to request per page.
+            Can be set to ``None`` to let the back-end decide.
+        :param prefetch: fetch the next page in a background thread while the current page is consumed.
+
+        .. versionadded:: 0.52.0
+        """
+        return self._iter_listing("/jobs", key="jobs", page_size=page_size, prefetch=prefetch)
+
     def assert_user_defined_process_support(self):
         """
         Capabilities document based verification that back-end supports user-defined processes.
@@ -1152,6 +1289,22 @@ class Connection(RestApiConnection):
         data = self.post(path="/validation", json=pg_with_metadata, expected_status=200).json()
         return ValidationResponse(response_data=data)
 
+    def _get_validation_errors(self, process: dict) -> List[dict]:
+        resp = self.post(path="/validation", json=process, expected_status=200)
+        return resp.json()["errors"]
+
+    def wait_for_validation(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for pending background preflight validations (with ``auto_validate="async"``) to finish,
+        so that their validation warnings are reported.
+
+        :param timeout: maximum time to wait (in seconds)
+        :return: whether all pending validations finished (within the timeout)
+
+        .. versionadded:: 0.52.0
+        """
+        return self._preflight_validator.wait(timeout=timeout)
+
     @property
     def _api_version(self) -> ComparableVersion:
         # TODO make this a public property (it's also useful outside the Connection class)
@@ -1630,6 +1783,21 @@ class Connection(RestApiConnection):
             parameters={"columns": "files", "missing": federation_missing, "federation": federation},
         )
 
+    def iter_files(self, *, page_size: Optional[int] = None, prefetch: bool = False) -> Iterator[UserFile]:
+        """
+        Lazily iterate over the user-uploaded files in the user workspace on the back-end,
+        page by page (following pagination links),
+        as a memory friendly alternative to :py:meth:`list_files`.
+
+        :param page_size: (optional) number of files to request per page.
+            If not set, the back-end decides.
+        :param prefetch: fetch the next page in a background thread while the current page is consumed.
+
+        .. versionadded:: 0.52.0
+        """
+        for metadata in self._iter_listing("/files", key="files", page_size=page_size, prefetch=prefetch):
+            yield UserFile.from_metadata(metadata=metadata, connection=self)
+
     def get_file(
         self, path: Union[str, PurePosixPath], metadata: Optional[dict] = None
     ) -> UserFile:
@@ -1662,16 +1830,107 @@ class Connection(RestApiConnection):
             metadata = resp.json()
         return UserFile.from_metadata(metadata=metadata, connection=self)
 
+    def upload_directory(
+        self,
+        source: Union[Path, str],
+        target: Union[str, PurePosixPath, None] = None,
+        *,
+        pattern: str = "**/*",
+        skip_unchanged: bool = True,
+        max_workers: int = 4,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> FileTransferSummary:
+        """
+        Upload the files of a local directory (recursively) to the user workspace on the back-end,
+        with multiple concurrent uploads.
+
+        Usage example:
+
+        .. code-block:: python
+
+            summary = connection.upload_directory("aux-data", target="campaign-2024/aux")
+            print(summary)
+
+        :param source: local directory to upload.
+        :param target: (optional) folder in the user workspace to upload to.
+            If not set: upload to the root of the user workspace.
+        :param pattern: glob pattern (relative to ``source``) to select the files to upload.
+        :param skip_unchanged: skip uploading files that are already in the user workspace
+            with same size and a modification time not older than the local file.
+        :param max_workers: maximum number of concurrent uploads.
+        :param retries: number of times to retry a failed upload
+            (on connection problems or server side errors).
+        :param retry_backoff: initial delay (in seconds) before retrying a failed upload,
+            doubled on each next retry.
+        :return: transfer summary (transferred/skipped/failed files, throughput, ...)
+
+        .. versionadded:: 0.52.0
+        """
+        return upload_directory(
+            connection=self,
+            source=source,
+            target=target,
+            pattern=pattern,
+            skip_unchanged=skip_unchanged,
+            max_workers=max_workers,
+            retries=retries,
+            retry_backoff=retry_backoff,
+        )
+
+    def download_directory(
+        self,
+        target: Union[Path, str],
+        source: Union[str, PurePosixPath, None] = None,
+        *,
+        skip_unchanged: bool = True,
+        max_workers: int = 4,
+        retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> FileTransferSummary:
+        """
+        Download the files of a folder in the user workspace on the back-end (recursively)
+        to a local directory, with multiple concurrent downloads.
+
+        :param target: local directory to download to.
+        :param source: (optional) folder in the user workspace to download.
+            If not set: download all files of the user workspace.
+        :param skip_unchanged: skip downloading files that already exist locally
+            with same size and a modification time not older than the workspace file.
+            Files without (valid) size or modification time metadata are always downloaded.
+        :param max_workers: maximum number of concurrent downloads.
+        :param retries: number of times to retry a failed download
+            (on connection problems or server side errors).
+        :param retry_backoff: initial delay (in seconds) before retrying a failed download,
+            doubled on each next retry.
+        :return: transfer summary (transferred/skipped/failed files, throughput, ...).
+            Workspace files that would end up outside of the target directory
+            (e.g. with absolute paths or ``..`` components) are not downloaded, but reported as failed.
+
+        .. versionadded:: 0.52.0
+        """
+        return download_directory(
+            connection=self,
+            target=target,
+            source=source,
+            skip_unchanged=skip_unchanged,
+            max_workers=max_workers,
+            retries=retries,
+            retry_backoff=retry_backoff,
+        )
+
     def _build_request_with_process_graph(
         self,
         process_graph: Union[dict, FlatGraphableMixin, str, Path, List[FlatGraphableMixin]],
         additional: Optional[dict] = None,
         job_options: Optional[dict] = None,
+        optimize: bool = False,
         **kwargs,
     ) -> dict:
         """
         Prepare a json payload with a process graph to submit to /result, /services, /jobs, ...
         :param process_graph: flat dict representing a "process graph with metadata" ({"process": {"process_graph": ...}, ...})
+        :param optimize: apply client-side process graph optimizations (if enabled on this connection)
         """
         # TODO: make this a more general helper (like `as_flat_graph`)
         connections = extract_connections(process_graph)
@@ -1687,6 +1946,8 @@ class Connection(RestApiConnection):
             assert "job_options" not in result
             result["job_options"] = job_options
 
+        if optimize and self._graph_optimizer:
+            process_graph = self._optimize_process_graph(process_graph)
         process_graph = as_flat_graph(process_graph)
         if "process_graph" not in process_graph:
             process_graph = {"process_graph": process_graph}
@@ -1694,6 +1955,33 @@ class Connection(RestApiConnection):
         result["process"] = process_graph
         return result
 
+    def _optimize_process_graph(self, process_graph):
+        """Apply client-side optimizations to process graph (graph building object(s) or flat graph)."""
+        if isinstance(process_graph, _FromNodeMixin):
+            return self._graph_optimizer.optimize([process_graph.from_node()])[0]
+        elif isinstance(process_graph, (list, tuple)) and all(isinstance(x, _FromNodeMixin) for x in process_graph):
+            return self._graph_optimizer.optimize([x.from_node() for x in process_graph])
+        elif isinstance(process_graph, dict) and isinstance(process_graph.get("process_graph"), dict):
+            return {
+                **process_graph,
+                "process_graph": self._graph_optimizer.optimize_flat_graph(process_graph["process_graph"]),
+            }
+        elif isinstance(process_graph, dict):
+            return self._graph_optimizer.optimize_flat_graph(process_graph)
+        return process_graph
+
+    def _preflight_validation_enabled(self, *, validate: Optional[bool] = None) -> bool:
+        """
+        Whether preflight validation should be done,
+        e.g. to avoid preparing the process graph to validate if it's not necessary.
+
+        :param validate: Optional toggle to enable/prevent validation
+            (overruling the connection's ``auto_validate`` setting).
+        """
+        if validate is None:
+            validate = self._auto_validate
+        return bool(validate) and self.capabilities().supports_endpoint("/validation", "POST")
+
     def _preflight_validation(self, pg_with_metadata: dict, *, validate: Optional[bool] = None):
         """
         Preflight validation of process graph to execute.
@@ -1705,23 +1993,12 @@ class Connection(RestApiConnection):
 
         :return:
         """
-        if validate is None:
-            validate = self._auto_validate
-        if validate and self.capabilities().supports_endpoint("/validation", "POST"):
+        if self._preflight_validation_enabled(validate=validate):
             # At present, the intention is that a failed validation does not block
             # the job from running, it is only reported as a warning.
-            # Therefor we also want to continue when something *else* goes wrong
-            # *during* the validation.
-            try:
-                resp = self.post(path="/validation", json=pg_with_metadata["process"], expected_status=200)
-                validation_errors = resp.json()["errors"]
-                if validation_errors:
-                    _log.warning(
-                        "Preflight process graph validation raised: "
-                        + (" ".join(f"[{e.get('code')}] {e.get('message')}" for e in validation_errors))
-                    )
-            except Exception as e:
-                _log.error(f"Preflight process graph validation failed: {e}")
+            # Results are cached (per canonical process graph) and, with `auto_validate="async"`,
+            # validation runs in background.
+            self._preflight_validator(pg_with_metadata["process"])
 
         # TODO: additional validation and sanity checks: e.g. is there a result node, are all process_ids valid, ...?
 
@@ -1767,17 +2044,47 @@ class Connection(RestApiConnection):
         .. versionchanged:: 0.40
             Added argument ``on_response_headers``.
         """
-        # TODO: unify or better code reuse with `.execute()`
+        response = self._post_sync_result(
+            process_graph=graph,
+            timeout=timeout,
+            validate=validate,
+            additional=additional,
+            job_options=job_options,
+            on_response_headers=on_response_headers,
+            stream=True,
+        )
+        if outputfile is not None:
+            ResultStream(response, chunk_size=chunk_size).save(outputfile)
+            # TODO: return target path instead of None? Or return a generic result wrapper?
+        else:
+            return response.content
+
+    def _post_sync_result(
+        self,
+        process_graph: Union[dict, FlatGraphableMixin, str, Path, List[FlatGraphableMixin]],
+        *,
+        timeout: Optional[int] = None,
+        validate: Optional[bool] = None,
+        additional: Optional[dict] = None,
+        job_options: Optional[dict] = None,
+        on_response_headers: Optional[ResponseHeadersHandler] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Common implementation of synchronous processing requests (`POST /result`).
+
+        :param kwargs: additional request arguments (e.g. ``stream``)
+        """
         pg_with_metadata = self._build_request_with_process_graph(
-            process_graph=graph, additional=additional, job_options=job_options
+            process_graph=process_graph, additional=additional, job_options=job_options, optimize=True
         )
         self._preflight_validation(pg_with_metadata=pg_with_metadata, validate=validate)
         response = self.post(
             path="/result",
             json=pg_with_metadata,
             expected_status=200,
-            stream=True,
             timeout=timeout or DEFAULT_TIMEOUT_SYNCHRONOUS_EXECUTE,
+            **kwargs,
         )
 
         # TODO: deprecate on_response_headers in favor of self.events?
@@ -1785,16 +2092,7 @@ class Connection(RestApiConnection):
             on_response_headers(response.headers)
         if sync_id := response.headers.get("OpenEO-Identifier"):
             self.events.emit(EVENTS.SYNC_RESULT, sync_id=sync_id)
-
-        if outputfile is not None:
-            target = Path(outputfile)
-            ensure_dir(target.parent)
-            with target.open(mode="wb") as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    f.write(chunk)
-            # TODO: return target path instead of None? Or return a generic result wrapper?
-        else:
-            return response.content
+        return response
 
     def execute(
         self,
@@ -1828,24 +2126,14 @@ class Connection(RestApiConnection):
         .. versionchanged:: 0.48
             Added argument ``on_response_headers``.
         """
-        # TODO: unify or better code reuse with `.download()`
-        pg_with_metadata = self._build_request_with_process_graph(
-            process_graph=process_graph, additional=additional, job_options=job_options
-        )
-        self._preflight_validation(pg_with_metadata=pg_with_metadata, validate=validate)
-        response = self.post(
-            path="/result",
-            json=pg_with_metadata,
-            expected_status=200,
-            timeout=timeout or DEFAULT_TIMEOUT_SYNCHRONOUS_EXECUTE,
+        response = self._post_sync_result(
+            process_graph=process_graph,
+            timeout=timeout,
+            validate=validate,
+            additional=additional,
+            job_options=job_options,
+            on_response_headers=on_response_headers,
         )
-
-        # TODO: deprecate on_response_headers in favor of self.events?
-        if on_response_headers := (on_response_headers or self._on_response_headers_sync):
-            on_response_headers(response.headers)
-        if sync_id := response.headers.get("OpenEO-Identifier"):
-            self.events.emit(EVENTS.SYNC_RESULT, sync_id=sync_id)
-
         if auto_decode:
             try:
                 return response.json()
@@ -1856,6 +2144,48 @@ class Connection(RestApiConnection):
         else:
             return response
 
+    def execute_stream(
+        self,
+        process_graph: Union[dict, FlatGraphableMixin, str, Path, List[FlatGraphableMixin]],
+        *,
+        timeout: Optional[int] = None,
+        validate: Optional[bool] = None,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        additional: Optional[dict] = None,
+        job_options: Optional[dict] = None,
+        on_response_headers: Optional[ResponseHeadersHandler] = None,
+    ) -> ResultStream:
+        """
+        Execute a process graph synchronously and return a streaming handle on the result,
+        to consume large results with bounded memory usage,
+        e.g. as iterator over raw chunks, as file-like object, as incrementally decoded JSON,
+        or as lazily loaded xarray dataset.
+        See :py:class:`~openeo.rest.streaming.ResultStream` for more information.
+
+        :param process_graph: (flat) dict representing a process graph, or process graph as raw JSON string,
+            or as local file path or URL
+        :param timeout: timeout to wait for response
+        :param validate: (optional) toggle to enable/prevent validation of the process graphs before execution
+            (overruling the connection's ``auto_validate`` setting).
+        :param chunk_size: default chunk size for streaming the response.
+        :param additional: (optional) additional (top-level) properties to set in the request body
+        :param job_options: (optional) dictionary of job options to pass to the backend
+            (under top-level property "job_options")
+        :param on_response_headers: (optional) callback to handle (e.g. :py:func:`print`) the response headers.
+
+        .. versionadded:: 0.52.0
+        """
+        response = self._post_sync_result(
+            process_graph=process_graph,
+            timeout=timeout,
+            validate=validate,
+            additional=additional,
+            job_options=job_options,
+            on_response_headers=on_response_headers,
+            stream=True,
+        )
+        return ResultStream(response, chunk_size=chunk_size)
+
     def create_job(
         self,
         process_graph: Union[dict, FlatGraphableMixin, str, Path, List[FlatGraphableMixin]],
@@ -1915,11 +2245,19 @@ class Connection(RestApiConnection):
             process_graph=process_graph,
             additional=additional,
             job_options=job_options,
+            optimize=True,
             **dict_no_none(title=title, description=description, plan=plan, budget=budget, log_level=log_level),
         )
 
         self._preflight_validation(pg_with_metadata=pg_with_metadata, validate=validate)
-        response = self.post("/jobs", json=pg_with_metadata, expected_status=HTTP_201_CREATED)
+        return self._post_job(json=pg_with_metadata)
+
+    def _post_job(self, **kwargs) -> BatchJob:
+        """
+        Do the actual job creation request (with ``json`` or pre-encoded ``data`` request body)
+        and return a corresponding :py:class:`~openeo.rest.job.BatchJob` instance.
+        """
+        response = self.post("/jobs", expected_status=HTTP_201_CREATED, **kwargs)
 
         job_id = None
         if "openeo-identifier" in response.headers:
@@ -1996,7 +2334,7 @@ class Connection(RestApiConnection):
         pg_with_metadata = self._build_request_with_process_graph(data, additional=additional, job_options=job_options)
         if path == "/validation":
             pg_with_metadata = pg_with_metadata["process"]
-        post_json = json.dumps(pg_with_metadata, separators=(",", ":"))
+        post_json = json_encoding.dumps(pg_with_metadata, separators=json_encoding.COMPACT_SEPARATORS)
         cmd += ["--data", post_json]
         cmd += [self.build_url(path)]
         return " ".join(shlex.quote(c) for c in cmd)
@@ -2034,9 +2372,14 @@ def connect(
     auth_options: Optional[dict] = None,
     session: Optional[requests.Session] = None,
     default_timeout: Optional[int] = None,
-    auto_validate: bool = True,
+    auto_validate: Union[bool, str] = True,
     retry: Union[urllib3.util.Retry, dict, bool, None] = None,
     on_response_headers_sync: Optional[ResponseHeadersHandler] = None,
+    tracer: Optional[Any] = None,
+    optimize_process_graphs: Union[bool, Iterable[str]] = False,
+    validation_cache_size: int = 1000,
+    compress_requests: Union[bool, int] = False,
+    coalesce_requests: Union[bool, float] = False,
 ) -> Connection:
     """
     This method is the entry point to OpenEO.
@@ -2056,6 +2399,7 @@ def connect(
     :param auth_options: Options/arguments specific to the authentication type
     :param default_timeout: default timeout (in seconds) for requests
     :param auto_validate: toggle to automatically validate process graphs before execution
+        (``"async"`` to validate in background)
     :param retry: general request retry settings, can be specified as:
 
         - :py:class:`urllib3.util.Retry` object
@@ -2066,6 +2410,18 @@ def connect(
 
     :param on_response_headers_sync: (optional) callback to handle (e.g. :py:func:`print`)
         the response headers of synchronous processing requests.
+    :param tracer: (optional) OpenTelemetry-compatible tracer (e.g. from ``opentelemetry.trace.get_tracer()``)
+        to wrap each request in a span.
+    :param optimize_process_graphs: opt-in toggle for client-side optimization of process graphs
+        before they are submitted for processing.
+        Can be ``True`` (all available optimization passes)
+        or a list of optimization pass names (``"filter_pushdown"``, ``"apply_fusion"``).
+    :param validation_cache_size: maximum number of cached preflight validation results
+        (0 to disable caching).
+    :param compress_requests: gzip-compress JSON request bodies larger than a default threshold (``True``)
+        or a given size in bytes (integer).
+    :param coalesce_requests: let concurrent identical GET requests share a single HTTP request (``True``),
+        and additionally reuse successful responses for a given number of seconds (number).
 
     .. versionchanged:: 0.24.0
         Added ``auto_validate`` argument
@@ -2075,6 +2431,11 @@ def connect(
 
     .. versionchanged:: 0.48
         Added argument ``on_response_headers_sync``.
+
+    .. versionchanged:: 0.52.0
+        Added arguments ``tracer``, ``optimize_process_graphs``, ``validation_cache_size``,
+        ``compress_requests`` and ``coalesce_requests``.
+        ``auto_validate`` also supports ``"async"``.
     """
 
     def _config_log(message):
@@ -2106,6 +2467,11 @@ def connect(
         auto_validate=auto_validate,
         retry=retry,
         on_response_headers_sync=on_response_headers_sync,
+        tracer=tracer,
+        optimize_process_graphs=optimize_process_graphs,
+        validation_cache_size=validation_cache_size,
+        compress_requests=compress_requests,
+        coalesce_requests=coalesce_requests,
     )
 
     auth_type = auth_type.lower() if isinstance(auth_type, str) else auth_type
@@ -2133,20 +2499,51 @@ def session(userid=None, endpoint: str = "https://openeo.org/openeo") -> Connect
     return connect(url=endpoint)
 
 
-def paginate(con: Connection, url: str, params: Optional[dict] = None, callback: Callable = lambda resp, page: resp):
+def paginate(
+    con: Connection,
+    url: str,
+    params: Optional[dict] = None,
+    callback: Callable = lambda resp, page: resp,
+    *,
+    prefetch: bool = False,
+):
+    """
+    Iterate over the pages of a paginated listing, following the "next" links.
+
+    :param prefetch: fetch the next page in a background thread
+        while the current one is being consumed.
+        When the iteration is stopped early, at most one page is fetched in vain.
+
+    .. versionchanged:: 0.52.0
+        Added ``prefetch`` argument.
+    """
     # TODO: make this a method `get_paginated` on `RestApiConnection`?
     # TODO: is it necessary to have `callback`? It's only used just before yielding,
     #       so it's probably cleaner (even for the caller) to to move it outside.
-    page = 1
-    while True:
+    executor = (
+        concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="openeo-paginate")
+        if prefetch
+        else None
+    )
+    try:
+        page = 1
         response = con.get(url, params=params).json()
-        yield callback(response, page)
-        next_links = [link for link in response.get("links", []) if link.get("rel") == "next" and "href" in link]
-        if not next_links:
-            break
-        url = next_links[0]["href"]
-        page += 1
-        params = {}
+        while True:
+            next_links = [link for link in response.get("links", []) if link.get("rel") == "next" and "href" in link]
+            next_url = next_links[0]["href"] if next_links else None
+            if next_url == url:
+                # Guard against pagination loops
+                next_url = None
+            next_page = executor.submit(con.get, next_url, params={}) if executor and next_url else None
+            yield callback(response, page)
+            if not next_url:
+                break
+            url = next_url
+            page += 1
+            response = (next_page.result() if next_page else con.get(url, params={})).json()
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
 
 
 def extract_connections(
@@ -40,6 +40,7 @@ from openeo.api.process import Parameter, schema_supports
 from openeo.dates import get_temporal_extent
 from openeo.internal.documentation import openeo_process
 from openeo.internal.graph_building import PGNode, ReduceNode, _FromNodeMixin
+from openeo.internal.json_encoding import PreEncodedJson
 from openeo.internal.jupyter import in_jupyter_context
 from openeo.internal.processes.builder import (
     ProcessBuilderBase,
@@ -71,6 +72,7 @@ from openeo.rest.mlmodel import MlModel
 from openeo.rest.models.general import ValidationResponse
 from openeo.rest.result import SaveResult
 from openeo.rest.service import Service
+from openeo.rest.streaming import ResultStream
 from openeo.rest.udp import RESTUserDefinedProcess
 from openeo.rest.vectorcube import VectorCube
 from openeo.util import dict_no_none, guess_format, load_json, normalize_crs, rfc3339
@@ -223,6 +225,7 @@ class DataCube(_ProcessGraphAbstraction):
             allow_none=True,
             allow_parameter=True,
             allow_bounding_box=True,
+            allow_reference=False,
             argument_name="spatial_extent",
             process_id="load_collection",
         )
@@ -434,6 +437,7 @@ class DataCube(_ProcessGraphAbstraction):
                 allow_none=True,
                 allow_parameter=True,
                 allow_bounding_box=True,
+                allow_reference=False,
                 argument_name="spatial_extent",
                 process_id="load_stac",
             )
@@ -2490,6 +2494,49 @@ class DataCube(_ProcessGraphAbstraction):
             on_response_headers=on_response_headers,
         )
 
+    def execute_stream(
+        self,
+        format: Optional[str] = None,
+        options: Optional[dict] = None,
+        *,
+        validate: Optional[bool] = None,
+        auto_add_save_result: bool = True,
+        additional: Optional[dict] = None,
+        job_options: Optional[dict] = None,
+        on_response_headers: Optional[Callable[[Mapping], None]] = None,
+    ) -> ResultStream:
+        """
+        Send the underlying process graph to the backend for synchronous processing
+        and return a streaming handle on the result,
+        to consume large results with bounded memory usage
+        (e.g. as iterator over raw chunks, as file-like object, as incrementally decoded JSON,
+        or as lazily loaded xarray dataset).
+        See :py:class:`~openeo.rest.streaming.ResultStream` for more information.
+
+        :param format: (optional) an output format supported by the backend.
+        :param options: (optional) file format options
+        :param validate: (optional) toggle to enable/prevent validation of the process graphs before execution
+            (overruling the connection's ``auto_validate`` setting).
+        :param auto_add_save_result: whether to automatically add a ``save_result`` node to the process graph.
+        :param additional: (optional) additional (top-level) properties to set in the request body
+        :param job_options: (optional) dictionary of job options to pass to the backend
+            (under top-level property "job_options")
+        :param on_response_headers: (optional) callback to handle (e.g. :py:func:`print`) the response headers.
+
+        .. versionadded:: 0.52.0
+        """
+        if auto_add_save_result:
+            res = self._auto_save_result(format=format, options=options)
+        else:
+            res = self
+        return self._connection.execute_stream(
+            res.flat_graph(),
+            validate=validate,
+            additional=additional,
+            job_options=job_options,
+            on_response_headers=on_response_headers,
+        )
+
     def validate(self) -> ValidationResponse:
         """
         Validate a process graph without executing it.
@@ -3135,6 +3182,7 @@ def _get_geometry_argument(
         pathlib.Path,
         Parameter,
         _FromNodeMixin,
+        PreEncodedJson,
     ],
     *,
     valid_geojson_types: List[str],
@@ -3143,9 +3191,10 @@ def _get_geometry_argument(
     allow_parameter: bool = True,
     allow_bounding_box: bool = False,
     allow_none: bool = False,
+    allow_reference: bool = True,
     argument_name: str = "n/a",
     process_id: str = "n/a",
-) -> Union[dict, Parameter, PGNode, _FromNodeMixin, None]:
+) -> Union[dict, Parameter, PGNode, _FromNodeMixin, PreEncodedJson, VectorCube, None]:
     """
     Normalize a user input to a openEO-compatible geometry representation,
     like a GeoJSON construct, vector cube reference, bounding box construct,
@@ -3156,6 +3205,11 @@ def _get_geometry_argument(
     :param allow_parameter: allow argument to be a :py:class:`Parameter` instance, and pass-through as such
     :param allow_none: allow argument to be ``None`` and pass-through as such
     :param allow_bounding_box: allow argument to be a bounding box dictionary and pass-through as such
+    :param allow_reference: allow the connection's geometry pipeline (if any)
+        to replace a large geometry with a reference to an uploaded file
+
+    A :py:class:`~openeo.util.PreEncodedJson` geometry construct is passed through as-is
+    (without validation or CRS handling), so that it only has to be JSON-encoded once.
     """
     # Some quick exit shortcuts
     if allow_parameter and isinstance(argument, Parameter):
@@ -3168,6 +3222,8 @@ def _get_geometry_argument(
     elif isinstance(argument, _FromNodeMixin):
         # Typical use case here: VectorCube instance
         return argument.from_node()
+    elif isinstance(argument, PreEncodedJson):
+        return argument
     elif allow_none and argument is None:
         return argument
     elif (
@@ -3236,6 +3292,9 @@ def _get_geometry_argument(
             warnings.warn(f"non-Lon-Lat CRS {crs!r} is not known to the proj library and might not be supported.")
             crs_name = crs
         geometry["crs"] = {"type": "name", "properties": {"name": crs_name}}
+    geometry_pipeline = getattr(connection, "geometry_pipeline", None)
+    if geometry_pipeline:
+        return geometry_pipeline.prepare(geometry, connection=connection, allow_reference=allow_reference)
     return geometry
 
 
@@ -0,0 +1,296 @@
+"""
+Client-side preparation of (large) geometry arguments
+(e.g. for ``aggregate_spatial``, ``filter_spatial``, ``mask_polygon``, ``load_geojson``):
+simplification, coordinate quantization, de-duplication
+and offloading to a file reference instead of inlining in the process graph.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import tempfile
+import typing
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy
+import shapely
+import shapely.geometry
+import shapely.ops
+
+from openeo.internal.json_encoding import PreEncodedJson, dumps, dumps_bytes
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (circular import issue at runtime).
+    from openeo.rest.connection import Connection
+    from openeo.rest.vectorcube import VectorCube
+
+_log = logging.getLogger(__name__)
+
+# Vectorized geometry operations are available since shapely 2.0
+_SHAPELY_VECTORIZED = hasattr(shapely, "simplify")
+
+
+class GeometryPayloadReport(NamedTuple):
+    """
+    Report of the geometry payload reduction by a :py:class:`GeometryPipeline`.
+
+    Sizes are in bytes of compact JSON encoding.
+    """
+
+    geometries_in: int
+    geometries_out: int
+    coordinates_in: int
+    coordinates_out: int
+    bytes_in: int
+    bytes_out: int
+    #: path or URL of the uploaded geometry (if it was not inlined in the process graph)
+    reference: Optional[str] = None
+
+    @property
+    def savings(self) -> float:
+        """Relative reduction of the process graph payload (0: no reduction, 1: fully offloaded)."""
+        inline_bytes = 0 if self.reference else self.bytes_out
+        return 1 - inline_bytes / self.bytes_in if self.bytes_in else 0.0
+
+    def __str__(self) -> str:
+        where = f"uploaded to {self.reference!r}" if self.reference else "inline"
+        return (
+            f"{self.geometries_in} -> {self.geometries_out} geometries,"
+            f" {self.coordinates_in} -> {self.coordinates_out} coordinates,"
+            f" {self.bytes_in} -> {self.bytes_out} bytes ({where}, {self.savings:.0%} payload reduction)"
+        )
+
+
+class GeometryPipeline:
+    """
+    Preparation of geometry arguments before they are embedded in a process graph.
+    Enable it on a connection with ``Connection(..., geometry_pipeline=GeometryPipeline(...))``
+    (or by setting the ``geometry_pipeline`` attribute).
+
+    Usage example:
+
+    .. code-block:: python
+
+        from openeo.rest.geometry import GeometryPipeline
+
+        connection.geometry_pipeline = GeometryPipeline(
+            simplify_tolerance=0.0001,
+            precision=5,
+            upload_threshold=1_000_000,
+        )
+        cube.aggregate_spatial(geometries=large_feature_collection, reducer="mean")
+        print(connection.geometry_pipeline.last_report)
+
+    Simplification and quantization are lossy and disabled by default.
+    Geometries are processed in vectorized fashion (with shapely 2).
+
+    :param simplify_tolerance: (optional) tolerance for topology preserving simplification of geometries,
+        in units of the coordinate reference system (e.g. degrees for lon-lat).
+    :param precision: (optional) number of decimals to round coordinates to.
+    :param deduplicate: drop duplicate features (same geometry and properties)
+        from feature collections (and duplicate geometries from geometry collections).
+        Note that this affects the number of results of e.g. ``aggregate_spatial``.
+    :param upload_threshold: (optional) size (in bytes of compact GeoJSON encoding) above which
+        a geometry is not inlined in the process graph, but uploaded as file
+        and referenced from the process graph.
+    :param uploader: (optional) custom upload function to use instead of uploading
+        to the user workspace of the back-end (with :py:meth:`Connection.upload_file`):
+        takes the GeoJSON data (bytes) and a file name, and returns a URL from which the back-end can load it
+        (with ``load_url``).
+    :param upload_folder: user workspace folder to upload geometry files to.
+
+    .. versionadded:: 0.52.0
+    """
+
+    def __init__(
+        self,
+        *,
+        simplify_tolerance: Optional[float] = None,
+        precision: Optional[int] = None,
+        deduplicate: bool = False,
+        upload_threshold: Optional[int] = None,
+        uploader: Optional[Callable[[bytes, str], str]] = None,
+        upload_folder: str = "openeo-geometries",
+    ):
+        self.simplify_tolerance = simplify_tolerance
+        self.precision = precision
+        self.deduplicate = deduplicate
+        self.upload_threshold = upload_threshold
+        self.uploader = uploader
+        self.upload_folder = upload_folder
+        # Cache of references of already uploaded geometries, keyed on (root url, content hash).
+        self._uploaded: Dict[Tuple[str, str], str] = {}
+        self.last_report: Optional[GeometryPayloadReport] = None
+
+    def process(self, geometry: dict) -> Tuple[dict, GeometryPayloadReport]:
+        """
+        Simplify, quantize and de-duplicate a GeoJSON construct.
+
+        :return: tuple of processed GeoJSON construct and payload report
+            (``bytes_out`` is the size of the processed GeoJSON).
+        """
+        result, report = self._process(geometry)
+        return result, report._replace(bytes_out=len(dumps_bytes(result)))
+
+    def _process(self, geometry: dict) -> Tuple[dict, GeometryPayloadReport]:
+        bytes_in = len(dumps_bytes(geometry))
+        holders, members, rebuild = _unpack(geometry)
+        if not (self.simplify_tolerance or self.precision is not None or self.deduplicate):
+            # Nothing to do: avoid round trip through shapely.
+            coordinates = sum(_count_geojson_coordinates(g) for g in members)
+            report = GeometryPayloadReport(
+                geometries_in=len(members),
+                geometries_out=len(members),
+                coordinates_in=coordinates,
+                coordinates_out=coordinates,
+                bytes_in=bytes_in,
+                bytes_out=0,
+            )
+            return geometry, report
+
+        shapes = [shapely.geometry.shape(g) for g in members]
+        coordinates_in = _count_coordinates(shapes)
+
+        if self.simplify_tolerance:
+            shapes = _simplify(shapes, tolerance=self.simplify_tolerance)
+        if self.precision is not None:
+            shapes = _quantize(shapes, precision=self.precision)
+        if self.deduplicate and len(shapes) > 1:
+            shapes, holders = _deduplicate(shapes, holders)
+
+        result = rebuild(holders, [shapely.geometry.mapping(s) for s in shapes])
+        report = GeometryPayloadReport(
+            geometries_in=len(members),
+            geometries_out=len(shapes),
+            coordinates_in=coordinates_in,
+            coordinates_out=_count_coordinates(shapes),
+            bytes_in=bytes_in,
+            bytes_out=0,
+        )
+        return result, report
+
+    def prepare(
+        self, geometry: dict, *, connection: Connection, allow_reference: bool = True
+    ) -> Union[PreEncodedJson, VectorCube]:
+        """
+        Prepare a GeoJSON construct to use as process argument:
+        process it (see :py:meth:`process`) and either pre-encode it to be inlined in the process graph,
+        or upload it (if above the upload threshold) and return a vector cube referencing it.
+
+        :param connection: connection to upload the geometry with
+        :param allow_reference: allow uploading and referencing, instead of inlining
+        """
+        processed, report = self._process(geometry)
+        result = PreEncodedJson(processed)
+        data = result.encoded.encode("utf8")
+        report = report._replace(bytes_out=len(data))
+        if allow_reference and self.upload_threshold is not None and len(data) > self.upload_threshold:
+            reference, result = self._upload(data, connection=connection)
+            report = report._replace(reference=reference)
+        _log.info(f"Geometry payload: {report}")
+        self.last_report = report
+        return result
+
+    def _upload(self, data: bytes, *, connection: Connection) -> Tuple[str, VectorCube]:
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        name = f"{digest}.geojson"
+        key = (connection.root_url, digest)
+        if key not in self._uploaded:
+            if self.uploader:
+                self._uploaded[key] = self.uploader(data, name)
+            else:
+                with tempfile.TemporaryDirectory() as tmp:
+                    path = Path(tmp) / name
+                    path.write_bytes(data)
+                    user_file = connection.upload_file(path, target=f"{self.upload_folder}/{name}")
+                self._uploaded[key] = str(user_file.path)
+        reference = self._uploaded[key]
+        if self.uploader:
+            return reference, connection.load_url(url=reference, format="GeoJSON")
+        else:
+            return reference, connection.vectorcube_from_paths(paths=[reference], format="GeoJSON")
+
+
+def _unpack(geometry: dict) -> Tuple[list, List[dict], Callable[[list, List[dict]], dict]]:
+    """
+    Unpack a GeoJSON construct into the "holders" of the member geometries (e.g. features),
+    the member geometries and a function to rebuild the construct from (possibly filtered) holders and geometries.
+    """
+    geojson_type = geometry.get("type")
+    if geojson_type == "FeatureCollection":
+        features = geometry["features"]
+
+        def rebuild(holders, geometries):
+            return {**geometry, "features": [{**f, "geometry": g} for f, g in zip(holders, geometries)]}
+
+        return features, [f["geometry"] for f in features], rebuild
+    elif geojson_type == "GeometryCollection":
+        members = geometry["geometries"]
+
+        def rebuild(holders, geometries):
+            return {**geometry, "geometries": geometries}
+
+        return [{}] * len(members), members, rebuild
+    elif geojson_type == "Feature":
+
+        def rebuild(holders, geometries):
+            return {**geometry, "geometry": geometries[0]}
+
+        return [geometry], [geometry["geometry"]], rebuild
+    else:
+
+        def rebuild(holders, geometries):
+            extra = {k: v for k, v in geometry.items() if k not in {"type", "coordinates"}}
+            return {**geometries[0], **extra}
+
+        return [{}], [geometry], rebuild
+
+
+def _count_coordinates(shapes: list) -> int:
+    if _SHAPELY_VECTORIZED:
+        return int(shapely.get_num_coordinates(numpy.asarray(shapes, dtype=object)).sum())
+    return sum(_count_geojson_coordinates(shapely.geometry.mapping(s)) for s in shapes)
+
+
+def _count_geojson_coordinates(geometry: dict) -> int:
+    if "geometries" in geometry:
+        return sum(_count_geojson_coordinates(g) for g in geometry["geometries"])
+
+    def count(coordinates) -> int:
+        if len(coordinates) > 0 and isinstance(coordinates[0], (int, float)):
+            return 1
+        return sum(count(c) for c in coordinates)
+
+    return count(geometry.get("coordinates", []))
+
+
+def _simplify(shapes: list, *, tolerance: float) -> list:
+    if _SHAPELY_VECTORIZED:
+        return list(shapely.simplify(numpy.asarray(shapes, dtype=object), tolerance, preserve_topology=True))
+    return [s.simplify(tolerance, preserve_topology=True) for s in shapes]
+
+
+def _quantize(shapes: list, *, precision: int) -> list:
+    if _SHAPELY_VECTORIZED:
+        # Round the coordinates of all geometries in one go
+        return list(shapely.transform(numpy.asarray(shapes, dtype=object), lambda c: numpy.round(c, precision)))
+    return [shapely.ops.transform(lambda *c: tuple(numpy.round(c, precision)), s) for s in shapes]
+
+
+def _deduplicate(shapes: list, holders: list) -> Tuple[list, list]:
+    if _SHAPELY_VECTORIZED:
+        keys = shapely.to_wkb(numpy.asarray(shapes, dtype=object))
+    else:
+        keys = [s.wkb for s in shapes]
+    seen = set()
+    unique_shapes = []
+    unique_holders = []
+    for shape, holder, key in zip(shapes, holders, keys):
+        key = (key, dumps(holder.get("properties"), canonical=True))
+        if key not in seen:
+            seen.add(key)
+            unique_shapes.append(shape)
+            unique_holders.append(holder)
+    return unique_shapes, unique_holders
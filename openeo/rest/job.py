@@ -7,7 +7,7 @@ import re
 import time
 import typing
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
 import requests
@@ -27,7 +27,7 @@ from openeo.rest import (
     OpenEoClientException,
 )
 from openeo.rest.models.general import LogsResponse
-from openeo.rest.models.logs import log_level_name
+from openeo.rest.models.logs import LogEntry, log_level_name, normalize_log_level
 from openeo.util import ensure_dir
 from openeo.utils.events import EVENTS
 from openeo.utils.http import (
@@ -59,6 +59,9 @@ RETRIABLE_STATUSCODES = [
     HTTP_504_GATEWAY_TIMEOUT,
 ]
 
+# Job statuses in which the job is not yet (or still) running: more logs can be expected.
+_JOB_STATUSES_ACTIVE = ("submitted", "created", "queued", "running")
+
 
 class BatchJob:
     """
@@ -237,6 +240,9 @@ class BatchJob:
             This is also the result when you explicitly pass log_level=None or log_level="".
 
         :return: A list containing the log entries for the batch job.
+
+        .. seealso:: :py:meth:`iter_logs` to iterate over (paginated or a lot of) logs
+            with constant memory usage, or to follow the logs of a running job.
         """
         url = f"/jobs/{self.job_id}/logs"
         params = {}
@@ -247,6 +253,42 @@ class BatchJob:
         response_data = self.connection.get(url, params=params, expected_status=200).json()
         return LogsResponse(response_data=response_data, log_level=level, connection=self.connection)
 
+    def iter_logs(
+        self,
+        *,
+        offset: Optional[str] = None,
+        level: Union[str, int, None] = None,
+        limit: Optional[int] = None,
+        follow: bool = False,
+        poll_interval: float = 10,
+    ) -> Iterator[LogEntry]:
+        """
+        Iterate over the job logs, page by page (following pagination links),
+        so that only a single page of log entries is held in memory.
+
+        :param offset: The last identifier (property ``id`` of a LogEntry) the client has received:
+            only iterate over the entries after that one.
+        :param level: Minimum log level to retrieve (see :py:meth:`logs`).
+        :param limit: (optional) page size to request from the back-end.
+        :param follow: keep polling for new log entries until the job is finished (or failed/canceled),
+            like ``tail -f``.
+        :param poll_interval: number of seconds to sleep between polls in ``follow`` mode.
+
+        .. versionadded:: 0.52.0
+        """
+        cursor = _LogCursor(
+            connection=self.connection, path=f"/jobs/{self.job_id}/logs", offset=offset, level=level, limit=limit
+        )
+        while True:
+            yield from cursor.fetch()
+            if not follow:
+                return
+            if self.status() not in _JOB_STATUSES_ACTIVE:
+                # Get the final log entries
+                yield from cursor.fetch()
+                return
+            time.sleep(poll_interval)
+
     @deprecated("Use start_and_wait instead", version="0.39.0")
     def run_synchronous(
         self,
@@ -290,6 +332,7 @@ class BatchJob:
         soft_error_max: int = DEFAULT_JOB_STATUS_POLL_SOFT_ERROR_MAX,
         show_error_logs: bool = True,
         require_success: bool = True,
+        follow_logs: Union[bool, str, int] = False,
     ) -> BatchJob:
         """
         Start the batch job, poll its status and wait till it finishes (or fails)
@@ -300,6 +343,8 @@ class BatchJob:
         :param soft_error_max: maximum number of soft errors (e.g. temporary connection glitches) to allow
         :param show_error_logs: whether to automatically print error logs when the batch job failed.
         :param require_success: whether to raise an exception if the job did not finish successfully.
+        :param follow_logs: print new log entries while polling the job status:
+            ``True`` for all levels, or a minimum log level (e.g. ``"warning"``).
 
         :return: Handle to the job created at the backend.
 
@@ -312,6 +357,9 @@ class BatchJob:
 
         .. versionchanged:: 0.42.0
             Added argument ``require_success``.
+
+        .. versionchanged:: 0.52.0
+            Added argument ``follow_logs``.
         """
         # TODO rename `connection_retry_interval` to something more generic?
         start_time = time.time()
@@ -343,6 +391,22 @@ class BatchJob:
             print_status(message)
             time.sleep(connection_retry_interval)
 
+        log_cursor = None
+        if follow_logs is not False:
+            log_cursor = _LogCursor(
+                connection=self.connection,
+                path=f"/jobs/{self.job_id}/logs",
+                level=None if follow_logs is True else follow_logs,
+            )
+
+        def print_new_logs():
+            try:
+                for entry in log_cursor.fetch():
+                    print_status(f"[{entry.level}] {entry.message}")
+            except (requests.ConnectionError, OpenEoApiPlainError, OpenEoApiError) as e:
+                # Logs are nice to have: don't let them break the status polling.
+                print_status(f"Failed to fetch logs: {e}")
+
         while True:
             # TODO: also allow a hard time limit on this infinite poll loop?
             try:
@@ -367,7 +431,9 @@ class BatchJob:
             else:
                 progress = "N/A"
             print_status(f"{status} (progress {progress})")
-            if status not in ("submitted", "created", "queued", "running"):
+            if log_cursor:
+                print_new_logs()
+            if status not in _JOB_STATUSES_ACTIVE:
                 break
 
             # Sleep for next poll (and adaptively make polling less frequent)
@@ -390,6 +456,71 @@ class BatchJob:
         return self
 
 
+class _LogCursor:
+    """
+    Incremental fetching of (paginated) logs,
+    keeping track of the identifier of the last received log entry.
+
+    :param path: logs endpoint, e.g. ``/jobs/{job_id}/logs``
+    :param offset: identifier of the last log entry received so far
+    :param level: minimum log level
+    :param limit: page size
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        path: str,
+        *,
+        offset: Optional[str] = None,
+        level: Union[str, int, None] = None,
+        limit: Optional[int] = None,
+    ):
+        self._connection = connection
+        self._path = path
+        self.offset = offset
+        self._level = level
+        self._min_level = normalize_log_level(level)
+        self._limit = limit
+
+    def _accept(self, entry: dict) -> bool:
+        return normalize_log_level(entry.get("level")) >= self._min_level
+
+    def fetch(self) -> Iterator[LogEntry]:
+        """
+        Fetch (lazily) the log entries that are currently available after the current offset,
+        following "next" pagination links.
+        """
+        params = {}
+        if self.offset is not None:
+            params["offset"] = self.offset
+        if self._level is not None:
+            params["level"] = log_level_name(self._level)
+        if self._limit is not None:
+            params["limit"] = self._limit
+        url = self._path
+        while url:
+            data = self._connection.get(url, params=params, expected_status=200).json()
+            entries = data.get("logs", [])
+            # Extra client-side level filtering, unless back-end confirms it did the filtering.
+            check_level = (
+                self._level is not None and normalize_log_level(data.get("level"), default=-1) < self._min_level
+            )
+            for entry in entries:
+                if check_level and not self._accept(entry):
+                    self.offset = entry.get("id", self.offset)
+                    continue
+                entry = LogEntry(entry)
+                self.offset = entry.id
+                yield entry
+            next_url = next((link.get("href") for link in data.get("links", []) if link.get("rel") == "next"), None)
+            if not entries or next_url == url:
+                break
+            # The "next" link is expected to encode all query parameters
+            url = next_url
+            params = None
+
+
 @deprecated(reason="Use :py:class:`BatchJob` instead", version="0.11.0")
 class RESTJob(BatchJob):
     """
@@ -0,0 +1,250 @@
+"""
+Streaming access to (large) results of synchronous processing requests, with bounded memory usage.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+import os
+import tempfile
+import typing
+import weakref
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Optional, Union
+
+import requests
+
+from openeo.rest import DEFAULT_DOWNLOAD_CHUNK_SIZE
+from openeo.util import ensure_dir
+
+if typing.TYPE_CHECKING:
+    # Imports for type checking only (circular import issue at runtime).
+    import xarray
+
+_log = logging.getLogger(__name__)
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_DELIMITERS = _JSON_WHITESPACE + ",:]}"
+# Maximum length of a JSON token that can be reported as invalid when truncated (e.g. "-Infinity" or "\uXXXX")
+_JSON_MAX_TOKEN_LENGTH = 10
+
+
+class _IncrementalJsonDecoder:
+    """
+    Incremental decoder of a JSON document that arrives in chunks of bytes:
+    items of a top-level array or (key, value) pairs of a top-level object
+    are yielded as soon as they are complete,
+    so that memory usage is bounded by the size of the largest item instead of the whole document.
+    Any other top-level value is yielded as a whole.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str = "utf-8"):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, min_size: int = 0) -> bool:
+        """
+        Drop consumed part of the buffer and append new data (at least `min_size` characters if possible).
+        Returns whether new data was read.
+        """
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        size = len(self._buffer)
+        while not self._eof and (len(self._buffer) == size or len(self._buffer) < min_size):
+            try:
+                self._buffer += self._text_decoder.decode(next(self._chunks))
+            except StopIteration:
+                self._buffer += self._text_decoder.decode(b"", final=True)
+                self._eof = True
+        return len(self._buffer) > size
+
+    def _peek(self) -> str:
+        """Skip whitespace and return next character (empty string at end of document)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"Invalid JSON document: expected one of {chars!r} but got {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode next JSON value, reading more data as necessary."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # Decoding errors at the end of the buffer (or in an unterminated string) might be due to truncation:
+                # read more data (at least doubling the buffer, to avoid quadratic re-parsing).
+                # Other errors are not going away with more data: fail fast instead of reading the whole stream.
+                truncated = (
+                    e.msg.startswith("Unterminated string") or len(self._buffer) - e.pos <= _JSON_MAX_TOKEN_LENGTH
+                )
+                if truncated and self._read(min_size=2 * (len(self._buffer) - self._pos)):
+                    continue
+                raise
+            if (end == len(self._buffer) or self._buffer[end] not in _JSON_DELIMITERS) and self._read():
+                # Value might have been truncated (e.g. number `12` from `123` or `1.5`): retry with more data.
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator:
+        start = self._peek()
+        if start and start in "[{":
+            self._pos += 1
+            end = "]" if start == "[" else "}"
+            if self._peek() == end:
+                self._pos += 1
+            else:
+                while True:
+                    if start == "[":
+                        yield self._value()
+                    else:
+                        key = self._value()
+                        self._expect(":")
+                        yield key, self._value()
+                    if self._expect("," + end) == end:
+                        break
+        else:
+            yield self._value()
+        if self._peek():
+            raise ValueError(f"Invalid JSON document: extra data {self._buffer[self._pos:self._pos + 16]!r}")
+
+
+def iter_json(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator:
+    """
+    Incrementally decode a JSON document from an iterable of byte chunks:
+    yield the items of a top-level array or the ``(key, value)`` pairs of a top-level object,
+    as soon as they are complete. Other top-level values are yielded as a whole.
+
+    :param chunks: iterable of byte chunks, e.g. from :py:meth:`requests.Response.iter_content`
+    :param encoding: text encoding of the JSON document
+    """
+    return iter(_IncrementalJsonDecoder(chunks=chunks, encoding=encoding))
+
+
+def _remove_file(path: Union[str, Path]):
+    try:
+        os.remove(path)
+    except OSError as e:
+        _log.warning(f"Failed to remove temporary file {path!r}: {e!r}")
+
+
+class ResultStream:
+    """
+    Streaming handle on the response of a synchronous processing request,
+    as returned by :py:meth:`Connection.execute_stream() <openeo.rest.connection.Connection.execute_stream>`,
+    to consume (large) results without holding the whole result in memory.
+
+    The response body can be consumed (only once) in different ways:
+    as iterator over raw chunks (:py:meth:`iter_bytes`),
+    as file-like object (:py:meth:`as_file`),
+    as incrementally decoded JSON (:py:meth:`iter_json`),
+    written to a file (:py:meth:`save`)
+    or loaded lazily as xarray dataset from a (temporary) file (:py:meth:`to_xarray`).
+
+    Can be used as context manager to make sure the underlying connection is released:
+
+    .. code-block:: python
+
+        with connection.execute_stream(process_graph) as stream:
+            for date, values in stream.iter_json():
+                ...
+
+    .. versionadded:: 0.52.0
+    """
+
+    def __init__(self, response: requests.Response, *, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE):
+        self._response = response
+        self._chunk_size = chunk_size
+
+    @property
+    def response(self) -> requests.Response:
+        """The underlying (streaming) response object."""
+        return self._response
+
+    @property
+    def headers(self) -> Mapping:
+        """Response headers"""
+        return self._response.headers
+
+    def iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Iterate over the (decoded) response body as chunks of bytes."""
+        return self._response.iter_content(chunk_size=chunk_size or self._chunk_size)
+
+    def as_file(self) -> BinaryIO:
+        """Get the (decoded) response body as read-only file-like object."""
+        raw = self._response.raw
+        raw.decode_content = True
+        return raw
+
+    def iter_json(self, chunk_size: Optional[int] = None) -> Iterator:
+        """
+        Incrementally decode the response body as JSON:
+        yields the items of a top-level array or the ``(key, value)`` pairs of a top-level object,
+        so that memory usage is bounded by the largest item, instead of the whole document.
+        Other top-level values are yielded as a whole.
+        """
+        return iter_json(self.iter_bytes(chunk_size=chunk_size), encoding=self._response.encoding or "utf-8")
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the response body (chunk by chunk) to given path."""
+        path = Path(path)
+        ensure_dir(path.parent)
+        with path.open(mode="wb") as f:
+            for chunk in self.iter_bytes():
+                f.write(chunk)
+        return path
+
+    def to_xarray(self, path: Union[str, Path, None] = None, **kwargs) -> xarray.Dataset:
+        """
+        Load the result (e.g. in netCDF format) as lazily loaded :py:class:`xarray.Dataset`:
+        the response is spooled to a file first (instead of loading it in memory),
+        from which the data is only read on access.
+
+        :param path: path to write the result to.
+            If not specified, a temporary file is used, which is removed
+            when the dataset is garbage collected.
+        :param kwargs: additional arguments for :py:func:`xarray.open_dataset`
+        """
+        import xarray
+
+        temporary = path is None
+        if temporary:
+            fd, path = tempfile.mkstemp(prefix="openeo-result-", suffix=".nc")
+            os.close(fd)
+        try:
+            self.save(path)
+            ds = xarray.open_dataset(path, **kwargs)
+        except Exception:
+            if temporary:
+                _remove_file(path)
+            raise
+        if temporary:
+            weakref.finalize(ds, _remove_file, path)
+        return ds
+
+    def close(self):
+        """Release the underlying connection."""
+        self._response.close()
+
+    def __enter__(self) -> ResultStream:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -6,6 +6,7 @@ from typing import List, Optional, Union
 
 from openeo.api.process import Parameter
 from openeo.internal.graph_building import FlatGraphableMixin, as_flat_graph
+from openeo.internal.json_encoding import resolve_pre_encoded
 from openeo.internal.jupyter import render_component
 from openeo.internal.processes.builder import ProcessBuilderBase
 from openeo.internal.warnings import deprecated
@@ -57,7 +58,7 @@ def build_process_dict(
 
     """
     process = dict_no_none(
-        process_graph=as_flat_graph(process_graph),
+        process_graph=resolve_pre_encoded(as_flat_graph(process_graph)),
         id=process_id,
         summary=summary,
         description=description,
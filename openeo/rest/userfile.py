@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import concurrent.futures
+import dataclasses
+import datetime
+import functools
+import logging
+import os
+import re
+import time
 import typing
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from openeo.rest import DEFAULT_DOWNLOAD_CHUNK_SIZE
+import requests
+
+from openeo.rest import DEFAULT_DOWNLOAD_CHUNK_SIZE, OpenEoApiPlainError
 from openeo.util import ensure_dir
 
 if typing.TYPE_CHECKING:
     # Imports for type checking only (circular import issue at runtime).
     from openeo.rest.connection import Connection
 
+_log = logging.getLogger(__name__)
+
 
 class UserFile:
     """
@@ -70,8 +82,17 @@ class UserFile:
             for chunk in response.iter_content(chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE):
                 f.write(chunk)
 
+        modified = self._get_modified_timestamp()
+        if modified is not None:
+            # Keep modification time of workspace file, so that unchanged files can be detected in later syncs.
+            os.utime(target, (modified, modified))
+
         return target
 
+    def _get_modified_timestamp(self) -> Optional[float]:
+        """Modification time (as POSIX timestamp) of the file in the workspace (if known)."""
+        return _parse_timestamp(self.metadata.get("modified"))
+
     def upload(self, source: Union[Path, str]) -> UserFile:
         """
         Uploads a local file to the path corresponding to this :py:class:`UserFile` in the user workspace
@@ -98,3 +119,221 @@ class UserFile:
         # This is used in internal/jupyter.py to detect and get the original metadata.
         # TODO: make this more explicit with an internal API?
         return self.metadata
+
+
+@dataclasses.dataclass
+class FileTransferSummary:
+    """
+    Summary of a bulk file transfer between a local directory and the user workspace
+    (see :py:meth:`Connection.upload_directory() <openeo.rest.connection.Connection.upload_directory>`
+    and :py:meth:`Connection.download_directory() <openeo.rest.connection.Connection.download_directory>`).
+
+    .. versionadded:: 0.52.0
+    """
+
+    #: (workspace) paths of the transferred files
+    transferred: List[str] = dataclasses.field(default_factory=list)
+    #: (workspace) paths of the files that were skipped because they were unchanged
+    skipped: List[str] = dataclasses.field(default_factory=list)
+    #: (workspace) paths of the files that failed to transfer (after retries), mapped to the error message
+    failed: Dict[str, str] = dataclasses.field(default_factory=dict)
+    #: total number of bytes transferred
+    bytes: int = 0
+    #: wall clock duration of the transfer in seconds
+    duration: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Transfer throughput in bytes per second."""
+        return self.bytes / self.duration if self.duration > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.transferred)} transferred, {len(self.skipped)} skipped, {len(self.failed)} failed:"
+            f" {self.bytes} bytes in {self.duration:.1f}s ({self.throughput / 1024 / 1024:.2f} MiB/s)"
+        )
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, OpenEoApiPlainError):
+        return error.http_status_code is None or error.http_status_code == 429 or error.http_status_code >= 500
+    return isinstance(error, (requests.exceptions.RequestException, ConnectionError))
+
+
+class _DirectorySync:
+    """Concurrent transfer of a batch of files, with skipping of unchanged files and retries."""
+
+    def __init__(self, *, max_workers: int = 4, retries: int = 2, retry_backoff: float = 1.0):
+        self.max_workers = max_workers
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+
+    def run(
+        self,
+        tasks: List[Tuple[str, Callable[[], int]]],
+        *,
+        skipped: List[str],
+        failed: Optional[Dict[str, str]] = None,
+    ) -> FileTransferSummary:
+        """
+        Run given transfer tasks concurrently.
+
+        :param tasks: list of (workspace path, transfer function returning number of bytes transferred)
+        :param skipped: workspace paths of files that were skipped
+        :param failed: workspace paths of files that were rejected upfront, mapped to the error message
+        """
+        summary = FileTransferSummary(skipped=skipped, failed=dict(failed or {}))
+        start = time.time()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="openeo-filesync"
+        ) as executor:
+            futures = {executor.submit(self._with_retries, path, transfer): path for path, transfer in tasks}
+            for future in concurrent.futures.as_completed(futures):
+                path = futures[future]
+                try:
+                    summary.bytes += future.result()
+                    summary.transferred.append(path)
+                except Exception as e:
+                    _log.warning(f"Failed to transfer {path!r}: {e!r}")
+                    summary.failed[path] = str(e)
+        summary.duration = time.time() - start
+        summary.transferred.sort()
+        _log.info(f"File transfer summary: {summary}")
+        return summary
+
+    def _with_retries(self, path: str, transfer: Callable[[], int]) -> int:
+        attempt = 0
+        while True:
+            try:
+                return transfer()
+            except Exception as e:
+                if attempt >= self.retries or not _is_retryable(e):
+                    raise
+                attempt += 1
+                _log.info(f"Retrying transfer of {path!r} (attempt {attempt}/{self.retries}) after {e!r}")
+                time.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """
+    Parse RFC 3339 date-time string (e.g. "modified" field of workspace file metadata) to POSIX timestamp.
+    Returns ``None`` if the value is missing or can not be parsed.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(re.sub("[Zz]$", "+00:00", value))
+    except ValueError:
+        _log.warning(f"Failed to parse timestamp {value!r}")
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def _is_unchanged(local: Path, remote: dict, *, local_is_source: bool) -> bool:
+    """
+    Detect unchanged files based on workspace file metadata (size, modification time)
+    and local file stats.
+    """
+    modified = _parse_timestamp(remote.get("modified"))
+    if not local.is_file() or remote.get("size") is None or modified is None:
+        return False
+    stat = local.stat()
+    if stat.st_size != remote["size"]:
+        return False
+    if local_is_source:
+        # Workspace copy should not be older than local file
+        return modified >= int(stat.st_mtime)
+    else:
+        # Local copy should not be older than workspace file
+        return stat.st_mtime >= modified
+
+
+def upload_directory(
+    connection: Connection,
+    source: Union[Path, str],
+    target: Union[str, PurePosixPath, None] = None,
+    *,
+    pattern: str = "**/*",
+    skip_unchanged: bool = True,
+    max_workers: int = 4,
+    retries: int = 2,
+    retry_backoff: float = 1.0,
+) -> FileTransferSummary:
+    """
+    Upload the files of a local directory (recursively) to the user workspace.
+    Usually used through :py:meth:`Connection.upload_directory() <openeo.rest.connection.Connection.upload_directory>`,
+    which documents the arguments.
+
+    .. versionadded:: 0.52.0
+    """
+    source = Path(source)
+    if not source.is_dir():
+        raise ValueError(f"Source {source} is not a directory.")
+    target = PurePosixPath(target or "")
+    remote = {}
+    if skip_unchanged:
+        for user_file in connection.iter_files():
+            if user_file.path.parts[: len(target.parts)] == target.parts:
+                remote[str(user_file.path)] = user_file.metadata
+
+    def upload(path: Path, target: PurePosixPath) -> int:
+        connection.upload_file(path, target=target)
+        return path.stat().st_size
+
+    tasks = []
+    skipped = []
+    for path in sorted(p for p in source.glob(pattern) if p.is_file()):
+        file_target = target / path.relative_to(source).as_posix()
+        if skip_unchanged and _is_unchanged(path, remote.get(str(file_target), {}), local_is_source=True):
+            skipped.append(str(file_target))
+        else:
+            tasks.append((str(file_target), functools.partial(upload, path, file_target)))
+    sync = _DirectorySync(max_workers=max_workers, retries=retries, retry_backoff=retry_backoff)
+    return sync.run(tasks, skipped=skipped)
+
+
+def download_directory(
+    connection: Connection,
+    target: Union[Path, str],
+    source: Union[str, PurePosixPath, None] = None,
+    *,
+    skip_unchanged: bool = True,
+    max_workers: int = 4,
+    retries: int = 2,
+    retry_backoff: float = 1.0,
+) -> FileTransferSummary:
+    """
+    Download the files of a folder in the user workspace (recursively) to a local directory.
+    Usually used through
+    :py:meth:`Connection.download_directory() <openeo.rest.connection.Connection.download_directory>`,
+    which documents the arguments.
+
+    .. versionadded:: 0.52.0
+    """
+    target = Path(target)
+    root = target.resolve()
+    source = PurePosixPath(source or "")
+
+    def download(user_file: UserFile, path: Path) -> int:
+        return user_file.download(path).stat().st_size
+
+    tasks = []
+    skipped = []
+    failed = {}
+    for user_file in connection.iter_files():
+        if source.parts and user_file.path.parts[: len(source.parts)] != source.parts:
+            continue
+        path = target.joinpath(*user_file.path.parts[len(source.parts) :])
+        if path.resolve() == root or root not in path.resolve().parents:
+            # Don't trust workspace paths like "/etc/passwd" or "../../.bashrc"
+            _log.warning(f"Not downloading {str(user_file.path)!r}: local path {path} outside of {target}")
+            failed[str(user_file.path)] = f"Local path {path} outside of target directory {target}"
+            continue
+        if skip_unchanged and _is_unchanged(path, user_file.metadata, local_is_source=False):
+            skipped.append(str(user_file.path))
+        else:
+            tasks.append((str(user_file.path), functools.partial(download, user_file, path)))
+    sync = _DirectorySync(max_workers=max_workers, retries=retries, retry_backoff=retry_backoff)
+    return sync.run(tasks, skipped=skipped, failed=failed)
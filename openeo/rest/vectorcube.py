@@ -27,6 +27,7 @@ from openeo.rest._datacube import (
 from openeo.rest.job import BatchJob
 from openeo.rest.mlmodel import MlModel
 from openeo.rest.result import SaveResult
+from openeo.rest.streaming import ResultStream
 from openeo.util import InvalidBBoxException, dict_no_none, guess_format, to_bbox_dict
 
 if typing.TYPE_CHECKING:
@@ -125,6 +126,12 @@ class VectorCube(_ProcessGraphAbstraction):
         else:
             raise ValueError(data)
         # TODO #457 client side verification of GeoJSON construct: valid type, valid structure, presence of CRS, ...?
+        geometry_pipeline = getattr(connection, "geometry_pipeline", None)
+        if geometry_pipeline and isinstance(geometry, dict):
+            geometry = geometry_pipeline.prepare(geometry, connection=connection, allow_reference=not properties)
+            if isinstance(geometry, VectorCube):
+                # Large geometry was uploaded: directly load it from there.
+                return geometry
 
         pg = PGNode(process_id="load_geojson", data=geometry, properties=properties or [])
         # TODO #457 always a "properties" dimension? https://github.com/Open-EO/openeo-processes/issues/448
@@ -300,6 +307,37 @@ class VectorCube(_ProcessGraphAbstraction):
             on_response_headers=on_response_headers,
         )
 
+    def execute_stream(
+        self,
+        format: Optional[str] = None,
+        options: Optional[dict] = None,
+        *,
+        validate: Optional[bool] = None,
+        auto_add_save_result: bool = True,
+        additional: Optional[dict] = None,
+        job_options: Optional[dict] = None,
+        on_response_headers: Optional[Callable[[Mapping], None]] = None,
+    ) -> ResultStream:
+        """
+        Send the underlying process graph to the backend for synchronous processing
+        and return a streaming handle on the result (e.g. to incrementally decode large JSON results).
+        See :py:meth:`DataCube.execute_stream() <openeo.rest.datacube.DataCube.execute_stream>`
+        for a description of the parameters.
+
+        .. versionadded:: 0.52.0
+        """
+        if auto_add_save_result:
+            res = self._auto_save_result(format=format, options=options)
+        else:
+            res = self
+        return self._connection.execute_stream(
+            res.flat_graph(),
+            validate=validate,
+            additional=additional,
+            job_options=job_options,
+            on_response_headers=on_response_headers,
+        )
+
     def execute_batch(
         self,
         outputfile: Optional[Union[str, pathlib.Path]] = None,
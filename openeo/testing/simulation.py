@@ -0,0 +1,530 @@
+"""
+Simulation of an openEO back-end for load testing of batch job workflows
+(e.g. with :py:class:`~openeo.extra.job_management.MultiBackendJobManager`) at scale,
+without an actual back-end.
+
+.. versionadded:: 0.52.0
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import datetime
+import gzip
+import heapq
+import http.server
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+import urllib.parse
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from openeo.rest._metrics import endpoint_template
+from openeo.rest._testing import build_capabilities
+from openeo.util import rfc3339
+
+#: Specification of a (random) duration in seconds:
+#: a constant, a ``(min, max)`` tuple for a uniform distribution,
+#: or a callable that draws a value from a given ``random.Random`` instance
+#: (e.g. ``lambda rng: rng.expovariate(1 / 30)``).
+Duration = Union[float, Tuple[float, float], Callable[[random.Random], float]]
+
+# Chunk size for generating asset content
+_CHUNK_SIZE = 1024 * 1024
+# Asset content: repeating byte pattern 0, 1, ..., 255 (padded to allow slicing chunks at any offset)
+_PATTERN = bytes(range(256)) * (_CHUNK_SIZE // 256 + 1)
+
+
+def asset_content(start: int, end: int) -> Iterator[bytes]:
+    """
+    Content (in chunks) of simulated result assets between given byte offsets (end exclusive):
+    a repeating byte pattern 0, 1, ..., 255.
+    """
+    for position in range(start, end, _CHUNK_SIZE):
+        size = min(_CHUNK_SIZE, end - position)
+        offset = position % 256
+        yield _PATTERN[offset : offset + size]
+
+
+def _draw(duration: Duration, rng: random.Random) -> float:
+    if callable(duration):
+        return max(0.0, float(duration(rng)))
+    elif isinstance(duration, tuple):
+        return rng.uniform(*duration)
+    return float(duration)
+
+
+class SimulationResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    #: response body: bytes or an iterator of chunks (e.g. for large assets)
+    body: Union[bytes, Iterator[bytes]] = b""
+
+
+@dataclasses.dataclass
+class _SimulatedJob:
+    job_id: str
+    created: float
+    title: Optional[str] = None
+    process: Optional[dict] = None
+    # Simulated timeline (in clock time), set when the job is started
+    started: Optional[float] = None
+    running_from: Optional[float] = None
+    done_at: Optional[float] = None
+    final_status: str = "finished"
+    canceled: bool = False
+
+    def status(self, now: float) -> str:
+        if self.canceled:
+            return "canceled"
+        elif self.started is None:
+            return "created"
+        elif now < self.running_from:
+            return "queued"
+        elif now < self.done_at:
+            return "running"
+        return self.final_status
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def acquire(self, now: float) -> Optional[float]:
+        """Take a token: return None on success, or the time (in seconds) to wait for a next token."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return (1 - self.tokens) / self.rate
+
+
+class BackendSimulation:
+    """
+    Simulated openEO back-end for load testing of batch job workflows with thousands of jobs,
+    e.g. to measure throughput and API call counts of
+    :py:class:`~openeo.extra.job_management.MultiBackendJobManager`.
+
+    Supports batch job creation, starting, status polling, listing (paginated), canceling, deletion,
+    logs and result assets (of configurable size, with support for HTTP range requests).
+    Job status evolves over (clock) time: after starting, a job is "queued" for a (random) queue time,
+    then "running" for a (random) run time, and finally "finished" (or "error").
+
+    The simulation can be served through a mocked ``requests`` session (``requests_mock``)
+    with :py:meth:`install`, or as a real HTTP server (on localhost) with :py:meth:`serve`,
+    so that (multi-threaded) clients work with real sockets and connection pools.
+
+    Usage example:
+
+    .. code-block:: python
+
+        import openeo
+        from openeo.testing.simulation import BackendSimulation
+
+        simulation = BackendSimulation(queue_time=(1, 5), run_time=(5, 20), failure_rate=0.05, max_running=50)
+        with simulation.serve() as url:
+            connection = openeo.connect(url)
+            manager = MultiBackendJobManager(poll_sleep=1)
+            manager.add_backend("sim", connection=connection, parallel_jobs=50)
+            manager.run_jobs(job_db=job_db, start_job=start_job)
+        print(simulation.stats())
+
+    :param queue_time: time (in seconds) a started job stays "queued" (see ``Duration``).
+    :param run_time: time (in seconds) a job stays "running" (see ``Duration``).
+    :param max_running: (optional) maximum number of jobs running at the same time:
+        additional started jobs stay queued until there is room.
+    :param failure_rate: fraction of jobs that end with status "error" instead of "finished".
+    :param error_rate: fraction of API requests (except the capabilities document)
+        to fail with a (random) server error status code from ``error_status_codes``.
+    :param error_status_codes: status codes of injected server errors.
+    :param rate_limit: (optional) maximum request rate (requests per second),
+        with a burst capacity of ``rate_limit_burst`` requests.
+        Requests exceeding the rate limit get a "429 Too Many Requests" response (with "Retry-After" header).
+    :param latency: response latency (in seconds) to simulate (see ``Duration``).
+    :param assets: number of result assets per job.
+    :param asset_size: size (in bytes) of each result asset.
+    :param seed: (optional) seed for the random number generator, for reproducible simulations.
+    :param clock: (advanced) clock function, e.g. to simulate time in tests.
+    :param sleep: (advanced) sleep function, used to simulate latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_time: Duration = 0,
+        run_time: Duration = 0,
+        max_running: Optional[int] = None,
+        failure_rate: float = 0.0,
+        error_rate: float = 0.0,
+        error_status_codes: Sequence[int] = (500, 502, 503),
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[float] = None,
+        latency: Duration = 0,
+        assets: int = 1,
+        asset_size: int = 1024,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.queue_time = queue_time
+        self.run_time = run_time
+        self.failure_rate = failure_rate
+        self.error_rate = error_rate
+        self.error_status_codes = list(error_status_codes)
+        self.latency = latency
+        self.assets = assets
+        self.asset_size = asset_size
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, _SimulatedJob] = {}
+        self._job_ids = itertools.count()
+        # Times at which the run slots (if limited) become available
+        self._run_slots: Optional[List[float]] = [0.0] * max_running if max_running else None
+        self._rate_limiter = (
+            _TokenBucket(rate=rate_limit, burst=rate_limit_burst or max(1.0, rate_limit), now=clock())
+            if rate_limit
+            else None
+        )
+        self._counts = collections.Counter()
+        self._endpoints = collections.Counter()
+
+    # Transport adapters
+
+    def install(self, requests_mock, root_url: str = "https://openeo.test/") -> BackendSimulation:
+        """
+        Serve the simulated back-end through a ``requests_mock`` mocker (e.g. the pytest fixture),
+        at given root URL.
+        """
+        root_url = root_url.rstrip("/") + "/"
+
+        def callback(request, context):
+            split = urllib.parse.urlsplit(request.url)
+            response = self.handle(
+                method=request.method,
+                path="/" + split.path[len(urllib.parse.urlsplit(root_url).path) :].lstrip("/"),
+                query=urllib.parse.parse_qs(split.query),
+                headers=request.headers,
+                body=request.body,
+                root_url=root_url,
+            )
+            context.status_code = response.status
+            context.headers.update(response.headers)
+            return response.body if isinstance(response.body, bytes) else b"".join(response.body)
+
+        from requests_mock import ANY
+
+        requests_mock.register_uri(ANY, re.compile(re.escape(root_url) + ".*"), content=callback)
+        return self
+
+    @contextlib.contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """
+        Context manager to serve the simulated back-end as real HTTP server (in a background thread).
+
+        :param port: port to listen on (0: pick a free port)
+        :return: root URL of the server
+        """
+        simulation = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            # HTTP/1.1 for persistent connections
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                split = urllib.parse.urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                response = simulation.handle(
+                    method=self.command,
+                    path=split.path,
+                    query=urllib.parse.parse_qs(split.query),
+                    headers=self.headers,
+                    body=body,
+                    root_url=f"http://{self.headers.get('Host', f'{host}:{server.server_port}')}/",
+                )
+                self.send_response(response.status)
+                chunks = [response.body] if isinstance(response.body, bytes) else response.body
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                if "Content-Length" not in response.headers:
+                    chunks = [b"".join(chunks)]
+                    self.send_header("Content-Length", str(len(chunks[0])))
+                self.end_headers()
+                if self.command != "HEAD":
+                    for chunk in chunks:
+                        self.wfile.write(chunk)
+
+            do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="openeo-backend-simulation", daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_port}/"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    # Request handling
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: Optional[Mapping[str, List[str]]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Union[bytes, str, None] = None,
+        root_url: str = "https://openeo.test/",
+    ) -> SimulationResponse:
+        """Handle a request (transport independent)."""
+        method = method.upper()
+        query = query or {}
+        headers = headers or {}
+        endpoint = f"{method} {endpoint_template(path)}"
+        with self._lock:
+            self._counts["requests"] += 1
+            self._endpoints[endpoint] += 1
+            latency = _draw(self.latency, self._rng)
+            inject_error = path not in {"/", "/.well-known/openeo"} and self._rng.random() < self.error_rate
+            error_status = self._rng.choice(self.error_status_codes) if inject_error else None
+        if latency > 0:
+            self._sleep(latency)
+
+        if self._rate_limiter:
+            with self._lock:
+                wait = self._rate_limiter.acquire(now=self._clock())
+                self._counts["rate limited"] += wait is not None
+            if wait is not None:
+                return self._error(429, "TooManyRequests", "Rate limit exceeded", {"Retry-After": str(math.ceil(wait))})
+        if error_status:
+            with self._lock:
+                self._counts["injected errors"] += 1
+            return self._error(error_status, "Internal", "Simulated server error")
+
+        if isinstance(body, str):
+            body = body.encode("utf8")
+        if body and headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        data = json.loads(body) if body else None
+
+        parts = [p for p in path.split("/") if p]
+        if not parts and method == "GET":
+            return self._json(build_capabilities())
+        if parts[:1] != ["jobs"]:
+            return self._error(404, "NotFound", f"Unknown endpoint {method} {path}")
+        if len(parts) == 1:
+            if method == "GET":
+                return self._list_jobs(query=query, root_url=root_url)
+            elif method == "POST":
+                return self._create_job(data or {}, root_url=root_url)
+        else:
+            with self._lock:
+                job = self._jobs.get(parts[1])
+            if job is None:
+                return self._error(404, "JobNotFound", f"The batch job {parts[1]!r} does not exist.")
+            if len(parts) == 2:
+                if method == "GET":
+                    return self._json(self._job_metadata(job))
+                elif method == "DELETE":
+                    with self._lock:
+                        self._release_run_slot(job, now=self._clock())
+                        del self._jobs[job.job_id]
+                    return SimulationResponse(status=204, headers={})
+            elif parts[2] == "results" and len(parts) == 3:
+                if method == "POST":
+                    return self._start_job(job)
+                elif method == "GET":
+                    return self._job_results(job, root_url=root_url)
+                elif method == "DELETE":
+                    with self._lock:
+                        now = self._clock()
+                        if job.status(now) in {"queued", "running"}:
+                            self._release_run_slot(job, now=now)
+                            job.canceled = True
+                    return SimulationResponse(status=204, headers={})
+            elif parts[2] == "results" and len(parts) == 4 and method in {"GET", "HEAD"}:
+                return self._asset(job, name=parts[3], headers=headers)
+            elif parts[2] == "logs" and len(parts) == 3 and method == "GET":
+                return self._json({"logs": [], "links": []})
+        return self._error(405, "MethodNotAllowed", f"Unsupported method {method} for {path}")
+
+    @staticmethod
+    def _json(data, status: int = 200, headers: Optional[dict] = None) -> SimulationResponse:
+        return SimulationResponse(
+            status=status,
+            headers={"Content-Type": "application/json", **(headers or {})},
+            body=json.dumps(data).encode("utf8"),
+        )
+
+    def _error(self, status: int, code: str, message: str, headers: Optional[dict] = None) -> SimulationResponse:
+        return self._json({"code": code, "message": message}, status=status, headers=headers)
+
+    def _create_job(self, data: dict, *, root_url: str) -> SimulationResponse:
+        with self._lock:
+            job_id = f"j-{next(self._job_ids):06d}"
+            self._jobs[job_id] = _SimulatedJob(
+                job_id=job_id, created=self._clock(), title=data.get("title"), process=data.get("process")
+            )
+            self._counts["jobs created"] += 1
+        return SimulationResponse(
+            status=201, headers={"Location": f"{root_url}jobs/{job_id}", "OpenEO-Identifier": job_id}
+        )
+
+    def _start_job(self, job: _SimulatedJob) -> SimulationResponse:
+        with self._lock:
+            now = self._clock()
+            status = job.status(now)
+            if status in {"queued", "running"}:
+                return SimulationResponse(status=202, headers={})
+            job.started = now
+            job.canceled = False
+            job.running_from = now + _draw(self.queue_time, self._rng)
+            if self._run_slots is not None:
+                job.running_from = max(job.running_from, heapq.heappop(self._run_slots))
+            job.done_at = job.running_from + _draw(self.run_time, self._rng)
+            if self._run_slots is not None:
+                heapq.heappush(self._run_slots, job.done_at)
+            job.final_status = "error" if self._rng.random() < self.failure_rate else "finished"
+            self._counts["jobs started"] += 1
+        return SimulationResponse(status=202, headers={})
+
+    def _release_run_slot(self, job: _SimulatedJob, *, now: float):
+        """Make the run slot of a queued/running job available (from now on), e.g. when canceled or deleted."""
+        if self._run_slots is None or job.status(now) not in {"queued", "running"}:
+            return
+        if job.done_at in self._run_slots:
+            # Note: a slot that is already handed over to a next job (queued for it) is not rescheduled.
+            self._run_slots[self._run_slots.index(job.done_at)] = now
+            heapq.heapify(self._run_slots)
+
+    def _job_metadata(self, job: _SimulatedJob, now: Optional[float] = None) -> dict:
+        now = self._clock() if now is None else now
+        status = job.status(now)
+        metadata = {
+            "id": job.job_id,
+            "title": job.title,
+            "status": status,
+            "created": self._rfc3339(job.created, now=now),
+        }
+        if status == "running":
+            metadata["progress"] = round(100 * (now - job.running_from) / max(job.done_at - job.running_from, 1e-9))
+        elif status in {"finished", "error"}:
+            duration = job.done_at - job.running_from
+            metadata["updated"] = self._rfc3339(job.done_at, now=now)
+            metadata["costs"] = round(duration / 10, 2)
+            metadata["usage"] = {
+                "cpu": {"unit": "cpu-seconds", "value": round(4 * duration, 1)},
+                "memory": {"unit": "mb-seconds", "value": round(2048 * duration, 1)},
+                "duration": {"unit": "seconds", "value": round(duration)},
+            }
+        return metadata
+
+    @staticmethod
+    def _rfc3339(clock_time: float, *, now: float) -> str:
+        """Convert a clock time to a wall clock timestamp."""
+        return rfc3339.datetime(
+            datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(seconds=now - clock_time)
+        )
+
+    def _list_jobs(self, query: Mapping[str, List[str]], *, root_url: str) -> SimulationResponse:
+        limit = int(query.get("limit", ["100"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        now = self._clock()
+        with self._lock:
+            jobs = list(self._jobs.values())[offset : offset + limit]
+            total = len(self._jobs)
+        links = []
+        if offset + limit < total:
+            links.append({"rel": "next", "href": f"{root_url}jobs?limit={limit}&offset={offset + limit}"})
+        return self._json({"jobs": [self._job_metadata(j, now=now) for j in jobs], "links": links})
+
+    def _job_results(self, job: _SimulatedJob, *, root_url: str) -> SimulationResponse:
+        if job.status(self._clock()) != "finished":
+            return self._error(400, "JobNotFinished", f"Batch job {job.job_id!r} has not finished computing results.")
+        assets = {
+            f"result-{i:02d}.data": {
+                "href": f"{root_url}jobs/{job.job_id}/results/result-{i:02d}.data",
+                "type": "application/octet-stream",
+                "roles": ["data"],
+                "file:size": self.asset_size,
+            }
+            for i in range(self.assets)
+        }
+        return self._json({"type": "Feature", "stac_version": "1.0.0", "id": job.job_id, "assets": assets})
+
+    def _asset(self, job: _SimulatedJob, *, name: str, headers: Mapping[str, str]) -> SimulationResponse:
+        valid = {f"result-{i:02d}.data" for i in range(self.assets)}
+        if job.status(self._clock()) != "finished" or name not in valid:
+            return self._error(404, "AssetNotFound", f"No asset {name!r} for batch job {job.job_id!r}.")
+        size = self.asset_size
+        response_headers = {"Accept-Ranges": "bytes", "Content-Type": "application/octet-stream"}
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", headers.get("Range", "") or "")
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(int(match.group(2)) + 1, size) if match.group(2) else size
+            else:
+                # Suffix range: last N bytes
+                start, end = max(0, size - int(match.group(2))), size
+            if start >= size or start >= end:
+                return SimulationResponse(status=416, headers={"Content-Range": f"bytes */{size}"})
+            response_headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+            response_headers["Content-Length"] = str(end - start)
+            return SimulationResponse(status=206, headers=response_headers, body=asset_content(start, end))
+        response_headers["Content-Length"] = str(size)
+        return SimulationResponse(status=200, headers=response_headers, body=asset_content(0, size))
+
+    # Inspection
+
+    def job_status_histogram(self) -> Dict[str, int]:
+        """Histogram of the current status of all jobs."""
+        now = self._clock()
+        with self._lock:
+            return dict(collections.Counter(j.status(now) for j in self._jobs.values()))
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the simulation statistics:
+        request counts (total, per endpoint, rate limited and injected errors),
+        job counts and the job status histogram.
+        """
+        with self._lock:
+            stats = {
+                "requests": self._counts["requests"],
+                "rate limited": self._counts["rate limited"],
+                "injected errors": self._counts["injected errors"],
+                "jobs created": self._counts["jobs created"],
+                "jobs started": self._counts["jobs started"],
+                "endpoints": dict(self._endpoints),
+            }
+        stats["job status"] = self.job_status_histogram()
+        return stats
@@ -0,0 +1,274 @@
+"""
+Local execution of UDFs chunk by chunk, emulating the chunking of the data cube by openEO back-ends
+(e.g. the ``size`` and ``overlap`` of ``apply_neighborhood``),
+to develop, test and profile UDFs locally with production-like chunk geometry.
+
+.. versionadded:: 0.52.0
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import pathlib
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import xarray
+
+import openeo
+from openeo.udf import OpenEoUdfException
+from openeo.udf.run_code import (
+    _concat_chunks,
+    _iter_chunk_slices,
+    _open_chunked_source,
+    _prepare_local_udf_input,
+    run_udf_code,
+)
+from openeo.udf.udf_data import UdfData
+from openeo.udf.xarraydatacube import XarrayDataCube
+
+_log = logging.getLogger(__name__)
+
+
+class ChunkTiming(NamedTuple):
+    """Timing of the UDF execution on a single chunk."""
+
+    #: index of the chunk in the chunk grid
+    index: Tuple[int, ...]
+    #: shape of the chunk (including overlap)
+    shape: Tuple[int, ...]
+    #: duration (in seconds) of the UDF execution on this chunk
+    seconds: float
+
+
+class ChunkReport(NamedTuple):
+    """Report of a chunked local UDF execution, with per-chunk timings."""
+
+    chunks: List[ChunkTiming]
+    #: wall clock duration (in seconds) of the whole execution
+    wall_seconds: float
+    #: number of worker processes used
+    workers: int
+
+    @property
+    def total_seconds(self) -> float:
+        """Sum of the UDF execution time of all chunks."""
+        return sum(c.seconds for c in self.chunks)
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / len(self.chunks) if self.chunks else 0.0
+
+    @property
+    def max_seconds(self) -> float:
+        return max((c.seconds for c in self.chunks), default=0.0)
+
+    def slowest(self, n: int = 5) -> List[ChunkTiming]:
+        """The ``n`` slowest chunks."""
+        return sorted(self.chunks, key=lambda c: c.seconds, reverse=True)[:n]
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.chunks)} chunks on {self.workers} workers in {self.wall_seconds:.3f}s:"
+            f" UDF time total {self.total_seconds:.3f}s, mean {self.mean_seconds:.3f}s, max {self.max_seconds:.3f}s"
+        )
+
+
+def _run_udf_on_chunk(code: str, context: Optional[dict], array: xarray.DataArray) -> Tuple[xarray.DataArray, float]:
+    """Run the UDF on a single chunk (possibly in a worker process)."""
+    start = time.perf_counter()
+    chunk = XarrayDataCube(_prepare_local_udf_input(array))
+    result = run_udf_code(code, UdfData(datacube_list=[chunk], user_context=context))
+    cubes = result.get_datacube_list()
+    if not cubes or len(cubes) != 1:
+        raise OpenEoUdfException(f"Expected UDF to produce a single data cube, but got {len(cubes or [])}.")
+    return cubes[0].get_array(), time.perf_counter() - start
+
+
+class _Chunk(NamedTuple):
+    index: Tuple[int, ...]
+    #: slices (along the chunked dimensions) to load, including overlap
+    load: Dict[str, slice]
+    #: slices (along the chunked dimensions) to keep from the UDF result, trimming the overlap
+    trim: Dict[str, slice]
+
+
+class LocalChunkScheduler:
+    """
+    Run UDFs locally on a data cube chunk by chunk, like an openEO back-end would do,
+    with chunks processed in parallel worker processes.
+    Chunk results are stitched back together (after trimming the overlap).
+
+    Usage example, emulating ``cube.apply_neighborhood(udf, size=..., overlap=...)``:
+
+    .. code-block:: python
+
+        from openeo.udf.chunking import LocalChunkScheduler
+
+        scheduler = LocalChunkScheduler(max_workers=4)
+        result = scheduler.apply_neighborhood(
+            udf,
+            "input.nc",
+            size=[{"dimension": "x", "value": 128, "unit": "px"}, {"dimension": "y", "value": 128, "unit": "px"}],
+            overlap=[{"dimension": "x", "value": 16, "unit": "px"}, {"dimension": "y", "value": 16, "unit": "px"}],
+        )
+        print(scheduler.last_report)
+
+    :param max_workers: number of worker processes (defaults to the number of CPUs).
+        With ``max_workers=1``, chunks are processed sequentially in the current process
+        (e.g. for debugging).
+    """
+
+    def __init__(self, *, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.last_report: Optional[ChunkReport] = None
+
+    def apply_neighborhood(
+        self,
+        udf: Union[str, openeo.UDF],
+        datacube: Union[str, pathlib.Path, xarray.DataArray, XarrayDataCube],
+        *,
+        size: List[dict],
+        overlap: Optional[List[dict]] = None,
+        fmt: str = "netcdf",
+        output: Union[str, pathlib.Path, None] = None,
+    ) -> UdfData:
+        """
+        Run the UDF per neighborhood, like ``apply_neighborhood``:
+        the data cube is split in chunks of given ``size``, extended with given ``overlap`` on each side
+        (clipped at the borders of the cube).
+        The UDF must preserve the chunk shape along these dimensions,
+        as the overlap is trimmed from the UDF results before stitching.
+
+        :param udf: the UDF (code)
+        :param datacube: data cube (or path to file with data cube)
+        :param size: neighborhood size per dimension, in ``apply_neighborhood`` format,
+            e.g. ``[{"dimension": "x", "value": 128, "unit": "px"}]``.
+            A ``value`` of ``None`` means the full dimension.
+        :param overlap: (optional) overlap per dimension, in ``apply_neighborhood`` format.
+        :param fmt: format of the file if datacube is a path
+        :param output: (optional) path to save the resulting data cube to.
+        """
+        sizes, load_chunk = _open_chunked_source(datacube, fmt=fmt)
+        chunk_sizes = _parse_dimension_values(size, sizes=sizes, argument="size")
+        overlaps = _parse_dimension_values(overlap or [], sizes=sizes, argument="overlap")
+        invalid = [d for d in overlaps if d not in chunk_sizes]
+        if invalid:
+            raise ValueError(f"Overlap specified for dimensions {invalid} without neighborhood size.")
+
+        def chunks() -> Iterator[_Chunk]:
+            for index, core in _iter_chunk_slices(sizes, chunk_sizes):
+                load = {}
+                trim = {}
+                for dim, s in core.items():
+                    o = overlaps.get(dim, 0)
+                    start, stop = max(0, s.start - o), min(sizes[dim], s.stop + o)
+                    load[dim] = slice(start, stop)
+                    trim[dim] = slice(s.start - start, min(s.stop, sizes[dim]) - start)
+                yield _Chunk(index=index, load=load, trim=trim)
+
+        return self._run(udf, chunks(), load_chunk=load_chunk, dims=list(chunk_sizes), output=output)
+
+    def apply_dimension(
+        self,
+        udf: Union[str, openeo.UDF],
+        datacube: Union[str, pathlib.Path, xarray.DataArray, XarrayDataCube],
+        *,
+        dimension: str,
+        tile_size: int = 128,
+        fmt: str = "netcdf",
+        output: Union[str, pathlib.Path, None] = None,
+    ) -> UdfData:
+        """
+        Run the UDF like ``apply_dimension``: each chunk covers the full extent of the given dimension
+        (e.g. full time series or all bands), while the spatial dimensions are split in tiles.
+        The UDF may change the number of labels along the given dimension.
+
+        :param udf: the UDF (code)
+        :param datacube: data cube (or path to file with data cube)
+        :param dimension: the dimension the UDF is applied along (e.g. "t" or "bands")
+        :param tile_size: size (in pixels) of the spatial tiles
+        :param fmt: format of the file if datacube is a path
+        :param output: (optional) path to save the resulting data cube to.
+        """
+        sizes, load_chunk = _open_chunked_source(datacube, fmt=fmt)
+        if dimension not in sizes and dimension != "bands":
+            raise ValueError(f"Invalid dimension {dimension!r}: available dimensions {list(sizes)}")
+        chunk_sizes = {d: tile_size for d in ["y", "x"] if d in sizes and d != dimension}
+
+        def chunks() -> Iterator[_Chunk]:
+            for index, slices in _iter_chunk_slices(sizes, chunk_sizes):
+                yield _Chunk(index=index, load=slices, trim={})
+
+        return self._run(udf, chunks(), load_chunk=load_chunk, dims=list(chunk_sizes), output=output)
+
+    def _run(self, udf, chunks: Iterator[_Chunk], *, load_chunk, dims: List[str], output) -> UdfData:
+        if isinstance(udf, str):
+            udf = openeo.UDF(code=udf)
+        start = time.perf_counter()
+        timings: List[ChunkTiming] = []
+        results: Dict[Tuple[int, ...], xarray.DataArray] = {}
+
+        def collect(chunk: _Chunk, array: xarray.DataArray, result: xarray.DataArray, seconds: float):
+            for dim, s in chunk.trim.items():
+                if result.sizes.get(dim) != array.sizes[dim]:
+                    raise OpenEoUdfException(
+                        f"UDF changed the size of dimension {dim!r} from {array.sizes[dim]} to {result.sizes.get(dim)}:"
+                        " can not trim overlap."
+                    )
+            missing = [d for d in dims if d not in result.dims]
+            if missing:
+                raise OpenEoUdfException(
+                    f"UDF result lacks chunked dimensions {missing}: can not stitch chunk results."
+                )
+            results[chunk.index] = result.isel(chunk.trim)
+            timings.append(ChunkTiming(index=chunk.index, shape=tuple(array.shape), seconds=seconds))
+
+        if self.max_workers == 1:
+            for chunk in chunks:
+                array = load_chunk(chunk.load)
+                result, seconds = _run_udf_on_chunk(udf.code, udf.context, array)
+                collect(chunk, array, result, seconds)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                pending = {}
+
+                def wait(return_when):
+                    done, _ = concurrent.futures.wait(pending, return_when=return_when)
+                    for future in done:
+                        chunk, array = pending.pop(future)
+                        collect(chunk, array, *future.result())
+
+                for chunk in chunks:
+                    # Bound the number of loaded chunks in flight
+                    if len(pending) >= 2 * self.max_workers:
+                        wait(concurrent.futures.FIRST_COMPLETED)
+                    array = load_chunk(chunk.load).load()
+                    pending[executor.submit(_run_udf_on_chunk, udf.code, udf.context, array)] = (chunk, array)
+                wait(concurrent.futures.ALL_COMPLETED)
+
+        result = _concat_chunks(results, dims)
+        timings.sort(key=lambda t: t.index)
+        self.last_report = ChunkReport(
+            chunks=timings, wall_seconds=time.perf_counter() - start, workers=self.max_workers
+        )
+        _log.info(f"Chunked UDF execution: {self.last_report}")
+        if output:
+            XarrayDataCube(result).save_to_file(output)
+        return UdfData(datacube_list=[XarrayDataCube(result)], user_context=udf.context)
+
+
+def _parse_dimension_values(values: List[dict], *, sizes: Dict[str, int], argument: str) -> Dict[str, int]:
+    """Parse ``apply_neighborhood`` style size/overlap specification to a mapping of dimension to pixel count."""
+    result = {}
+    for item in values:
+        dim = item["dimension"]
+        if dim not in sizes:
+            raise ValueError(f"Invalid {argument} dimension {dim!r}: available dimensions {list(sizes)}")
+        if item.get("unit", "px") != "px":
+            raise ValueError(f"Unsupported {argument} unit {item.get('unit')!r} for dimension {dim!r}: only 'px'.")
+        value = item.get("value")
+        result[dim] = sizes[dim] if value is None else int(value)
+    return result
@@ -3,13 +3,16 @@
 Note: this module was initially developed under the ``openeo-udf`` project (https://github.com/Open-EO/openeo-udf)
 """
 
+import collections
 import functools
+import importlib.util
 import inspect
+import itertools
 import logging
 import math
 import pathlib
 import re
-from typing import Callable, List, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy
 import pandas
@@ -24,7 +27,7 @@ from openeo.udf._compat import tomllib
 from openeo.udf.feature_collection import FeatureCollection
 from openeo.udf.structured_data import StructuredData
 from openeo.udf.udf_data import UdfData
-from openeo.udf.xarraydatacube import XarrayDataCube
+from openeo.udf.xarraydatacube import XarrayDataCube, XarrayIO
 
 _log = logging.getLogger(__name__)
 
@@ -239,7 +242,12 @@ def run_udf_code(code: str, data: UdfData) -> UdfData:
 
 
 def execute_local_udf(
-    udf: Union[str, openeo.UDF], datacube: Union[str, pathlib.Path, xarray.DataArray, XarrayDataCube], fmt="netcdf"
+    udf: Union[str, openeo.UDF],
+    datacube: Union[str, pathlib.Path, xarray.DataArray, XarrayDataCube],
+    fmt="netcdf",
+    *,
+    chunks: Optional[Dict[str, int]] = None,
+    output: Union[str, pathlib.Path, None] = None,
 ):
     """
     Locally executes an user defined function on a previously downloaded datacube.
@@ -247,11 +255,25 @@ def execute_local_udf(
     :param udf: the code of the user defined function
     :param datacube: the path to the downloaded data in disk or a DataCube
     :param fmt: format of the file if datacube is string
+    :param chunks: (optional) process the data cube chunk by chunk,
+        with given chunk size (number of labels) per dimension, e.g. ``{"x": 256, "y": 256}``.
+        Input files (NetCDF, Zarr) are then loaded lazily, one chunk at a time.
+        Only chunk along dimensions the UDF handles independently
+        (e.g. "x" and "y" for a pixel-wise UDF, but not "t" for a UDF working on time series).
+    :param output: (optional) path (NetCDF, Zarr) to save the resulting data cube to.
+        With ``chunks`` and Zarr output, results are written incrementally
+        (appended along the first chunked dimension), so the full result never has to be kept in memory.
     :return: the resulting DataCube
+
+    .. versionchanged:: 0.52.0
+        Added ``chunks`` and ``output`` arguments and Zarr support.
     """
     if isinstance(udf, str):
         udf = openeo.UDF(code=udf)
 
+    if chunks:
+        return _execute_local_udf_chunked(udf=udf, datacube=datacube, fmt=fmt, chunks=chunks, output=output)
+
     if isinstance(datacube, (str, pathlib.Path)):
         d = XarrayDataCube.from_file(path=datacube, fmt=fmt)
     elif isinstance(datacube, XarrayDataCube):
@@ -260,16 +282,9 @@ def execute_local_udf(
         d = XarrayDataCube(datacube)
     else:
         raise ValueError(datacube)
-    d_array = d.get_array()
-    expected_order = ("t", "bands", "y", "x")
-    dims = [d for d in expected_order if d in d_array.dims]
 
     # TODO #472: skip going through XarrayDataCube above, we only need xarray.DataArray here anyway.
-    d = XarrayDataCube(
-        d_array.transpose(*dims)
-        # TODO: this float conversion was in original implementation (0962e00e03) but is that actually necessary?
-        .astype(numpy.float64)
-    )
+    d = XarrayDataCube(_prepare_local_udf_input(d.get_array()))
     # wrap to udf_data
     udf_data = UdfData(datacube_list=[d], user_context=udf.context)
 
@@ -278,9 +293,125 @@ def execute_local_udf(
 
     # run the udf through the same routine as it would have been parsed in the backend
     result = run_udf_code(udf.code, udf_data)
+    if output:
+        result.get_datacube_list()[0].save_to_file(output)
     return result
 
 
+def _prepare_local_udf_input(array: xarray.DataArray) -> xarray.DataArray:
+    expected_order = ("t", "bands", "y", "x")
+    dims = [d for d in expected_order if d in array.dims]
+    return (
+        array.transpose(*dims)
+        # TODO: this float conversion was in original implementation (0962e00e03) but is that actually necessary?
+        .astype(numpy.float64)
+    )
+
+
+def _iter_chunk_slices(sizes: Dict[str, int], chunks: Dict[str, int]) -> Iterator[Tuple[Tuple[int, ...], dict]]:
+    """
+    Iterate over the chunks of an array with given dimension sizes and chunk sizes:
+    produces tuples of chunk grid index (following the order of ``chunks``)
+    and corresponding ``isel`` slices.
+    An empty dimension gives a single (empty) chunk.
+    """
+    ranges = [
+        [(i, slice(start, start + size)) for i, start in enumerate(range(0, max(sizes[dim], 1), size))]
+        for dim, size in chunks.items()
+    ]
+    for combination in itertools.product(*ranges):
+        yield tuple(i for i, _ in combination), {dim: s for dim, (_, s) in zip(chunks, combination)}
+
+
+def _concat_chunks(blocks: Dict[Tuple[int, ...], xarray.DataArray], dims: List[str]) -> xarray.DataArray:
+    """Stitch together a (nested) grid of chunk results, given the dimensions of the grid axes."""
+    if not dims:
+        return blocks[()]
+    groups = collections.defaultdict(dict)
+    for index, block in blocks.items():
+        groups[index[0]][index[1:]] = block
+    return xarray.concat([_concat_chunks(groups[i], dims[1:]) for i in sorted(groups)], dim=dims[0])
+
+
+def _open_chunked_source(
+    datacube: Union[str, pathlib.Path, xarray.DataArray, XarrayDataCube], fmt: str
+) -> Tuple[Dict[str, int], Callable[[dict], xarray.DataArray]]:
+    """
+    Prepare chunk by chunk access to a data cube:
+    returns the dimension sizes and a function to load the chunk corresponding with given ``isel`` slices.
+    Files in NetCDF or Zarr format are opened lazily.
+    """
+    if isinstance(datacube, (str, pathlib.Path)) and fmt.lower() in {"netcdf", "zarr"}:
+        dataset = XarrayIO.open_dataset(datacube, fmt=fmt)
+
+        def load_chunk(slices: dict) -> xarray.DataArray:
+            return XarrayIO.dataset_to_array(dataset.isel(slices))
+
+        return dict(dataset.sizes), load_chunk
+
+    if isinstance(datacube, (str, pathlib.Path)):
+        datacube = XarrayDataCube.from_file(path=datacube, fmt=fmt)
+    if isinstance(datacube, XarrayDataCube):
+        datacube = datacube.get_array()
+    if not isinstance(datacube, xarray.DataArray):
+        raise ValueError(datacube)
+    array = datacube
+
+    def load_chunk(slices: dict) -> xarray.DataArray:
+        return array.isel(slices)
+
+    return dict(array.sizes), load_chunk
+
+
+def _execute_local_udf_chunked(
+    udf: openeo.UDF,
+    datacube: Union[str, pathlib.Path, xarray.DataArray, XarrayDataCube],
+    fmt: str,
+    chunks: Dict[str, int],
+    output: Union[str, pathlib.Path, None] = None,
+) -> UdfData:
+    sizes, load_chunk = _open_chunked_source(datacube, fmt=fmt)
+
+    invalid = [d for d in chunks if d not in sizes]
+    if invalid:
+        raise ValueError(f"Can not chunk along dimensions {invalid}: available dimensions {list(sizes)}")
+
+    dims = list(chunks)
+    incremental = output is not None and XarrayDataCube._guess_format(output) == "zarr"
+    # Chunk results, grouped on index along first chunked dimension
+    pending: Dict[int, Dict[Tuple[int, ...], xarray.DataArray]] = collections.defaultdict(dict)
+    stitched = []
+
+    def flush(outer: int):
+        row = _concat_chunks(pending.pop(outer), dims[1:])
+        if incremental:
+            XarrayIO.to_zarr(row, output, mode="a" if outer > 0 else "w", append_dim=dims[0] if outer > 0 else None)
+        else:
+            stitched.append(row)
+
+    for index, slices in _iter_chunk_slices(sizes, chunks):
+        if pending and index[0] not in pending:
+            flush(min(pending))
+        chunk = XarrayDataCube(_prepare_local_udf_input(load_chunk(slices)))
+        result = run_udf_code(udf.code, UdfData(datacube_list=[chunk], user_context=udf.context))
+        result_array = result.get_datacube_list()[0].get_array()
+        missing = [d for d in dims if d not in result_array.dims]
+        if missing:
+            raise OpenEoUdfException(f"UDF result lacks chunked dimensions {missing}: can not stitch chunk results.")
+        pending[index[0]][index[1:]] = result_array
+    if pending:
+        flush(min(pending))
+
+    if incremental:
+        # Load result lazily (with dask if available) from output
+        array = XarrayIO.from_zarr(output, chunks={} if importlib.util.find_spec("dask") else None)
+    else:
+        array = xarray.concat(stitched, dim=dims[0])
+        if output:
+            XarrayDataCube(array).save_to_file(output)
+    return UdfData(datacube_list=[XarrayDataCube(array)], user_context=udf.context)
+
+
 def extract_udf_dependencies(udf: Union[str, UDF]) -> Union[List[str], None]:
     """
     Extract dependencies from UDF code declared in a top-level comment block
@@ -10,7 +10,7 @@ import collections
 import json
 import typing
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 import numpy
 import xarray
@@ -115,6 +115,8 @@ class XarrayDataCube:
             return "netcdf"
         elif suffix in [".json"]:
             return "json"
+        elif suffix in [".zarr"]:
+            return "zarr"
         else:
             raise ValueError("Can not guess format of {p}".format(p=path))
 
@@ -124,14 +126,22 @@ class XarrayDataCube:
         Load data file as :py:class:`XarrayDataCube` in memory
 
         :param path: the file on disk
-        :param fmt: format to load from, e.g. "netcdf" or "json"
+        :param fmt: format to load from, e.g. "netcdf", "zarr" or "json"
             (will be auto-detected when not specified)
+        :param kwargs: additional format specific options,
+            e.g. ``chunks`` for lazy, dask-chunked loading of NetCDF and Zarr
+            (see :py:meth:`XarrayIO.from_netcdf_file` and :py:meth:`XarrayIO.from_zarr`)
 
         :return: loaded data cube
+
+        .. versionchanged:: 0.52.0
+            Added support for Zarr.
         """
         fmt = fmt or cls._guess_format(path)
         if fmt.lower() == 'netcdf':
             return cls(array=XarrayIO.from_netcdf_file(path=path, **kwargs))
+        elif fmt.lower() == "zarr":
+            return cls(array=XarrayIO.from_zarr(path=path, **kwargs))
         elif fmt.lower() == 'json':
             return cls(array=XarrayIO.from_json_file(path=path))
         else:
@@ -142,12 +152,19 @@ class XarrayDataCube:
         Store :py:class:`XarrayDataCube` to file
 
         :param path: destination file on disk
-        :param fmt: format to save as, e.g. "netcdf" or "json"
+        :param fmt: format to save as, e.g. "netcdf", "zarr" or "json"
             (will be auto-detected when not specified)
+        :param kwargs: additional format specific options, e.g. ``compression`` or ``encoding``
+            (see :py:meth:`XarrayIO.to_netcdf_file` and :py:meth:`XarrayIO.to_zarr`)
+
+        .. versionchanged:: 0.52.0
+            Added support for Zarr.
         """
         fmt = fmt or self._guess_format(path)
         if fmt.lower() == 'netcdf':
             XarrayIO.to_netcdf_file(array=self.get_array(), path=path, **kwargs)
+        elif fmt.lower() == "zarr":
+            XarrayIO.to_zarr(array=self.get_array(), path=path, **kwargs)
         elif fmt.lower() == 'json':
             XarrayIO.to_json_file(array=self.get_array(), path=path)
         else:
@@ -193,10 +210,60 @@ class XarrayIO:
         return r.transpose(*dims)
 
     @classmethod
-    def from_netcdf_file(cls, path: Union[str, Path], engine: Optional[str] = None) -> xarray.DataArray:
+    def from_netcdf_file(
+        cls, path: Union[str, Path], engine: Optional[str] = None, chunks: Union[Dict[str, int], str, None] = None
+    ) -> xarray.DataArray:
+        """
+        Load a NetCDF file as :py:class:`xarray.DataArray` (with band variables stacked along a "bands" dimension).
+
+        :param engine: (optional) xarray NetCDF engine to use.
+        :param chunks: (optional) load lazily as dask array with given chunking
+            (e.g. ``{"t": 1}``, ``"auto"``, or ``{}`` to use the chunking of the file). Requires dask.
+
+        .. versionchanged:: 0.52.0
+            Added ``chunks`` argument.
+        """
         # load the dataset and convert to data array
-        ds = xarray.open_dataset(path, engine=engine)
+        ds = xarray.open_dataset(path, engine=engine, chunks=chunks)
+        return cls.dataset_to_array(ds)
+
+    @classmethod
+    def from_zarr(cls, path: Union[str, Path], chunks: Union[Dict[str, int], str, None] = None) -> xarray.DataArray:
+        """
+        Load a Zarr store as :py:class:`xarray.DataArray` (with band variables stacked along a "bands" dimension).
+        Requires the ``zarr`` package.
+
+        :param chunks: (optional) load lazily as dask array with given chunking
+            (e.g. ``{"t": 1}``, ``"auto"``, or ``{}`` to use the chunking of the store). Requires dask.
+
+        .. versionadded:: 0.52.0
+        """
+        ds = xarray.open_zarr(path, chunks=chunks)
+        return cls.dataset_to_array(ds)
+
+    @classmethod
+    def open_dataset(cls, path: Union[str, Path], fmt: str = "netcdf", **kwargs) -> xarray.Dataset:
+        """
+        Open a NetCDF file or Zarr store lazily as :py:class:`xarray.Dataset` (one variable per band),
+        e.g. to load it piece by piece (with :py:meth:`xarray.Dataset.isel` and :py:meth:`dataset_to_array`).
+
+        .. versionadded:: 0.52.0
+        """
+        if fmt.lower() == "netcdf":
+            return xarray.open_dataset(path, **kwargs)
+        elif fmt.lower() == "zarr":
+            return xarray.open_zarr(path, **{"chunks": None, **kwargs})
+        else:
+            raise ValueError(f"Can not open {fmt!r} as lazy dataset.")
+
+    @classmethod
+    def dataset_to_array(cls, ds: xarray.Dataset) -> xarray.DataArray:
+        """
+        Convert a dataset (with one variable per band) to a :py:class:`xarray.DataArray`
+        with a "bands" dimension and dimensions in the usual order.
 
+        .. versionadded:: 0.52.0
+        """
         # Skip non-numerical variables (like "crs")
         band_vars = [k for k, v in ds.data_vars.items() if v.dtype.kind in {"b", "i", "u", "f"} and len(v.dims) > 0]
         ds = ds[band_vars]
@@ -239,7 +306,83 @@ class XarrayIO:
             custom_print(jsonarray)
 
     @classmethod
-    def to_netcdf_file(cls, array: xarray.DataArray, path: Union[str, Path], engine: Optional[str] = None):
+    def to_netcdf_file(
+        cls,
+        array: xarray.DataArray,
+        path: Union[str, Path],
+        engine: Optional[str] = None,
+        *,
+        compression: Union[bool, int, None] = None,
+        encoding: Optional[Dict[str, dict]] = None,
+    ):
+        """
+        Store a :py:class:`xarray.DataArray` as NetCDF file (with one variable per band).
+        Dask arrays are written chunk by chunk.
+
+        :param engine: (optional) xarray NetCDF engine to use.
+        :param compression: (optional) zlib compression of the band variables:
+            ``True`` for default compression level, or compression level (1-9).
+            Not supported by the "scipy" engine.
+        :param encoding: (optional) explicit xarray encoding settings per band variable
+            (e.g. dtype, scale factor, chunk sizes), taking precedence over ``compression``.
+
+        .. versionchanged:: 0.52.0
+            Added ``compression`` and ``encoding`` arguments.
+        """
+        ds = cls.array_to_dataset(array)
+        encoding = cls._build_encoding(ds, compression=compression, encoding=encoding)
+        ds.to_netcdf(path, engine=engine, encoding=encoding)
+
+    @classmethod
+    def to_zarr(
+        cls,
+        array: xarray.DataArray,
+        path: Union[str, Path],
+        *,
+        mode: str = "w",
+        append_dim: Optional[str] = None,
+        encoding: Optional[Dict[str, dict]] = None,
+    ):
+        """
+        Store a :py:class:`xarray.DataArray` as Zarr store (with one variable per band).
+        Requires the ``zarr`` package.
+        Dask arrays are written chunk by chunk. Zarr stores are compressed by default.
+
+        :param mode: "w" to (over)write the store, or "a" to append
+            (along ``append_dim``) to an existing store, e.g. to write a result incrementally.
+        :param append_dim: dimension to append along (with ``mode="a"``).
+        :param encoding: (optional) explicit xarray encoding settings per band variable
+            (e.g. chunk sizes, compressor).
+
+        .. versionadded:: 0.52.0
+        """
+        ds = cls.array_to_dataset(array)
+        if mode == "a" and append_dim:
+            # Encoding can only be set when creating the store.
+            ds.to_zarr(path, mode=mode, append_dim=append_dim)
+        else:
+            ds.to_zarr(path, mode=mode, encoding=encoding or {})
+
+    @staticmethod
+    def _build_encoding(
+        ds: xarray.Dataset, *, compression: Union[bool, int, None], encoding: Optional[Dict[str, dict]]
+    ) -> Dict[str, dict]:
+        result = {}
+        if compression:
+            level = 4 if compression is True else int(compression)
+            result = {name: {"zlib": True, "complevel": level} for name in ds.data_vars}
+        for name, settings in (encoding or {}).items():
+            result[name] = {**result.get(name, {}), **settings}
+        return result
+
+    @classmethod
+    def array_to_dataset(cls, array: xarray.DataArray) -> xarray.Dataset:
+        """
+        Convert a :py:class:`xarray.DataArray` to a dataset with one variable per band
+        (as used for storage in NetCDF or Zarr).
+
+        .. versionadded:: 0.52.0
+        """
         # temp reference to avoid modifying the original array
         result = array
         # rearrange in a basic way because older xarray versions have a bug and ellipsis don't work in xarray.transpose()
@@ -253,5 +396,4 @@ class XarrayIO:
             if not 'bands' in result.coords:
                 labels = ['band_' + str(i) for i in range(result.shape[result.dims.index('bands')])]
                 result = result.assign_coords(bands=labels)
-        result = result.to_dataset('bands')
-        result.to_netcdf(path, engine=engine)
+        return result.to_dataset("bands")
@@ -22,6 +22,7 @@ import requests
 import shapely.geometry.base
 from deprecated import deprecated
 
+from openeo.internal.json_encoding import PreEncodedJson  # noqa: F401
 from openeo.internal.warnings import legacy_alias
 
 try:
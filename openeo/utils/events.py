@@ -13,6 +13,10 @@ class EVENTS:
     JOB_CREATED = "job.created"
     JOB_STARTED = "job.started"
     SYNC_RESULT = "sync.result"
+    # Finished HTTP request, with metrics like `status_code`, `elapsed`, `request_bytes`, `response_bytes`, ...
+    HTTP_REQUEST = "http.request"
+    # Access token refresh attempt, with `success` and `elapsed`
+    AUTH_REFRESH = "auth.refresh"
 
 
 class EventBus:
@@ -2,7 +2,9 @@
 openEO-oriented HTTP utilities
 """
 
-from typing import Collection, Union
+import collections
+import threading
+from typing import Collection, Dict, Union
 
 import requests
 import requests.adapters
@@ -96,7 +98,45 @@ def _to_retry(retry: Union[Retry, dict, None]) -> Retry:
     return retry
 
 
-def session_with_retries(retry: Union[Retry, dict, None] = None) -> requests.Session:
+class HTTPAdapterWithStats(requests.adapters.HTTPAdapter):
+    """
+    :py:class:`requests.adapters.HTTPAdapter` that additionally keeps track
+    of request counts and concurrency, e.g. to detect connection pool saturation:
+    when more requests are in flight than the pool size (``pool_maxsize``),
+    urllib3 has to open (and discard) extra connections, or block (with ``pool_block``).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = collections.Counter()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        with self._stats_lock:
+            self._in_flight += 1
+            self._stats["requests"] += 1
+            if self._in_flight > self._pool_maxsize:
+                self._stats["pool saturated"] += 1
+            self._stats["max in flight"] = max(self._stats["max in flight"], self._in_flight)
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the request counters."""
+        with self._stats_lock:
+            return {"in flight": self._in_flight, **self._stats}
+
+
+def session_with_retries(
+    retry: Union[Retry, dict, None] = None,
+    *,
+    pool_connections: int = requests.adapters.DEFAULT_POOLSIZE,
+    pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+) -> requests.Session:
     """
     Factory for a requests session with openEO-oriented retry settings.
 
@@ -105,10 +145,13 @@ def session_with_retries(retry: Union[Retry, dict, None] = None) -> requests.Ses
         - a dictionary with :py:class:`urllib3.util.retry.Retry` arguments,
           e.g. ``total``, ``backoff_factor``, ``status_forcelist``, ...
         - ``None`` for default openEO-oriented retry settings
+    :param pool_connections: number of urllib3 connection pools (one per host) to cache.
+    :param pool_maxsize: maximum number of (keep-alive) connections to keep per pool.
+        Should be at least the number of threads sharing the session.
     """
     session = requests.Session()
     retry = _to_retry(retry)
-    adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapterWithStats(max_retries=retry, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
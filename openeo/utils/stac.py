@@ -0,0 +1,222 @@
+"""
+Utilities to efficiently read (static) STAC metadata:
+pooled HTTP connections, concurrent traversal and caching of STAC documents.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Deque, Iterator, List, Optional, Union
+
+import pystac
+import pystac.stac_io
+import requests
+
+from openeo.config import get_config_option
+from openeo.utils.http import session_with_retries
+
+_log = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 60 * 60
+DEFAULT_MAX_WORKERS = 8
+
+
+def _is_remote(href: str) -> bool:
+    return urllib.parse.urlsplit(href).scheme in {"http", "https"}
+
+
+class CachingStacIO(pystac.stac_io.DefaultStacIO):
+    """
+    :py:class:`pystac.StacIO` implementation that reads remote STAC documents
+    over a pooled (and retrying) HTTP session (safe to be used from multiple threads)
+    and caches them by URL: in memory and optionally on disk.
+    Local files are read as usual (without caching).
+
+    :param session: requests session to use (a pooled session with retries by default).
+    :param cache_dir: directory to cache remote STAC documents in (no disk cache if not set).
+    :param max_age: maximum age (in seconds) of cached documents.
+    :param memory_cache_size: maximum number of documents to keep in memory.
+    :param timeout: timeout (in seconds) of HTTP requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: Optional[requests.Session] = None,
+        cache_dir: Union[str, Path, None] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        memory_cache_size: int = 1000,
+        timeout: float = 60,
+        headers: Optional[dict] = None,
+    ):
+        super().__init__(headers=headers)
+        self._session = session or session_with_retries(pool_maxsize=DEFAULT_MAX_WORKERS)
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._max_age = max_age
+        self._memory_cache_size = memory_cache_size
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._memory_cache: collections.OrderedDict[str, tuple] = collections.OrderedDict()
+
+    def read_text_from_href(self, href: str) -> str:
+        if not _is_remote(href):
+            return super().read_text_from_href(href)
+        text = self._get_from_memory(href)
+        if text is None:
+            text = self._get_from_disk(href)
+            if text is None:
+                _log.debug(f"CachingStacIO: GET {href}")
+                response = self._session.get(href, headers=self.headers, timeout=self._timeout)
+                response.raise_for_status()
+                text = response.text
+                self._put_on_disk(href, text)
+            self._put_in_memory(href, text)
+        return text
+
+    def _get_from_memory(self, href: str) -> Union[str, None]:
+        with self._lock:
+            if href in self._memory_cache:
+                timestamp, text = self._memory_cache[href]
+                if time.time() - timestamp <= self._max_age:
+                    self._memory_cache.move_to_end(href)
+                    return text
+                del self._memory_cache[href]
+
+    def _put_in_memory(self, href: str, text: str):
+        with self._lock:
+            self._memory_cache[href] = (time.time(), text)
+            self._memory_cache.move_to_end(href)
+            while len(self._memory_cache) > self._memory_cache_size:
+                self._memory_cache.popitem(last=False)
+
+    def _cache_path(self, href: str) -> Path:
+        return self._cache_dir / (hashlib.sha256(href.encode("utf8")).hexdigest() + ".json")
+
+    def _get_from_disk(self, href: str) -> Union[str, None]:
+        if self._cache_dir:
+            path = self._cache_path(href)
+            try:
+                if time.time() - path.stat().st_mtime <= self._max_age:
+                    return path.read_text(encoding="utf8")
+            except OSError:
+                pass
+
+    def _put_on_disk(self, href: str, text: str):
+        if self._cache_dir:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                # Write to temp file first and move it in place, to be safe against concurrent readers/writers.
+                fd, temp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf8") as f:
+                    f.write(text)
+                os.replace(temp_path, self._cache_path(href))
+            except OSError as e:
+                _log.warning(f"CachingStacIO: failed to cache {href!r} in {self._cache_dir}: {e!r}")
+
+    def __deepcopy__(self, memo) -> CachingStacIO:
+        # Share (thread-safe) instance, e.g. when pystac deep-copies objects that refer to it.
+        return self
+
+    def __getstate__(self) -> dict:
+        # Don't pickle lock and in-memory cache
+        return {k: v for k, v in self.__dict__.items() if k not in {"_lock", "_memory_cache"}}
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._memory_cache = collections.OrderedDict()
+
+    def clear(self):
+        """Clear in-memory cache (the disk cache is left as is)."""
+        with self._lock:
+            self._memory_cache.clear()
+
+
+_default_stac_io: Optional[CachingStacIO] = None
+
+
+def get_default_stac_io() -> CachingStacIO:
+    """
+    Get shared :py:class:`CachingStacIO` instance (lazily created),
+    with caching settings from the client config
+    (options ``stac.cache_dir``, ``stac.memory_cache_size`` and ``stac.cache_max_age``).
+    Caching is opt-in: without these config options, documents are not cached.
+    """
+    global _default_stac_io
+    if _default_stac_io is None:
+        _default_stac_io = CachingStacIO(
+            cache_dir=get_config_option("stac.cache_dir"),
+            max_age=float(get_config_option("stac.cache_max_age", default=DEFAULT_MAX_AGE)),
+            memory_cache_size=int(get_config_option("stac.memory_cache_size", default=0)),
+        )
+    return _default_stac_io
+
+
+def reset_default_stac_io():
+    """
+    Discard the shared :py:class:`CachingStacIO` instance (and its in-memory cache),
+    e.g. to pick up changed config or to isolate tests.
+    """
+    global _default_stac_io
+    _default_stac_io = None
+
+
+def _traversal_links(catalog: pystac.Catalog, recursive: bool = True) -> List[pystac.Link]:
+    """Links to follow from a catalog: item links first, then child links."""
+    links = catalog.get_links(rel=pystac.RelType.ITEM)
+    if recursive:
+        links += catalog.get_links(rel=pystac.RelType.CHILD)
+    return links
+
+
+def _resolve(link: pystac.Link, stac_io: pystac.StacIO) -> pystac.STACObject:
+    if link.is_resolved():
+        return link.target
+    href = link.get_absolute_href()
+    return stac_io.stac_object_from_dict(stac_io.read_json(href), href=href, preserve_dict=False)
+
+
+def iter_stac_items(
+    catalog: pystac.Catalog,
+    *,
+    stac_io: Optional[pystac.StacIO] = None,
+    max_items: Optional[int] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    recursive: bool = True,
+) -> Iterator[pystac.Item]:
+    """
+    Iterate over the items of a (static) STAC catalog or collection,
+    in breadth-first order of the "item" (and "child") links,
+    fetching batches of linked documents concurrently.
+    Stopping the iteration early avoids fetching the remaining documents.
+
+    :param catalog: STAC catalog or collection to traverse
+    :param stac_io: :py:class:`pystac.StacIO` to read linked documents with
+        (should be thread-safe, like :py:class:`CachingStacIO`).
+    :param max_items: maximum number of items to yield.
+    :param max_workers: maximum number of documents to fetch concurrently.
+    :param recursive: also traverse child catalogs/collections.
+    """
+    stac_io = stac_io or get_default_stac_io()
+    queue: Deque[pystac.Link] = collections.deque(_traversal_links(catalog, recursive=recursive))
+    count = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while queue and (max_items is None or count < max_items):
+            batch = [queue.popleft() for _ in range(min(len(queue), max_workers))]
+            for obj in executor.map(lambda link: _resolve(link, stac_io=stac_io), batch):
+                if isinstance(obj, pystac.Item):
+                    yield obj
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+                elif isinstance(obj, pystac.Catalog):
+                    queue.extend(_traversal_links(obj, recursive=recursive))
@@ -103,6 +103,7 @@ setup(
         "localprocessing": localprocessing_require,
         "jupyter": jupyter_require,
         "artifacts": artifacts_require,
+        "orjson": ["orjson>=3.6"],
     },
     entry_points={
         "console_scripts": ["openeo-auth=openeo.rest.auth.cli:main"],
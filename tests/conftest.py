@@ -11,6 +11,7 @@ pytest.register_assert_rewrite(
 
 from openeo.testing.io import TestDataLoader
 from openeo.util import ensure_dir
+from openeo.utils.stac import reset_default_stac_io
 
 pytest_plugins = "pytester"
 
@@ -33,6 +34,32 @@ def tmp_openeo_config_home(tmp_path):
         yield path
 
 
+@pytest.fixture(autouse=True)
+def _reset_default_stac_io():
+    """Avoid leaking cached STAC documents between tests."""
+    reset_default_stac_io()
+    yield
+    reset_default_stac_io()
+
+
+class FakeClock:
+    """Fake (manually advanced) clock, to be used as ``clock`` callable (e.g. instead of ``time.time``)."""
+
+    def __init__(self, now: float = 1000):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def shift(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
 @pytest.fixture
 def test_data() -> TestDataLoader:
     return TestDataLoader(root=Path(__file__).parent / "data")
@@ -352,3 +352,89 @@ def test_feature_flag_checksum_via_trailers(
     else:
         # Only do checksumming if really required as this likely fails since support is unconfirmed
         assert s3_client._client_config.request_checksum_calculation == "when_required"
+
+
+@pytest.fixture
+def s3sts_helper(clean_capabilities_cache, conn_with_s3sts_capabilities, mocked_sts, mock_s3_access):
+    config = S3STSConfig(bucket=test_c_bucket_name, s3_endpoint=test_c_s3_endpoint)
+    ah = build_artifact_helper(conn_with_s3sts_capabilities, config)
+    assert isinstance(ah, S3STSArtifactHelper)
+    return ah
+
+
+def _get_object(uri) -> bytes:
+    return boto3.client("s3").get_object(Bucket=uri.bucket, Key=uri.key)["Body"].read()
+
+
+def test_credentials_refresh(s3sts_helper, mocked_sts):
+    assert mocked_sts.assume_role_with_web_identity.call_count == 1
+    s3 = s3sts_helper._get_s3_client()
+    # Credentials are still valid long enough: same client
+    assert s3sts_helper._get_s3_client() is s3
+    assert mocked_sts.assume_role_with_web_identity.call_count == 1
+
+    # Credentials about to expire: refresh and rebuild client
+    expiring = deepcopy(fake_creds_response)
+    expiring["Credentials"]["Expiration"] = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        minutes=5
+    )
+    s3sts_helper._creds = s3sts_helper._creds.from_assume_role_response(expiring)
+    s3_refreshed = s3sts_helper._get_s3_client()
+    assert s3_refreshed is not s3
+    assert mocked_sts.assume_role_with_web_identity.call_count == 2
+    assert s3sts_helper._get_s3_client() is s3_refreshed
+
+
+def test_credentials_refresh_naive_expiration(s3sts_helper, mocked_sts):
+    expired = deepcopy(fake_creds_response)
+    expired["Credentials"]["Expiration"] = datetime.datetime.utcnow() - datetime.timedelta(minutes=1)
+    s3sts_helper._creds = s3sts_helper._creds.from_assume_role_response(expired)
+    s3sts_helper._get_s3_client()
+    assert mocked_sts.assume_role_with_web_identity.call_count == 2
+
+
+def test_upload_files(s3sts_helper, tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"file-{i}.txt"
+        path.write_text(f"hello {i}")
+        paths.append(path)
+    uris = s3sts_helper.upload_files(paths, max_concurrency=3)
+    assert [uri.key.split("/")[-1] for uri in uris] == [f"file-{i}.txt" for i in range(5)]
+    assert [_get_object(uri) for uri in uris] == [f"hello {i}".encode() for i in range(5)]
+
+
+def test_upload_files_with_object_names(s3sts_helper, tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"data")
+    uris = s3sts_helper.upload_files({path: "model.bin", str(path): "copy.bin"})
+    assert [uri.key.split("/")[-1] for uri in uris] == ["model.bin", "copy.bin"]
+
+
+def test_upload_files_duplicate_key(s3sts_helper, tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "data.txt").write_text("a")
+    (tmp_path / "b" / "data.txt").write_text("b")
+    with pytest.raises(ValueError, match="Multiple files would be uploaded to the same key"):
+        s3sts_helper.upload_files([tmp_path / "a" / "data.txt", tmp_path / "b" / "data.txt"])
+
+
+def test_upload_files_multipart(s3sts_helper, tmp_path):
+    path = tmp_path / "large.bin"
+    data = os.urandom(12 * 1024 * 1024)
+    path.write_bytes(data)
+    (uri,) = s3sts_helper.upload_files([path], multipart_threshold_mb=5, multipart_chunksize_mb=5, max_concurrency=4)
+    assert _get_object(uri) == data
+    head = boto3.client("s3").head_object(Bucket=uri.bucket, Key=uri.key)
+    # ETag of multipart upload has part count suffix
+    assert head["ETag"].strip('"').endswith("-3")
+
+
+def test_get_presigned_urls(s3sts_helper, test_file):
+    uris = s3sts_helper.upload_files([test_file])
+    urls = s3sts_helper.get_presigned_urls(uris * 3, expires_in_seconds=600)
+    assert len(urls) == 3
+    assert all(url.startswith(test_c_s3_endpoint) and uris[0].key in url for url in urls)
+    assert "Expires=600" in urls[0] or "X-Amz-Expires=600" in urls[0]
+    assert s3sts_helper.get_presigned_url(uris[0]).startswith(test_c_s3_endpoint)
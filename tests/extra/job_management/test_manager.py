@@ -1,4 +1,5 @@
 import collections
+import concurrent.futures
 import dataclasses
 import datetime
 import json
@@ -91,6 +92,12 @@ class DummyResultTask(Task):
         )
 
 
+def _wait_for_tasks(worker_pool: _JobManagerWorkerThreadPool):
+    """Wait until all submitted tasks are done, to process their results deterministically."""
+    for pool in worker_pool._pools.values():
+        concurrent.futures.wait([future for future, _ in pool._future_task_pairs])
+
+
 class TestMultiBackendJobManager:
     @pytest.fixture
     def job_manager_root_dir(self, tmp_path):
@@ -654,6 +661,96 @@ class TestMultiBackendJobManager:
         needle = re.compile(r"Job status histogram:.*'finished': 5.*Run stats:.*'job_queued_for_start': 5")
         assert needle.search(caplog.text)
 
+    def test_tail_logs(self, tmp_path, requests_mock, dummy_backend_foo, sleep_mock, caplog):
+        caplog.set_level(logging.INFO)
+        entries = [
+            {"id": "log1", "level": "warning", "message": "Careful"},
+            {"id": "log2", "level": "info", "message": "Hello"},
+            {"id": "log3", "level": "error", "message": "Nope"},
+        ]
+        offsets = []
+
+        def get_logs(request, context):
+            offset = request.qs.get("offset", [None])[0]
+            offsets.append(offset)
+            # Only make log entries available one by one
+            start = [e["id"] for e in entries].index(offset) + 1 if offset else 0
+            return {"logs": entries[start : start + 1], "links": []}
+
+        requests_mock.get("https://foo.test/jobs/job-2018/logs", json=get_logs)
+
+        job_manager = MultiBackendJobManager(root_dir=tmp_path, tail_logs="warning")
+        job_manager.add_backend("foo", connection=dummy_backend_foo.connection)
+        job_db = CsvJobDatabase(tmp_path / "jobs.csv").initialize_from_df(pd.DataFrame({"year": [2018]}))
+        run_stats = job_manager.run_jobs(job_db=job_db, start_job=self._create_year_job)
+
+        assert run_stats == dirty_equals.IsPartialDict({"job finished": 1, "job log entries": 2})
+        assert offsets[:4] == [None, "log1", "log2", "log3"]
+        messages = [(r.levelname, r.getMessage()) for r in caplog.records if "log:" in r.getMessage()]
+        assert messages == [("WARNING", "Job 'job-2018' log: Careful"), ("ERROR", "Job 'job-2018' log: Nope")]
+
+    def test_metrics(self, tmp_path, dummy_backend_foo, dummy_backend_bar, sleep_mock, caplog):
+        caplog.set_level(logging.INFO)
+        metrics_path = tmp_path / "metrics.prom"
+        job_manager = MultiBackendJobManager(root_dir=tmp_path / "job_mgr_root", metrics_path=metrics_path)
+        job_manager.add_backend("foo", connection=dummy_backend_foo.connection)
+        job_manager.add_backend("bar", connection=dummy_backend_bar.connection)
+        job_db = CsvJobDatabase(tmp_path / "jobs.csv").initialize_from_df(
+            pd.DataFrame({"year": [2018, 2019, 2020, 2021, 2022]})
+        )
+        job_manager.run_jobs(job_db=job_db, start_job=self._create_year_job)
+
+        report = json.loads((tmp_path / "metrics.json").read_text())
+        assert report["backends"] == {
+            "foo": dirty_equals.IsPartialDict(
+                events=dirty_equals.IsPartialDict(created=3, running=3, finished=3, downloaded=3),
+                active={},
+                durations=dirty_equals.HasLen(7),
+                download_bytes=dirty_equals.IsInt(gt=0),
+            ),
+            "bar": dirty_equals.IsPartialDict(
+                events=dirty_equals.IsPartialDict(created=2, running=2, finished=2, downloaded=2),
+                active={},
+            ),
+        }
+        assert report["backends"]["foo"]["durations"]["run"] == dirty_equals.IsPartialDict(count=3)
+        assert report["run_stats"] == dirty_equals.IsPartialDict({"start_job call": 5, "job finished": 5})
+
+        lines = metrics_path.read_text().splitlines()
+        assert 'openeo_job_manager_job_events_total{backend="foo",event="finished"} 3' in lines
+        assert 'openeo_job_manager_job_run_seconds_count{backend="bar"} 2' in lines
+        assert 'openeo_job_manager_run_stats{stat="start_job call"} 5' in lines
+
+        assert re.search(r"Job manager final metrics: bar: 2 finished, 0 failed, .*; foo: 3 finished", caplog.text)
+
+    def test_metrics_no_download(self, tmp_path, dummy_backend_foo, sleep_mock):
+        job_manager = MultiBackendJobManager(root_dir=tmp_path / "job_mgr_root", download_results=False)
+        job_manager.add_backend("foo", connection=dummy_backend_foo.connection)
+        job_db = CsvJobDatabase(tmp_path / "jobs.csv").initialize_from_df(pd.DataFrame({"year": [2018, 2019]}))
+        job_manager.run_jobs(job_db=job_db, start_job=self._create_year_job)
+        assert job_manager.metrics.report()["backends"]["foo"]["events"] == dirty_equals.IsPartialDict(finished=2)
+        assert job_manager.metrics._finished == {}
+
+    def test_queueing_limit(self, tmp_path, dummy_backend_foo, sleep_mock):
+        job_manager = MultiBackendJobManager(root_dir=tmp_path / "job_mgr_root")
+        job_manager.add_backend("foo", connection=dummy_backend_foo.connection, parallel_jobs=5, queueing_limit=1)
+        assert job_manager.backends["foo"].queueing_limit == 1
+
+        queued = []
+        original_job_update_loop = job_manager._job_update_loop
+
+        def job_update_loop(job_db, **kwargs):
+            original_job_update_loop(job_db=job_db, **kwargs)
+            queued.append(sum(job_db.count_by_status(statuses=["queued", "queued_for_start"]).values()))
+
+        job_manager._job_update_loop = job_update_loop
+        job_db = CsvJobDatabase(tmp_path / "jobs.csv").initialize_from_df(
+            pd.DataFrame({"year": [2018, 2019, 2020, 2021, 2022]})
+        )
+        run_stats = job_manager.run_jobs(job_db=job_db, start_job=self._create_year_job)
+        assert run_stats == dirty_equals.IsPartialDict({"start_job call": 5, "job finished": 5})
+        assert max(queued) == 1
+
     @pytest.mark.parametrize(
         ["create_time", "start_time", "running_start_time", "end_time", "end_status", "cancel_after_seconds"],
         [
@@ -748,6 +845,7 @@ class TestMultiBackendJobManager:
 
         mgr = MultiBackendJobManager(root_dir=tmp_path / "jobs")
 
+        _wait_for_tasks(pool)
         mgr._process_threadworker_updates(worker_pool=pool, job_db=job_db, stats=stats)
 
         df_final = job_db.read()
@@ -785,6 +883,7 @@ class TestMultiBackendJobManager:
 
         mgr = MultiBackendJobManager(root_dir=tmp_path / "jobs")
 
+        _wait_for_tasks(pool)
         mgr._process_threadworker_updates(worker_pool=pool, job_db=job_db, stats=stats)
 
         df_final = job_db.read()
@@ -839,6 +938,7 @@ class TestMultiBackendJobManager:
         job_db = CsvJobDatabase(tmp_path / "jobs.csv").initialize_from_df(df_initial)
         mgr = MultiBackendJobManager(root_dir=tmp_path / "jobs")
 
+        _wait_for_tasks(pool)
         with caplog.at_level(logging.ERROR):
             mgr._process_threadworker_updates(pool, job_db=job_db, stats=stats)
 
@@ -0,0 +1,241 @@
+import json
+import math
+import re
+
+import dirty_equals
+import pytest
+import requests
+
+from openeo.extra.job_management._metrics import JobManagerMetrics, _quantile
+
+
+@pytest.fixture
+def metrics(clock) -> JobManagerMetrics:
+    return JobManagerMetrics(clock=clock)
+
+
+def _run_job(metrics, clock, job_id, *, backend="foo", queue=10, run=100, status="finished"):
+    metrics.job_created(job_id, backend=backend, seconds=0.5)
+    metrics.job_status(job_id, "queued_for_start")
+    metrics.job_started(job_id, seconds=0.25)
+    metrics.job_status(job_id, "queued")
+    clock.shift(queue)
+    metrics.job_status(job_id, "running", backend=backend)
+    clock.shift(run)
+    metrics.job_status(job_id, status, backend=backend)
+
+
+@pytest.mark.parametrize(
+    ["values", "q", "expected"],
+    [
+        ([1], 0.5, 1),
+        ([1, 2], 0.5, 1.5),
+        ([1, 2, 3, 4, 5], 0.5, 3),
+        ([1, 2, 3, 4, 5], 0.9, 4.6),
+        ([1, 2, 3, 4, 5], 0, 1),
+        ([1, 2, 3, 4, 5], 1, 5),
+    ],
+)
+def test_quantile(values, q, expected):
+    assert _quantile(values, q) == pytest.approx(expected)
+
+
+def test_quantile_empty():
+    assert math.isnan(_quantile([], 0.5))
+
+
+class TestJobManagerMetrics:
+    def test_empty(self, metrics):
+        assert metrics.report() == {
+            "start_time": "1970-01-01T00:16:40Z",
+            "elapsed": 0,
+            "backends": {},
+            "run_stats": {},
+        }
+        assert str(metrics) == "no jobs"
+
+    def test_job_lifecycle(self, metrics, clock):
+        _run_job(metrics, clock, "j-1", queue=10, run=100)
+        metrics.job_downloaded("j-1", seconds=2, size=1000)
+
+        report = metrics.report()
+        assert report["elapsed"] == 110
+        assert report["backends"] == {
+            "foo": {
+                "events": {
+                    "created": 1,
+                    "downloaded": 1,
+                    "finished": 1,
+                    "queued": 1,
+                    "queued_for_start": 1,
+                    "running": 1,
+                },
+                "active": {},
+                "throughput_per_minute": pytest.approx(60 / 110),
+                "durations": {
+                    "create": dirty_equals.IsPartialDict(count=1, mean=0.5, p50=0.5),
+                    "start_request": dirty_equals.IsPartialDict(count=1, mean=0.25),
+                    "queue_wait": dirty_equals.IsPartialDict(count=1, mean=10, min=10, max=10),
+                    "created_to_running": dirty_equals.IsPartialDict(count=1, mean=10),
+                    "run": dirty_equals.IsPartialDict(count=1, mean=100, p50=100, p90=100, p99=100),
+                    "turnaround": dirty_equals.IsPartialDict(count=1, mean=110),
+                    "download": dirty_equals.IsPartialDict(count=1, mean=2),
+                },
+                "download_bytes": 1000,
+                "download_bytes_per_second": 500,
+            }
+        }
+
+    def test_active(self, metrics, clock):
+        metrics.job_created("j-1", backend="foo", seconds=1)
+        metrics.job_created("j-2", backend="foo", seconds=1)
+        metrics.job_created("j-3", backend="bar", seconds=1)
+        metrics.job_status("j-2", "running")
+        assert {b: r["active"] for b, r in metrics.report()["backends"].items()} == {
+            "bar": {"created": 1},
+            "foo": {"created": 1, "running": 1},
+        }
+
+    def test_per_backend_quantiles(self, metrics, clock):
+        for i, run in enumerate([10, 20, 30, 40, 50]):
+            _run_job(metrics, clock, f"foo-{i}", backend="foo", run=run)
+        _run_job(metrics, clock, "bar-0", backend="bar", run=500, status="error")
+
+        backends = metrics.report()["backends"]
+        assert backends["foo"]["durations"]["run"] == {
+            "count": 5,
+            "mean": 30,
+            "min": 10,
+            "max": 50,
+            "p50": 30,
+            "p90": pytest.approx(46),
+            "p99": pytest.approx(49.6),
+        }
+        assert backends["foo"]["events"]["finished"] == 5
+        assert backends["bar"]["durations"]["run"] == dirty_equals.IsPartialDict(count=1, p50=500)
+        assert backends["bar"]["events"] == dirty_equals.IsPartialDict(error=1)
+        assert "finished" not in backends["bar"]["events"]
+
+    def test_rolling_window(self, clock):
+        metrics = JobManagerMetrics(window_size=3, clock=clock)
+        for i, run in enumerate([1000, 1, 2, 3]):
+            _run_job(metrics, clock, f"j-{i}", run=run)
+        run = metrics.report()["backends"]["foo"]["durations"]["run"]
+        # Quantiles over the recent samples only, running aggregates over all samples.
+        assert run == dirty_equals.IsPartialDict(count=4, max=1000, p50=2, p99=pytest.approx(2.98))
+
+    def test_throughput_rate_window(self, clock):
+        metrics = JobManagerMetrics(rate_window=60, clock=clock)
+        for i in range(3):
+            _run_job(metrics, clock, f"j-{i}", queue=0, run=10)
+        assert metrics.report()["backends"]["foo"]["throughput_per_minute"] == pytest.approx(3 * 60 / 30)
+        # Jobs done at t=10, 20 and 30: only the last two are within the window at t=75
+        clock.shift(45)
+        assert metrics.report()["backends"]["foo"]["throughput_per_minute"] == pytest.approx(2)
+        clock.shift(60)
+        assert metrics.report()["backends"]["foo"]["throughput_per_minute"] == 0
+
+    def test_resumed_job(self, metrics, clock):
+        """Job not created in this session: no durations from before first observation."""
+        metrics.job_status("j-1", "queued", backend="foo")
+        clock.shift(10)
+        metrics.job_status("j-1", "running", backend="foo")
+        clock.shift(100)
+        metrics.job_status("j-1", "finished", backend="foo")
+        durations = metrics.report()["backends"]["foo"]["durations"]
+        assert set(durations.keys()) == {"run"}
+        assert durations["run"]["mean"] == 100
+
+    def test_unknown_job(self, metrics):
+        metrics.job_status("j-1", "queued")
+        metrics.job_started("j-1", seconds=1)
+        metrics.job_downloaded("j-1", seconds=1, size=100)
+        assert metrics.report()["backends"] == {}
+
+    def test_outdated_status(self, metrics, clock):
+        metrics.job_created("j-1", backend="foo", seconds=1)
+        metrics.job_status("j-1", "queued_for_start")
+        clock.shift(10)
+        metrics.job_status("j-1", "running")
+        # Result of start task processed after job was observed running
+        metrics.job_status("j-1", "queued")
+        clock.shift(10)
+        metrics.job_status("j-1", "finished")
+        report = metrics.report()["backends"]["foo"]
+        assert report["events"] == {"created": 1, "queued_for_start": 1, "running": 1, "finished": 1}
+        assert report["durations"]["run"]["mean"] == 10
+
+    def test_download_failed(self, metrics, clock):
+        _run_job(metrics, clock, "j-1")
+        metrics.job_download_failed("j-1")
+        assert metrics.report()["backends"]["foo"]["events"] == dirty_equals.IsPartialDict(download_failed=1)
+        assert "downloaded" not in metrics.report()["backends"]["foo"]["events"]
+        assert metrics._finished == {}
+
+    def test_download_skipped(self, metrics, clock):
+        _run_job(metrics, clock, "j-1")
+        metrics.job_download_skipped("j-1")
+        assert metrics._finished == {}
+        # Late download record is ignored
+        metrics.job_downloaded("j-1", seconds=1, size=100)
+        assert "download" not in metrics.report()["backends"]["foo"]["durations"]
+
+    def test_launch_failed(self, metrics):
+        metrics.job_launch_failed(backend="foo")
+        assert metrics.report()["backends"]["foo"]["events"] == {"start_failed": 1}
+
+    def test_run_stats(self, metrics):
+        stats = {"job launch": 3}
+        metrics.update_run_stats(stats)
+        stats["job launch"] = 4
+        assert metrics.report()["run_stats"] == {"job launch": 3}
+
+    def test_str(self, metrics, clock):
+        _run_job(metrics, clock, "j-1", queue=10, run=100)
+        assert str(metrics) == "foo: 1 finished, 0 failed, 0.55 jobs/min, queue wait p50 10.0s, run p50 100.0s"
+
+    def test_to_prometheus(self, metrics, clock):
+        _run_job(metrics, clock, "j-1", queue=10, run=100)
+        metrics.job_downloaded("j-1", seconds=2, size=1000)
+        metrics.update_run_stats({"job launch": 1})
+        text = metrics.to_prometheus()
+        assert text.endswith("\n")
+        lines = text.splitlines()
+        assert "# TYPE openeo_job_manager_job_events_total counter" in lines
+        assert 'openeo_job_manager_job_events_total{backend="foo",event="finished"} 1' in lines
+        assert "# TYPE openeo_job_manager_job_run_seconds summary" in lines
+        assert 'openeo_job_manager_job_run_seconds{backend="foo",quantile="0.5"} 100' in lines
+        assert 'openeo_job_manager_job_run_seconds{backend="foo",quantile="0.99"} 100' in lines
+        assert 'openeo_job_manager_job_run_seconds_sum{backend="foo"} 100' in lines
+        assert 'openeo_job_manager_job_run_seconds_count{backend="foo"} 1' in lines
+        assert 'openeo_job_manager_job_queue_wait_seconds_count{backend="foo"} 1' in lines
+        assert 'openeo_job_manager_download_bytes_total{backend="foo"} 1000' in lines
+        assert 'openeo_job_manager_throughput_jobs_per_minute{backend="foo"} 0.545455' in lines
+        assert 'openeo_job_manager_run_stats{stat="job launch"} 1' in lines
+        # All samples have valid metric name syntax
+        samples = [line for line in lines if not line.startswith("#")]
+        assert all(re.match(r"^[a-z_]+(\{[^}]*\})? \S+$", line) for line in samples)
+
+    def test_to_prometheus_escaping(self, metrics):
+        metrics.job_launch_failed(backend='f"o\\o')
+        assert 'openeo_job_manager_job_events_total{backend="f\\"o\\\\o",event="start_failed"} 1' in (
+            metrics.to_prometheus().splitlines()
+        )
+
+    def test_write_prometheus_and_report(self, metrics, clock, tmp_path):
+        _run_job(metrics, clock, "j-1")
+        metrics.write_prometheus(tmp_path / "metrics.prom")
+        metrics.write_report(tmp_path / "metrics.json")
+        assert (tmp_path / "metrics.prom").read_text() == metrics.to_prometheus()
+        assert json.loads((tmp_path / "metrics.json").read_text()) == dirty_equals.IsPartialDict(
+            backends={"foo": dirty_equals.IsPartialDict(events=dirty_equals.IsPartialDict(finished=1))}
+        )
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["metrics.json", "metrics.prom"]
+
+    def test_serve(self, metrics, clock):
+        _run_job(metrics, clock, "j-1")
+        with metrics.serve() as url:
+            resp = requests.get(url)
+        assert resp.status_code == 200
+        assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert resp.text == metrics.to_prometheus()
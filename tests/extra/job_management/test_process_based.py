@@ -1,4 +1,5 @@
 import copy
+import json
 from unittest import mock
 
 import dirty_equals
@@ -12,6 +13,7 @@ from openeo.extra.job_management import (
     CsvJobDatabase,
     MultiBackendJobManager,
     ParquetJobDatabase,
+    process_based,
 )
 from openeo.extra.job_management.process_based import ProcessBasedJobCreator
 from openeo.rest._testing import OPENEO_BACKEND, DummyBackend, build_capabilities
@@ -229,6 +231,82 @@ class TestProcessBasedJobCreator:
             }
         }
 
+    def test_multiple_rows_template_reuse(self, requests_mock, dummy_backend, remote_process_definitions):
+        requests_mock.get(OPENEO_BACKEND, json=build_capabilities(api_version="1.2.0", validation=True))
+        con = openeo.Connection(OPENEO_BACKEND)
+        job_factory = ProcessBasedJobCreator(process_id="increment", namespace="https://remote.test/increment.json")
+
+        job_factory.start_job(row=pd.Series({"data": 1}), connection=con)
+        job_factory.start_job(row=pd.Series({"data": 2, "title": "Two"}), connection=con)
+        job_factory.start_job(row=pd.Series({"data": {"some": ["json", 3.5, None]}}), connection=con)
+
+        assert [j["pg"]["increment1"]["arguments"] for j in dummy_backend.batch_jobs.values()] == [
+            {"data": 1, "increment": 1},
+            {"data": 2, "increment": 1},
+            {"data": {"some": ["json", 3.5, None]}, "increment": 1},
+        ]
+        assert dummy_backend.batch_jobs["job-001"]["title"] == "Two"
+        assert remote_process_definitions["increment"].call_count == 1
+        # Preflight validation of each job (identical process graphs are deduplicated by the validation cache)
+        job_factory.start_job(row=pd.Series({"data": 1, "title": "One again"}), connection=con)
+        assert [pg["increment1"]["arguments"] for pg in dummy_backend.validation_requests] == [
+            {"data": 1, "increment": 1},
+            {"data": 2, "increment": 1},
+            {"data": {"some": ["json", 3.5, None]}, "increment": 1},
+        ]
+
+    @pytest.mark.parametrize(
+        ["validation", "auto_validate", "expected_decodes"],
+        [(True, True, 1), (True, False, 0), (False, True, 0)],
+    )
+    def test_template_body_decoded_for_validation_only(
+        self, requests_mock, dummy_backend, remote_process_definitions, validation, auto_validate, expected_decodes
+    ):
+        requests_mock.get(OPENEO_BACKEND, json=build_capabilities(api_version="1.2.0", validation=validation))
+        con = openeo.Connection(OPENEO_BACKEND, auto_validate=auto_validate)
+        job_factory = ProcessBasedJobCreator(process_id="increment", namespace="https://remote.test/increment.json")
+
+        with mock.patch.object(process_based, "json", wraps=json) as json_mock:
+            job_factory.start_job(row=pd.Series({"data": 1}), connection=con)
+
+        assert json_mock.loads.call_count == expected_decodes
+        assert len(dummy_backend.validation_requests) == expected_decodes
+        assert dummy_backend.batch_jobs["job-000"]["pg"]["increment1"]["arguments"] == {"data": 1, "increment": 1}
+
+    @pytest.mark.parametrize(["size", "expected"], [(10, False), (100_000, True)])
+    def test_template_compress_requests(self, requests_mock, remote_process_definitions, size, expected):
+        requests_mock.get(OPENEO_BACKEND, json=build_capabilities(api_version="1.2.0"))
+        con = openeo.Connection(OPENEO_BACKEND, compress_requests=True)
+        dummy_backend = DummyBackend(requests_mock=requests_mock, connection=con)
+        job_factory = ProcessBasedJobCreator(process_id="increment", namespace="https://remote.test/increment.json")
+
+        job_factory.start_job(row=pd.Series({"data": "x" * size}), connection=con)
+
+        [post_jobs] = [r for r in requests_mock.request_history if r.method == "POST" and r.path == "/jobs"]
+        assert post_jobs.headers["Content-Type"] == "application/json"
+        assert ("Content-Encoding" in post_jobs.headers) == expected
+        assert dummy_backend.batch_jobs["job-000"]["pg"]["increment1"]["arguments"] == {
+            "data": "x" * size,
+            "increment": 1,
+        }
+
+    def test_non_json_argument_fallback(self, con, dummy_backend, remote_process_definitions):
+        job_factory = ProcessBasedJobCreator(
+            process_id="increment",
+            namespace="https://remote.test/increment.json",
+            parameter_defaults={"increment": con.datacube_from_process("answer")},
+        )
+        job_factory.start_job(row=pd.Series({"data": 1}), connection=con)
+        assert dummy_backend.batch_jobs["job-000"]["pg"] == {
+            "answer1": {"process_id": "answer", "arguments": {}},
+            "increment1": {
+                "process_id": "increment",
+                "namespace": "https://remote.test/increment.json",
+                "arguments": {"data": 1, "increment": {"from_node": "answer1"}},
+                "result": True,
+            },
+        }
+
     def test_no_process_id_nor_namespace(self):
         with pytest.raises(ValueError, match="At least one of `process_id` and `namespace` should be provided"):
             _ = ProcessBasedJobCreator()
@@ -619,7 +697,8 @@ class TestProcessBasedJobCreator:
                 "job finished": 2,
             }
         )
-        assert increment_udp_mock.call_count == 2
+        # UDP definition is only fetched once
+        assert increment_udp_mock.call_count == 1
         assert set(job_db.read().status) == {"finished"}
 
         assert dummy_backend.batch_jobs == {
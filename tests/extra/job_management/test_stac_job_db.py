@@ -1,5 +1,6 @@
 import collections
 import datetime
+import json
 import re
 from typing import Any, Dict, List, Optional, Union
 from unittest import mock
@@ -12,6 +13,7 @@ import pandas.testing as pdt
 import pystac
 import pystac_client
 import pytest
+import requests
 from shapely.geometry import Point
 
 from openeo.extra.job_management import MultiBackendJobManager
@@ -477,6 +479,99 @@ class TestSTACAPIJobDatabase:
 
         assert normalize(chunks) == normalize(expected)
 
+    def test_persist_multiple_chunks_concurrent_failure(self, requests_mock, job_db_exists):
+        df = pd.DataFrame({"item_id": [f"item-{i}" for i in range(12)], "datetime": "2020-01-01"})
+
+        def post_bulk_items(request, context):
+            if "item-5" in request.json()["items"]:
+                context.status_code = 400
+                return {"error": "nope"}
+            return {"status": "success"}
+
+        post_bulk_items_mock = requests_mock.post(
+            re.compile(r"http://fake-stac-api/collections/.*/bulk_items"), json=post_bulk_items
+        )
+        job_db_exists.bulk_size = 5
+        with pytest.raises(requests.HTTPError, match="400"):
+            job_db_exists.persist(df)
+        assert post_bulk_items_mock.call_count == 3
+
+    @pytest.mark.parametrize("has_geometry", [False, True])
+    def test_item_dicts_from_df(self, job_db_exists, has_geometry, time_machine):
+        time_machine.move_to("2025-06-07T12:34:56Z", tick=False)
+        df = pd.DataFrame(
+            {
+                "item_id": ["item-1", "item-2", "item-3"],
+                "datetime": ["2020-01-01", datetime.datetime(2021, 2, 3, 4, 5, 6), None],
+                "status": ["not_started", "running", "finished"],
+                "geometry": [{"type": "Point", "coordinates": [i, 2 * i]} for i in range(3)],
+            }
+        )
+        job_db_exists.has_geometry = has_geometry
+
+        expected = []
+        # Note: `item_from` does not support missing datetime
+        for _, series in df.iloc[:2].iterrows():
+            item = job_db_exists.item_from(series)
+            item.collection_id = "collection-1"
+            item.add_link(pystac.Link(rel=pystac.RelType.COLLECTION, target="collection-1"))
+            expected.append(json.loads(json.dumps(item.to_dict())))
+
+        actual = job_db_exists._item_dicts_from_df(df)
+        assert json.loads(json.dumps(actual[:2])) == expected
+        assert [d["properties"]["datetime"] for d in actual] == [
+            "2020-01-01T00:00:00Z",
+            "2021-02-03T04:05:06Z",
+            "2025-06-07T12:34:56Z",
+        ]
+
+    def test_count_by_status_local_mirror(self, requests_mock):
+        stac_api_url = "http://stacapi.test"
+        dummy_stac_api = DummyStacApi(root_url=stac_api_url, requests_mock=requests_mock)
+        dummy_stac_api.predefine_item(
+            collection_id="collection-123",
+            item=_pystac_item(id="item-1", properties={"status": "not_started"}),
+        )
+        dummy_stac_api.predefine_item(
+            collection_id="collection-123",
+            item=_pystac_item(id="item-2", properties={"status": "running"}),
+        )
+        job_db = STACAPIJobDatabase(collection_id="collection-123", stac_root_url=stac_api_url)
+
+        def search_count():
+            return sum(r.path == "/search" for r in requests_mock.request_history)
+
+        assert job_db.count_by_status() == {"not_started": 1, "running": 1}
+        assert job_db.count_by_status(statuses=["running"]) == {"running": 1}
+        assert search_count() == 1
+
+        job_db.persist(pd.DataFrame({"item_id": ["item-1", "item-3"], "status": ["running", "not_started"]}))
+        assert job_db.count_by_status() == {"not_started": 1, "running": 2}
+        assert search_count() == 1
+
+    def test_count_by_status_resync(self, requests_mock, time_machine):
+        time_machine.move_to("2025-06-07T12:00:00Z", tick=False)
+        stac_api_url = "http://stacapi.test"
+        dummy_stac_api = DummyStacApi(root_url=stac_api_url, requests_mock=requests_mock)
+        dummy_stac_api.predefine_item(
+            collection_id="collection-123",
+            item=_pystac_item(id="item-1", properties={"status": "not_started"}),
+        )
+        job_db = STACAPIJobDatabase(
+            collection_id="collection-123", stac_root_url=stac_api_url, status_sync_interval=60
+        )
+        assert job_db.count_by_status() == {"not_started": 1}
+
+        # Change by another writer
+        dummy_stac_api.predefine_item(
+            collection_id="collection-123",
+            item=_pystac_item(id="item-1", properties={"status": "finished"}),
+        )
+        time_machine.move_to("2025-06-07T12:00:30Z", tick=False)
+        assert job_db.count_by_status() == {"not_started": 1}
+        time_machine.move_to("2025-06-07T12:01:30Z", tick=False)
+        assert job_db.count_by_status() == {"finished": 1}
+
 
 @pytest.fixture
 def dummy_backend_foo(requests_mock) -> DummyBackend:
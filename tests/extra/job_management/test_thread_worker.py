@@ -6,10 +6,13 @@ from typing import Iterator
 from pathlib import Path
 from requests_mock import Mocker
 
+import dirty_equals
 import pytest
+import urllib3.util
 
 from openeo.extra.job_management._thread_worker import (
     Task,
+    _ConnectionPool,
     _TaskThreadPool,
     _JobManagerWorkerThreadPool,
     _JobStartTask,
@@ -35,6 +38,70 @@ class TestTaskResult:
         assert result.stats_update == {}
 
 
+class TestConnectionPool:
+    def test_reuse(self, dummy_backend):
+        pool = _ConnectionPool()
+        con1 = pool.get_connection("https://foo.test", bearer_token="h4ll0")
+        con2 = pool.get_connection("https://foo.test", bearer_token="h4ll0")
+        assert con1 is con2
+        assert con1.auth.bearer == "h4ll0"
+        assert pool.stats() == dirty_equals.IsPartialDict(
+            {"connection pool create": 1, "connection pool reuse": 1}
+        )
+
+    def test_key(self, dummy_backend):
+        pool = _ConnectionPool()
+        con1 = pool.get_connection("https://foo.test", bearer_token="h4ll0")
+        con2 = pool.get_connection("https://foo.test", bearer_token="s3cr3t")
+        con3 = pool.get_connection("https://foo.test", bearer_token="h4ll0", retry={"total": 1})
+        con4 = pool.get_connection("https://foo.test", bearer_token="h4ll0", retry={"total": 1})
+        assert len({id(con1), id(con2), id(con3)}) == 3
+        assert con4 is con3
+
+    def test_retry_object_key(self, dummy_backend):
+        pool = _ConnectionPool()
+        con1 = pool.get_connection("https://foo.test", retry=urllib3.util.Retry(total=2, allowed_methods=["POST"]))
+        con2 = pool.get_connection("https://foo.test", retry=urllib3.util.Retry(total=2, allowed_methods=["POST"]))
+        con3 = pool.get_connection("https://foo.test", retry=urllib3.util.Retry(total=3, allowed_methods=["POST"]))
+        assert con1 is con2
+        assert con3 is not con1
+
+    def test_evict(self, dummy_backend):
+        pool = _ConnectionPool(max_connections=2)
+        con1 = pool.get_connection("https://foo.test", bearer_token="t1")
+        pool.get_connection("https://foo.test", bearer_token="t2")
+        pool.get_connection("https://foo.test", bearer_token="t3")
+        assert pool.get_connection("https://foo.test", bearer_token="t1") is not con1
+        assert pool.stats() == dirty_equals.IsPartialDict(
+            {"connection pool create": 4, "connection pool evict": 2}
+        )
+
+    def test_pool_size(self, dummy_backend):
+        pool = _ConnectionPool(pool_maxsize=7)
+        con = pool.get_connection("https://foo.test")
+        adapter = con.session.adapters["https://"]
+        assert adapter._pool_maxsize == 7
+
+    def test_tasks_share_connection(self, dummy_backend):
+        pool = _ConnectionPool()
+        job1 = dummy_backend.connection.create_job(process_graph={})
+        job2 = dummy_backend.connection.create_job(process_graph={})
+        for job in [job1, job2]:
+            task = _JobStartTask(
+                job_id=job.job_id,
+                df_idx=0,
+                root_url=dummy_backend.connection.root_url,
+                bearer_token="h4ll0",
+                connection_pool=pool,
+            )
+            assert task.execute().db_update == {"status": "queued"}
+        assert job1.status() == "queued"
+        assert job2.status() == "queued"
+        assert pool.stats() == dirty_equals.IsPartialDict(
+            {"connection pool create": 1, "connection pool reuse": 1, "api requests": 3, "api errors": 0}
+        )
+
+
 class TestJobStartTask:
     def test_start_success(self, dummy_backend, caplog):
         caplog.set_level(logging.WARNING)
@@ -50,6 +117,7 @@ class TestJobStartTask:
             df_idx=0,
             db_update={"status": "queued"},
             stats_update={"job start": 1},
+            metrics={"start seconds": dirty_equals.IsFloat(ge=0)},
         )
         assert job.status() == "queued"
         assert caplog.messages == []
@@ -123,6 +191,11 @@ class TestJobDownloadTask:
         
         # Verify stats update for the MultiBackendJobManager
         assert result.stats_update == {'files downloaded': 1, "job download": 1}
+        assert result.metrics == {
+            "download seconds": dirty_equals.IsFloat(ge=0),
+            # Result asset and results metadata
+            "download bytes": 28 + (download_dir / "job-results.json").stat().st_size,
+        }
         
         # Verify download content (crucial part of the unit test)
         downloaded_file = download_dir / "result.data"
@@ -172,6 +245,7 @@ class TestJobDownloadTask:
         
         # Verify stats update for the MultiBackendJobManager
         assert result.stats_update == {'files downloaded': 0, "job download error": 1}
+        assert result.metrics == {"download errors": 1}
         
         # Verify no file was created (or only empty/failed files)
         assert not any(p.is_file() for p in download_dir.glob("*"))
@@ -411,6 +485,7 @@ class TestTaskThreadPool:
                 df_idx=0,
                 db_update={"status": "queued"},
                 stats_update={"job start": 1},
+                metrics={"start seconds": dirty_equals.IsFloat(ge=0)},
             )
         ]
         assert remaining == 0
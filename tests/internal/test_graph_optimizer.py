@@ -0,0 +1,477 @@
+import pytest
+
+import openeo
+from openeo.api.process import Parameter
+from openeo.internal.graph_building import PGNode, ReduceNode
+from openeo.internal.graph_optimizer import GraphOptimizer, optimize_process_graph
+from openeo.rest.datacube import DataCube
+
+
+def load_collection(**kwargs) -> PGNode:
+    arguments = {"id": "S2", "spatial_extent": None, "temporal_extent": None}
+    arguments.update(kwargs)
+    return PGNode("load_collection", arguments=arguments)
+
+
+def filter_bbox(data, extent) -> PGNode:
+    return PGNode("filter_bbox", data=data, extent=extent)
+
+
+def filter_temporal(data, extent) -> PGNode:
+    return PGNode("filter_temporal", data=data, extent=extent)
+
+
+def filter_bands(data, bands) -> PGNode:
+    return PGNode("filter_bands", data=data, bands=bands)
+
+
+def save_result(data) -> PGNode:
+    return PGNode("save_result", data=data, format="GTiff")
+
+
+BBOX = {"west": 3, "south": 51, "east": 4, "north": 52}
+
+
+# Corpus of (original, expected optimized) graphs.
+CORPUS = {
+    "bbox": (
+        save_result(filter_bbox(load_collection(), BBOX)),
+        save_result(load_collection(spatial_extent=BBOX)),
+    ),
+    "bbox-intersection": (
+        save_result(
+            filter_bbox(
+                load_collection(spatial_extent={**BBOX, "crs": 4326}),
+                {"west": 3.5, "south": 50, "east": 5, "north": 51.5},
+            )
+        ),
+        save_result(load_collection(spatial_extent={"west": 3.5, "south": 51, "east": 4, "north": 51.5, "crs": 4326})),
+    ),
+    "bbox-crs-equivalent": (
+        save_result(filter_bbox(load_collection(spatial_extent=BBOX), {**BBOX, "crs": "EPSG:4326"})),
+        save_result(load_collection(spatial_extent=BBOX)),
+    ),
+    "bbox-other-crs": (
+        save_result(filter_bbox(load_collection(spatial_extent=BBOX), {**BBOX, "crs": 32631})),
+        None,
+    ),
+    "bbox-empty-intersection": (
+        save_result(
+            filter_bbox(load_collection(spatial_extent=BBOX), {"west": 5, "south": 51, "east": 6, "north": 52})
+        ),
+        None,
+    ),
+    "bbox-geojson": (
+        save_result(filter_bbox(load_collection(spatial_extent={"type": "Polygon", "coordinates": []}), BBOX)),
+        None,
+    ),
+    "bbox-parameter": (
+        save_result(filter_bbox(load_collection(), Parameter("bbox", description="bbox"))),
+        None,
+    ),
+    "bbox-base-height": (
+        save_result(filter_bbox(load_collection(), {**BBOX, "base": 0, "height": 10})),
+        None,
+    ),
+    "temporal": (
+        save_result(filter_temporal(load_collection(), ["2021-01-01", "2022-01-01"])),
+        save_result(load_collection(temporal_extent=["2021-01-01", "2022-01-01"])),
+    ),
+    "temporal-intersection": (
+        save_result(
+            filter_temporal(
+                load_collection(temporal_extent=["2021-01-01", None]), ["2020-06-01T12:00:00Z", "2021-03-01T00:00:00Z"]
+            )
+        ),
+        save_result(load_collection(temporal_extent=["2021-01-01", "2021-03-01T00:00:00Z"])),
+    ),
+    "temporal-empty-intersection": (
+        save_result(
+            filter_temporal(load_collection(temporal_extent=["2021-01-01", "2021-02-01"]), ["2021-02-01", "2021-03-01"])
+        ),
+        None,
+    ),
+    "temporal-dimension": (
+        save_result(PGNode("filter_temporal", data=load_collection(), extent=["2021-01-01", None], dimension="t")),
+        None,
+    ),
+    "temporal-parameter": (
+        save_result(filter_temporal(load_collection(), Parameter("dates", description="dates"))),
+        None,
+    ),
+    "bands": (
+        save_result(filter_bands(load_collection(), ["B03", "B02"])),
+        save_result(load_collection(bands=["B03", "B02"])),
+    ),
+    "bands-subset": (
+        save_result(filter_bands(load_collection(bands=["B02", "B03", "B04"]), ["B04", "B02"])),
+        save_result(load_collection(bands=["B04", "B02"])),
+    ),
+    "bands-not-subset": (
+        save_result(filter_bands(load_collection(bands=["B02", "B03"]), ["B04"])),
+        None,
+    ),
+    "bands-wavelengths": (
+        save_result(PGNode("filter_bands", data=load_collection(), wavelengths=[[0.4, 0.5]])),
+        None,
+    ),
+    "chain": (
+        save_result(
+            filter_bands(
+                filter_temporal(filter_bbox(load_collection(), BBOX), ["2021-01-01", "2022-01-01"]),
+                ["B02"],
+            )
+        ),
+        save_result(load_collection(spatial_extent=BBOX, temporal_extent=["2021-01-01", "2022-01-01"], bands=["B02"])),
+    ),
+    "chain-interrupted": (
+        save_result(filter_bands(PGNode("ndvi", data=filter_bbox(load_collection(), BBOX)), ["NDVI"])),
+        save_result(filter_bands(PGNode("ndvi", data=load_collection(spatial_extent=BBOX)), ["NDVI"])),
+    ),
+    "load_stac": (
+        save_result(filter_bbox(PGNode("load_stac", url="https://stac.test"), BBOX)),
+        save_result(PGNode("load_stac", url="https://stac.test", spatial_extent=BBOX)),
+    ),
+    "namespaced-load": (
+        save_result(filter_bbox(PGNode("load_collection", id="S2", namespace="foo"), BBOX)),
+        None,
+    ),
+    "other-process": (
+        save_result(PGNode("filter_spatial", data=load_collection(), geometries={"type": "Polygon"})),
+        None,
+    ),
+}
+
+
+@pytest.mark.parametrize(["original", "expected"], CORPUS.values(), ids=CORPUS.keys())
+def test_filter_pushdown_corpus(original, expected):
+    flat_original = original.flat_graph()
+    optimized = optimize_process_graph(original, passes=["filter_pushdown"])
+    if expected is None:
+        assert optimized is original
+    else:
+        assert optimized.flat_graph() == expected.flat_graph()
+    # Original graph is not modified.
+    assert original.flat_graph() == flat_original
+
+
+def test_filter_pushdown_shared_load_node():
+    """Load node with multiple consumers can not be modified."""
+    load = load_collection()
+    merged = PGNode(
+        "merge_cubes",
+        cube1=filter_bbox(load, BBOX),
+        cube2=filter_temporal(load, ["2021-01-01", "2022-01-01"]),
+    )
+    assert optimize_process_graph(merged) is merged
+
+
+def test_filter_pushdown_shared_filter_node():
+    """Filtered load node is pushed down once and shared by all consumers of the filter node."""
+    filtered = filter_bbox(load_collection(), BBOX)
+    merged = PGNode("merge_cubes", cube1=filtered, cube2=PGNode("ndvi", data=filtered))
+    optimized = optimize_process_graph(merged)
+    expected_load = load_collection(spatial_extent=BBOX)
+    expected = PGNode("merge_cubes", cube1=expected_load, cube2=PGNode("ndvi", data=expected_load))
+    assert optimized.flat_graph() == expected.flat_graph()
+    assert (
+        optimized.arguments["cube1"]["from_node"]
+        is optimized.arguments["cube2"]["from_node"].arguments["data"]["from_node"]
+    )
+
+
+def test_filter_pushdown_load_node_is_also_result():
+    load = load_collection()
+    filtered = filter_bbox(load, BBOX)
+    assert optimize_process_graph([load, filtered]) == [load, filtered]
+
+
+def test_filter_pushdown_multiple_results():
+    results = [save_result(filter_bbox(load_collection(), BBOX)), save_result(load_collection())]
+    optimized = optimize_process_graph(results)
+    assert optimized[0].flat_graph() == save_result(load_collection(spatial_extent=BBOX)).flat_graph()
+    assert optimized[1] is results[1]
+
+
+def test_filter_pushdown_child_process_graph_untouched():
+    callback = {"process_graph": PGNode("absolute", x={"from_parameter": "x"})}
+    original = PGNode("apply", data=filter_bbox(load_collection(), BBOX), process=callback)
+    optimized = optimize_process_graph(original)
+    assert optimized.arguments["process"] is callback
+    assert (
+        optimized.flat_graph()
+        == PGNode("apply", data=load_collection(spatial_extent=BBOX), process=callback).flat_graph()
+    )
+
+
+def test_deep_graph():
+    node = filter_bbox(load_collection(), BBOX)
+    for _ in range(5000):
+        node = PGNode("absolute", x=node)
+    optimized = optimize_process_graph(node)
+    assert optimized is not node
+    assert [n.process_id for n in optimized.walk_nodes()][-1] == "load_collection"
+    assert len(list(optimized.walk_nodes())) == 5001
+
+
+def test_unknown_pass():
+    with pytest.raises(ValueError, match="Unknown optimization passes"):
+        GraphOptimizer(passes=["foobar"])
+
+
+class TestOptimizeFlatGraph:
+    def test_basic(self):
+        flat_graph = save_result(filter_bbox(load_collection(), BBOX)).flat_graph()
+        optimized = GraphOptimizer().optimize_flat_graph(flat_graph)
+        assert optimized == save_result(load_collection(spatial_extent=BBOX)).flat_graph()
+
+    def test_nothing_to_optimize(self):
+        flat_graph = {
+            "lc": {"process_id": "load_collection", "arguments": {"id": "S2"}},
+            "sr": {"process_id": "save_result", "arguments": {"data": {"from_node": "lc"}}, "result": True},
+        }
+        assert GraphOptimizer().optimize_flat_graph(flat_graph) is flat_graph
+
+    def test_multiple_leaves(self):
+        flat_graph = {
+            "lc": {"process_id": "load_collection", "arguments": {"id": "S2"}},
+            "fb": {"process_id": "filter_bands", "arguments": {"data": {"from_node": "lc"}, "bands": ["B02"]}},
+            "sr1": {
+                "process_id": "save_result",
+                "arguments": {"data": {"from_node": "fb"}, "format": "GTiff"},
+                "result": True,
+            },
+            "sr2": {"process_id": "save_result", "arguments": {"data": {"from_node": "fb"}, "format": "netCDF"}},
+        }
+        assert GraphOptimizer().optimize_flat_graph(flat_graph) == {
+            "loadcollection1": {"process_id": "load_collection", "arguments": {"id": "S2", "bands": ["B02"]}},
+            "saveresult1": {
+                "process_id": "save_result",
+                "arguments": {"data": {"from_node": "loadcollection1"}, "format": "netCDF"},
+            },
+            "saveresult2": {
+                "process_id": "save_result",
+                "arguments": {"data": {"from_node": "loadcollection1"}, "format": "GTiff"},
+                "result": True,
+            },
+        }
+
+    def test_parameters_and_child_graphs(self):
+        flat_graph = {
+            "lc": {
+                "process_id": "load_collection",
+                "arguments": {"id": "S2", "spatial_extent": {"from_parameter": "bbox"}},
+            },
+            "ft": {
+                "process_id": "filter_temporal",
+                "arguments": {"data": {"from_node": "lc"}, "extent": ["2021-01-01", None]},
+            },
+            "ap": {
+                "process_id": "apply",
+                "arguments": {
+                    "data": {"from_node": "ft"},
+                    "process": {
+                        "process_graph": {
+                            "abs": {
+                                "process_id": "absolute",
+                                "arguments": {"x": {"from_parameter": "x"}},
+                                "result": True,
+                            }
+                        }
+                    },
+                },
+                "result": True,
+            },
+        }
+        assert GraphOptimizer().optimize_flat_graph(flat_graph) == {
+            "loadcollection1": {
+                "process_id": "load_collection",
+                "arguments": {
+                    "id": "S2",
+                    "spatial_extent": {"from_parameter": "bbox"},
+                    "temporal_extent": ["2021-01-01", None],
+                },
+            },
+            "apply1": {
+                "process_id": "apply",
+                "arguments": {
+                    "data": {"from_node": "loadcollection1"},
+                    "process": {
+                        "process_graph": {
+                            "abs": {
+                                "process_id": "absolute",
+                                "arguments": {"x": {"from_parameter": "x"}},
+                                "result": True,
+                            }
+                        }
+                    },
+                },
+                "result": True,
+            },
+        }
+
+    def test_invalid(self):
+        flat_graph = {"foo1": {"process_id": "foo"}}
+        assert GraphOptimizer().optimize_flat_graph(flat_graph) is flat_graph
+
+
+class TestApplyFusion:
+    @pytest.fixture
+    def cube(self) -> DataCube:
+        return DataCube.load_collection("S2", connection=None, fetch_metadata=False)
+
+    def _optimize(self, cube: DataCube) -> dict:
+        return optimize_process_graph(cube.from_node(), passes=["apply_fusion"]).flat_graph()
+
+    def test_apply_apply(self, cube):
+        cube = (cube * 2).apply(lambda x: x.absolute()).apply("sqrt")
+        assert len([n for n in cube.flat_graph().values() if n["process_id"] == "apply"]) == 3
+        assert self._optimize(cube) == {
+            "loadcollection1": {
+                "process_id": "load_collection",
+                "arguments": {"id": "S2", "spatial_extent": None, "temporal_extent": None},
+            },
+            "apply1": {
+                "process_id": "apply",
+                "arguments": {
+                    "data": {"from_node": "loadcollection1"},
+                    "process": {
+                        "process_graph": {
+                            "multiply1": {
+                                "process_id": "multiply",
+                                "arguments": {"x": {"from_parameter": "x"}, "y": 2},
+                            },
+                            "absolute1": {"process_id": "absolute", "arguments": {"x": {"from_node": "multiply1"}}},
+                            "sqrt1": {
+                                "process_id": "sqrt",
+                                "arguments": {"x": {"from_node": "absolute1"}},
+                                "result": True,
+                            },
+                        }
+                    },
+                },
+                "result": True,
+            },
+        }
+
+    def test_apply_chain_with_parameter(self, cube):
+        factor = Parameter.number("factor", description="factor")
+        cube = cube.apply("absolute").apply(lambda x: x * factor).apply("log10")
+        apply = self._optimize(cube)["apply1"]
+        assert apply["arguments"]["process"]["process_graph"] == {
+            "absolute1": {"process_id": "absolute", "arguments": {"x": {"from_parameter": "x"}}},
+            "multiply1": {
+                "process_id": "multiply",
+                "arguments": {"x": {"from_node": "absolute1"}, "y": {"from_parameter": "factor"}},
+            },
+            "log101": {"process_id": "log10", "arguments": {"x": {"from_node": "multiply1"}}, "result": True},
+        }
+
+    def test_callback_uses_x_twice(self, cube):
+        cube = cube.apply("absolute").apply(lambda x: x * x)
+        apply = self._optimize(cube)["apply1"]
+        assert apply["arguments"]["process"]["process_graph"] == {
+            "absolute1": {"process_id": "absolute", "arguments": {"x": {"from_parameter": "x"}}},
+            "multiply1": {
+                "process_id": "multiply",
+                "arguments": {"x": {"from_node": "absolute1"}, "y": {"from_node": "absolute1"}},
+                "result": True,
+            },
+        }
+
+    def test_reduce_apply(self):
+        reduce = ReduceNode(
+            data=PGNode("load_collection", id="S2"),
+            reducer=PGNode("mean", data={"from_parameter": "data"}),
+            dimension="t",
+        )
+        apply = PGNode("apply", data=reduce, process={"process_graph": PGNode("absolute", x={"from_parameter": "x"})})
+        optimized = optimize_process_graph(apply)
+        assert isinstance(optimized, ReduceNode)
+        assert optimized.flat_graph() == {
+            "loadcollection1": {"process_id": "load_collection", "arguments": {"id": "S2"}},
+            "reducedimension1": {
+                "process_id": "reduce_dimension",
+                "arguments": {
+                    "data": {"from_node": "loadcollection1"},
+                    "dimension": "t",
+                    "reducer": {
+                        "process_graph": {
+                            "mean1": {"process_id": "mean", "arguments": {"data": {"from_parameter": "data"}}},
+                            "absolute1": {
+                                "process_id": "absolute",
+                                "arguments": {"x": {"from_node": "mean1"}},
+                                "result": True,
+                            },
+                        }
+                    },
+                },
+                "result": True,
+            },
+        }
+
+    def test_band_math_apply(self):
+        cube = DataCube.load_collection("S2", connection=None, bands=["B2", "B3"], fetch_metadata=False)
+        b1, b2 = cube.band("B2"), cube.band("B3")
+        cube = ((b1 - b2) / (b1 + b2)).apply("absolute")
+        flat = optimize_process_graph(cube.from_node()).flat_graph()
+        assert [n["process_id"] for n in flat.values()] == ["load_collection", "reduce_dimension"]
+        reducer = flat["reducedimension1"]["arguments"]["reducer"]["process_graph"]
+        assert reducer["absolute1"] == {
+            "process_id": "absolute",
+            "arguments": {"x": {"from_node": "divide1"}},
+            "result": True,
+        }
+
+    def test_different_context(self, cube):
+        cube = cube.apply("absolute", context={"a": 1}).apply("sqrt", context={"a": 2})
+        assert optimize_process_graph(cube.from_node()) is cube.from_node()
+
+    def test_same_context(self, cube):
+        cube = cube.apply("absolute", context={"a": 1}).apply("sqrt", context={"a": 1})
+        flat = self._optimize(cube)
+        assert flat["apply1"]["arguments"]["context"] == {"a": 1}
+        assert list(flat["apply1"]["arguments"]["process"]["process_graph"]) == ["absolute1", "sqrt1"]
+
+    def test_reduce_context_leak(self):
+        reduce = ReduceNode(
+            data=PGNode("load_collection", id="S2"),
+            reducer=PGNode("mean", data={"from_parameter": "data"}),
+            dimension="t",
+            context={"a": 1},
+        )
+        callback = PGNode("add", x={"from_parameter": "x"}, y={"from_parameter": "context"})
+        apply = PGNode("apply", data=reduce, process={"process_graph": callback})
+        assert optimize_process_graph(apply) is apply
+
+    def test_shared_inner_apply(self, cube):
+        inner = cube.apply("absolute")
+        merged = inner.apply("sqrt").merge_cubes(inner)
+        assert optimize_process_graph(merged.from_node()) is merged.from_node()
+
+    def test_udf_not_fused(self, cube):
+        cube = cube.apply("absolute").apply(
+            openeo.UDF("def apply_datacube(cube, context): return cube", runtime="Python")
+        )
+        assert optimize_process_graph(cube.from_node()) is cube.from_node()
+
+    def test_nested_callback_not_fused(self, cube):
+        nested = PGNode(
+            "array_apply",
+            data={"from_parameter": "x"},
+            process={"process_graph": PGNode("absolute", x={"from_parameter": "x"})},
+        )
+        cube = cube.apply("absolute").apply(nested)
+        assert optimize_process_graph(cube.from_node()) is cube.from_node()
+
+    def test_flat_graph(self, cube):
+        cube = cube.apply("absolute").apply("sqrt").apply("log10")
+        optimized = GraphOptimizer(passes=["apply_fusion"]).optimize_flat_graph(cube.flat_graph())
+        assert optimized == self._optimize(cube)
+        assert list(optimized["apply1"]["arguments"]["process"]["process_graph"]) == ["absolute1", "sqrt1", "log101"]
+
+    def test_combined_with_filter_pushdown(self, cube):
+        cube = cube.filter_bands(["B02"]).apply("absolute").apply("sqrt")
+        flat = optimize_process_graph(cube.from_node()).flat_graph()
+        assert [n["process_id"] for n in flat.values()] == ["load_collection", "apply"]
+        assert flat["loadcollection1"]["arguments"]["bands"] == ["B02"]
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.graph_template import JsonTemplate
+from openeo.internal.json_encoding import PreEncodedJson
+
+
+class TestJsonTemplate:
+    def test_basic(self):
+        template = JsonTemplate(lambda slot: {"add": {"x": slot("x"), "y": 3}})
+        assert template.slot_names == ["x"]
+        assert template.render({"x": 5}) == '{"add": {"x": 5, "y": 3}}'
+        assert json.loads(template.render({"x": [1, {"a": None}]})) == {"add": {"x": [1, {"a": None}], "y": 3}}
+
+    def test_multiple_slots(self):
+        template = JsonTemplate(lambda slot: [slot("a"), {"b": slot("b"), "a": slot("a")}, "c"])
+        assert template.slot_names == ["a", "b", "a"]
+        assert json.loads(template.render({"a": "A", "b": 'quote"s'})) == ["A", {"b": 'quote"s', "a": "A"}, "c"]
+
+    def test_no_slots(self):
+        template = JsonTemplate(lambda slot: {"x": 1})
+        assert template.render({}) == '{"x": 1}'
+
+    def test_missing_value(self):
+        template = JsonTemplate(lambda slot: {"x": slot("x")})
+        with pytest.raises(KeyError):
+            template.render({})
+
+    def test_non_json_value(self):
+        template = JsonTemplate(lambda slot: {"x": slot("x")})
+        with pytest.raises(TypeError):
+            template.render({"x": object()})
+        with pytest.raises(ValueError):
+            template.render({"x": float("nan")})
+
+    def test_pre_encoded_json(self):
+        geometry = PreEncodedJson({"type": "Point", "coordinates": [3, 5]})
+        template = JsonTemplate(lambda slot: {"g": geometry, "x": slot("x")})
+        assert template.render({"x": geometry}) == (
+            '{"g": {"coordinates":[3,5],"type":"Point"}, "x": {"coordinates":[3,5],"type":"Point"}}'
+        )
+
+    def test_slot_in_string(self):
+        with pytest.raises(ValueError, match="Slot placeholder not used as complete JSON value"):
+            JsonTemplate(lambda slot: {"x": "prefix" + slot("x")})
+
+    def test_process_graph(self):
+        template = JsonTemplate(
+            lambda slot: PGNode("ndvi", data=PGNode("load_collection", id=slot("id")), nir=slot("nir")).flat_graph()
+        )
+        assert json.loads(template.render({"id": "S2", "nir": "B08"})) == {
+            "loadcollection1": {"process_id": "load_collection", "arguments": {"id": "S2"}},
+            "ndvi1": {
+                "process_id": "ndvi",
+                "arguments": {"data": {"from_node": "loadcollection1"}, "nir": "B08"},
+                "result": True,
+            },
+        }
@@ -504,6 +504,67 @@ def test_walk_nodes_nested():
     assert set(n.process_id for n in walk) == {"load1", "max", "foo", "load2", "add", "five"}
 
 
+def test_walk_nodes_order():
+    five = PGNode("five")
+    node = PGNode("foo", x=PGNode("add", x=five, y=[PGNode("load1"), five]), y=PGNode("max"))
+    assert [n.process_id for n in node.walk_nodes()] == ["foo", "add", "five", "load1", "five", "max"]
+
+
+def test_to_dict_tuple_and_parameter():
+    node = PGNode("foo", x=(1, PGNode("bar", y=Parameter("p")), [2, (3,)]), namespace="ns")
+    assert node.to_dict() == {
+        "process_id": "foo",
+        "arguments": {
+            "x": (1, {"process_id": "bar", "arguments": {"y": {"from_parameter": "p"}}}, [2, (3,)]),
+        },
+        "namespace": "ns",
+    }
+
+
+class TestDeepGraphs:
+    """Traversals should not be limited by the recursion limit."""
+
+    DEPTH = 5000
+
+    @pytest.fixture
+    def deep_node(self) -> PGNode:
+        node = PGNode("load", x=0)
+        for i in range(1, self.DEPTH):
+            node = PGNode("add", x={"from_node": node}, y=[i])
+        return node
+
+    def test_flat_graph(self, deep_node):
+        flat = deep_node.flat_graph()
+        assert len(flat) == self.DEPTH
+        assert flat["load1"] == {"process_id": "load", "arguments": {"x": 0}}
+        assert flat["add1"] == {"process_id": "add", "arguments": {"x": {"from_node": "load1"}, "y": [1]}}
+        assert flat[f"add{self.DEPTH - 1}"] == {
+            "process_id": "add",
+            "arguments": {"x": {"from_node": f"add{self.DEPTH - 2}"}, "y": [self.DEPTH - 1]},
+            "result": True,
+        }
+
+    def test_walk_nodes(self, deep_node):
+        walk = [n.process_id for n in deep_node.walk_nodes()]
+        assert walk == ["add"] * (self.DEPTH - 1) + ["load"]
+
+    def test_to_dict(self, deep_node):
+        d = deep_node.to_dict()
+        depth = 0
+        while d["process_id"] == "add":
+            assert d["arguments"]["y"] == [self.DEPTH - 1 - depth]
+            d = d["arguments"]["x"]["from_node"]
+            depth += 1
+        assert depth == self.DEPTH - 1
+        assert d == {"process_id": "load", "arguments": {"x": 0}}
+
+    def test_unflatten(self, deep_node):
+        flat = deep_node.flat_graph()
+        node = PGNode.from_flat_graph(flat)
+        assert [n.process_id for n in node.walk_nodes()] == ["add"] * (self.DEPTH - 1) + ["load"]
+        assert node.flat_graph() == flat
+
+
 def test_as_flat_graph_dict():
     pg = {"foo1": {"process_id": "foo", "arguments": {"color": "red"}, "result": True}}
     assert as_flat_graph(pg) == {"foo1": {"process_id": "foo", "arguments": {"color": "red"}, "result": True}}
@@ -0,0 +1,170 @@
+import gzip
+import json
+
+import pytest
+
+from openeo.internal import json_encoding
+from openeo.internal.graph_building import PGNode
+from openeo.internal.json_encoding import (
+    PreEncodedJson,
+    dumps,
+    dumps_bytes,
+    encode_request_body,
+    prepare_request_body,
+    resolve_pre_encoded,
+)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run test with orjson (if available) and the standard library fallback."""
+    if request.param == "orjson":
+        if json_encoding.orjson is None:
+            pytest.skip("orjson not available")
+    else:
+        monkeypatch.setattr(json_encoding, "orjson", None)
+        monkeypatch.setattr(json_encoding, "_orjson_fragment", None)
+    return request.param
+
+
+DATA = {"b": [1, 2.5, None, True], "a": {"z": "zz", "y": "ÿ"}, "c": []}
+
+
+class TestDumps:
+    def test_default(self, encoder):
+        assert json.loads(dumps(DATA)) == DATA
+
+    def test_compact(self, encoder):
+        assert dumps({"a": [1, 2], "b": "c"}, separators=(",", ":")) == '{"a":[1,2],"b":"c"}'
+
+    def test_indent(self, encoder):
+        assert dumps({"a": [1, 2], "b": {}}, indent=2) == '{\n  "a": [\n    1,\n    2\n  ],\n  "b": {}\n}'
+
+    def test_other_formatting(self, encoder):
+        assert dumps({"a": [1, 2]}) == '{"a": [1, 2]}'
+        assert dumps({"a": [1, 2]}, indent=4) == json.dumps({"a": [1, 2]}, indent=4)
+
+    def test_canonical(self, encoder):
+        assert dumps(DATA, canonical=True) == '{"a":{"y":"ÿ","z":"zz"},"b":[1,2.5,null,true],"c":[]}'
+
+    def test_canonical_ignores_insertion_order(self, encoder):
+        assert dumps({"x": 1, "y": {"b": 2, "a": 3}}, canonical=True) == dumps(
+            {"y": {"a": 3, "b": 2}, "x": 1}, canonical=True
+        )
+
+    def test_dumps_bytes(self, encoder):
+        assert dumps_bytes({"a": "ÿ"}) == '{"a":"ÿ"}'.encode("utf8")
+
+    def test_non_str_keys(self, encoder):
+        assert json.loads(dumps({1: "a"}, separators=(",", ":"))) == {"1": "a"}
+
+    def test_big_int(self, encoder):
+        assert dumps_bytes([2**70]) == b"[1180591620717411303424]"
+
+    def test_not_serializable(self, encoder):
+        with pytest.raises(TypeError):
+            dumps({"a": object()})
+
+    def test_nan(self, encoder):
+        assert dumps({"a": float("nan"), "b": float("inf")}) == '{"a": NaN, "b": Infinity}'
+
+    def test_same_as_stdlib(self, encoder):
+        data = {"a": [1e-7, 0.1, 2**70], "b": "ÿ"}
+        assert dumps(data) == json.dumps(data)
+        assert dumps(data, indent=2) == json.dumps(data, indent=2)
+        assert dumps(data, separators=(",", ":")) == json.dumps(data, separators=(",", ":"))
+
+    def test_to_json_nan(self, encoder):
+        node = PGNode("add", x=float("nan"), y=1)
+        assert '"arguments": {"x": NaN, "y": 1}' in node.to_json(indent=None)
+        assert '"x": NaN' in node.to_json()
+
+    def test_nan_strict(self, encoder):
+        with pytest.raises(ValueError, match="not JSON compliant"):
+            dumps_bytes({"a": float("nan")}, allow_nan=False)
+
+
+class TestPreEncodedJson:
+    def test_basic(self, encoder):
+        geometry = PreEncodedJson({"type": "Point", "coordinates": [3, 5]})
+        assert geometry.encoded == '{"coordinates":[3,5],"type":"Point"}'
+        assert geometry == {"type": "Point", "coordinates": [3, 5]}
+        assert {"type": "Point", "coordinates": [3, 5]} == geometry
+        assert geometry != {"type": "Point", "coordinates": [3, 6]}
+        assert repr(geometry) == "<PreEncodedJson (36 chars)>"
+
+    @pytest.mark.parametrize(
+        ["kwargs", "expected"],
+        [
+            ({}, '{"geometry": {"coordinates":[3,5],"type":"Point"}, "n": [1]}'),
+            ({"separators": (",", ":")}, '{"geometry":{"coordinates":[3,5],"type":"Point"},"n":[1]}'),
+            ({"canonical": True}, '{"geometry":{"coordinates":[3,5],"type":"Point"},"n":[1]}'),
+            ({"indent": 2}, '{\n  "geometry": {"coordinates":[3,5],"type":"Point"},\n  "n": [\n    1\n  ]\n}'),
+        ],
+    )
+    def test_embedded(self, encoder, kwargs, expected):
+        geometry = PreEncodedJson({"type": "Point", "coordinates": [3, 5]})
+        assert dumps({"geometry": geometry, "n": [1]}, **kwargs) == expected
+
+    def test_embedded_multiple(self, encoder):
+        a = PreEncodedJson({"a": 1})
+        b = PreEncodedJson(["b"])
+        data = {"x": [a, b, a], "y": "ÿ"}
+        assert json.loads(dumps_bytes(data)) == {"x": [{"a": 1}, ["b"], {"a": 1}], "y": "ÿ"}
+        assert json.loads(dumps(data, canonical=True)) == {"x": [{"a": 1}, ["b"], {"a": 1}], "y": "ÿ"}
+
+    def test_encoded_once(self, encoder, monkeypatch):
+        geometry = PreEncodedJson({"type": "Point", "coordinates": [3, 5]})
+        monkeypatch.setattr(geometry, "value", "poisoned")
+        assert json.loads(dumps_bytes({"g": geometry})) == {"g": {"type": "Point", "coordinates": [3, 5]}}
+
+    def test_nan(self):
+        with pytest.raises(ValueError, match="not JSON compliant"):
+            PreEncodedJson([float("nan")])
+
+
+class TestResolvePreEncoded:
+    def test_basic(self):
+        geometry = PreEncodedJson({"type": "Point", "coordinates": [3, 5]})
+        data = {"a": [1, {"g": geometry}], "b": (geometry,), "c": "C"}
+        resolved = resolve_pre_encoded(data)
+        assert resolved == {"a": [1, {"g": geometry.value}], "b": [geometry.value], "c": "C"}
+        assert resolved["a"][1]["g"] is geometry.value
+        assert json.loads(json.dumps(resolved)) == {
+            "a": [1, {"g": {"type": "Point", "coordinates": [3, 5]}}],
+            "b": [{"type": "Point", "coordinates": [3, 5]}],
+            "c": "C",
+        }
+
+    def test_as_is(self):
+        data = {"a": [1, {"b": "B"}], "c": (2, 3)}
+        assert resolve_pre_encoded(data) is data
+
+
+class TestEncodeRequestBody:
+    def test_basic(self, encoder):
+        body, headers = encode_request_body({"process": {"id": "ÿ"}})
+        assert body == '{"process":{"id":"ÿ"}}'.encode("utf8")
+        assert headers == {"Content-Type": "application/json"}
+
+    def test_nan(self, encoder):
+        with pytest.raises(ValueError, match="not JSON compliant"):
+            encode_request_body({"x": float("nan")})
+
+    def test_compress(self, encoder):
+        data = {"coordinates": [[i, i + 1] for i in range(1000)]}
+        body, headers = encode_request_body(data, compress_threshold=1000)
+        assert headers == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(body)) == data
+        assert len(body) < len(dumps_bytes(data))
+
+    def test_compress_below_threshold(self, encoder):
+        body, headers = encode_request_body({"x": 1}, compress_threshold=1000)
+        assert body == b'{"x":1}'
+        assert headers == {"Content-Type": "application/json"}
+
+    def test_prepare_pre_encoded(self):
+        assert prepare_request_body(b'{"x":1}') == (b'{"x":1}', {"Content-Type": "application/json"})
+        body, headers = prepare_request_body(b'{"x":"' + b"x" * 2000 + b'"}', compress_threshold=1000)
+        assert headers == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(body)) == {"x": "x" * 2000}
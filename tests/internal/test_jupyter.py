@@ -1,3 +1,4 @@
+from openeo.internal.json_encoding import PreEncodedJson
 from openeo.internal.jupyter import render_component
 from openeo.rest.models.logs import LogEntry
 
@@ -9,3 +10,9 @@ def test_render_component_logs():
     assert '"id": "log-01"' in html
     assert '"level": "info"' in html
     assert '"message": "hello"' in html
+
+
+def test_render_component_pre_encoded_json():
+    geometry = PreEncodedJson({"type": "Point", "coordinates": [3, 5]})
+    html = render_component("model-builder", data={"process_graph": {"g": geometry}})
+    assert '{"value": {"process_graph": {"g": {"coordinates":[3,5],"type":"Point"}}}}' in html
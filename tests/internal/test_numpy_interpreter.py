@@ -0,0 +1,245 @@
+import math
+
+import numpy as np
+import pytest
+import xarray
+
+from openeo.internal.graph_building import PGNode
+from openeo.internal.numpy_interpreter import (
+    PROCESSES,
+    ArrayElementNotAvailable,
+    compile_process_graph,
+)
+from openeo.internal.process_graph_visitor import ProcessGraphVisitException
+from openeo.processes import (
+    and_,
+    array_apply,
+    array_element,
+    count,
+    first,
+    if_,
+    is_nodata,
+    last,
+    mean,
+    not_,
+    or_,
+    quantiles,
+    sd,
+)
+from openeo.rest.datacube import DataCube
+
+NAN = np.nan
+
+
+def assert_equal(actual, expected):
+    np.testing.assert_array_equal(np.asarray(actual), np.asarray(expected))
+
+
+class TestMath:
+    @pytest.mark.parametrize(
+        ["callback", "x", "expected"],
+        [
+            (lambda x: x + 1, [1, 2], [2, 3]),
+            (lambda x: 2 * x - 1, [1, 2], [1, 3]),
+            (lambda x: x / 2, [1, 2], [0.5, 1]),
+            (lambda x: x**2, [2, 3], [4, 9]),
+            (lambda x: x.absolute(), [-1, 2], [1, 2]),
+            (lambda x: x.sqrt(), [4, 9], [2, 3]),
+            (lambda x: x.log(base=10), [10, 100], [1, 2]),
+            (lambda x: x.ln(), [1, math.e], [0, 1]),
+            (lambda x: x.mod(3), [5, -5], [2, 1]),
+            (lambda x: x.clip(0, 10), [-5, 15], [0, 10]),
+            (lambda x: x.linear_scale_range(0, 10, 0, 100), [5, 20], [50, 100]),
+            (lambda x: x.round(), [0.5, 1.5, 2.4], [0, 2, 2]),
+            (lambda x: x.int(), [-1.5, 1.5], [-1, 1]),
+            (lambda x: x + 1, [1, NAN], [2, NAN]),
+        ],
+    )
+    def test_unary_callbacks(self, callback, x, expected):
+        compiled = compile_process_graph(callback)
+        assert_equal(compiled(x=np.array(x, dtype=float)), expected)
+
+    def test_scalar(self):
+        compiled = compile_process_graph(lambda x: (x * 0.0001 + 1).log(base=10))
+        assert compiled(x=9990000) == pytest.approx(3)
+
+    def test_null_scalar(self):
+        compiled = compile_process_graph(lambda x: x + 1)
+        assert np.isnan(compiled(x=None))
+
+
+class TestComparisonAndLogic:
+    def test_comparison_with_nulls(self):
+        compiled = compile_process_graph(lambda x: x > 2)
+        assert_equal(compiled(x=np.array([1, 3, NAN])), [0, 1, NAN])
+        assert_equal(compiled(x=np.array([1, 3])), [False, True])
+        assert compiled(x=np.array([1, 3])).dtype == bool
+
+    def test_eq_delta_and_strings(self):
+        assert_equal(compile_process_graph(lambda x: x.eq(1, delta=0.1))(x=np.array([1.05, 1.2])), [True, False])
+        assert compile_process_graph(lambda x: x.eq("ABC", case_sensitive=False))(x="abc") is True
+        assert_equal(compile_process_graph(lambda x: x.neq(1))(x=np.array([1, 2, NAN])), [0, 1, NAN])
+
+    def test_and_or_truth_tables(self):
+        x = np.array([1, 1, 1, 0, 0, 0, NAN, NAN, NAN])
+        y = np.array([1, 0, NAN, 1, 0, NAN, 1, 0, NAN])
+        assert_equal(compile_process_graph(lambda x, y: and_(x, y))(x=x, y=y), [1, 0, NAN, 0, 0, 0, NAN, 0, NAN])
+        assert_equal(compile_process_graph(lambda x, y: or_(x, y))(x=x, y=y), [1, 1, 1, 1, 0, NAN, 1, NAN, NAN])
+        assert_equal(compile_process_graph(lambda x: not_(x))(x=np.array([1, 0, NAN])), [0, 1, NAN])
+
+    def test_if(self):
+        compiled = compile_process_graph(lambda x: if_(x > 2, x, 0))
+        assert_equal(compiled(x=np.array([1, 3, NAN])), [0, 3, 0])
+
+    def test_is_nodata(self):
+        assert_equal(compile_process_graph(lambda x: is_nodata(x))(x=np.array([1, NAN])), [False, True])
+
+
+class TestArrays:
+    DATA = np.array([[1, 2, NAN], [3, NAN, NAN], [5, 6, NAN]])
+
+    def test_band_math(self):
+        compiled = compile_process_graph(
+            lambda data: (array_element(data, 0) - array_element(data, 1))
+            / (array_element(data, 0) + array_element(data, 1))
+        )
+        assert_equal(compiled(data=self.DATA), [-0.5, NAN, NAN])
+
+    @pytest.mark.parametrize(
+        ["callback", "expected"],
+        [
+            (lambda data: mean(data), [3, 4, NAN]),
+            (lambda data: mean(data, ignore_nodata=False), [3, NAN, NAN]),
+            (lambda data: data.sum(), [9, 8, NAN]),
+            (lambda data: data.max(), [5, 6, NAN]),
+            (lambda data: data.median(), [3, 4, NAN]),
+            (lambda data: sd(data), [2, math.sqrt(8), NAN]),
+            (lambda data: first(data), [1, 2, NAN]),
+            (lambda data: last(data), [5, 6, NAN]),
+            (lambda data: count(data), [3, 2, 0]),
+            (lambda data: count(data, condition=True), [3, 3, 3]),
+            (lambda data: count(data, condition=lambda x: x > 2), [2, 1, 0]),
+            (lambda data: data.cumsum(), [[1, 2, NAN], [4, NAN, NAN], [9, 8, NAN]]),
+            (lambda data: data.array_contains(3), [True, False, False]),
+            (lambda data: data.array_find(6), [NAN, 2, NAN]),
+            (lambda data: array_apply(data, process=lambda x: x * 2), DATA * 2),
+        ],
+    )
+    def test_reducers(self, callback, expected):
+        assert_equal(compile_process_graph(callback)(data=self.DATA), expected)
+
+    @pytest.mark.parametrize(
+        ["process_id", "data", "ignore_nodata", "expected"],
+        [
+            # Examples from the openEO process specifications
+            ("all", [0, NAN], True, False),
+            ("all", [1, NAN], True, True),
+            ("all", [0, NAN], False, False),
+            ("all", [1, NAN], False, NAN),
+            ("all", [], True, NAN),
+            ("any", [0, NAN], True, False),
+            ("any", [1, NAN], True, True),
+            ("any", [0, NAN], False, NAN),
+            ("any", [1, NAN], False, True),
+            ("any", [], True, NAN),
+        ],
+    )
+    def test_all_any(self, process_id, data, ignore_nodata, expected):
+        compiled = compile_process_graph(
+            PGNode(process_id, data={"from_parameter": "data"}, ignore_nodata=ignore_nodata)
+        )
+        assert_equal(compiled(data=np.array(data, dtype=float)), expected)
+
+    @pytest.mark.parametrize("process_id", ["all", "any"])
+    def test_all_any_empty(self, process_id):
+        compiled = compile_process_graph(PGNode(process_id, data={"from_parameter": "data"}))
+        assert_equal(compiled(data=np.empty((0, 3))), [NAN, NAN, NAN])
+        result = compiled(data=xarray.DataArray(np.empty((0, 2)), dims=["bands", "x"], coords={"x": [10, 20]}))
+        assert isinstance(result, xarray.DataArray)
+        assert result.dims == ("x",)
+        assert_equal(result, [NAN, NAN])
+
+    def test_quantiles(self):
+        compiled = compile_process_graph(lambda data: quantiles(data, probabilities=[0.5, 1]))
+        assert_equal(compiled(data=np.array([1, 2, 3, NAN])), [2, 3])
+
+    def test_list_of_arrays(self):
+        compiled = compile_process_graph(lambda data: mean(data))
+        assert_equal(compiled(data=[np.array([1, 2]), np.array([3, NAN]), 5]), [3, 3.5])
+
+    def test_array_element_out_of_bounds(self):
+        with pytest.raises(ArrayElementNotAvailable):
+            compile_process_graph(lambda data: array_element(data, 5))(data=self.DATA)
+        result = compile_process_graph(lambda data: array_element(data, 5, return_nodata=True))(data=self.DATA)
+        assert_equal(result, [NAN, NAN, NAN])
+
+    def test_xarray_labels(self):
+        data = xarray.DataArray(
+            np.array([[1.0, 2.0], [3.0, 4.0]]), dims=["bands", "x"], coords={"bands": ["B02", "B03"]}
+        )
+        compiled = compile_process_graph(lambda data: array_element(data, label="B03") * 2 + mean(data))
+        result = compiled(data=data)
+        assert isinstance(result, xarray.DataArray)
+        assert_equal(result, [8, 11])
+
+
+class TestCompilation:
+    def test_flat_graph(self):
+        flat_graph = {
+            "add": {"process_id": "add", "arguments": {"x": {"from_parameter": "x"}, "y": 1}},
+            "mul": {
+                "process_id": "multiply",
+                "arguments": {"x": {"from_node": "add"}, "y": {"from_node": "add"}},
+                "result": True,
+            },
+        }
+        compiled = compile_process_graph(flat_graph)
+        assert_equal(compiled(x=np.array([1, 2])), [4, 9])
+        assert_equal(compiled(x=np.array([3])), [16])
+        assert_equal(compile_process_graph({"process_graph": flat_graph})(x=2), 9)
+
+    def test_shared_node_evaluated_once(self):
+        calls = []
+
+        def add(x, y):
+            calls.append((x, y))
+            return x + y
+
+        shared = PGNode("add", x={"from_parameter": "x"}, y=1)
+        compiled = compile_process_graph(PGNode("multiply", x=shared, y=shared), processes={**PROCESSES, "add": add})
+        assert compiled(x=2) == 9
+        assert calls == [(2, 1)]
+
+    def test_parent_parameter_in_callback(self):
+        compiled = compile_process_graph(
+            PGNode(
+                "array_apply",
+                data={"from_parameter": "data"},
+                process={
+                    "process_graph": PGNode("multiply", x={"from_parameter": "x"}, y={"from_parameter": "factor"})
+                },
+            )
+        )
+        assert_equal(compiled(data=np.array([1, 2]), factor=3), [3, 6])
+
+    def test_missing_parameter(self):
+        with pytest.raises(ProcessGraphVisitException, match="No value for parameter 'x'"):
+            compile_process_graph(lambda x: x + 1)()
+
+    def test_unsupported_process(self):
+        with pytest.raises(ProcessGraphVisitException, match="Unsupported process 'load_collection'"):
+            compile_process_graph(PGNode("load_collection", id="S2"))
+
+    def test_datacube_band_math_reducer(self):
+        cube = DataCube.load_collection("S2", connection=None, bands=["B02", "B03"], fetch_metadata=False)
+        b2, b3 = cube.band("B02"), cube.band("B03")
+        reducer = ((b3 - b2) / (b3 + b2)).result_node().arguments["reducer"]
+        compiled = compile_process_graph(reducer)
+        data = xarray.DataArray(np.array([[1, 1], [3, 1]]), dims=["bands", "x"], coords={"bands": ["B02", "B03"]})
+        assert_equal(compiled(data=data), [0.5, 0])
+
+    def test_deep_graph(self):
+        node = PGNode("add", x={"from_parameter": "x"}, y=1)
+        for _ in range(5000):
+            node = PGNode("add", x=node, y=1)
+        assert compile_process_graph(node)(x=0) == 5001
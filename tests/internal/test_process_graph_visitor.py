@@ -467,6 +467,47 @@ def test_dereference_add_node_id(add_node_id, expected):
 
 
 
+def _deep_flat_graph(depth: int) -> dict:
+    graph = {"node0": {"process_id": "load", "arguments": {"x": 0}}}
+    for i in range(1, depth):
+        graph[f"node{i}"] = {"process_id": "add", "arguments": {"x": {"from_node": f"node{i - 1}"}, "y": [i]}}
+    graph[f"node{depth - 1}"]["result"] = True
+    return graph
+
+
+def test_visit_deep_graph():
+    depth = 5000
+    visitor = ProcessGraphVisitor()
+    visitor.leaveProcess = MagicMock()
+    visitor.constantArrayElement = MagicMock()
+    visitor.accept_process_graph(_deep_flat_graph(depth))
+
+    assert [c.kwargs["process_id"] for c in visitor.leaveProcess.call_args_list] == ["load"] + ["add"] * (depth - 1)
+    assert visitor.constantArrayElement.call_args_list == [call(i) for i in range(1, depth)]
+    assert visitor.process_stack == []
+
+
+def test_visit_legacy_accept_node_override():
+    """Subclasses that only override `accept_node` (and call super) should still work."""
+
+    class Visitor(ProcessGraphVisitor):
+        def __init__(self):
+            super().__init__()
+            self.visited = []
+
+        def accept_node(self, node: dict):
+            self.visited.append(node["process_id"])
+            super().accept_node(node)
+
+    graph = {
+        "abs": {"process_id": "abs", "arguments": {"data": {"from_parameter": "data"}}},
+        "cos": {"process_id": "cos", "arguments": {"data": [{"from_node": "abs"}]}, "result": True},
+    }
+    visitor = Visitor()
+    visitor.accept_process_graph(graph)
+    assert visitor.visited == ["cos", "abs"]
+
+
 class TestProcessGraphUnflattener:
     def test_minimal(self):
         graph = {
@@ -607,3 +648,13 @@ class TestProcessGraphUnflattener:
         }
         with pytest.raises(ProcessGraphVisitException, match="Cycle in process graph"):
             _ = ProcessGraphUnflattener.unflatten(graph)
+
+    def test_deep_graph(self):
+        depth = 5000
+        result = ProcessGraphUnflattener.unflatten(_deep_flat_graph(depth))
+        for i in reversed(range(1, depth)):
+            assert result["process_id"] == "add"
+            assert result["arguments"]["y"] == [i]
+            assert result["arguments"]["x"]["from_node"] == f"node{i - 1}"
+            result = result["arguments"]["x"]["node"]
+        assert result == {"process_id": "load", "arguments": {"x": 0}}
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from openeo.local.execution import (
+    ChunkingPolicy,
+    ExecutionOptions,
+    guess_format,
+    profiled,
+    profiling,
+)
+from tests.local.test_local_collection import create_local_data
+
+try:
+    from openeo.local import LocalConnection
+except ImportError:
+    LocalConnection = None
+
+
+class TestChunkingPolicy:
+    def test_default(self):
+        policy = ChunkingPolicy(target_chunk_bytes=128 * 1024 * 1024)
+        assert policy.chunks({"bands": 4, "t": 10, "y": 10000, "x": 10000}) == {
+            "bands": 4,
+            "t": 10,
+            "y": 647,
+            "x": 647,
+        }
+
+    def test_split_time(self):
+        policy = ChunkingPolicy(target_chunk_bytes=128 * 1024 * 1024)
+        assert policy.chunks({"bands": 4, "t": 1000, "y": 10000, "x": 10000}) == {
+            "bands": 4,
+            "t": 64,
+            "y": 256,
+            "x": 256,
+        }
+
+    def test_fixed_tiles(self):
+        sizes = {"bands": 4, "t": 1000, "y": 10000, "x": 10000}
+        assert ChunkingPolicy(spatial_tile=512).chunks(sizes) == {"bands": 4, "t": 16, "y": 512, "x": 512}
+        assert ChunkingPolicy(temporal_tile=1).chunks(sizes) == {"bands": 4, "t": 1, "y": 2048, "x": 2048}
+        assert ChunkingPolicy(spatial_tile=100, temporal_tile=5).chunks(sizes) == {
+            "bands": 4,
+            "t": 5,
+            "y": 100,
+            "x": 100,
+        }
+
+    def test_small(self):
+        assert ChunkingPolicy().chunks({"bands": 2, "time": 2, "y": 2, "x": 2}) == {
+            "bands": 2,
+            "time": 2,
+            "y": 2,
+            "x": 2,
+        }
+
+    @pytest.mark.parametrize(
+        "sizes",
+        [
+            {"bands": 4, "t": 0, "y": 100, "x": 100},
+            {"bands": 0, "t": 10, "y": 100, "x": 100},
+            {"bands": 4, "t": 10, "y": 0, "x": 100},
+            {"t": 0},
+            {"y": 0, "x": 0},
+        ],
+    )
+    @pytest.mark.parametrize(
+        "policy",
+        [ChunkingPolicy(), ChunkingPolicy(spatial_tile=16), ChunkingPolicy(temporal_tile=2)],
+    )
+    def test_zero_size(self, policy, sizes):
+        assert policy.chunks(sizes) == sizes
+
+    def test_memory_limit(self):
+        options = ExecutionOptions(num_workers=8, memory_limit=1024 * 1024 * 1024, chunking=ChunkingPolicy())
+        assert options.effective_chunking().target_chunk_bytes == 32 * 1024 * 1024
+
+
+def test_execution_options_invalid_scheduler():
+    with pytest.raises(ValueError, match="Invalid scheduler 'foo'"):
+        ExecutionOptions(scheduler="foo")
+
+
+@pytest.mark.parametrize(
+    ["path", "expected"],
+    [("out.nc", "netcdf"), ("data/out.zarr", "zarr"), ("out.tar.zarr", "zarr")],
+)
+def test_guess_format(path, expected):
+    assert guess_format(path) == expected
+
+
+def test_profiled():
+    def load_local_collection(x):
+        return x
+
+    f = profiled(load_local_collection)
+    assert f(1) == 1
+    with profiling() as profile:
+        f(2)
+        f(3)
+    assert profile.to_dict() == {
+        "processes": {"load_collection": {"count": 2, "seconds": pytest.approx(0, abs=1)}},
+        "tasks": {},
+    }
+
+
+@pytest.mark.skipif(not LocalConnection, reason="environment does not support localprocessing")
+@pytest.mark.parametrize("scheduler", [None, "threads", "synchronous"])
+def test_execute_compute_save(tmp_path_factory, tmp_path, scheduler):
+    sample_netcdf = create_local_data(tmp_path_factory, 8, 8, 4, "netcdf")
+    connection = LocalConnection(
+        sample_netcdf.as_posix(),
+        scheduler=scheduler,
+        num_workers=2,
+        chunking=ChunkingPolicy(spatial_tile=4, temporal_tile=2),
+    )
+    cube = connection.load_collection((sample_netcdf / "sample_data.nc").as_posix()).apply(lambda x: x + 1)
+
+    with connection.profile() as profile:
+        result = cube.execute()
+        assert result.chunks is not None
+        assert max(max(c) for c in result.chunks) <= 4
+        computed = connection.compute(result)
+        path = connection.save_result(result, tmp_path / "result.nc")
+
+    assert isinstance(computed.data, np.ndarray)
+    saved = xr.open_dataset(path)
+    assert set(saved.data_vars) == {"temperature", "precipitation"}
+    assert "load_collection" in profile.processes
+    assert "apply" in profile.processes
+    assert profile.tasks
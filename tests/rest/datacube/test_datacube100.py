@@ -4073,6 +4073,20 @@ def test_download_auto_add_save_result(s2cube, dummy_backend, tmp_path, auto_add
     assert set(n["process_id"] for n in dummy_backend.get_pg().values()) == process_ids
 
 
+@pytest.mark.parametrize(
+    ["format", "expected_format"],
+    [
+        (None, "GTiff"),
+        ("netCDF", "netCDF"),
+    ],
+)
+def test_execute_stream(s2cube, dummy_backend, format, expected_format):
+    dummy_backend.next_result = b"Result data"
+    with s2cube.execute_stream(format=format) as stream:
+        assert b"".join(stream.iter_bytes()) == b"Result data"
+    assert dummy_backend.get_pg("save_result")["arguments"]["format"] == expected_format
+
+
 class TestBatchJob:
     _EXPECTED_SIMPLE_S2_PG = {
         "loadcollection1": {
@@ -185,6 +185,16 @@ def test_download_auto_add_save_result(vector_cube, dummy_backend, auto_add_save
     assert set(n["process_id"] for n in dummy_backend.get_pg().values()) == process_ids
 
 
+def test_execute_stream(vector_cube, dummy_backend):
+    dummy_backend.next_result = {"type": "FeatureCollection", "features": [{"id": "f1"}, {"id": "f2"}]}
+    with vector_cube.execute_stream(format="JSON") as stream:
+        assert list(stream.iter_json()) == [
+            ("type", "FeatureCollection"),
+            ("features", [{"id": "f1"}, {"id": "f2"}]),
+        ]
+    assert dummy_backend.get_pg("save_result")["arguments"]["format"] == "JSON"
+
+
 @pytest.mark.parametrize(
     ["output_file", "save_result_format", "expected_format"],
     [
@@ -1,10 +1,14 @@
+import concurrent.futures
 import contextlib
+import gzip
 import json
 import logging
 import os
 import random
 import re
 import textwrap
+import threading
+import time
 import typing
 import unittest.mock as mock
 import zlib
@@ -50,9 +54,11 @@ from openeo.rest.connection import (
     paginate,
 )
 from openeo.rest.models.general import Link, ValidationResponse
+from openeo.rest.udp import build_process_dict
+from openeo.rest.userfile import UserFile
 from openeo.rest.vectorcube import VectorCube
 from openeo.testing.stac import StacDummyBuilder
-from openeo.util import ContextTimer, deep_get, dict_no_none
+from openeo.util import ContextTimer, PreEncodedJson, deep_get, dict_no_none
 from openeo.utils.events import EVENTS
 from openeo.utils.version import ApiVersionException
 
@@ -339,6 +345,86 @@ def test_slow_response_threshold_truncate_url(requests_mock, caplog):
     assert expected in caplog.text
 
 
+def test_request_stats(requests_mock):
+    requests_mock.get("https://oeo.test/jobs/j-123", status_code=200, text="hello world")
+    requests_mock.get("https://oeo.test/jobs/j-456", status_code=404, json={"code": "JobNotFound", "message": "nope"})
+    requests_mock.post("https://oeo.test/jobs", status_code=201)
+    con = RestApiConnection("https://oeo.test")
+
+    with mock.patch.object(ContextTimer, "_clock", new=iter([10, 11]).__next__):
+        con.get("/jobs/j-123")
+    with mock.patch.object(ContextTimer, "_clock", new=iter([10, 13]).__next__):
+        with pytest.raises(OpenEoApiError):
+            con.get("/jobs/j-456")
+    con.post("/jobs", json={"foo": "bar"})
+
+    stats = con.stats()
+    assert stats == dirty_equals.IsPartialDict(
+        {"requests": 3, "errors": 1, "request bytes": 13, "response bytes": 11 + 42, "retries": 0}
+    )
+    assert stats["endpoints"]["GET /jobs/{job_id}"] == dirty_equals.IsPartialDict(
+        {
+            "requests": 2,
+            "errors": 1,
+            "status": {200: 1, 404: 1},
+            "latency": dirty_equals.IsPartialDict({"total": 4, "min": 1, "max": 3, "mean": 2}),
+        }
+    )
+    assert stats["endpoints"]["POST /jobs"] == dirty_equals.IsPartialDict({"requests": 1, "status": {201: 1}})
+
+
+def test_request_stats_connection_error(requests_mock):
+    requests_mock.get("https://oeo.test/foo", exc=requests.exceptions.ConnectionError)
+    con = RestApiConnection("https://oeo.test")
+    with pytest.raises(requests.exceptions.ConnectionError):
+        con.get("/foo")
+    stats = con.stats()
+    assert stats == dirty_equals.IsPartialDict({"requests": 1, "errors": 1})
+    assert stats["endpoints"]["GET /foo"]["status"] == {"exception": 1}
+
+
+def test_request_event(requests_mock):
+    requests_mock.get("https://oeo.test/jobs/j-123", status_code=200, text="hello world")
+    con = RestApiConnection("https://oeo.test")
+    history = []
+    con.events.on(EVENTS.HTTP_REQUEST, lambda **kwargs: history.append(kwargs))
+    with mock.patch.object(ContextTimer, "_clock", new=iter([10, 12]).__next__):
+        con.get("/jobs/j-123")
+    assert history == [
+        {
+            "event": "http.request",
+            "method": "GET",
+            "url": "https://oeo.test/jobs/j-123",
+            "endpoint": "/jobs/{job_id}",
+            "status_code": 200,
+            "elapsed": 2,
+            "request_bytes": 0,
+            "response_bytes": 11,
+            "retries": 0,
+        }
+    ]
+
+
+def test_request_tracer(requests_mock):
+    requests_mock.get("https://oeo.test/jobs/j-123", status_code=200, text="hello world")
+    tracer = mock.MagicMock()
+    con = RestApiConnection("https://oeo.test", tracer=tracer)
+    con.get("/jobs/j-123")
+    tracer.start_as_current_span.assert_called_once_with(
+        "GET /jobs/{job_id}",
+        attributes={"http.request.method": "GET", "url.full": "https://oeo.test/jobs/j-123", "http.route": "/jobs/{job_id}"},
+    )
+    span = tracer.start_as_current_span.return_value.__enter__.return_value
+    span.set_attribute.assert_called_once_with("http.response.status_code", 200)
+
+
+def test_connect_tracer(requests_mock):
+    requests_mock.get("https://oeo.test/", json={"api_version": "1.0.0"})
+    tracer = mock.MagicMock()
+    con = connect("https://oeo.test", tracer=tracer)
+    assert con.tracer is tracer
+
+
 def test_connection_other_domain_auth_headers(requests_mock, api_version):
     """https://github.com/Open-EO/openeo-python-client/issues/201"""
     secret = "!secret token!"
@@ -4474,6 +4560,297 @@ def test_execute_100(requests_mock, pg):
     ]
 
 
+def test_execute_stream(dummy_backend):
+    dummy_backend.next_result = {"2020-01-01": [[1, 2]], "2020-01-02": [[3, 4]]}
+    history = []
+    dummy_backend.connection.events.on(EVENTS.SYNC_RESULT, lambda **kwargs: history.append(kwargs))
+    with dummy_backend.connection.execute_stream({"foo1": {"process_id": "foo", "result": True}}) as stream:
+        assert list(stream.iter_json()) == [("2020-01-01", [[1, 2]]), ("2020-01-02", [[3, 4]])]
+    assert dummy_backend.get_sync_pg() == {"foo1": {"process_id": "foo", "result": True}}
+    assert history == [{"event": "sync.result", "sync_id": dirty_equals.IsStr()}]
+
+
+def test_execute_stream_bytes(dummy_backend, tmp_path):
+    dummy_backend.next_result = b"Hello world"
+    stream = dummy_backend.connection.execute_stream({"foo1": {"process_id": "foo", "result": True}}, chunk_size=5)
+    assert list(stream.iter_bytes()) == [b"Hello", b" worl", b"d"]
+
+
+class TestOptimizeProcessGraphs:
+    @pytest.fixture
+    def connection(self, requests_mock, dummy_backend) -> Connection:
+        connection = Connection(API_URL, optimize_process_graphs=True)
+        dummy_backend.connection = connection
+        return connection
+
+    EXPECTED = {
+        "loadcollection1": {
+            "process_id": "load_collection",
+            "arguments": {
+                "id": "S2",
+                "spatial_extent": {"west": 3, "south": 51, "east": 4, "north": 52},
+                "temporal_extent": ["2021-01-01", "2021-02-01"],
+                "bands": ["B2"],
+            },
+        },
+        "saveresult1": {
+            "process_id": "save_result",
+            "arguments": {"data": {"from_node": "loadcollection1"}, "format": "GTiff", "options": {}},
+            "result": True,
+        },
+    }
+
+    def _build_cube(self, connection):
+        cube = connection.load_collection("S2", temporal_extent=["2021-01-01", "2021-06-01"])
+        return cube.filter_bbox(west=3, south=51, east=4, north=52).filter_temporal("2020-01-01", "2021-02-01").filter_bands(["B2"])
+
+    def test_download(self, connection, dummy_backend):
+        self._build_cube(connection).download(format="GTiff")
+        assert dummy_backend.get_sync_pg() == self.EXPECTED
+
+    def test_execute(self, connection, dummy_backend):
+        connection.execute(self._build_cube(connection).save_result(format="GTiff"))
+        assert dummy_backend.get_sync_pg() == self.EXPECTED
+
+    def test_create_job(self, connection, dummy_backend):
+        self._build_cube(connection).create_job(out_format="GTiff")
+        assert dummy_backend.get_batch_pg() == self.EXPECTED
+
+    def test_multiple_results(self, connection, dummy_backend):
+        cube = self._build_cube(connection)
+        connection.create_job([cube.save_result(format="GTiff"), cube.save_result(format="netCDF")])
+        assert dummy_backend.get_batch_pg() == {
+            "loadcollection1": self.EXPECTED["loadcollection1"],
+            "saveresult1": {
+                "process_id": "save_result",
+                "arguments": {"data": {"from_node": "loadcollection1"}, "format": "GTiff", "options": {}},
+            },
+            "saveresult2": {
+                "process_id": "save_result",
+                "arguments": {"data": {"from_node": "loadcollection1"}, "format": "netCDF", "options": {}},
+                "result": True,
+            },
+        }
+
+    def test_original_cube_untouched(self, connection):
+        cube = self._build_cube(connection)
+        cube.download(format="GTiff")
+        assert sorted(cube.flat_graph().keys()) == [
+            "filterbands1",
+            "filterbbox1",
+            "filtertemporal1",
+            "loadcollection1",
+        ]
+
+    def test_disabled_by_default(self, dummy_backend):
+        self._build_cube(dummy_backend.connection).download(format="GTiff")
+        assert set(dummy_backend.get_sync_pg().keys()) == {
+            "loadcollection1",
+            "filterbbox1",
+            "filtertemporal1",
+            "filterbands1",
+            "saveresult1",
+        }
+
+    def test_flat_graph_dict_untouched(self, connection, dummy_backend):
+        pg = {"lc": {"process_id": "load_collection", "arguments": {"id": "S2"}, "result": True}}
+        connection.execute(pg)
+        assert dummy_backend.get_sync_pg() == pg
+
+    def test_unknown_pass(self, requests_mock, dummy_backend):
+        with pytest.raises(ValueError, match="Unknown optimization passes"):
+            Connection(API_URL, optimize_process_graphs=["foobar"])
+
+
+class TestJsonRequestBodies:
+    GEOMETRY = {"type": "Polygon", "coordinates": [[[3, 51], [4, 51], [4, 52], [3, 51]]]}
+
+    def test_pre_encoded_geometry(self, dummy_backend):
+        connection = dummy_backend.connection
+        geometry = PreEncodedJson(self.GEOMETRY)
+        cube = connection.load_collection("S2").aggregate_spatial(geometries=geometry, reducer="mean")
+        cube.create_job()
+        cube.execute()
+        assert dummy_backend.get_batch_pg()["aggregatespatial1"]["arguments"]["geometries"] == self.GEOMETRY
+        assert dummy_backend.get_sync_pg()["aggregatespatial1"]["arguments"]["geometries"] == self.GEOMETRY
+        pg = json.loads(cube.to_json())["process_graph"]
+        assert pg["aggregatespatial1"]["arguments"]["geometries"] == self.GEOMETRY
+
+    def test_pre_encoded_geometry_repr_html(self, dummy_backend):
+        geometry = PreEncodedJson(self.GEOMETRY)
+        cube = dummy_backend.connection.load_collection("S2").aggregate_spatial(geometries=geometry, reducer="mean")
+        assert '"geometries": {"coordinates":[[[3,51],[4,51],[4,52],[3,51]]],"type":"Polygon"}' in cube._repr_html_()
+
+    def test_pre_encoded_geometry_build_process_dict(self, dummy_backend):
+        geometry = PreEncodedJson(self.GEOMETRY)
+        cube = dummy_backend.connection.load_collection("S2").aggregate_spatial(geometries=geometry, reducer="mean")
+        process = json.loads(json.dumps(build_process_dict(cube, process_id="agg")))
+        assert process["process_graph"]["aggregatespatial1"]["arguments"]["geometries"] == self.GEOMETRY
+
+    def test_compact_body(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        post = requests_mock.post(API_URL + "foo", status_code=200)
+        Connection(API_URL).post("/foo", json={"a": [1, "ÿ"]})
+        assert post.last_request.body == '{"a":[1,"ÿ"]}'.encode("utf8")
+        assert post.last_request.headers["Content-Type"] == "application/json"
+        assert "Content-Encoding" not in post.last_request.headers
+
+    @pytest.mark.parametrize(
+        ["compress_requests", "size", "expected"],
+        [
+            (False, 100_000, False),
+            (True, 100, False),
+            (True, 100_000, True),
+            (1000, 100, False),
+            (1000, 2000, True),
+        ],
+    )
+    def test_compress_requests(self, requests_mock, compress_requests, size, expected):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        post = requests_mock.post(API_URL + "foo", status_code=200)
+        data = {"data": "x" * size}
+        Connection(API_URL, compress_requests=compress_requests).post("/foo", json=data)
+        body = post.last_request.body
+        if expected:
+            assert post.last_request.headers["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(body)) == data
+        else:
+            assert "Content-Encoding" not in post.last_request.headers
+            assert json.loads(body) == data
+
+    def test_custom_headers(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        post = requests_mock.post(API_URL + "foo", status_code=200)
+        Connection(API_URL).post("/foo", json={"a": 1}, headers={"Content-Type": "application/x+json"})
+        assert post.last_request.headers["Content-Type"] == "application/x+json"
+
+
+class TestCoalesceRequests:
+    def test_disabled_by_default(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        job = requests_mock.get(API_URL + "jobs/j-1", json={"id": "j-1"})
+        con = Connection(API_URL)
+        con.get("/jobs/j-1")
+        con.get("/jobs/j-1")
+        assert job.call_count == 2
+
+    @pytest.mark.parametrize("coalesce_requests", [False, None, 0])
+    def test_disabled_falsy(self, requests_mock, coalesce_requests):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        job = requests_mock.get(API_URL + "jobs/j-1", json={"id": "j-1"})
+        con = Connection(API_URL, coalesce_requests=coalesce_requests)
+        assert con._single_flight is None
+        con.job("j-1").describe()
+        con.job("j-1").describe()
+        assert job.call_count == 2
+
+    def test_concurrent(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        started = threading.Event()
+        release = threading.Event()
+
+        def get_job(request, context):
+            started.set()
+            release.wait(timeout=5)
+            return {"id": "j-1", "status": "running"}
+
+        job = requests_mock.get(API_URL + "jobs/j-1", json=get_job)
+        con = Connection(API_URL, coalesce_requests=True)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(con.job("j-1").describe)]
+            assert started.wait(timeout=5)
+            futures += [executor.submit(con.job("j-1").describe) for _ in range(3)]
+            # Wait until the other requests are waiting on the first one in flight
+            (call,) = con._single_flight._in_flight.values()
+            while len(call.done._cond._waiters) < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert results == [{"id": "j-1", "status": "running"}] * 4
+        assert job.call_count == 1
+        assert con.stats()["coalesced"] == 3
+        assert con.stats()["memo hits"] == 0
+        # No memoization by default
+        con.job("j-1").describe()
+        assert job.call_count == 2
+
+    def test_different_requests(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        jobs = requests_mock.get(re.compile(API_URL + "jobs.*"), json={"jobs": [], "links": []})
+        con = Connection(API_URL, coalesce_requests=60)
+        con.get("/jobs/j-1")
+        con.get("/jobs/j-2")
+        con.get("/jobs", params={"limit": 10})
+        con.get("/jobs", params={"limit": 20})
+        con.get("/jobs", headers={"X-Foo": "bar"})
+        assert jobs.call_count == 5
+        con.get("/jobs", params={"limit": 10})
+        assert jobs.call_count == 5
+
+    def test_memo(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        job = requests_mock.get(API_URL + "jobs/j-1", json={"id": "j-1"})
+        con = Connection(API_URL, coalesce_requests=10)
+        assert con.job("j-1").describe() == {"id": "j-1"}
+        assert con.job("j-1").describe() == {"id": "j-1"}
+        assert job.call_count == 1
+        assert con.stats()["memo hits"] == 1
+
+    def test_memo_expiry(self, requests_mock, monkeypatch):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        job = requests_mock.get(API_URL + "jobs/j-1", json={"id": "j-1"})
+        con = Connection(API_URL, coalesce_requests=10)
+        now = [1000]
+        monkeypatch.setattr(con._single_flight, "_clock", lambda: now[0])
+        con.job("j-1").describe()
+        now[0] += 5
+        con.job("j-1").describe()
+        assert job.call_count == 1
+        now[0] += 6
+        con.job("j-1").describe()
+        assert job.call_count == 2
+
+    def test_memo_cleared_by_post(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        job = requests_mock.get(API_URL + "jobs/j-1", json={"id": "j-1"})
+        requests_mock.post(API_URL + "jobs/j-1/results", status_code=202)
+        con = Connection(API_URL, coalesce_requests=10)
+        con.job("j-1").describe()
+        con.job("j-1").start()
+        con.job("j-1").describe()
+        assert job.call_count == 2
+
+    def test_memo_cleared_by_auth_update(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        job = requests_mock.get(API_URL + "jobs/j-1", json={"id": "j-1"})
+        con = Connection(API_URL, coalesce_requests=10)
+        con.job("j-1").describe()
+        con.auth = BearerAuth("basic//t0k3n")
+        con.job("j-1").describe()
+        assert job.call_count == 2
+        assert job.last_request.headers["Authorization"] == "Bearer basic//t0k3n"
+
+    def test_no_memo_of_errors(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        job = requests_mock.get(
+            API_URL + "jobs/j-1", status_code=404, json={"code": "JobNotFound", "message": "No job j-1"}
+        )
+        con = Connection(API_URL, coalesce_requests=10)
+        for _ in range(2):
+            with pytest.raises(OpenEoApiError, match="No job j-1"):
+                con.job("j-1").describe()
+        assert job.call_count == 2
+
+    def test_no_coalescing_of_streaming(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        asset = requests_mock.get(API_URL + "jobs/j-1/results/out.tif", content=b"data")
+        con = Connection(API_URL, coalesce_requests=10)
+        con.get("/jobs/j-1/results/out.tif", stream=True)
+        con.get("/jobs/j-1/results/out.tif", stream=True)
+        assert asset.call_count == 2
+
+
 class TestUserDefinedProcesses:
     """Test for UDP features"""
 
@@ -4697,6 +5074,116 @@ def test_paginate_callback(requests_mock):
     assert list(res) == [(1, "first"), (2, "second"), (3, "third")]
 
 
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginate_prefetch(requests_mock, prefetch):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    for i in range(1, 5):
+        links = [{"rel": "next", "href": API_URL + f"result/{i + 1}"}] if i < 4 else []
+        requests_mock.get(API_URL + f"result/{i}", json={"data": i, "links": links})
+    con = Connection(API_URL)
+    res = paginate(con, API_URL + "result/1", callback=lambda resp, page: (page, resp["data"]), prefetch=prefetch)
+    assert list(res) == [(1, 1), (2, 2), (3, 3), (4, 4)]
+
+
+def test_paginate_stop_early(requests_mock):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    mocks = {}
+    for i in range(1, 5):
+        links = [{"rel": "next", "href": API_URL + f"result/{i + 1}"}]
+        mocks[i] = requests_mock.get(API_URL + f"result/{i}", json={"data": i, "links": links})
+    con = Connection(API_URL)
+    res = paginate(con, API_URL + "result/1", callback=lambda resp, page: resp["data"])
+    assert next(res) == 1
+    assert next(res) == 2
+    res.close()
+    assert [mocks[i].call_count for i in range(1, 5)] == [1, 1, 0, 0]
+
+
+def test_paginate_loop(requests_mock):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    requests_mock.get(
+        API_URL + "results", json={"data": "d6t6", "links": [{"rel": "next", "href": API_URL + "results"}]}
+    )
+    con = Connection(API_URL)
+    assert [r["data"] for r in paginate(con, API_URL + "results")] == ["d6t6"]
+
+
+class TestIterListings:
+    @pytest.fixture
+    def paginated(self, requests_mock):
+        """Set up a paginated listing endpoint with given items (under given key) and page size."""
+
+        def setup(path: str, key: str, items: list, page_size: int = 2):
+            def get(request, context):
+                offset = int(request.qs.get("offset", ["0"])[0])
+                limit = int(request.qs.get("limit", [page_size])[0])
+                data = {key: items[offset : offset + limit], "links": []}
+                if offset + limit < len(items):
+                    next_url = f"{API_URL}{path[1:]}?offset={offset + limit}&limit={limit}"
+                    data["links"].append({"rel": "next", "href": next_url})
+                return data
+
+            return requests_mock.get(API_URL + path[1:], json=get)
+
+        return setup
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_jobs(self, requests_mock, paginated, prefetch):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        jobs = [{"id": f"job-{i}", "status": "finished"} for i in range(7)]
+        mock = paginated("/jobs", "jobs", jobs)
+        con = Connection(API_URL)
+        res = con.iter_jobs(page_size=3, prefetch=prefetch)
+        assert isinstance(res, typing.Iterator)
+        assert list(res) == jobs
+        assert mock.call_count == 3
+        assert mock.request_history[0].qs == {"limit": ["3"]}
+
+    def test_iter_jobs_stop_early(self, requests_mock, paginated):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        mock = paginated("/jobs", "jobs", [{"id": f"job-{i}"} for i in range(100)])
+        con = Connection(API_URL)
+        for job in con.iter_jobs(page_size=10):
+            if job["id"] == "job-15":
+                break
+        assert mock.call_count == 2
+
+    def test_iter_jobs_no_pagination(self, requests_mock):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        requests_mock.get(API_URL + "jobs", json={"jobs": [{"id": "j1"}, {"id": "j2"}], "links": []})
+        con = Connection(API_URL)
+        assert [j["id"] for j in con.iter_jobs()] == ["j1", "j2"]
+
+    def test_iter_collections(self, requests_mock, paginated):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        mock = paginated("/collections", "collections", [{"id": f"C{i}"} for i in range(5)])
+        con = Connection(API_URL)
+        assert [c["id"] for c in con.iter_collections()] == ["C0", "C1", "C2", "C3", "C4"]
+        assert mock.call_count == 3
+        assert mock.request_history[0].qs == {}
+
+    @pytest.mark.parametrize(
+        ["namespace", "path"],
+        [
+            (None, "/processes"),
+            ("user", "/processes/user"),
+        ],
+    )
+    def test_iter_processes(self, requests_mock, paginated, namespace, path):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        paginated(path, "processes", [{"id": f"p{i}"} for i in range(3)])
+        con = Connection(API_URL)
+        assert [p["id"] for p in con.iter_processes(namespace=namespace, page_size=2)] == ["p0", "p1", "p2"]
+
+    def test_iter_files(self, requests_mock, paginated):
+        requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+        paginated("/files", "files", [{"path": f"data/f{i}.txt", "size": i} for i in range(3)])
+        con = Connection(API_URL)
+        files = list(con.iter_files(prefetch=True))
+        assert all(isinstance(f, UserFile) for f in files)
+        assert [f.path.as_posix() for f in files] == ["data/f0.txt", "data/f1.txt", "data/f2.txt"]
+
+
 @pytest.mark.parametrize("data_factory", [
     lambda con: {"add1": {"process_id": "add", "arguments": {"x": 3, "y": 5}, "result": True}},
     lambda con: con.datacube_from_process("add", x=3, y=5),
@@ -5244,6 +5731,65 @@ class TestExecuteWithValidation:
             assert caplog.messages == []
             assert dummy_backend.validation_requests == []
 
+    @pytest.mark.parametrize(["api_capabilities", "auto_validate"], [({"validation": True}, True)])
+    def test_validation_cache(self, dummy_backend, connection, caplog, api_capabilities):
+        caplog.set_level(logging.WARNING)
+        dummy_backend.next_validation_errors = [{"code": "OddSupport", "message": "Odd values are not supported."}]
+        pg_dict_2 = {"add": {"process_id": "add", "arguments": {"x": 3, "y": 6}, "result": True}}
+
+        connection.create_job(self.PG_DICT_1)
+        connection.create_job(self.PG_DICT_1)
+        connection.execute(self.PG_DICT_1)
+        connection.create_job(pg_dict_2)
+
+        # Only one validation request per distinct process graph, but every submission reports the warnings
+        assert dummy_backend.validation_requests == [self.PG_DICT_1, pg_dict_2]
+        assert caplog.messages == ["Preflight process graph validation raised: [OddSupport] Odd values are not supported."] * 4
+
+    @pytest.mark.parametrize(["api_capabilities"], [({"validation": True},)])
+    def test_validation_cache_disabled(self, dummy_backend, requests_mock, api_capabilities):
+        connection = Connection(API_URL, validation_cache_size=0)
+        connection.create_job(self.PG_DICT_1)
+        connection.create_job(self.PG_DICT_1)
+        assert dummy_backend.validation_requests == [self.PG_DICT_1, self.PG_DICT_1]
+
+    @pytest.mark.parametrize(["api_capabilities"], [({"validation": True},)])
+    def test_validation_cache_broken_not_cached(self, dummy_backend, requests_mock, caplog, api_capabilities):
+        connection = Connection(API_URL)
+        m = requests_mock.post(API_URL + "validation", json={"code": "Internal", "message": "Nope!"}, status_code=500)
+        connection.create_job(self.PG_DICT_1)
+        connection.create_job(self.PG_DICT_1)
+        assert m.call_count == 2
+        assert caplog.messages == ["Preflight process graph validation failed: [500] Internal: Nope!"] * 2
+
+    @pytest.mark.parametrize(["api_capabilities", "auto_validate"], [({"validation": True}, "async")])
+    def test_validation_async(self, dummy_backend, connection, caplog, api_capabilities):
+        caplog.set_level(logging.WARNING)
+        dummy_backend.next_validation_errors = [{"code": "OddSupport", "message": "Odd values are not supported."}]
+
+        job = connection.create_job(self.PG_DICT_1)
+        assert job.job_id == "job-000"
+        assert connection.wait_for_validation(timeout=5)
+        assert dummy_backend.validation_requests == [self.PG_DICT_1]
+        assert caplog.messages == ["Preflight process graph validation raised: [OddSupport] Odd values are not supported."]
+
+        # Cached result is reported directly
+        connection.create_job(self.PG_DICT_1)
+        assert dummy_backend.validation_requests == [self.PG_DICT_1]
+        assert len(caplog.messages) == 2
+
+    @pytest.mark.parametrize(["api_capabilities"], [({"validation": True},)])
+    @pytest.mark.parametrize("auto_validate", [None, 0, ""])
+    def test_auto_validate_falsy(self, dummy_backend, requests_mock, api_capabilities, auto_validate):
+        connection = Connection(API_URL, auto_validate=auto_validate)
+        connection.create_job(self.PG_DICT_1)
+        assert dummy_backend.validation_requests == []
+
+    @pytest.mark.parametrize(["api_capabilities"], [({},)])
+    def test_auto_validate_invalid(self, requests_mock, api_capabilities):
+        with pytest.raises(ValueError, match="Invalid auto_validate value: 'sometimes'"):
+            Connection(API_URL, auto_validate="sometimes")
+
 
 def test_extract_connections_elementary():
     assert extract_connections(123) == set()
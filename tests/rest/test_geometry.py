@@ -0,0 +1,233 @@
+import json
+import re
+
+import dirty_equals
+import pytest
+import shapely.geometry
+
+from openeo.internal.json_encoding import PreEncodedJson
+from openeo.rest.geometry import GeometryPayloadReport, GeometryPipeline
+from openeo.rest.udp import build_process_dict
+from openeo.rest.vectorcube import VectorCube
+
+API_URL = "https://oeo.test"
+
+
+def _circle(x: float, y: float, radius: float = 0.1) -> dict:
+    return shapely.geometry.mapping(shapely.geometry.Point(x, y).buffer(radius))
+
+
+def _feature_collection(n: int = 9, distinct: int = 3) -> dict:
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "properties": {"id": i % distinct}, "geometry": _circle(5 + i % distinct, 51)}
+            for i in range(n)
+        ],
+    }
+
+
+class TestGeometryPipeline:
+    def test_process_noop(self):
+        geometry = {"type": "Polygon", "coordinates": [[[1, 2], [3, 4], [5, 2], [1, 2]]]}
+        result, report = GeometryPipeline().process(geometry)
+        assert result is geometry
+        assert report == GeometryPayloadReport(
+            geometries_in=1, geometries_out=1, coordinates_in=4, coordinates_out=4, bytes_in=60, bytes_out=60
+        )
+        assert report.savings == 0
+
+    def test_process_simplify(self):
+        geometry = _circle(5, 51)
+        result, report = GeometryPipeline(simplify_tolerance=0.01).process(geometry)
+        assert result["type"] == "Polygon"
+        assert report.coordinates_in == 65
+        assert 4 < report.coordinates_out < 20
+        assert report.bytes_out < report.bytes_in
+        assert shapely.geometry.shape(result).area == pytest.approx(shapely.geometry.shape(geometry).area, rel=0.2)
+
+    def test_process_precision(self):
+        geometry = {"type": "Polygon", "coordinates": [[[1.123456, 2.1], [3.987654, 4], [5, 2], [1.123456, 2.1]]]}
+        result, report = GeometryPipeline(precision=2).process(geometry)
+        assert json.loads(json.dumps(result)) == {
+            "type": "Polygon",
+            "coordinates": [[[1.12, 2.1], [3.99, 4.0], [5.0, 2.0], [1.12, 2.1]]],
+        }
+
+    def test_process_deduplicate(self):
+        geometry = _feature_collection(n=9, distinct=3)
+        result, report = GeometryPipeline(deduplicate=True).process(geometry)
+        assert [f["properties"]["id"] for f in result["features"]] == [0, 1, 2]
+        assert (report.geometries_in, report.geometries_out) == (9, 3)
+        assert (report.coordinates_in, report.coordinates_out) == (9 * 65, 3 * 65)
+
+    def test_process_deduplicate_different_properties(self):
+        geometry = {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "properties": {"id": i}, "geometry": _circle(5, 51)} for i in range(3)],
+        }
+        result, report = GeometryPipeline(deduplicate=True).process(geometry)
+        assert [f["properties"]["id"] for f in result["features"]] == [0, 1, 2]
+
+    def test_process_feature(self):
+        geometry = {"type": "Feature", "properties": {"a": 1}, "geometry": _circle(5, 51)}
+        result, report = GeometryPipeline(simplify_tolerance=0.01, precision=3).process(geometry)
+        assert result == {"type": "Feature", "properties": {"a": 1}, "geometry": dirty_equals.IsPartialDict()}
+        assert report.coordinates_out < report.coordinates_in
+
+    def test_process_geometry_collection(self):
+        geometry = {"type": "GeometryCollection", "geometries": [_circle(5, 51), _circle(5, 51), _circle(6, 51)]}
+        result, report = GeometryPipeline(deduplicate=True).process(geometry)
+        assert len(result["geometries"]) == 2
+
+    def test_process_keeps_crs(self):
+        geometry = {**_circle(5, 51), "crs": {"type": "name", "properties": {"name": "EPSG:32631"}}}
+        result, report = GeometryPipeline(precision=1).process(geometry)
+        assert result["crs"] == {"type": "name", "properties": {"name": "EPSG:32631"}}
+
+    def test_report_str(self):
+        report = GeometryPayloadReport(
+            geometries_in=10, geometries_out=5, coordinates_in=100, coordinates_out=50, bytes_in=2000, bytes_out=500
+        )
+        assert report.savings == 0.75
+        assert (
+            str(report)
+            == "10 -> 5 geometries, 100 -> 50 coordinates, 2000 -> 500 bytes (inline, 75% payload reduction)"
+        )
+        report = report._replace(reference="openeo-geometries/abc.geojson")
+        assert report.savings == 1
+        assert str(report) == (
+            "10 -> 5 geometries, 100 -> 50 coordinates, 2000 -> 500 bytes"
+            " (uploaded to 'openeo-geometries/abc.geojson', 100% payload reduction)"
+        )
+
+
+class TestGeometryPipelineConnection:
+    @pytest.fixture
+    def upload_mock(self, requests_mock):
+        def put_file(request, context):
+            return {"path": request.path.split("/files/", 1)[1]}
+
+        return requests_mock.put(re.compile(r".*/files/.*"), json=put_file)
+
+    def test_disabled_by_default(self, dummy_backend):
+        geometry = _circle(5, 51)
+        cube = dummy_backend.connection.load_collection("S2").aggregate_spatial(geometries=geometry, reducer="mean")
+        geometries = cube.flat_graph()["aggregatespatial1"]["arguments"]["geometries"]
+        assert not isinstance(geometries, PreEncodedJson)
+        assert geometries == geometry
+
+    def test_inline(self, dummy_backend, caplog):
+        caplog.set_level("INFO")
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline(precision=3)
+        geometry = _feature_collection()
+        cube = connection.load_collection("S2").aggregate_spatial(geometries=geometry, reducer="mean")
+        geometries = cube.flat_graph()["aggregatespatial1"]["arguments"]["geometries"]
+        assert isinstance(geometries, PreEncodedJson)
+        assert geometries.value["type"] == "FeatureCollection"
+
+        cube.execute()
+        sent = dummy_backend.get_sync_pg()["aggregatespatial1"]["arguments"]["geometries"]
+        assert sent["features"][0]["geometry"]["coordinates"][0][0] == [5.1, 51.0]
+
+        report = connection.geometry_pipeline.last_report
+        assert report.reference is None
+        assert report.bytes_out < report.bytes_in
+        assert "Geometry payload: 9 -> 9 geometries" in caplog.text
+
+    @pytest.mark.parametrize(
+        ["build", "node", "argument"],
+        [
+            (
+                lambda c, g: c.load_collection("S2").aggregate_spatial(geometries=g, reducer="mean"),
+                "aggregatespatial1",
+                "geometries",
+            ),
+            (lambda c, g: c.load_geojson(g), "loadgeojson1", "data"),
+        ],
+    )
+    def test_inline_render(self, dummy_backend, build, node, argument):
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline()
+        geometry = _circle(5, 51)
+        expected = json.loads(json.dumps(geometry))
+        cube = build(connection, geometry)
+        assert isinstance(cube.flat_graph()[node]["arguments"][argument], PreEncodedJson)
+        assert '"type":"Polygon"' in cube._repr_html_()
+        assert json.loads(cube.to_json())["process_graph"][node]["arguments"][argument] == expected
+        process = json.loads(json.dumps(build_process_dict(cube, process_id="p")))
+        assert process["process_graph"][node]["arguments"][argument] == expected
+
+    def test_upload_user_file(self, dummy_backend, upload_mock):
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline(upload_threshold=1000)
+        cube = connection.load_collection("S2")
+        cube.aggregate_spatial(geometries=_feature_collection(), reducer="mean").execute()
+        assert upload_mock.call_count == 1
+        path = upload_mock.last_request.path.split("/files/", 1)[1]
+        assert path == dirty_equals.IsStr(regex=r"openeo-geometries/[0-9a-f]{32}\.geojson")
+        pg = dummy_backend.get_sync_pg()
+        assert pg["loaduploadedfiles1"] == {
+            "process_id": "load_uploaded_files",
+            "arguments": {"paths": [path], "format": "GeoJSON", "options": {}},
+        }
+        assert pg["aggregatespatial1"]["arguments"]["geometries"] == {"from_node": "loaduploadedfiles1"}
+
+        # Same geometry is only uploaded once
+        pg = cube.mask_polygon(mask=_feature_collection()).flat_graph()
+        assert upload_mock.call_count == 1
+        assert pg["loaduploadedfiles1"]["arguments"]["paths"] == [path]
+        assert pg["maskpolygon1"]["arguments"]["mask"] == {"from_node": "loaduploadedfiles1"}
+        assert connection.geometry_pipeline.last_report.reference == path
+        assert connection.geometry_pipeline.last_report.savings == 1
+
+    def test_upload_below_threshold(self, dummy_backend, upload_mock):
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline(upload_threshold=100_000)
+        connection.load_collection("S2").filter_spatial(_feature_collection()).execute()
+        assert upload_mock.call_count == 0
+        pg = dummy_backend.get_sync_pg()
+        assert pg["filterspatial1"]["arguments"]["geometries"]["type"] == "FeatureCollection"
+
+    def test_custom_uploader(self, dummy_backend, requests_mock):
+        requests_mock.get(API_URL + "/file_formats", json={"input": {"GeoJSON": {"gis_data_types": ["vector"]}}})
+        uploads = []
+
+        def uploader(data: bytes, name: str) -> str:
+            uploads.append((json.loads(data), name))
+            return f"https://storage.test/{name}"
+
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline(upload_threshold=1000, uploader=uploader)
+        geometry = _feature_collection()
+        connection.load_collection("S2").aggregate_spatial(geometries=geometry, reducer="mean").execute()
+        assert uploads == [(json.loads(json.dumps(geometry)), dirty_equals.IsStr(regex=r"[0-9a-f]{32}\.geojson"))]
+        pg = dummy_backend.get_sync_pg()
+        assert pg["loadurl1"] == {
+            "process_id": "load_url",
+            "arguments": {"url": f"https://storage.test/{uploads[0][1]}", "format": "GeoJSON"},
+        }
+
+    def test_load_collection_spatial_extent_not_uploaded(self, dummy_backend, upload_mock):
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline(upload_threshold=100)
+        connection.load_collection("S2", spatial_extent=_circle(5, 51)).execute()
+        assert upload_mock.call_count == 0
+        pg = dummy_backend.get_sync_pg()
+        assert pg["loadcollection1"]["arguments"]["spatial_extent"]["type"] == "Polygon"
+
+    def test_load_geojson(self, dummy_backend, upload_mock):
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline(upload_threshold=1000)
+        cube = connection.load_geojson(_feature_collection())
+        assert isinstance(cube, VectorCube)
+        assert upload_mock.call_count == 1
+        assert cube.flat_graph()["loaduploadedfiles1"]["process_id"] == "load_uploaded_files"
+
+    def test_load_geojson_with_properties(self, dummy_backend, upload_mock):
+        connection = dummy_backend.connection
+        connection.geometry_pipeline = GeometryPipeline(upload_threshold=1000)
+        cube = connection.load_geojson(_feature_collection(), properties=["id"])
+        assert upload_mock.call_count == 0
+        assert cube.flat_graph()["loadgeojson1"]["arguments"]["properties"] == ["id"]
@@ -653,6 +653,131 @@ def test_get_job_logs_level_handling_custom_with_backend_level(
     assert con100.job("f00ba5").logs(level="warning") == expected
 
 
+class TestIterLogs:
+    @pytest.fixture
+    def logs_backend(self, requests_mock):
+        """Fake paginated logs endpoint (paging based on `offset` and `limit` query parameters)."""
+
+        class LogsBackend:
+            def __init__(self):
+                self.entries = []
+                self.backend_level = None
+
+            def handle(self, request, context):
+                offset = request.qs.get("offset", [None])[0]
+                limit = int(request.qs.get("limit", [3])[0])
+                ids = [e["id"] for e in self.entries]
+                start = ids.index(offset) + 1 if offset else 0
+                page = self.entries[start : start + limit]
+                links = []
+                if start + limit < len(self.entries):
+                    links.append(
+                        {"rel": "next", "href": f"{API_URL}/jobs/f00ba5/logs?offset={page[-1]['id']}&limit={limit}"}
+                    )
+                return dict_no_none(logs=page, links=links, level=self.backend_level)
+
+        backend = LogsBackend()
+        backend.mock = requests_mock.get(API_URL + "/jobs/f00ba5/logs", json=backend.handle)
+        return backend
+
+    def test_pagination(self, con100, logs_backend, log_generator):
+        logs_backend.entries = [log_generator.info() for _ in range(8)]
+        logs = con100.job("f00ba5").iter_logs()
+        assert next(logs) == LogEntry(id="abc000", level="info", message="Hello abc000")
+        # Lazy: only first page is requested
+        assert logs_backend.mock.call_count == 1
+        assert [e.id for e in logs] == [f"abc{i:03d}" for i in range(1, 8)]
+        assert logs_backend.mock.call_count == 3
+        assert [r.qs for r in logs_backend.mock.request_history] == [
+            {},
+            {"offset": ["abc002"], "limit": ["3"]},
+            {"offset": ["abc005"], "limit": ["3"]},
+        ]
+
+    def test_offset_and_limit(self, con100, logs_backend, log_generator):
+        logs_backend.entries = [log_generator.info() for _ in range(8)]
+        logs = list(con100.job("f00ba5").iter_logs(offset="abc004", limit=2))
+        assert [e.id for e in logs] == ["abc005", "abc006", "abc007"]
+        assert logs_backend.mock.request_history[0].qs == {"offset": ["abc004"], "limit": ["2"]}
+
+    @pytest.mark.parametrize(
+        ["backend_level", "expected"],
+        [
+            (None, ["abc001", "abc003"]),
+            ("warning", ["abc000", "abc001", "abc002", "abc003"]),
+        ],
+    )
+    def test_level(self, con100, logs_backend, log_generator, backend_level, expected):
+        logs_backend.entries = [
+            log_generator.info(),
+            log_generator.error(),
+            log_generator.debug(),
+            log_generator.warning(),
+        ]
+        logs_backend.backend_level = backend_level
+        logs = list(con100.job("f00ba5").iter_logs(level="warning"))
+        assert [e.id for e in logs] == expected
+        assert logs_backend.mock.request_history[0].qs == {"level": ["warning"]}
+
+    def test_empty(self, con100, logs_backend):
+        assert list(con100.job("f00ba5").iter_logs()) == []
+
+    def test_follow(self, con100, requests_mock, logs_backend, log_generator):
+        statuses = iter(["queued", "running", "running", "finished"])
+
+        def get_status(request, context):
+            status = next(statuses)
+            if status != "queued":
+                logs_backend.entries.append(log_generator.info(message=f"Still {status}"))
+            return {"id": "f00ba5", "status": status}
+
+        requests_mock.get(API_URL + "/jobs/f00ba5", json=get_status)
+        logs_backend.entries.append(log_generator.info(message="Start"))
+        with mock.patch("time.sleep") as sleep:
+            logs = list(con100.job("f00ba5").iter_logs(follow=True, poll_interval=3))
+        assert [e.message for e in logs] == ["Start", "Still running", "Still running", "Still finished"]
+        assert sleep.call_args_list == [mock.call(3)] * 3
+
+    def test_start_and_wait_follow_logs(self, con100, requests_mock, logs_backend, log_generator):
+        requests_mock.post(API_URL + "/jobs/f00ba5/results", status_code=202)
+        statuses = iter(["queued", "running", "running", "finished"])
+
+        def get_status(request, context):
+            status = next(statuses)
+            logs_backend.entries.append(log_generator.debug(message=f"Debug {status}"))
+            logs_backend.entries.append(log_generator.warning(message=f"Warning {status}"))
+            return {"id": "f00ba5", "status": status}
+
+        requests_mock.get(API_URL + "/jobs/f00ba5", json=get_status)
+        stdout = []
+        with fake_time(times=itertools.count()):
+            con100.job("f00ba5").start_and_wait(print=stdout.append, max_poll_interval=0.1, follow_logs="warning")
+        assert stdout == [
+            "0:00:01 Job 'f00ba5': send 'start'",
+            "0:00:02 Job 'f00ba5': queued (progress N/A)",
+            "0:00:03 Job 'f00ba5': [warning] Warning queued",
+            "0:00:04 Job 'f00ba5': running (progress N/A)",
+            "0:00:05 Job 'f00ba5': [warning] Warning running",
+            "0:00:06 Job 'f00ba5': running (progress N/A)",
+            "0:00:07 Job 'f00ba5': [warning] Warning running",
+            "0:00:08 Job 'f00ba5': finished (progress N/A)",
+            "0:00:09 Job 'f00ba5': [warning] Warning finished",
+        ]
+
+    def test_start_and_wait_follow_logs_failure(self, con100, requests_mock):
+        requests_mock.post(API_URL + "/jobs/f00ba5/results", status_code=202)
+        requests_mock.get(API_URL + "/jobs/f00ba5", json={"id": "f00ba5", "status": "finished"})
+        requests_mock.get(API_URL + "/jobs/f00ba5/logs", status_code=500, text="nope")
+        stdout = []
+        with fake_time(times=itertools.count()):
+            con100.job("f00ba5").start_and_wait(print=stdout.append, follow_logs=True)
+        assert stdout == [
+            "0:00:01 Job 'f00ba5': send 'start'",
+            "0:00:02 Job 'f00ba5': finished (progress N/A)",
+            "0:00:03 Job 'f00ba5': Failed to fetch logs: [500] nope",
+        ]
+
+
 def test_create_job_100(con100, requests_mock):
     def check_request(request):
         assert request.json() == {
@@ -0,0 +1,70 @@
+import pytest
+
+from openeo.rest._metrics import RequestMetrics, endpoint_template
+
+
+@pytest.mark.parametrize(
+    ["path", "expected"],
+    [
+        ("/", "/"),
+        ("", "/"),
+        ("/jobs", "/jobs"),
+        ("/jobs/j-123", "/jobs/{job_id}"),
+        ("jobs/j-123", "/jobs/{job_id}"),
+        ("/jobs/j-123/results", "/jobs/{job_id}/results"),
+        ("/jobs/j-123/logs?offset=12", "/jobs/{job_id}/logs"),
+        ("/collections", "/collections"),
+        ("/collections/S2/items", "/collections/{collection_id}/items"),
+        ("/process_graphs/evi", "/process_graphs/{process_graph_id}"),
+        ("/processes", "/processes"),
+        ("/processes/u:john/evi", "/processes/{namespace}/{process_id}"),
+        ("/files/foo/bar.txt", "/files/{path}"),
+        ("https://storage.test/asset.tiff", "{external}"),
+    ],
+)
+def test_endpoint_template(path, expected):
+    assert endpoint_template(path) == expected
+
+
+class TestRequestMetrics:
+    def test_empty(self):
+        metrics = RequestMetrics()
+        assert metrics.totals() == {}
+        assert metrics.snapshot() == {"endpoints": {}}
+
+    def test_record_request(self):
+        metrics = RequestMetrics()
+        metrics.record_request(method="get", path="/jobs/j-1", status_code=200, elapsed=0.2, response_bytes=100)
+        metrics.record_request(method="GET", path="/jobs/j-2", status_code=404, elapsed=0.6, response_bytes=20)
+        metrics.record_request(method="post", path="/jobs", status_code=None, elapsed=3, request_bytes=50, retries=2)
+
+        assert metrics.totals() == {
+            "requests": 3,
+            "errors": 2,
+            "retries": 2,
+            "request bytes": 50,
+            "response bytes": 120,
+        }
+        snapshot = metrics.snapshot()
+        assert set(snapshot["endpoints"].keys()) == {"GET /jobs/{job_id}", "POST /jobs"}
+        get_job = snapshot["endpoints"]["GET /jobs/{job_id}"]
+        assert get_job["requests"] == 2
+        assert get_job["errors"] == 1
+        assert get_job["status"] == {200: 1, 404: 1}
+        assert get_job["latency"]["min"] == 0.2
+        assert get_job["latency"]["max"] == 0.6
+        assert get_job["latency"]["mean"] == pytest.approx(0.4)
+        assert {k: v for k, v in get_job["latency"]["histogram"].items() if v} == {0.25: 1, 1: 1}
+        assert snapshot["endpoints"]["POST /jobs"]["status"] == {"exception": 1}
+
+    def test_record_auth_refresh(self):
+        metrics = RequestMetrics()
+        metrics.record_auth_refresh(elapsed=1.5, success=True)
+        metrics.record_auth_refresh(elapsed=0.5, success=False)
+        assert metrics.totals() == {"auth refresh": 2, "auth refresh failed": 1, "auth refresh time": 2.0}
+
+    def test_record_coalesced(self):
+        metrics = RequestMetrics()
+        metrics.record_coalesced(memo=False)
+        metrics.record_coalesced(memo=True)
+        assert metrics.totals() == {"coalesced": 2, "memo hits": 1}
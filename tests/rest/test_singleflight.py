@@ -0,0 +1,117 @@
+import collections
+import threading
+import time
+
+import pytest
+
+from openeo.rest._singleflight import SingleFlight
+
+
+def _wait_for_followers(single_flight: SingleFlight, key, count: int):
+    """Wait until given number of callers are waiting on the call in flight."""
+    waiters = single_flight._in_flight[key].done._cond._waiters
+    while len(waiters) < count:
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    def test_basic(self):
+        single_flight = SingleFlight()
+        assert single_flight.do("a", lambda: 123) == (123, None)
+        assert single_flight.do("a", lambda: 456) == (456, None)
+
+    def test_concurrent_calls_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(single_flight.do("a", func)))
+        leader.start()
+        assert started.wait(timeout=5)
+        followers = [threading.Thread(target=lambda: results.append(single_flight.do("a", func))) for _ in range(3)]
+        for t in followers:
+            t.start()
+        _wait_for_followers(single_flight, "a", count=3)
+        release.set()
+        for t in [leader] + followers:
+            t.join(timeout=5)
+
+        assert len(calls) == 1
+        assert collections.Counter(results) == {("result", None): 1, ("result", "shared"): 3}
+
+    def test_concurrent_exception_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func():
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                single_flight.do("a", func)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        assert started.wait(timeout=5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        _wait_for_followers(single_flight, "a", count=1)
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+        assert [str(e) for e in errors] == ["boom", "boom"]
+        # Nothing left in flight
+        assert single_flight.do("a", lambda: "ok") == ("ok", None)
+
+    def test_memo(self, clock):
+        single_flight = SingleFlight(ttl=10, clock=clock)
+        assert single_flight.do("a", lambda: 1) == (1, None)
+        assert single_flight.do("a", lambda: 2) == (1, "memo")
+        assert single_flight.do("b", lambda: 3) == (3, None)
+        clock.now += 11
+        assert single_flight.do("a", lambda: 4) == (4, None)
+        assert single_flight.do("a", lambda: 5) == (4, "memo")
+
+    def test_memo_predicate(self, clock):
+        single_flight = SingleFlight(ttl=10, clock=clock)
+        assert single_flight.do("a", lambda: -1, memoize=lambda r: r > 0) == (-1, None)
+        assert single_flight.do("a", lambda: 1, memoize=lambda r: r > 0) == (1, None)
+        assert single_flight.do("a", lambda: 2, memoize=lambda r: r > 0) == (1, "memo")
+
+    def test_memo_no_exceptions(self, clock):
+        single_flight = SingleFlight(ttl=10, clock=clock)
+
+        def fail():
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            single_flight.do("a", fail)
+        assert single_flight.do("a", lambda: 1) == (1, None)
+
+    def test_clear(self, clock):
+        single_flight = SingleFlight(ttl=10, clock=clock)
+        single_flight.do("a", lambda: 1)
+        single_flight.clear()
+        assert single_flight.do("a", lambda: 2) == (2, None)
+
+    def test_max_size(self, clock):
+        single_flight = SingleFlight(ttl=10, max_size=3, clock=clock)
+        for i, key in enumerate("abcd"):
+            single_flight.do(key, lambda: i)
+            clock.now += 1
+        assert list(single_flight._memo) == ["b", "c", "d"]
@@ -0,0 +1,134 @@
+import json
+
+import numpy as np
+import pytest
+import requests
+import xarray
+
+from openeo.rest.streaming import ResultStream, iter_json
+
+
+def _chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJson:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+    @pytest.mark.parametrize(
+        ["doc", "expected"],
+        [
+            ([], []),
+            ([1, 22, 333, -4.5e6], [1, 22, 333, -4.5e6]),
+            (["a", {"b": [1, 2]}, None, True], ["a", {"b": [1, 2]}, None, True]),
+            ({}, []),
+            (
+                {"2020-01-01": [[1, 2]], "2020-01-02": [[3, None]]},
+                [("2020-01-01", [[1, 2]]), ("2020-01-02", [[3, None]])],
+            ),
+            (12345, [12345]),
+            ("hello", ["hello"]),
+        ],
+    )
+    def test_basic(self, doc, expected, chunk_size):
+        data = json.dumps(doc, indent=2).encode("utf-8")
+        assert list(iter_json(_chunked(data, size=chunk_size))) == expected
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5])
+    def test_unicode(self, chunk_size):
+        data = json.dumps({"naïve": "café ☕"}, ensure_ascii=False).encode("utf-8")
+        assert list(iter_json(_chunked(data, size=chunk_size))) == [("naïve", "café ☕")]
+
+    def test_lazy(self):
+        consumed = []
+
+        def chunks():
+            for chunk in [b"[1,", b" 2, ", b"3]"]:
+                consumed.append(chunk)
+                yield chunk
+
+        items = iter_json(chunks())
+        assert next(items) == 1
+        assert consumed == [b"[1,"]
+        assert list(items) == [2, 3]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"[1, 2",
+            b"[1, 2}",
+            b'{"a" 1}',
+            b"[1, 2] 3",
+        ],
+    )
+    def test_invalid(self, data):
+        with pytest.raises(ValueError):
+            list(iter_json(_chunked(data, size=2)))
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b'[{"a" 1}, ',
+            b'{"a": [1, 2 3], ',
+            b"[1, 2, nope, ",
+        ],
+    )
+    def test_invalid_fail_fast(self, data):
+        """Malformed value should fail without reading the rest of the stream."""
+        consumed = []
+
+        def chunks():
+            consumed.append(data)
+            yield data
+            for i in range(1000):
+                chunk = f"{i}, ".encode("utf-8")
+                consumed.append(chunk)
+                yield chunk
+            yield b"0]"
+
+        with pytest.raises(ValueError):
+            list(iter_json(chunks()))
+        assert len(consumed) < 10
+
+
+class TestResultStream:
+    @pytest.fixture
+    def stream(self, requests_mock):
+        def get(content: bytes) -> ResultStream:
+            requests_mock.get("https://oeo.test/result", content=content)
+            return ResultStream(requests.get("https://oeo.test/result", stream=True), chunk_size=4)
+
+        return get
+
+    def test_iter_bytes(self, stream):
+        assert list(stream(b"Hello world!").iter_bytes()) == [b"Hell", b"o wo", b"rld!"]
+
+    def test_as_file(self, stream):
+        f = stream(b"Hello world!").as_file()
+        assert f.read(5) == b"Hello"
+        assert f.read() == b" world!"
+
+    def test_iter_json(self, stream):
+        assert list(stream(b'{"a": [1, 2], "b": 3}').iter_json()) == [("a", [1, 2]), ("b", 3)]
+
+    def test_save(self, stream, tmp_path):
+        path = stream(b"Hello world!").save(tmp_path / "sub" / "result.txt")
+        assert path.read_bytes() == b"Hello world!"
+
+    def test_to_xarray(self, stream, tmp_path):
+        ds = xarray.Dataset({"B02": (("x", "y"), np.arange(6).reshape((2, 3)))})
+        ds.to_netcdf(tmp_path / "orig.nc")
+        data = (tmp_path / "orig.nc").read_bytes()
+
+        with stream(data).to_xarray(path=tmp_path / "result.nc") as result:
+            xarray.testing.assert_equal(result, ds)
+        assert (tmp_path / "result.nc").exists()
+
+    def test_to_xarray_temporary(self, stream, tmp_path):
+        ds = xarray.Dataset({"B02": (("x", "y"), np.arange(6).reshape((2, 3)))})
+        ds.to_netcdf(tmp_path / "orig.nc")
+        data = (tmp_path / "orig.nc").read_bytes()
+
+        result = stream(data).to_xarray()
+        xarray.testing.assert_equal(result, ds)
+        result.close()
@@ -1,6 +1,7 @@
 import re
 from pathlib import PurePosixPath
 
+import dirty_equals
 import pytest
 
 import openeo
@@ -198,3 +199,160 @@ class TestUserFile:
         assert expected.exists()
         assert expected.read_bytes() == b"hello world\n"
         assert download_mock.call_count == 1
+
+
+class TestDirectorySync:
+    @pytest.fixture
+    def workspace(self, requests_mock) -> dict:
+        """Fake user workspace: mapping of path to (content, modified)."""
+        files = {}
+
+        def list_files(request, context):
+            return {
+                "files": [
+                    {"path": path, "size": len(content), "modified": modified}
+                    for path, (content, modified) in sorted(files.items())
+                ]
+            }
+
+        def put_file(request, context):
+            path = request.path.split("/files/", 1)[1]
+            body = request.body.read() if hasattr(request.body, "read") else request.body
+            files[path] = (body, "2099-01-01T00:00:00Z")
+            return {"path": path, "size": len(body), "modified": files[path][1]}
+
+        def get_file(request, context):
+            path = request.path.split("/files/", 1)[1]
+            context.headers["Content-Type"] = "application/octet-stream"
+            return files[path][0]
+
+        requests_mock.get(API_URL + "/files", json=list_files)
+        requests_mock.put(re.compile(r".*/files/.+"), json=put_file)
+        requests_mock.get(re.compile(r".*/files/.+"), content=get_file)
+        return files
+
+    @pytest.fixture
+    def local_dir(self, tmp_path):
+        local_dir = tmp_path / "aux"
+        (local_dir / "models").mkdir(parents=True)
+        (local_dir / "a.txt").write_bytes(b"aaa")
+        (local_dir / "models" / "m.bin").write_bytes(b"model data")
+        return local_dir
+
+    def test_upload_directory(self, con100, workspace, local_dir):
+        summary = con100.upload_directory(local_dir, target="campaign/aux")
+        assert sorted(workspace) == ["campaign/aux/a.txt", "campaign/aux/models/m.bin"]
+        assert workspace["campaign/aux/models/m.bin"][0] == b"model data"
+        assert summary.transferred == ["campaign/aux/a.txt", "campaign/aux/models/m.bin"]
+        assert summary.skipped == []
+        assert summary.failed == {}
+        assert summary.bytes == 13
+        assert summary.throughput > 0
+        assert re.match(r"2 transferred, 0 skipped, 0 failed: 13 bytes in .*s \(.* MiB/s\)", str(summary))
+
+    def test_upload_directory_skip_unchanged(self, con100, workspace, local_dir, requests_mock):
+        con100.upload_directory(local_dir)
+        (local_dir / "a.txt").write_bytes(b"aaaa")
+        (local_dir / "b.txt").write_bytes(b"b")
+        summary = con100.upload_directory(local_dir)
+        assert summary.transferred == ["a.txt", "b.txt"]
+        assert summary.skipped == ["models/m.bin"]
+        assert workspace["a.txt"][0] == b"aaaa"
+
+        summary = con100.upload_directory(local_dir, skip_unchanged=False)
+        assert summary.transferred == ["a.txt", "b.txt", "models/m.bin"]
+
+    def test_upload_directory_pattern(self, con100, workspace, local_dir):
+        summary = con100.upload_directory(local_dir, pattern="*.txt")
+        assert summary.transferred == ["a.txt"]
+        assert sorted(workspace) == ["a.txt"]
+
+    def test_upload_directory_not_a_directory(self, con100, local_dir):
+        with pytest.raises(ValueError, match="is not a directory"):
+            con100.upload_directory(local_dir / "a.txt")
+
+    def test_upload_directory_retry(self, con100, workspace, local_dir, requests_mock):
+        put_mock = requests_mock.put(
+            API_URL + "/files/a.txt",
+            [
+                {"status_code": 503, "text": "busy"},
+                {"status_code": 200, "json": {"path": "a.txt", "size": 3}},
+            ],
+        )
+        summary = con100.upload_directory(local_dir, retry_backoff=0)
+        assert summary.transferred == ["a.txt", "models/m.bin"]
+        assert summary.failed == {}
+        assert put_mock.call_count == 2
+
+    def test_upload_directory_failure(self, con100, workspace, local_dir, requests_mock, caplog):
+        put_mock = requests_mock.put(API_URL + "/files/a.txt", status_code=403, text="nope")
+        summary = con100.upload_directory(local_dir, retry_backoff=0)
+        assert summary.transferred == ["models/m.bin"]
+        assert summary.failed == {"a.txt": "[403] nope"}
+        assert put_mock.call_count == 1
+        assert "Failed to transfer 'a.txt'" in caplog.text
+
+    def test_download_directory(self, con100, workspace, tmp_path):
+        workspace["campaign/a.txt"] = (b"aaa", "2020-01-01T00:00:00Z")
+        workspace["campaign/models/m.bin"] = (b"model data", "2020-01-01T00:00:00Z")
+        workspace["other.txt"] = (b"other", "2020-01-01T00:00:00Z")
+        summary = con100.download_directory(tmp_path / "local", source="campaign")
+        assert summary.transferred == ["campaign/a.txt", "campaign/models/m.bin"]
+        assert summary.bytes == 13
+        assert (tmp_path / "local" / "a.txt").read_bytes() == b"aaa"
+        assert (tmp_path / "local" / "models" / "m.bin").read_bytes() == b"model data"
+        assert not (tmp_path / "local" / "other.txt").exists()
+
+        workspace["campaign/a.txt"] = (b"AAAA", "2021-01-01T00:00:00Z")
+        summary = con100.download_directory(tmp_path / "local", source="campaign")
+        assert summary.transferred == ["campaign/a.txt"]
+        assert summary.skipped == ["campaign/models/m.bin"]
+        assert (tmp_path / "local" / "a.txt").read_bytes() == b"AAAA"
+
+    def test_download_directory_all(self, con100, workspace, tmp_path):
+        workspace["a.txt"] = (b"aaa", "2020-01-01T00:00:00Z")
+        workspace["data/b.txt"] = (b"bb", "2020-01-01T00:00:00Z")
+        summary = con100.download_directory(tmp_path, max_workers=1)
+        assert summary.transferred == ["a.txt", "data/b.txt"]
+        assert (tmp_path / "data" / "b.txt").read_bytes() == b"bb"
+
+    def test_download_directory_outside_target(self, con100, workspace, tmp_path, caplog):
+        workspace["a.txt"] = (b"aaa", "2020-01-01T00:00:00Z")
+        workspace["../evil.txt"] = (b"evil", "2020-01-01T00:00:00Z")
+        workspace["/etc/evil.txt"] = (b"evil", "2020-01-01T00:00:00Z")
+        workspace["data/../../evil.txt"] = (b"evil", "2020-01-01T00:00:00Z")
+        local = tmp_path / "local"
+        summary = con100.download_directory(local)
+        assert summary.transferred == ["a.txt"]
+        assert summary.failed == {
+            "../evil.txt": dirty_equals.IsStr(regex=".*outside of target directory.*"),
+            "/etc/evil.txt": dirty_equals.IsStr(regex=".*outside of target directory.*"),
+            "data/../../evil.txt": dirty_equals.IsStr(regex=".*outside of target directory.*"),
+        }
+        assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == ["a.txt"]
+        assert "Not downloading '../evil.txt'" in caplog.text
+
+    @pytest.mark.parametrize(
+        "modified",
+        ["2020-01-02T03:04:05Z", "2020-01-02T03:04:05+00:00", "2020-01-02T05:04:05+02:00", "2020-01-02T03:04:05.123Z"],
+    )
+    def test_download_directory_modified_formats(self, con100, workspace, tmp_path, modified):
+        workspace["a.txt"] = (b"aaa", modified)
+        summary = con100.download_directory(tmp_path)
+        assert summary.transferred == ["a.txt"]
+        assert int((tmp_path / "a.txt").stat().st_mtime) == 1577934245
+
+        summary = con100.download_directory(tmp_path)
+        assert summary.transferred == []
+        assert summary.skipped == ["a.txt"]
+
+    def test_download_directory_invalid_modified(self, con100, workspace, tmp_path):
+        workspace["a.txt"] = (b"aaa", "last tuesday")
+        summary = con100.download_directory(tmp_path)
+        assert summary.transferred == ["a.txt"]
+        assert (tmp_path / "a.txt").read_bytes() == b"aaa"
+
+        # Unchanged file can not be detected: download again
+        summary = con100.download_directory(tmp_path)
+        assert summary.transferred == ["a.txt"]
+        assert summary.failed == {}
@@ -24,6 +24,7 @@ from openeo.metadata import (
     metadata_from_stac,
 )
 from openeo.testing.stac import StacDummyBuilder
+from openeo.utils.stac import CachingStacIO
 
 CUBE_METADATA_XYTB = CubeMetadata(
     dimensions=[
@@ -129,6 +130,48 @@ def test_band_dimension_band_index_with_aliases():
         bdim.band_index("apple")
 
 
+def test_band_dimension_band_index_duplicates():
+    bdim = BandDimension(
+        name="spectral",
+        bands=[
+            Band("B02", "blue"),
+            Band("B03", "blue"),
+            Band("B03", "green"),
+            Band("green", "red"),
+        ],
+    )
+    # First match wins, common names take precedence over band names
+    assert bdim.band_index("blue") == 0
+    assert bdim.band_index("B03") == 1
+    assert bdim.band_index("green") == 2
+    assert bdim.band_name("green", allow_common=False) == "green"
+    assert bdim.band_name("blue", allow_common=False) == "B02"
+
+
+def test_band_dimension_index_not_in_repr_or_eq():
+    bands = [Band("B02", "blue"), Band("B03", "green")]
+    bdim1 = BandDimension(name="spectral", bands=bands)
+    bdim2 = BandDimension(name="spectral", bands=list(bands))
+    assert bdim1.band_index("green") == 1
+    assert bdim1 == bdim2
+    assert repr(bdim1) == repr(bdim2)
+    assert "_index" not in repr(bdim1)
+
+
+def test_band_dimension_many_bands():
+    bands = [Band(f"B{i:03d}", common_name=f"c{i}", aliases=[f"a{i}"]) for i in range(500)]
+    bdim = BandDimension(name="spectral", bands=bands)
+    assert bdim.band_index("B123") == 123
+    assert bdim.band_index("c456") == 456
+    assert bdim.band_index("a499") == 499
+    assert bdim.band_name("a7") == "B007"
+    filtered = bdim.filter_bands([f"B{i:03d}" for i in range(0, 500, 5)])
+    assert len(filtered.bands) == 100
+    assert filtered.band_index("B495") == 99
+    # Bands are shared, not copied
+    assert filtered.bands[1] is bands[5]
+
+
 def test_band_dimension_contains_band():
     bdim = BandDimension(
         name="spectral",
@@ -943,6 +986,26 @@ def test_cubemetadata_add_temporal_dimension_duplicate():
         _ = metadata.add_dimension("date", "2020-05-15", "temporal")
 
 
+def test_cube_metadata_structural_sharing():
+    x = SpatialDimension(name="x", extent=[0, 10])
+    t = TemporalDimension(name="t", extent=None)
+    bands = BandDimension(name="bands", bands=[Band(f"B{i}") for i in range(100)])
+    metadata = CubeMetadata(dimensions=[x, t, bands])
+
+    filtered = metadata.filter_bands(["B1", "B2"])
+    assert filtered.dimension_names() == ["x", "t", "bands"]
+    assert filtered.band_names == ["B1", "B2"]
+    assert filtered.spatial_dimensions[0] is x
+    assert filtered.temporal_dimension is t
+    assert metadata.band_dimension is bands
+
+    reduced = filtered.reduce_dimension("t").rename_dimension("x", "xx")
+    assert reduced.dimension_names() == ["xx", "bands"]
+    assert reduced.band_dimension is filtered.band_dimension
+    with pytest.raises(ValueError, match="Invalid dimension 't'"):
+        reduced.assert_valid_dimension("t")
+
+
 def test_cube_metadata_add_dimension_geometry():
     orig = CubeMetadata(dimensions=[TemporalDimension(name="t", extent=None)])
     new = orig.add_dimension(name="fields", label="Mol", type="geometry")
@@ -1160,6 +1223,21 @@ def test_metadata_from_stac_bands(tmp_path, test_stac, expected):
     assert metadata.band_names == expected
 
 
+def test_metadata_from_stac_remote_cached(requests_mock, tmp_path):
+    collection_mock = requests_mock.get(
+        "https://stac.test/collection.json",
+        json=StacDummyBuilder.collection(links=[{"rel": "item", "href": "https://stac.test/item.json"}]),
+    )
+    item_mock = requests_mock.get(
+        "https://stac.test/item.json",
+        json=StacDummyBuilder.item(properties={"eo:bands": [{"name": "B02"}, {"name": "B03"}]}),
+    )
+    for _ in range(2):
+        metadata = metadata_from_stac("https://stac.test/collection.json", stac_io=CachingStacIO(cache_dir=tmp_path))
+        assert metadata.band_names == ["B02", "B03"]
+    assert (collection_mock.call_count, item_mock.call_count) == (1, 1)
+
+
 
 @pytest.mark.skipif(not _PYSTAC_1_9_EXTENSION_INTERFACE, reason="Requires PySTAC 1.9+ extension interface")
 @pytest.mark.parametrize(
@@ -1820,6 +1898,45 @@ class TestStacMetadataParser:
 
         assert caplog.messages == expected_warnings
 
+    @pytest.fixture
+    def many_items_collection(self, requests_mock) -> pystac.Collection:
+        """Collection with 50 items: all with band B02, and item 3 also with band B03"""
+        root = "https://stac.test"
+        requests_mock.get(
+            f"{root}/collection.json",
+            json=StacDummyBuilder.collection(
+                links=[{"rel": "item", "href": f"{root}/item{i}.json"} for i in range(50)]
+            ),
+        )
+        for i in range(50):
+            bands = [{"name": "B02"}, {"name": "B03"}] if i == 3 else [{"name": "B02"}]
+            requests_mock.get(f"{root}/item{i}.json", json=StacDummyBuilder.item(properties={"eo:bands": bands}))
+        return pystac.read_file(f"{root}/collection.json", stac_io=CachingStacIO())
+
+    @pytest.mark.parametrize(
+        ["parser_kwargs", "expected_bands", "expected_item_fetches"],
+        [
+            # Note: fetches of a concurrent batch might be cancelled on early stop
+            ({}, ["B02", "B03"], range(14, 17)),
+            ({"item_convergence": 2, "max_workers": 1}, ["B02"], 3),
+            ({"item_convergence": 5, "max_workers": 1}, ["B02", "B03"], 9),
+            ({"item_convergence": 5, "max_workers": 4}, ["B02", "B03"], range(9, 13)),
+            ({"item_budget": 3, "max_workers": 1}, ["B02"], 3),
+            ({"item_budget": None, "item_convergence": None}, ["B02", "B03"], 50),
+        ],
+    )
+    def test_bands_from_stac_collection_consult_items_sampling(
+        self, many_items_collection, requests_mock, parser_kwargs, expected_bands, expected_item_fetches
+    ):
+        requests_mock.reset_mock()
+        parser = _StacMetadataParser(stac_io=CachingStacIO(), **parser_kwargs)
+        bands = parser.bands_from_stac_collection(collection=many_items_collection)
+        assert bands.band_names() == expected_bands
+        if isinstance(expected_item_fetches, range):
+            assert requests_mock.call_count in expected_item_fetches
+        else:
+            assert requests_mock.call_count == expected_item_fetches
+
     @pytest.mark.parametrize(
         ["data", "expected"],
         [
@@ -0,0 +1,232 @@
+import dirty_equals
+import pandas as pd
+import pytest
+
+import openeo
+from openeo.extra.job_management import CsvJobDatabase, MultiBackendJobManager
+from openeo.rest import OpenEoApiError, OpenEoApiPlainError
+from openeo.testing.simulation import BackendSimulation, asset_content
+
+API_URL = "https://sim.test/"
+
+PROCESS_GRAPH = {"add": {"process_id": "add", "arguments": {"x": 3, "y": 5}, "result": True}}
+
+
+def _connect(simulation: BackendSimulation, requests_mock, **kwargs) -> openeo.Connection:
+    simulation.install(requests_mock, root_url=API_URL)
+    return openeo.connect(API_URL, **kwargs)
+
+
+def test_asset_content():
+    assert b"".join(asset_content(0, 5)) == bytes([0, 1, 2, 3, 4])
+    assert b"".join(asset_content(254, 258)) == bytes([254, 255, 0, 1])
+    content = b"".join(asset_content(100, 3_000_100))
+    assert len(content) == 3_000_000
+    assert content == (bytes(range(256)) * 11_800)[100:3_000_100]
+
+
+class TestBackendSimulation:
+    def test_job_status_flow(self, requests_mock, clock):
+        simulation = BackendSimulation(queue_time=10, run_time=20, clock=clock)
+        connection = _connect(simulation, requests_mock)
+        job = connection.create_job(PROCESS_GRAPH, title="Addition")
+        assert job.job_id == "j-000000"
+        assert job.status() == "created"
+        job.start()
+        assert job.status() == "queued"
+        clock.now += 11
+        assert job.describe() == {
+            "id": "j-000000",
+            "title": "Addition",
+            "status": "running",
+            "created": dirty_equals.IsStr(regex=r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z"),
+            "progress": 5,
+        }
+        clock.now += 20
+        metadata = job.describe()
+        assert metadata["status"] == "finished"
+        assert metadata["usage"]["duration"] == {"unit": "seconds", "value": 20}
+        assert simulation.job_status_histogram() == {"finished": 1}
+
+    def test_random_durations(self, requests_mock, clock):
+        simulation = BackendSimulation(queue_time=(5, 10), run_time=lambda rng: 100, clock=clock, seed=42)
+        connection = _connect(simulation, requests_mock)
+        jobs = [connection.create_job(PROCESS_GRAPH) for _ in range(20)]
+        for job in jobs:
+            job.start()
+        clock.now += 4.9
+        assert simulation.job_status_histogram() == {"queued": 20}
+        clock.now += 5.2
+        assert simulation.job_status_histogram() == {"running": 20}
+        clock.now += 100
+        assert simulation.job_status_histogram() == {"finished": 20}
+
+    def test_max_running(self, requests_mock, clock):
+        simulation = BackendSimulation(queue_time=1, run_time=10, max_running=2, clock=clock)
+        connection = _connect(simulation, requests_mock)
+        jobs = [connection.create_job(PROCESS_GRAPH) for _ in range(5)]
+        for job in jobs:
+            job.start()
+        clock.now += 2
+        assert [j.status() for j in jobs] == ["running", "running", "queued", "queued", "queued"]
+        clock.now += 10
+        assert [j.status() for j in jobs] == ["finished", "finished", "running", "running", "queued"]
+        clock.now += 10
+        assert [j.status() for j in jobs] == ["finished"] * 4 + ["running"]
+
+    @pytest.mark.parametrize("release", ["stop", "delete"])
+    def test_max_running_release_slot(self, requests_mock, clock, release):
+        simulation = BackendSimulation(run_time=10, max_running=1, clock=clock)
+        connection = _connect(simulation, requests_mock)
+        job1, job2, job3 = [connection.create_job(PROCESS_GRAPH) for _ in range(3)]
+        job1.start()
+        clock.now += 2
+        assert job1.status() == "running"
+        getattr(job1, release)()
+        job2.start()
+        job3.start()
+        assert [job2.status(), job3.status()] == ["running", "queued"]
+        clock.now += 10
+        assert [job2.status(), job3.status()] == ["finished", "running"]
+
+    def test_failure_rate(self, requests_mock, clock):
+        simulation = BackendSimulation(failure_rate=0.5, seed=123, clock=clock)
+        connection = _connect(simulation, requests_mock)
+        for _ in range(100):
+            connection.create_job(PROCESS_GRAPH).start()
+        histogram = simulation.job_status_histogram()
+        assert set(histogram) == {"finished", "error"}
+        assert 30 < histogram["error"] < 70
+
+    def test_error_injection(self, requests_mock):
+        simulation = BackendSimulation(error_rate=1, error_status_codes=[503])
+        connection = _connect(simulation, requests_mock)
+        with pytest.raises(OpenEoApiError, match=r"\[503\] Internal: Simulated server error"):
+            connection.create_job(PROCESS_GRAPH)
+        assert simulation.stats()["injected errors"] == 1
+
+    def test_rate_limit(self, requests_mock, clock):
+        simulation = BackendSimulation(rate_limit=2, rate_limit_burst=3, clock=clock)
+        connection = _connect(simulation, requests_mock)
+        # Capabilities requests on connect took two tokens already
+        connection.create_job(PROCESS_GRAPH)
+        with pytest.raises(OpenEoApiError, match="TooManyRequests") as exc_info:
+            connection.job("j-000000").status()
+        assert exc_info.value.http_status_code == 429
+        clock.now += 0.5
+        assert connection.job("j-000000").status() == "created"
+        assert simulation.stats()["rate limited"] == 1
+
+    def test_latency(self, requests_mock):
+        sleeps = []
+        simulation = BackendSimulation(latency=0.25, sleep=sleeps.append)
+        connection = _connect(simulation, requests_mock)
+        connection.create_job(PROCESS_GRAPH)
+        assert sleeps == [0.25] * simulation.stats()["requests"]
+
+    def test_list_jobs_paginated(self, requests_mock):
+        simulation = BackendSimulation()
+        connection = _connect(simulation, requests_mock)
+        for _ in range(25):
+            connection.create_job(PROCESS_GRAPH)
+        job_ids = [j["id"] for j in connection.iter_jobs(page_size=10)]
+        assert job_ids == [f"j-{i:06d}" for i in range(25)]
+        assert simulation.stats()["endpoints"]["GET /jobs"] == 3
+
+    def test_cancel_and_delete(self, requests_mock, clock):
+        simulation = BackendSimulation(run_time=10, clock=clock)
+        connection = _connect(simulation, requests_mock)
+        job = connection.create_job(PROCESS_GRAPH)
+        job.start()
+        job.stop()
+        assert job.status() == "canceled"
+        job.delete()
+        with pytest.raises(OpenEoApiError, match="JobNotFound"):
+            job.status()
+        assert connection.create_job(PROCESS_GRAPH).job_id == "j-000001"
+
+    def test_results_not_finished(self, requests_mock, clock):
+        simulation = BackendSimulation(run_time=10, clock=clock)
+        connection = _connect(simulation, requests_mock)
+        job = connection.create_job(PROCESS_GRAPH)
+        job.start()
+        with pytest.raises(OpenEoApiError, match="JobNotFinished"):
+            job.get_results().get_metadata()
+
+    def test_compressed_request_body(self, requests_mock):
+        simulation = BackendSimulation()
+        connection = _connect(simulation, requests_mock, compress_requests=1)
+        assert connection.create_job(PROCESS_GRAPH, title="Compressed").describe()["title"] == "Compressed"
+
+    @pytest.mark.parametrize(
+        ["range_header", "expected_status", "expected_range", "expected"],
+        [
+            (None, 200, None, bytes(range(256)) * 4),
+            ("bytes=0-9", 206, "bytes 0-9/1024", bytes(range(10))),
+            ("bytes=1020-", 206, "bytes 1020-1023/1024", bytes([252, 253, 254, 255])),
+            ("bytes=1020-5000", 206, "bytes 1020-1023/1024", bytes([252, 253, 254, 255])),
+            ("bytes=-3", 206, "bytes 1021-1023/1024", bytes([253, 254, 255])),
+        ],
+    )
+    def test_asset_range(self, range_header, expected_status, expected_range, expected):
+        simulation = BackendSimulation(asset_size=1024)
+        simulation.handle("POST", "/jobs", body=b"{}")
+        simulation.handle("POST", "/jobs/j-000000/results")
+        headers = {"Range": range_header} if range_header else {}
+        response = simulation.handle("GET", "/jobs/j-000000/results/result-00.data", headers=headers)
+        assert response.status == expected_status
+        assert response.headers.get("Content-Range") == expected_range
+        assert response.headers["Content-Length"] == str(len(expected))
+        assert b"".join(response.body) == expected
+
+    def test_asset_range_not_satisfiable(self):
+        simulation = BackendSimulation(asset_size=1024)
+        simulation.handle("POST", "/jobs", body=b"{}")
+        simulation.handle("POST", "/jobs/j-000000/results")
+        response = simulation.handle("GET", "/jobs/j-000000/results/result-00.data", headers={"Range": "bytes=2000-"})
+        assert response.status == 416
+
+    def test_unknown_endpoint(self):
+        response = BackendSimulation().handle("GET", "/collections")
+        assert response.status == 404
+
+
+class TestBackendSimulationServer:
+    def test_ranged_download(self, tmp_path):
+        simulation = BackendSimulation(assets=2, asset_size=3_000_000)
+        with simulation.serve() as url:
+            connection = openeo.connect(url)
+            job = connection.create_job(PROCESS_GRAPH)
+            job.start()
+            asset = job.get_results().get_asset("result-01.data")
+            path = asset.download(tmp_path / "result.data", range_size=1_000_000)
+        assert path.read_bytes() == b"".join(asset_content(0, 3_000_000))
+        assert simulation.stats()["endpoints"]["GET /jobs/{job_id}/results/result-01.data"] == 3
+
+    def test_server_error(self):
+        simulation = BackendSimulation(error_rate=1, error_status_codes=[400])
+        with simulation.serve() as url:
+            connection = openeo.connect(url, retry=False)
+            with pytest.raises(OpenEoApiPlainError, match="Simulated server error"):
+                connection.create_job(PROCESS_GRAPH)
+
+    def test_job_manager(self, tmp_path):
+        simulation = BackendSimulation(queue_time=(0, 0.05), run_time=(0, 0.1), failure_rate=0.2, seed=1)
+        with simulation.serve() as url:
+            manager = MultiBackendJobManager(poll_sleep=0.01, root_dir=tmp_path, download_results=False)
+            manager.add_backend("sim", connection=openeo.connect(url), parallel_jobs=5)
+            job_db = CsvJobDatabase(tmp_path / "jobs.csv").initialize_from_df(pd.DataFrame({"x": range(20)}))
+
+            def start_job(row, connection, **kwargs):
+                return connection.create_job(
+                    {"add": {"process_id": "add", "arguments": {"x": int(row["x"]), "y": 1}, "result": True}}
+                )
+
+            run_stats = manager.run_jobs(job_db=job_db, start_job=start_job)
+
+        assert run_stats["job finished"] + run_stats["job failed"] == 20
+        stats = simulation.stats()
+        assert stats["jobs created"] == 20
+        assert stats["jobs started"] == 20
+        assert sum(stats["job status"].values()) == 20
+        assert set(pd.read_csv(tmp_path / "jobs.csv")["status"]) <= {"finished", "error"}
@@ -0,0 +1,147 @@
+import textwrap
+
+import numpy
+import pytest
+import xarray
+import xarray.testing
+
+from openeo import UDF
+from openeo.udf import OpenEoUdfException, UdfData, XarrayDataCube, execute_local_udf
+from openeo.udf.chunking import ChunkReport, ChunkTiming, LocalChunkScheduler
+
+from .test_xarraydatacube import _build_xdc
+
+# Focal 3x3 mean: result at chunk borders depends on neighboring pixels
+UDF_FOCAL_MEAN = textwrap.dedent("""
+    import xarray
+    def apply_datacube(cube: xarray.DataArray, context: dict) -> xarray.DataArray:
+        return cube.rolling(x=3, y=3, center=True, min_periods=1).mean()
+    """)
+
+UDF_TIME_CUMSUM = textwrap.dedent("""
+    import xarray
+    def apply_datacube(cube: xarray.DataArray, context: dict) -> xarray.DataArray:
+        return cube.cumsum(dim="t") * context.get("factor", 1)
+    """)
+
+UDF_TIME_MEAN = textwrap.dedent("""
+    import xarray
+    def apply_datacube(cube: xarray.DataArray, context: dict) -> xarray.DataArray:
+        return cube.mean(dim="t").expand_dims(t=["mean"])
+    """)
+
+UDF_SHRINK = textwrap.dedent("""
+    import xarray
+    def apply_datacube(cube: xarray.DataArray, context: dict) -> xarray.DataArray:
+        return cube.isel(x=slice(1, None))
+    """)
+
+
+def _size(**kwargs) -> list:
+    return [{"dimension": d, "value": v, "unit": "px"} for d, v in kwargs.items()]
+
+
+@pytest.fixture
+def xdc() -> XarrayDataCube:
+    return _build_xdc(
+        ts=[numpy.datetime64("2020-08-01"), numpy.datetime64("2020-08-11"), numpy.datetime64("2020-08-21")],
+        bands=["a", "b"],
+        xs=[float(x) for x in range(10, 20)],
+        ys=[float(y) for y in range(20, 27)],
+    )
+
+
+def _get_result(res: UdfData) -> xarray.DataArray:
+    assert isinstance(res, UdfData)
+    return res.get_datacube_list()[0].get_array()
+
+
+class TestApplyNeighborhood:
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_overlap_matches_full_cube(self, xdc, max_workers):
+        expected = _get_result(execute_local_udf(UDF_FOCAL_MEAN, xdc))
+        scheduler = LocalChunkScheduler(max_workers=max_workers)
+        res = scheduler.apply_neighborhood(UDF_FOCAL_MEAN, xdc, size=_size(x=4, y=3), overlap=_size(x=1, y=1))
+        xarray.testing.assert_allclose(_get_result(res), expected)
+
+        report = scheduler.last_report
+        assert isinstance(report, ChunkReport)
+        assert report.workers == max_workers
+        assert [c.index for c in report.chunks] == [(i, j) for i in range(3) for j in range(3)]
+        # Chunk shapes (t, bands, x, y) include the overlap (clipped at the borders)
+        assert report.chunks[0] == ChunkTiming(index=(0, 0), shape=(3, 2, 5, 4), seconds=pytest.approx(0, abs=10))
+        assert report.chunks[4].shape == (3, 2, 6, 5)
+        assert report.total_seconds >= report.max_seconds > 0
+        assert len(report.slowest(2)) == 2
+        assert str(report).startswith("9 chunks on")
+
+    def test_without_overlap_differs(self, xdc):
+        expected = _get_result(execute_local_udf(UDF_FOCAL_MEAN, xdc))
+        res = LocalChunkScheduler(max_workers=1).apply_neighborhood(UDF_FOCAL_MEAN, xdc, size=_size(x=4, y=3))
+        result = _get_result(res)
+        assert result.shape == expected.shape
+        assert not numpy.allclose(result.values, expected.values)
+
+    def test_full_dimension_size(self, xdc):
+        size = [{"dimension": "x", "value": 5, "unit": "px"}, {"dimension": "t", "value": None}]
+        scheduler = LocalChunkScheduler(max_workers=1)
+        res = scheduler.apply_neighborhood(UDF_TIME_CUMSUM, xdc, size=size)
+        expected = _get_result(execute_local_udf(UDF_TIME_CUMSUM, xdc))
+        xarray.testing.assert_allclose(_get_result(res), expected)
+        assert len(scheduler.last_report.chunks) == 2
+
+    def test_from_netcdf_file(self, xdc, tmp_path):
+        path = tmp_path / "data.nc"
+        xdc.save_to_file(path)
+        expected = _get_result(execute_local_udf(UDF_FOCAL_MEAN, path))
+        output = tmp_path / "result.nc"
+        res = LocalChunkScheduler(max_workers=2).apply_neighborhood(
+            UDF_FOCAL_MEAN, path, size=_size(x=3, y=3), overlap=_size(x=2, y=2), output=output
+        )
+        xarray.testing.assert_allclose(_get_result(res), expected)
+        assert output.exists()
+
+    def test_context(self, xdc):
+        udf = UDF(UDF_TIME_CUMSUM, runtime="Python", context={"factor": 10})
+        res = LocalChunkScheduler(max_workers=1).apply_neighborhood(udf, xdc, size=_size(x=3))
+        expected = _get_result(execute_local_udf(udf, xdc))
+        xarray.testing.assert_allclose(_get_result(res), expected)
+
+    @pytest.mark.parametrize(
+        ["size", "overlap", "expected"],
+        [
+            (_size(z=3), None, r"Invalid size dimension 'z'"),
+            (_size(x=3), _size(y=1), r"Overlap specified for dimensions \['y'\] without neighborhood size"),
+            ([{"dimension": "x", "value": 10, "unit": "m"}], None, r"Unsupported size unit 'm'"),
+        ],
+    )
+    def test_invalid(self, xdc, size, overlap, expected):
+        with pytest.raises(ValueError, match=expected):
+            LocalChunkScheduler(max_workers=1).apply_neighborhood(UDF_FOCAL_MEAN, xdc, size=size, overlap=overlap)
+
+    def test_udf_changes_chunk_shape(self, xdc):
+        with pytest.raises(OpenEoUdfException, match="UDF changed the size of dimension 'x' from 5 to 4"):
+            LocalChunkScheduler(max_workers=1).apply_neighborhood(UDF_SHRINK, xdc, size=_size(x=4), overlap=_size(x=1))
+
+
+class TestApplyDimension:
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_time_series(self, xdc, max_workers):
+        expected = _get_result(execute_local_udf(UDF_TIME_CUMSUM, xdc))
+        scheduler = LocalChunkScheduler(max_workers=max_workers)
+        res = scheduler.apply_dimension(UDF_TIME_CUMSUM, xdc, dimension="t", tile_size=4)
+        xarray.testing.assert_allclose(_get_result(res), expected)
+        assert len(scheduler.last_report.chunks) == 2 * 3
+
+    def test_change_dimension_labels(self, xdc):
+        scheduler = LocalChunkScheduler(max_workers=1)
+        res = scheduler.apply_dimension(UDF_TIME_MEAN, xdc, dimension="t", tile_size=3)
+        result = _get_result(res)
+        assert result.sizes == {"t": 1, "bands": 2, "y": 7, "x": 10}
+        xarray.testing.assert_allclose(
+            result.isel(t=0, drop=True), xdc.array.mean(dim="t").transpose("bands", "y", "x")
+        )
+
+    def test_invalid_dimension(self, xdc):
+        with pytest.raises(ValueError, match="Invalid dimension 'z'"):
+            LocalChunkScheduler(max_workers=1).apply_dimension(UDF_TIME_CUMSUM, xdc, dimension="z")
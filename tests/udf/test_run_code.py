@@ -9,7 +9,7 @@ import pytest
 import xarray
 
 from openeo import UDF
-from openeo.udf import UdfData, XarrayDataCube
+from openeo.udf import OpenEoUdfException, UdfData, XarrayDataCube
 from openeo.udf._compat import FlimsyTomlParser
 from openeo.udf.run_code import (
     _annotation_is_pandas_series,
@@ -332,6 +332,90 @@ def test_run_local_udf_from_file_netcdf_with_context(tmp_path):
     xarray.testing.assert_equal(swapped_result, expected)
 
 
+class TestExecuteLocalUdfChunked:
+    @pytest.fixture
+    def xdc(self) -> XarrayDataCube:
+        return _build_xdc(
+            ts=[numpy.datetime64("2020-08-01"), numpy.datetime64("2020-08-11"), numpy.datetime64("2020-08-21")],
+            bands=["bandzero", "bandone"],
+            xs=[10.0, 11.0, 12.0, 13.0, 14.0],
+            ys=[20.0, 21.0, 22.0, 23.0, 24.0, 25.0],
+        )
+
+    @pytest.mark.parametrize(
+        "chunks",
+        [
+            {"x": 2},
+            {"t": 1, "y": 4},
+            {"y": 4, "x": 3, "t": 2},
+            {"x": 100},
+        ],
+    )
+    @pytest.mark.parametrize("source", ["array", "netcdf"])
+    def test_chunked_matches_unchunked(self, xdc, tmp_path, chunks, source):
+        udf_code = _get_udf_code("ndvi01.py")
+        if source == "netcdf":
+            datacube = tmp_path / "data.nc"
+            xdc.save_to_file(datacube)
+        else:
+            datacube = xdc
+        expected = execute_local_udf(udf_code, datacube).get_datacube_list()[0].get_array()
+        res = execute_local_udf(udf_code, datacube, chunks=chunks)
+        assert isinstance(res, UdfData)
+        result = res.get_datacube_list()[0].get_array()
+        assert result.shape == (3, 1, 6, 5)
+        xarray.testing.assert_equal(result, expected)
+
+    def test_chunked_with_context(self, xdc):
+        udf = UDF(_get_udf_code("multiply_factor.py"), runtime="Python", context={"factor": 10})
+        res = execute_local_udf(udf, xdc, chunks={"x": 2, "y": 2})
+        result = res.get_datacube_list()[0].get_array()
+        xarray.testing.assert_equal(result.transpose("t", "bands", "x", "y"), xdc.array * 10)
+
+    @pytest.mark.parametrize("chunks", [{"t": 2}, {"x": 2, "t": 1}])
+    def test_chunked_empty_dimension(self, xdc, chunks):
+        empty = XarrayDataCube(xdc.array.isel(t=slice(0, 0)))
+        udf = UDF(_get_udf_code("multiply_factor.py"), runtime="Python", context={"factor": 10})
+        expected = execute_local_udf(udf, empty).get_datacube_list()[0].get_array()
+        result = execute_local_udf(udf, empty, chunks=chunks).get_datacube_list()[0].get_array()
+        assert result.sizes["t"] == 0
+        xarray.testing.assert_equal(result, expected)
+
+    def test_chunked_invalid_dimension(self, xdc):
+        with pytest.raises(ValueError, match=r"Can not chunk along dimensions \['z'\]"):
+            execute_local_udf(_get_udf_code("ndvi01.py"), xdc, chunks={"z": 2})
+
+    def test_chunked_udf_drops_dimension(self, xdc):
+        with pytest.raises(OpenEoUdfException, match=r"UDF result lacks chunked dimensions \['t'\]"):
+            udf_code = textwrap.dedent(
+                """
+                import xarray
+                def apply_datacube(cube: xarray.DataArray, context: dict) -> xarray.DataArray:
+                    return cube.mean(dim="t")
+                """
+            )
+            execute_local_udf(udf_code, xdc, chunks={"t": 2})
+
+    @pytest.mark.parametrize("chunks", [None, {"x": 2}])
+    def test_output_netcdf(self, xdc, tmp_path, chunks):
+        output = tmp_path / "result.nc"
+        res = execute_local_udf(_get_udf_code("ndvi01.py"), xdc, chunks=chunks, output=output)
+        saved = XarrayDataCube.from_file(output).get_array()
+        assert saved.shape == (3, 1, 5, 6)
+        result = res.get_datacube_list()[0].get_array()
+        xarray.testing.assert_equal(saved.transpose(*result.dims), result)
+
+    def test_output_zarr_incremental(self, xdc, tmp_path):
+        pytest.importorskip("zarr")
+        datacube = tmp_path / "data.nc"
+        xdc.save_to_file(datacube)
+        output = tmp_path / "result.zarr"
+        expected = execute_local_udf(_get_udf_code("ndvi01.py"), datacube).get_datacube_list()[0].get_array()
+        res = execute_local_udf(_get_udf_code("ndvi01.py"), datacube, chunks={"t": 1, "x": 2}, output=output)
+        result = res.get_datacube_list()[0].get_array()
+        xarray.testing.assert_allclose(result.transpose(*expected.dims), expected)
+
+
 def _is_package_available(name: str) -> bool:
     # TODO: move this to a more general test utility module.
     return importlib.util.find_spec(name) is not None
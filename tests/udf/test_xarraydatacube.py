@@ -376,3 +376,65 @@ class TestXarrayIO:
         assert res.coords["bands"].values.tolist() == ["B02", "B03"]
         assert res.coords["x"].values.tolist() == [4, 5, 6, 7]
         assert res.coords["y"].values.tolist() == [5, 6, 7, 8, 9]
+
+    def test_to_netcdf_file_compression(self, tmp_path):
+        xdc = _build_xdc(ts=[2019, 2020], bands=["a", "b"], xs=list(range(50)), ys=list(range(60)), dtype=numpy.float64)
+        XarrayIO.to_netcdf_file(xdc.array, tmp_path / "plain.nc")
+        XarrayIO.to_netcdf_file(xdc.array, tmp_path / "compressed.nc", compression=True)
+        assert (tmp_path / "compressed.nc").stat().st_size < (tmp_path / "plain.nc").stat().st_size
+        with xarray.open_dataset(tmp_path / "compressed.nc") as ds:
+            assert ds["a"].encoding["zlib"] is True
+            assert ds["a"].encoding["complevel"] == 4
+        xarray.testing.assert_equal(XarrayIO.from_netcdf_file(tmp_path / "compressed.nc"), xdc.array)
+
+    def test_to_netcdf_file_encoding(self, tmp_path):
+        xdc = _build_xdc(ts=[2019, 2020], bands=["a", "b"], xs=list(range(5)), ys=list(range(6)), dtype=numpy.float64)
+        path = tmp_path / "cube.nc"
+        XarrayIO.to_netcdf_file(xdc.array, path, compression=9, encoding={"b": {"dtype": "int16"}})
+        with xarray.open_dataset(path) as ds:
+            assert ds["a"].encoding["complevel"] == 9
+            assert ds["b"].encoding["complevel"] == 9
+            assert ds["b"].encoding["dtype"] == numpy.int16
+
+    def test_open_dataset_lazy(self, tmp_path):
+        xdc = _build_xdc(ts=[2019, 2020, 2021], bands=["a", "b"], xs=list(range(5)), ys=list(range(6)))
+        path = tmp_path / "cube.nc"
+        xdc.save_to_file(path)
+        with XarrayIO.open_dataset(path) as ds:
+            assert list(ds.data_vars) == ["a", "b"]
+            res = XarrayIO.dataset_to_array(ds.isel(t=slice(1, 2), x=slice(0, 2)))
+        assert res.dims == ("t", "bands", "x", "y")
+        xarray.testing.assert_equal(res, xdc.array.isel(t=slice(1, 2), x=slice(0, 2)))
+
+    def test_open_dataset_invalid_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Can not open 'json' as lazy dataset"):
+            XarrayIO.open_dataset(tmp_path / "cube.json", fmt="json")
+
+    def test_from_netcdf_file_chunks(self, tmp_path):
+        pytest.importorskip("dask")
+        xdc = _build_xdc(ts=[2019, 2020, 2021], bands=["a", "b"], xs=list(range(5)), ys=list(range(6)))
+        path = tmp_path / "cube.nc"
+        xdc.save_to_file(path)
+        res = XarrayIO.from_netcdf_file(path, chunks={"t": 1})
+        assert res.chunks is not None
+        xarray.testing.assert_equal(res.compute(), xdc.array)
+
+    def test_zarr_roundtrip(self, tmp_path):
+        pytest.importorskip("zarr")
+        xdc = _build_xdc(ts=[2019, 2020, 2021], bands=["a", "b"], xs=list(range(5)), ys=list(range(6)))
+        path = tmp_path / "cube.zarr"
+        xdc.save_to_file(path)
+        result = XarrayDataCube.from_file(path)
+        xarray.testing.assert_equal(result.array, xdc.array)
+
+    def test_zarr_append(self, tmp_path):
+        pytest.importorskip("zarr")
+        xdc = _build_xdc(ts=[2019, 2020, 2021], bands=["a", "b"], xs=list(range(5)), ys=list(range(6)))
+        path = tmp_path / "cube.zarr"
+        XarrayIO.to_zarr(xdc.array.isel(t=slice(0, 2)), path)
+        XarrayIO.to_zarr(xdc.array.isel(t=slice(2, 3)), path, mode="a", append_dim="t")
+        xarray.testing.assert_equal(XarrayIO.from_zarr(path), xdc.array)
+
+
+def test_guess_format_zarr():
+    assert XarrayDataCube._guess_format("cube.zarr") == "zarr"
@@ -5,7 +5,7 @@ import httpretty
 import pytest
 import requests
 
-from openeo.utils.http import session_with_retries
+from openeo.utils.http import HTTPAdapterWithStats, session_with_retries
 
 
 class TestSessionWithRetries:
@@ -144,3 +144,32 @@ class TestSessionWithRetries:
         assert resp.status_code == 200
         assert resp.text == "ok then"
         assert time_sleep.call_args_list == [mock.call(23)]
+
+
+class TestHTTPAdapterWithStats:
+    @pytest.fixture(autouse=True)
+    def _auto_httpretty_enabled(self):
+        with httpretty.enabled(allow_net_connect=False):
+            yield
+
+    def test_basic(self):
+        httpretty.register_uri(httpretty.GET, uri="https://example.test/", body="ok")
+        session = session_with_retries()
+        for _ in range(3):
+            assert session.get("https://example.test/").text == "ok"
+        adapter = session.get_adapter("https://example.test/")
+        assert isinstance(adapter, HTTPAdapterWithStats)
+        assert adapter.stats() == {"in flight": 0, "requests": 3, "max in flight": 1}
+
+    def test_pool_saturated(self):
+        adapter = HTTPAdapterWithStats(pool_maxsize=1)
+        with mock.patch.object(requests.adapters.HTTPAdapter, "send") as send:
+
+            def nested_send(request, **kwargs):
+                if send.call_count == 1:
+                    adapter.send(request, **kwargs)
+
+            send.side_effect = nested_send
+            adapter.send(requests.Request("GET", "https://example.test/").prepare())
+
+        assert adapter.stats() == {"in flight": 0, "requests": 2, "max in flight": 2, "pool saturated": 1}
@@ -0,0 +1,153 @@
+import copy
+import json
+import pickle
+from unittest import mock
+
+import pystac
+import pytest
+
+from openeo.testing.stac import StacDummyBuilder
+from openeo.utils.stac import (
+    CachingStacIO,
+    get_default_stac_io,
+    iter_stac_items,
+    reset_default_stac_io,
+)
+
+
+class TestCachingStacIO:
+    def test_memory_cache(self, requests_mock):
+        m = requests_mock.get("https://stac.test/collection.json", json={"id": "c1"})
+        stac_io = CachingStacIO()
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 1
+
+        stac_io.clear()
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 2
+
+    def test_max_age(self, requests_mock, time_machine):
+        time_machine.move_to("2025-06-07T12:00:00Z", tick=False)
+        m = requests_mock.get("https://stac.test/collection.json", json={"id": "c1"})
+        stac_io = CachingStacIO(max_age=60)
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        time_machine.move_to("2025-06-07T12:00:30Z", tick=False)
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 1
+        time_machine.move_to("2025-06-07T12:01:30Z", tick=False)
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 2
+
+    def test_disk_cache(self, requests_mock, tmp_path):
+        m = requests_mock.get("https://stac.test/collection.json", json={"id": "c1"})
+        assert CachingStacIO(cache_dir=tmp_path).read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert CachingStacIO(cache_dir=tmp_path).read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_http_error(self, requests_mock, tmp_path):
+        requests_mock.get("https://stac.test/collection.json", status_code=404)
+        stac_io = CachingStacIO(cache_dir=tmp_path)
+        with pytest.raises(Exception, match="404"):
+            stac_io.read_json("https://stac.test/collection.json")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_local_file_not_cached(self, tmp_path):
+        path = tmp_path / "collection.json"
+        stac_io = CachingStacIO(cache_dir=tmp_path / "cache")
+        path.write_text(json.dumps({"id": "c1"}))
+        assert stac_io.read_json(str(path)) == {"id": "c1"}
+        path.write_text(json.dumps({"id": "c2"}))
+        assert stac_io.read_json(str(path)) == {"id": "c2"}
+        assert not (tmp_path / "cache").exists()
+
+    def test_copy_and_pickle(self, requests_mock):
+        requests_mock.get("https://stac.test/collection.json", json={"id": "c1"})
+        stac_io = CachingStacIO()
+        assert copy.deepcopy(stac_io) is stac_io
+        restored = pickle.loads(pickle.dumps(stac_io))
+        assert restored.read_json("https://stac.test/collection.json") == {"id": "c1"}
+
+
+class TestDefaultStacIO:
+    def test_no_caching_by_default(self, requests_mock):
+        m = requests_mock.get("https://stac.test/collection.json", json={"id": "c1"})
+        stac_io = get_default_stac_io()
+        assert get_default_stac_io() is stac_io
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 2
+
+    def test_memory_cache_opt_in(self, requests_mock):
+        m = requests_mock.get("https://stac.test/collection.json", json={"id": "c1"})
+        config = {"stac.memory_cache_size": "10"}
+        with mock.patch("openeo.utils.stac.get_config_option", new=lambda key, default=None: config.get(key, default)):
+            stac_io = get_default_stac_io()
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert stac_io.read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 1
+
+        reset_default_stac_io()
+        assert get_default_stac_io() is not stac_io
+        assert get_default_stac_io().read_json("https://stac.test/collection.json") == {"id": "c1"}
+        assert m.call_count == 2
+
+
+class TestIterStacItems:
+    @pytest.fixture
+    def catalog(self, requests_mock) -> pystac.Collection:
+        """Collection with 3 items and a child collection with 2 items and a sub-child with 1 item."""
+        root = "https://stac.test"
+        documents = {
+            "collection.json": StacDummyBuilder.collection(
+                id="c1",
+                links=[
+                    {"rel": "child", "href": f"{root}/child.json"},
+                    *({"rel": "item", "href": f"{root}/item{i}.json"} for i in range(3)),
+                ],
+            ),
+            "child.json": StacDummyBuilder.collection(
+                id="c2",
+                links=[
+                    {"rel": "child", "href": f"{root}/subchild.json"},
+                    *({"rel": "item", "href": f"{root}/item{i}.json"} for i in range(3, 5)),
+                ],
+            ),
+            "subchild.json": StacDummyBuilder.collection(
+                id="c3", links=[{"rel": "item", "href": f"{root}/item5.json"}]
+            ),
+            **{f"item{i}.json": StacDummyBuilder.item(id=f"item{i}") for i in range(6)},
+        }
+        for name, data in documents.items():
+            requests_mock.get(f"{root}/{name}", json=data)
+        return pystac.read_file(f"{root}/collection.json", stac_io=CachingStacIO())
+
+    def test_basic(self, catalog):
+        items = list(iter_stac_items(catalog, stac_io=CachingStacIO(), max_workers=2))
+        assert [i.id for i in items] == ["item0", "item1", "item2", "item3", "item4", "item5"]
+        assert all(isinstance(i, pystac.Item) for i in items)
+
+    def test_non_recursive(self, catalog):
+        items = iter_stac_items(catalog, stac_io=CachingStacIO(), recursive=False)
+        assert [i.id for i in items] == ["item0", "item1", "item2"]
+
+    @pytest.mark.parametrize(["max_items", "max_workers", "expected_fetches"], [(1, 1, 1), (2, 2, 2), (4, 2, 6)])
+    def test_max_items(self, catalog, requests_mock, max_items, max_workers, expected_fetches):
+        requests_mock.reset_mock()
+        items = iter_stac_items(catalog, stac_io=CachingStacIO(), max_items=max_items, max_workers=max_workers)
+        assert len(list(items)) == max_items
+        assert requests_mock.call_count == expected_fetches
+
+    def test_early_stop(self, catalog, requests_mock):
+        requests_mock.reset_mock()
+        items = iter_stac_items(catalog, stac_io=CachingStacIO(), max_workers=2)
+        assert next(items).id == "item0"
+        items.close()
+        # Other fetches of the (concurrent) batch might be cancelled.
+        assert requests_mock.call_count in {1, 2}
+
+    def test_resolved_links(self):
+        collection = pystac.Collection.from_dict(StacDummyBuilder.collection())
+        collection.add_item(pystac.Item.from_dict(StacDummyBuilder.item(id="item1")))
+        assert [i.id for i in iter_stac_items(collection, stac_io=CachingStacIO())] == ["item1"]